@@ -2,32 +2,77 @@
 Main module for the a1a_infra_base application.
 
 This module initializes the CDKTF application and synthesizes the Terraform backend stack.
+
+Functions:
+    parse_env_overlay: Parse an `ENV=PATH` environment overlay argument.
+    main: Load the configuration, build the stacks and synthesize the application.
 """
 
 import argparse
 import logging
 from pathlib import Path
-from typing import Any, Final
+from typing import Any
 
 from cdktf import App
 
 from a1a_infra_base.file import FileHandlerFactory
 from a1a_infra_base.logger import setup_logger
-from a1a_infra_base.stacks.lake_house import LakeHouseStack, LakeHouseStackConfig
+from a1a_infra_base.profiling import ProfilerBase, ProfilerFactory
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
+from a1a_infra_base.synth import (
+    ENV_KEY,
+    NAME_KEY,
+    STACK_KEY,
+    build_matrix,
+    build_stack,
+    check_capacity,
+    decode_stack_config,
+)
 
 logger: logging.Logger = setup_logger(__name__)
 
-ENV_KEY: Final[str] = "env"
-NAME_KEY: Final[str] = "name"
-STACK_KEY: Final[str] = "stack"
 
+def parse_env_overlay(value: str) -> tuple[str, Path]:
+    """
+    Parse an environment overlay argument of the form `ENV=PATH`.
+
+    Args:
+        value (str): The argument value, e.g. `prd=config/prd.yaml`.
+
+    Returns:
+        tuple[str, Path]: The environment name and the path of the overlay file.
 
-def main(config_filepath: Path) -> None:
+    Raises:
+        argparse.ArgumentTypeError: If the value is not of the form `ENV=PATH`.
+    """
+    overlay_env, separator, overlay_filepath = value.partition("=")
+    if not separator or not overlay_env or not overlay_filepath:
+        raise argparse.ArgumentTypeError(f"Expected ENV=PATH, e.g. prd=config/prd.yaml, got '{value}'.")
+    return overlay_env, Path(overlay_filepath)
+
+
+def main(
+    config_filepath: Path,
+    profiler: ProfilerBase | None = None,
+    selection: ConstructSelection = SELECT_ALL,
+    envs: list[str] | None = None,
+    overlay_filepaths: dict[str, Path] | None = None,
+) -> None:
     """
     Main function to load configuration, initialize the application, and synthesize the app.
 
+    When environments are given, the configuration is synthesized once per environment in a single app instead of for
+    the `env` in the configuration file. Before synth, the projected load of the data lake layers is checked against
+    the storage scalability targets.
+
     Args:
         config_filepath (Path): The file path to the configuration file.
+        profiler (ProfilerBase | None): Optional profiler that is notified after config load, construct build and
+            synth.
+        selection (ConstructSelection): The construct subtree to synthesize, defaults to everything.
+        envs (list[str] | None): The environments to synthesize the configuration for.
+        overlay_filepaths (dict[str, Path] | None): Per environment, a configuration file merged over the base
+            configuration.
 
     Raises:
         Exception: If there is an error loading the configuration file.
@@ -39,20 +84,27 @@ def main(config_filepath: Path) -> None:
     env: str = dict_[ENV_KEY]
     stack: dict[str, Any] = dict_[STACK_KEY]
 
-    if name == "lake_house":
-        data_lake_config: LakeHouseStackConfig = LakeHouseStackConfig.from_dict(dict_=stack)
-        LakeHouseStack(app, "LakeHouseStack", env=env, config=data_lake_config)
-
-    # if name == "terraform_backend":
-    #     terraform_backend_dict: dict[str, Any] = constructs[TERRAFORM_BACKEND_KEY]
-    #     terraform_backend_config: TerraformBackendStackConfig = TerraformBackendStackConfig.from_dict(
-    #         dict_=terraform_backend
-    #     )
-    #     terraform_backend: TerraformBackendStack = TerraformBackendStack(
-    #         app, "terraform_backend", env=env, config=terraform_backend_config
-    #     )
-
+    if envs:
+        overlays: dict[str, dict[str, Any]] = {
+            overlay_env: FileHandlerFactory.create(filepath=str(overlay_filepath)).read().get(STACK_KEY, {})
+            for overlay_env, overlay_filepath in (overlay_filepaths or {}).items()
+        }
+        if profiler is not None:
+            profiler.checkpoint("config loaded")
+        build_matrix(app, name=name, dict_=stack, envs=envs, overlays=overlays, selection=selection)
+    else:
+        config = decode_stack_config(name=name, dict_=stack)
+        if profiler is not None:
+            profiler.checkpoint("config loaded")
+        build_stack(app, name=name, env=env, config=config, selection=selection)
+
+    if profiler is not None:
+        profiler.checkpoint("constructs built")
+
+    check_capacity(app)
     app.synth()
+    if profiler is not None:
+        profiler.checkpoint("app synthesized")
     logger.info("Application finished.")
 
 
@@ -66,8 +118,67 @@ if __name__ == "__main__":
         type=str,
         help="Path to config file.",
     )
+    parser.add_argument(
+        "--only",
+        default="",
+        type=str,
+        help="Construct path to synthesize on its own, e.g. LakeHouseStack/DataLakeL2/StorageL1_Gold.",
+    )
+    parser.add_argument(
+        "--envs",
+        nargs="+",
+        default=None,
+        help="Synthesize the config once per environment in one app, e.g. --envs dev tst acc prd.",
+    )
+    parser.add_argument(
+        "--env-overlay",
+        action="append",
+        default=[],
+        type=parse_env_overlay,
+        metavar="ENV=PATH",
+        help="Config file merged over the base config for one environment of --envs. Can be repeated.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(ProfilerFactory.SUPPORTED_MODES),
+        default=None,
+        help="Profile the run: cpu writes .pstats and collapsed stacks, mem reports top allocations, both does both.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profiles",
+        type=str,
+        help="Directory to write profile output to, one set of files per config file.",
+    )
 
     args: argparse.Namespace = parser.parse_args()
     logger.info("Parsed arguments: %s", args)
 
-    main(config_filepath=Path(args.config_filepath))
+    config_filepath_arg = Path(args.config_filepath)
+    selection_arg = ConstructSelection(path=args.only)
+    overlay_filepaths_arg: dict[str, Path] = dict(args.env_overlay)
+    unknown_overlay_envs_arg = sorted(set(overlay_filepaths_arg) - set(args.envs or []))
+    if unknown_overlay_envs_arg:
+        parser.error(f"--env-overlay given for {', '.join(unknown_overlay_envs_arg)}, which is not in --envs.")
+    if args.profile is None:
+        main(
+            config_filepath=config_filepath_arg,
+            selection=selection_arg,
+            envs=args.envs,
+            overlay_filepaths=overlay_filepaths_arg,
+        )
+    else:
+        profiler_: ProfilerBase = ProfilerFactory.create(
+            mode=args.profile, output_dir=Path(args.profile_dir), name=config_filepath_arg.stem
+        )
+        profiler_.start()
+        try:
+            main(
+                config_filepath=config_filepath_arg,
+                profiler=profiler_,
+                selection=selection_arg,
+                envs=args.envs,
+                overlay_filepaths=overlay_filepaths_arg,
+            )
+        finally:
+            profiler_.stop()
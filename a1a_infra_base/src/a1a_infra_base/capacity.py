@@ -0,0 +1,376 @@
+"""
+Module capacity
+
+This module checks the projected load of storage accounts against the published scalability targets of a single
+Azure storage account before anything is provisioned. The targets depend on the account tier, kind, replication type
+and region. Each account gets its utilization and headroom per metric and the number of accounts its load needs.
+Accounts without published targets, such as premium block blob accounts, are logged and left out of the plan.
+
+All accounts, e.g. every layer of every data lake in an app, are planned in one columnar pass: the loads and targets
+are laid out per metric and divided element-wise, and the target lookup is cached per account type.
+
+Classes:
+    ProjectedLoadConfig: The projected peak load of a storage account.
+    CapacityPlanConfig: The projected loads per layer of a data lake and the utilization to plan for.
+    AccountLimits: The scalability targets of a single storage account.
+    ScalabilityTarget: The published scalability targets of the storage accounts of a tier and kind.
+    PlannedAccount: A storage account with its projected load.
+    AccountCapacity: The utilization and headroom of a storage account under its projected load.
+
+Functions:
+    get_account_limits: Get the published scalability targets of a storage account type.
+    plan_capacity: Plan the capacity of storage accounts in one pass.
+    log_capacity_plan: Log the headroom of every planned account and warn about the ones that need more accounts.
+"""
+
+import logging
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Final, Self
+
+from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constructs.level0.storage_account import StorageAccountL0Config
+from a1a_infra_base.logger import setup_logger
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+REQUEST_RATE_PER_SECOND_KEY: Final[str] = "request_rate_per_second"
+INGRESS_GBPS_KEY: Final[str] = "ingress_gbps"
+EGRESS_GBPS_KEY: Final[str] = "egress_gbps"
+CAPACITY_TIB_KEY: Final[str] = "capacity_tib"
+TARGET_UTILIZATION_KEY: Final[str] = "target_utilization"
+LAYERS_KEY: Final[str] = "layers"
+
+METRICS: Final[tuple[str, ...]] = (
+    REQUEST_RATE_PER_SECOND_KEY,
+    INGRESS_GBPS_KEY,
+    EGRESS_GBPS_KEY,
+    CAPACITY_TIB_KEY,
+)
+# Azure defaults the kind of a storage account without one to general-purpose v2.
+DEFAULT_ACCOUNT_KIND: Final[str] = "StorageV2"
+GEO_REDUNDANT_REPLICATION_TYPES: Final[frozenset[str]] = frozenset({"GRS", "RAGRS", "GZRS", "RAGZRS"})
+# The locations in the United States and Europe, which have higher bandwidth targets than other regions.
+US_EUROPE_LOCATIONS: Final[frozenset[AzureLocation]] = frozenset(
+    {AzureLocation.WEST_EUROPE, AzureLocation.GERMANY_WEST_CENTRAL}
+)
+
+
+@dataclass
+class ProjectedLoadConfig:
+    """
+    The projected peak load of a storage account.
+
+    Attributes:
+        request_rate_per_second (float): The peak request rate.
+        ingress_gbps (float): The peak ingress in gigabits per second.
+        egress_gbps (float): The peak egress in gigabits per second.
+        capacity_tib (float): The stored data in tebibytes.
+    """
+
+    request_rate_per_second: float = 0
+    ingress_gbps: float = 0
+    egress_gbps: float = 0
+    capacity_tib: float = 0
+
+    def __post_init__(self) -> None:
+        """
+        Validate the load is not negative.
+
+        Raises:
+            ValueError: If a metric of the load is negative.
+        """
+        for metric in METRICS:
+            if getattr(self, metric) < 0:
+                raise ValueError(f"Projected {metric} must not be negative, got {getattr(self, metric)}.")
+
+    def spread(self, partitions: int) -> "ProjectedLoadConfig":
+        """
+        Get the share of the load of a single partition when the load is spread evenly over partitions.
+
+        Args:
+            partitions (int): The number of partitions, e.g. the storage accounts of a partitioned layer.
+
+        Returns:
+            ProjectedLoadConfig: The load of a single partition.
+        """
+        return ProjectedLoadConfig(**{metric: getattr(self, metric) / partitions for metric in METRICS})
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a ProjectedLoadConfig by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "request_rate_per_second": <requests per second>,
+            "ingress_gbps": <Gbps>,
+            "egress_gbps": <Gbps>,
+            "capacity_tib": <TiB>
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing the projected load.
+
+        Returns:
+            ProjectedLoadConfig: A fully-initialized ProjectedLoadConfig.
+        """
+        return cls(**{metric: dict_.get(metric, 0) for metric in METRICS})
+
+
+@dataclass
+class CapacityPlanConfig:
+    """
+    The projected loads per layer of a data lake and the utilization to plan for.
+
+    Attributes:
+        target_utilization (float): The fraction of a scalability target a single account may use, e.g. 0.8 to keep
+            20% headroom for bursts.
+        projected_loads (dict[str, ProjectedLoadConfig]): The projected load per layer name, e.g. `gold`.
+    """
+
+    target_utilization: float = 1.0
+    projected_loads: dict[str, ProjectedLoadConfig] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the target utilization.
+
+        Raises:
+            ValueError: If the target utilization is not within (0, 1].
+        """
+        if not 0 < self.target_utilization <= 1:
+            raise ValueError(f"Capacity target_utilization must be within (0, 1], got {self.target_utilization}.")
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a CapacityPlanConfig by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "target_utilization": <fraction>,
+            "layers": {"<layer name>": {<ProjectedLoadConfig>}}
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing the capacity plan.
+
+        Returns:
+            CapacityPlanConfig: A fully-initialized CapacityPlanConfig.
+        """
+        return cls(
+            target_utilization=dict_.get(TARGET_UTILIZATION_KEY, cls.target_utilization),
+            projected_loads={
+                layer: ProjectedLoadConfig.from_dict(load) for layer, load in dict_.get(LAYERS_KEY, {}).items()
+            },
+        )
+
+
+@dataclass(frozen=True)
+class AccountLimits:
+    """
+    The scalability targets of a single storage account.
+
+    Attributes:
+        request_rate_per_second (float): The maximum request rate.
+        ingress_gbps (float): The maximum ingress in gigabits per second.
+        egress_gbps (float): The maximum egress in gigabits per second.
+        capacity_tib (float): The maximum capacity in tebibytes.
+    """
+
+    request_rate_per_second: float
+    ingress_gbps: float
+    egress_gbps: float
+    capacity_tib: float
+
+
+@dataclass(frozen=True)
+class ScalabilityTarget:
+    """
+    The published scalability targets of the storage accounts of a tier and kind.
+
+    Attributes:
+        account_tier (str): The account tier.
+        account_kind (str): The account kind.
+        geo_redundant (bool | None): Whether the targets apply to geo-redundant replication, None for any.
+        us_europe (bool | None): Whether the targets apply to the United States and Europe, None for any region.
+        limits (AccountLimits): The targets.
+    """
+
+    account_tier: str
+    account_kind: str
+    geo_redundant: bool | None
+    us_europe: bool | None
+    limits: AccountLimits
+
+
+# The default scalability targets of standard storage accounts, which can be raised through Azure support.
+SCALABILITY_TARGETS: Final[tuple[ScalabilityTarget, ...]] = (
+    *(
+        ScalabilityTarget("Standard", account_kind, None, True, AccountLimits(20_000, 60, 200, 5 * 1024))
+        for account_kind in ("StorageV2", "BlobStorage")
+    ),
+    *(
+        ScalabilityTarget("Standard", account_kind, None, False, AccountLimits(20_000, 25, 50, 5 * 1024))
+        for account_kind in ("StorageV2", "BlobStorage")
+    ),
+    # Legacy general-purpose v1 accounts, whose bandwidth is lower with geo-redundant replication.
+    ScalabilityTarget("Standard", "Storage", True, None, AccountLimits(20_000, 5, 10, 500)),
+    ScalabilityTarget("Standard", "Storage", False, None, AccountLimits(20_000, 10, 15, 500)),
+)
+
+
+@lru_cache
+def get_account_limits(
+    *, account_tier: str, account_kind: str | None, account_replication_type: str, location: AzureLocation
+) -> AccountLimits:
+    """
+    Get the published scalability targets of a storage account type.
+
+    Args:
+        account_tier (str): The account tier.
+        account_kind (str | None): The account kind, None for the Azure default.
+        account_replication_type (str): The replication type.
+        location (AzureLocation): The location of the account.
+
+    Returns:
+        AccountLimits: The scalability targets of a single account.
+
+    Raises:
+        ValueError: If no targets are published for the account type.
+    """
+    account_kind = account_kind or DEFAULT_ACCOUNT_KIND
+    geo_redundant = account_replication_type in GEO_REDUNDANT_REPLICATION_TYPES
+    us_europe = location in US_EUROPE_LOCATIONS
+    for target in SCALABILITY_TARGETS:
+        if (
+            target.account_tier == account_tier
+            and target.account_kind == account_kind
+            and target.geo_redundant in (None, geo_redundant)
+            and target.us_europe in (None, us_europe)
+        ):
+            return target.limits
+    raise ValueError(f"No scalability targets are published for {account_tier} {account_kind} storage accounts.")
+
+
+@dataclass(frozen=True)
+class PlannedAccount:
+    """
+    A storage account with its projected load.
+
+    Attributes:
+        name (str): The name of the account, e.g. the layer or the full account name.
+        config (StorageAccountL0Config): The configuration of the account.
+        load (ProjectedLoadConfig): The projected load of the account.
+        target_utilization (float): The fraction of a scalability target the account may use.
+    """
+
+    name: str
+    config: StorageAccountL0Config
+    load: ProjectedLoadConfig
+    target_utilization: float = 1.0
+
+
+@dataclass(frozen=True)
+class AccountCapacity:
+    """
+    The utilization and headroom of a storage account under its projected load.
+
+    Attributes:
+        name (str): The name of the account.
+        limits (AccountLimits): The scalability targets of the account.
+        utilization (dict[str, float]): The fraction of each target used by the projected load.
+        accounts_required (int): The number of accounts the load needs to stay within the target utilization.
+        headroom (dict[str, float]): The fraction of each target left, negative if the target is exceeded.
+        bottleneck (str): The metric with the highest utilization.
+        fits (bool): Whether the load fits in a single account.
+    """
+
+    name: str
+    limits: AccountLimits
+    utilization: dict[str, float]
+    accounts_required: int
+
+    @property
+    def headroom(self) -> dict[str, float]:
+        """Gets the fraction of each target left, negative if the target is exceeded."""
+        return {metric: 1 - utilization for metric, utilization in self.utilization.items()}
+
+    @property
+    def bottleneck(self) -> str:
+        """Gets the metric with the highest utilization."""
+        return max(self.utilization, key=self.utilization.__getitem__)
+
+    @property
+    def fits(self) -> bool:
+        """Gets whether the load fits in a single account."""
+        return self.accounts_required <= 1
+
+
+def plan_capacity(accounts: Sequence[PlannedAccount]) -> list[AccountCapacity]:
+    """
+    Plan the capacity of storage accounts in one pass.
+
+    The loads and targets are laid out as one column per metric, divided element-wise into utilizations, and the peak
+    utilization of each account divided by its target utilization gives the number of accounts it needs. Accounts
+    without published scalability targets are logged and left out, as the plan is advisory.
+
+    Args:
+        accounts (Sequence[PlannedAccount]): The accounts to plan, e.g. every layer of every data lake in an app.
+
+    Returns:
+        list[AccountCapacity]: The capacity of each account with published targets, in the order of the accounts.
+    """
+    planned_accounts: list[PlannedAccount] = []
+    limits: list[AccountLimits] = []
+    for account in accounts:
+        try:
+            limit = get_account_limits(
+                account_tier=account.config.account_tier,
+                account_kind=account.config.account_kind,
+                account_replication_type=account.config.account_replication_type,
+                location=account.config.location,
+            )
+        except ValueError as error:
+            logger.info("Storage account '%s' is not planned: %s", account.name, error)
+            continue
+        planned_accounts.append(account)
+        limits.append(limit)
+    utilization_columns = [
+        [getattr(account.load, metric) / getattr(limit, metric) for account, limit in zip(planned_accounts, limits)]
+        for metric in METRICS
+    ]
+    return [
+        AccountCapacity(
+            name=account.name,
+            limits=limit,
+            utilization=dict(zip(METRICS, utilization)),
+            accounts_required=max(1, math.ceil(max(utilization) / account.target_utilization)),
+        )
+        for account, limit, utilization in zip(planned_accounts, limits, zip(*utilization_columns))
+    ]
+
+
+def log_capacity_plan(plan: Sequence[AccountCapacity]) -> None:
+    """
+    Log the headroom of every planned account and warn about the ones that need more accounts.
+
+    Args:
+        plan (Sequence[AccountCapacity]): The capacity of each account.
+    """
+    for capacity in plan:
+        headroom = ", ".join(f"{metric} {value:.0%}" for metric, value in capacity.headroom.items())
+        if capacity.fits:
+            logger.info("Storage account '%s' fits in one account, headroom: %s.", capacity.name, headroom)
+        else:
+            logger.warning(
+                "Storage account '%s' needs %d accounts, limited by %s, headroom: %s.",
+                capacity.name,
+                capacity.accounts_required,
+                capacity.bottleneck,
+                headroom,
+            )
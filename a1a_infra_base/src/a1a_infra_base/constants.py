@@ -6,6 +6,8 @@ This module defines constants for Azure locations and resources using Enums.
 Classes:
     AzureLocation: Enum representing Azure locations with their full names and abbreviations.
     AzureResource: Enum representing Azure resources with their full names and abbreviations.
+    StoragePerformanceProfile: Enum representing the storage account kind, tier and replication combinations of a
+        data lake layer.
 """
 
 from enum import Enum
@@ -79,6 +81,10 @@ class AzureResource(Enum):
     RESOURCE_GROUP = "resource_group", "rg"
     STORAGE_ACCOUNT = "storage_account", "sa"
     MANAGEMENT_LOCK = "management_lock", "lock"
+    PRIVATE_ENDPOINT = "private_endpoint", "pep"
+    LOG_ANALYTICS_WORKSPACE = "log_analytics_workspace", "log"
+    DIAGNOSTIC_SETTING = "diagnostic_setting", "diag"
+    METRIC_ALERT = "metric_alert", "alert"
 
     def __init__(self, full_name: str, abbr: str) -> None:
         """
@@ -129,3 +135,153 @@ class AzureResource(Enum):
         if location is None:
             raise ValueError(f"No AzureResource with full name '{full_name}' found.")
         return location
+
+
+class StoragePerformanceProfile(Enum):
+    """
+    Enum representing the storage account kind, tier and replication combinations of a data lake layer.
+
+    Every profile enables the hierarchical namespace. The premium profiles use BlockBlobStorage accounts, which have
+    low and consistent latency for small-file writes and reads but only support locally or zone-redundant replication
+    and have no access tiers.
+    """
+
+    STANDARD_HNS = (
+        "standard-hns",
+        "StorageV2",
+        "Standard",
+        ("LRS", "ZRS", "GRS", "RAGRS", "GZRS", "RAGZRS"),
+        ("Hot", "Cool", "Cold"),
+    )
+    PREMIUM_HNS = ("premium-hns", "BlockBlobStorage", "Premium", ("LRS",), ())
+    PREMIUM_ZRS = ("premium-zrs", "BlockBlobStorage", "Premium", ("ZRS",), ())
+
+    def __init__(
+        self,
+        full_name: str,
+        account_kind: str,
+        account_tier: str,
+        replication_types: tuple[str, ...],
+        access_tiers: tuple[str, ...],
+    ) -> None:
+        """
+        Initialize the StoragePerformanceProfile enum with the combinations Azure allows.
+
+        Args:
+            full_name (str): The full name of the profile.
+            account_kind (str): The storage account kind.
+            account_tier (str): The storage account tier.
+            replication_types (tuple[str, ...]): The allowed replication types, the first one is the default.
+            access_tiers (tuple[str, ...]): The allowed access tiers, empty if the kind has no access tiers.
+        """
+        self._full_name = full_name
+        self._account_kind = account_kind
+        self._account_tier = account_tier
+        self._replication_types = replication_types
+        self._access_tiers = access_tiers
+
+    @property
+    def full_name(self) -> str:
+        """
+        Get the full name of the profile.
+
+        Returns:
+            str: The full name of the profile.
+        """
+        return self._full_name
+
+    @property
+    def account_kind(self) -> str:
+        """
+        Get the storage account kind of the profile.
+
+        Returns:
+            str: The storage account kind.
+        """
+        return self._account_kind
+
+    @property
+    def account_tier(self) -> str:
+        """
+        Get the storage account tier of the profile.
+
+        Returns:
+            str: The storage account tier.
+        """
+        return self._account_tier
+
+    @property
+    def replication_types(self) -> tuple[str, ...]:
+        """
+        Get the replication types allowed by the profile, the first one is the default.
+
+        Returns:
+            tuple[str, ...]: The allowed replication types.
+        """
+        return self._replication_types
+
+    @property
+    def access_tiers(self) -> tuple[str, ...]:
+        """
+        Get the access tiers allowed by the profile.
+
+        Returns:
+            tuple[str, ...]: The allowed access tiers, empty if the kind has no access tiers.
+        """
+        return self._access_tiers
+
+    def validate(
+        self,
+        account_kind: str | None,
+        account_tier: str,
+        account_replication_type: str,
+        access_tier: str | None,
+        is_hns_enabled: bool | None,
+    ) -> None:
+        """
+        Validate a storage account configuration against the profile.
+
+        Args:
+            account_kind (str | None): The storage account kind.
+            account_tier (str): The storage account tier.
+            account_replication_type (str): The replication type.
+            access_tier (str | None): The access tier.
+            is_hns_enabled (bool | None): Whether hierarchical namespace is enabled.
+
+        Raises:
+            ValueError: If the configuration does not match the profile.
+        """
+        errors: list[str] = []
+        if account_kind != self.account_kind:
+            errors.append(f"account_kind must be '{self.account_kind}', got '{account_kind}'")
+        if account_tier != self.account_tier:
+            errors.append(f"account_tier must be '{self.account_tier}', got '{account_tier}'")
+        if account_replication_type not in self.replication_types:
+            errors.append(
+                f"account_replication_type must be one of {self.replication_types}, got '{account_replication_type}'"
+            )
+        if access_tier is not None and access_tier not in self.access_tiers:
+            errors.append(f"access_tier must be one of {self.access_tiers or (None,)}, got '{access_tier}'")
+        if not is_hns_enabled:
+            errors.append("is_hns_enabled must be true")
+        if errors:
+            raise ValueError(f"Storage performance profile '{self.full_name}': {'; '.join(errors)}.")
+
+    @classmethod
+    def from_full_name(cls, full_name: str) -> Self:
+        """
+        Get the StoragePerformanceProfile enum member from the full name.
+
+        Args:
+            full_name (str): The full name of the profile, e.g. `premium-hns`.
+
+        Returns:
+            StoragePerformanceProfile: The corresponding StoragePerformanceProfile enum member.
+
+        Raises:
+            ValueError: If no matching StoragePerformanceProfile is found.
+        """
+        profile = next((profile for profile in cls if profile.full_name == full_name), None)
+        if profile is None:
+            raise ValueError(f"No StoragePerformanceProfile with full name '{full_name}' found.")
+        return profile
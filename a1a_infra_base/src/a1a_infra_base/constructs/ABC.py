@@ -6,6 +6,7 @@ This module defines abstract base classes for construct configurations and const
 Classes:
     CombinedMeta: Meta class combining JSIIMeta and ABCMeta.
     ConstructConfigABC: Abstract base class for construct configuration classes.
+    LazyConfigABC: Abstract base class for configuration classes that decode their sections on first access.
     ConstructABC: Abstract base class for constructs.
     DetachedConstructABC: Abstract base class for constructs without dynamically attached resources.
     AttachedConstructABC: Abstract base class for constructs with dynamically attached resources.
@@ -44,6 +45,37 @@ class ConstructConfigABC(ABC):
         """
 
 
+class LazyConfigABC(ABC):
+    """
+    Abstract base class for configuration classes that decode their sections on first access.
+
+    A lazy configuration keeps the raw configuration dictionary. Each nested section is decoded with the same from_dict
+    as its eager counterpart when first accessed and cached afterwards, so validation errors surface on access instead
+    of on construction.
+
+    Methods:
+        materialize: Decode all sections and return the eager configuration instance.
+    """
+
+    def __init__(self, dict_: dict[str, Any]) -> None:
+        """
+        Initializes the lazy configuration.
+
+        Args:
+            dict_ (dict[str, Any]): The raw configuration dictionary.
+        """
+        self.dict_: dict[str, Any] = dict_
+
+    @abstractmethod
+    def materialize(self) -> Any:
+        """
+        Decode all sections and return the eager configuration instance.
+
+        Returns:
+            Any: A fully-initialized eager configuration instance.
+        """
+
+
 class CombinedMeta(JSIIMeta, ABCMeta):
     """
     Meta class combining CDKTF.Construct and ABCMeta.
@@ -0,0 +1,120 @@
+"""
+Module diagnostic_setting
+
+This module defines the DiagnosticSettingL0 class and the DiagnosticSettingL0Config class,
+which are responsible for sending the logs and metrics of an Azure resource to a Log Analytics workspace.
+
+Classes:
+    DiagnosticSettingL0: A level 0 construct that creates and manages a diagnostic setting.
+    DiagnosticSettingL0Config: A configuration class for DiagnosticSettingL0.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from cdktf_cdktf_provider_azurerm.monitor_diagnostic_setting import (
+    MonitorDiagnosticSetting,
+    MonitorDiagnosticSettingEnabledLog,
+    MonitorDiagnosticSettingEnabledMetric,
+)
+
+from a1a_infra_base.constants import AzureResource
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.logger import setup_logger
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+LOG_CATEGORIES_KEY: Final[str] = "log_categories"
+METRIC_CATEGORIES_KEY: Final[str] = "metric_categories"
+
+
+@dataclass
+class DiagnosticSettingL0Config(ConstructConfigABC):
+    """
+    A configuration class for DiagnosticSettingL0.
+
+    Attributes:
+        log_categories (list[str]): The log categories to collect, e.g. `StorageRead`.
+        metric_categories (list[str]): The metric categories to collect, e.g. `Transaction`.
+    """
+
+    log_categories: list[str] = field(default_factory=list)
+    metric_categories: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a DiagnosticSettingL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "log_categories": ["<log category>"],
+            "metric_categories": ["<metric category>"]
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing diagnostic setting configuration.
+
+        Returns:
+            DiagnosticSettingL0Config: A fully-initialized DiagnosticSettingL0Config.
+        """
+        log_categories = list(dict_.get(LOG_CATEGORIES_KEY, []))
+        metric_categories = list(dict_.get(METRIC_CATEGORIES_KEY, []))
+        return cls(log_categories=log_categories, metric_categories=metric_categories)
+
+
+class DiagnosticSettingL0(Construct, ConstructABC, metaclass=CombinedMeta):
+    """
+    A level 0 construct that sends the logs and metrics of an Azure resource to a Log Analytics workspace.
+
+    Attributes:
+        diagnostic_setting (MonitorDiagnosticSetting): The diagnostic setting.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        _: str,  # unused env parameter; only present for consistency and to match signature
+        config: DiagnosticSettingL0Config,
+        target_resource_id: str,
+        resource_name: str,
+        log_analytics_workspace_id: str,
+    ) -> None:
+        """
+        Initializes the DiagnosticSettingL0 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            config (DiagnosticSettingL0Config): The configuration for the diagnostic setting.
+            target_resource_id (str): The ID of the resource to collect logs and metrics of.
+            resource_name (str): The name of the resource to collect logs and metrics of.
+            log_analytics_workspace_id (str): The ID of the workspace to send the logs and metrics to.
+        """
+        super().__init__(scope, id_)
+
+        self.full_name = f"{resource_name}-{AzureResource.DIAGNOSTIC_SETTING.abbr}"
+
+        self._diagnostic_setting = MonitorDiagnosticSetting(
+            self,
+            "MonitorDiagnosticSetting",
+            name=self.full_name,
+            target_resource_id=target_resource_id,
+            log_analytics_workspace_id=log_analytics_workspace_id,
+            enabled_log=[MonitorDiagnosticSettingEnabledLog(category=category) for category in config.log_categories]
+            or None,
+            enabled_metric=[
+                MonitorDiagnosticSettingEnabledMetric(category=category) for category in config.metric_categories
+            ]
+            or None,
+        )
+
+    @property
+    def diagnostic_setting(self) -> MonitorDiagnosticSetting:
+        """Gets the diagnostic setting."""
+        return self._diagnostic_setting
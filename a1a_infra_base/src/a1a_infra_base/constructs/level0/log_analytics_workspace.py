@@ -0,0 +1,152 @@
+"""
+Module log_analytics_workspace
+
+This module defines the LogAnalyticsWorkspaceL0 class and the LogAnalyticsWorkspaceL0Config class,
+which are responsible for creating and managing an Azure Log Analytics workspace.
+
+Classes:
+    LogAnalyticsWorkspaceL0: A level 0 construct that creates and manages a Log Analytics workspace.
+    LogAnalyticsWorkspaceL0Config: A configuration class for LogAnalyticsWorkspaceL0.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Final, Self
+
+from cdktf_cdktf_provider_azurerm.log_analytics_workspace import LogAnalyticsWorkspace
+
+from a1a_infra_base.constants import AzureLocation, AzureResource
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.logger import setup_logger
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+NAME_KEY: Final[str] = "name"
+LOCATION_KEY: Final[str] = "location"
+SEQUENCE_NUMBER_KEY: Final[str] = "sequence_number"
+SKU_KEY: Final[str] = "sku"
+RETENTION_IN_DAYS_KEY: Final[str] = "retention_in_days"
+DAILY_QUOTA_GB_KEY: Final[str] = "daily_quota_gb"
+
+
+@dataclass
+class LogAnalyticsWorkspaceL0Config(ConstructConfigABC):
+    """
+    A configuration class for LogAnalyticsWorkspaceL0.
+
+    Attributes:
+        name (str): The name of the workspace.
+        location (AzureLocation): The Azure location.
+        sequence_number (str): The sequence number.
+        sku (str): The pricing tier of the workspace.
+        retention_in_days (int): The number of days the collected logs and metrics are retained.
+        daily_quota_gb (float | None): The daily ingestion cap in GB, None for no cap.
+    """
+
+    name: str
+    location: AzureLocation
+    sequence_number: str
+    sku: str = "PerGB2018"
+    retention_in_days: int = 30
+    daily_quota_gb: float | None = None
+
+    def full_name(self, env: str) -> str:
+        """
+        Generates the full name for the workspace.
+
+        Args:
+            env (str): The environment name.
+
+        Returns:
+            str: The full name of the workspace.
+        """
+        return (
+            f"{AzureResource.LOG_ANALYTICS_WORKSPACE.abbr}-{self.name}-{env}-{self.location.abbr}-"
+            f"{self.sequence_number}"
+        )
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a LogAnalyticsWorkspaceL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "name": "<workspace name>",
+            "location": "<AzureLocation full name>",
+            "sequence_number": "<sequence number>",
+            "sku": "<pricing tier>",
+            "retention_in_days": <days>,
+            "daily_quota_gb": <GB>
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing workspace configuration.
+
+        Returns:
+            LogAnalyticsWorkspaceL0Config: A fully-initialized LogAnalyticsWorkspaceL0Config.
+        """
+        name = dict_[NAME_KEY]
+        location = AzureLocation.from_full_name(dict_[LOCATION_KEY])
+        sequence_number = dict_[SEQUENCE_NUMBER_KEY]
+        sku = dict_.get(SKU_KEY, cls.sku)
+        retention_in_days = dict_.get(RETENTION_IN_DAYS_KEY, cls.retention_in_days)
+        daily_quota_gb = dict_.get(DAILY_QUOTA_GB_KEY, cls.daily_quota_gb)
+        return cls(
+            name=name,
+            location=location,
+            sequence_number=sequence_number,
+            sku=sku,
+            retention_in_days=retention_in_days,
+            daily_quota_gb=daily_quota_gb,
+        )
+
+
+class LogAnalyticsWorkspaceL0(Construct, ConstructABC, metaclass=CombinedMeta):
+    """
+    A level 0 construct that creates and manages an Azure Log Analytics workspace.
+
+    Attributes:
+        log_analytics_workspace (LogAnalyticsWorkspace): The Log Analytics workspace.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        config: LogAnalyticsWorkspaceL0Config,
+        resource_group_name: str,
+    ) -> None:
+        """
+        Initializes the LogAnalyticsWorkspaceL0 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            env (str): The environment name.
+            config (LogAnalyticsWorkspaceL0Config): The configuration for the workspace.
+            resource_group_name (str): The name of the resource group to create the workspace in.
+        """
+        super().__init__(scope, id_)
+
+        self.full_name = config.full_name(env)
+
+        self._log_analytics_workspace = LogAnalyticsWorkspace(
+            self,
+            f"LogAnalyticsWorkspace_{self.full_name}",
+            name=self.full_name,
+            location=config.location.full_name,
+            resource_group_name=resource_group_name,
+            sku=config.sku,
+            retention_in_days=config.retention_in_days,
+            daily_quota_gb=config.daily_quota_gb,
+        )
+
+    @property
+    def log_analytics_workspace(self) -> LogAnalyticsWorkspace:
+        """Gets the Log Analytics workspace."""
+        return self._log_analytics_workspace
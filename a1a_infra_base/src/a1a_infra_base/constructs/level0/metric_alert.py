@@ -0,0 +1,213 @@
+"""
+Module metric_alert
+
+This module defines the MetricAlertL0 class and the MetricAlertL0Config class,
+which are responsible for creating and managing an Azure Monitor metric alert on a single metric of a resource.
+
+Classes:
+    MetricAlertL0: A level 0 construct that creates and manages a metric alert.
+    MetricAlertL0Config: A configuration class for MetricAlertL0.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from cdktf_cdktf_provider_azurerm.monitor_metric_alert import (
+    MonitorMetricAlert,
+    MonitorMetricAlertAction,
+    MonitorMetricAlertCriteria,
+    MonitorMetricAlertCriteriaDimension,
+)
+
+from a1a_infra_base.constants import AzureResource
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.logger import setup_logger
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+NAME_KEY: Final[str] = "name"
+METRIC_NAMESPACE_KEY: Final[str] = "metric_namespace"
+METRIC_NAME_KEY: Final[str] = "metric_name"
+AGGREGATION_KEY: Final[str] = "aggregation"
+OPERATOR_KEY: Final[str] = "operator"
+THRESHOLD_KEY: Final[str] = "threshold"
+DIMENSIONS_KEY: Final[str] = "dimensions"
+SEVERITY_KEY: Final[str] = "severity"
+WINDOW_SIZE_KEY: Final[str] = "window_size"
+FREQUENCY_KEY: Final[str] = "frequency"
+DESCRIPTION_KEY: Final[str] = "description"
+
+AGGREGATIONS: Final[tuple[str, ...]] = ("Average", "Count", "Minimum", "Maximum", "Total")
+OPERATORS: Final[tuple[str, ...]] = ("Equals", "GreaterThan", "GreaterThanOrEqual", "LessThan", "LessThanOrEqual")
+# The window sizes and evaluation frequencies accepted by Azure Monitor, in ISO 8601 durations.
+WINDOW_SIZES: Final[tuple[str, ...]] = ("PT1M", "PT5M", "PT15M", "PT30M", "PT1H", "PT6H", "PT12H", "P1D")
+FREQUENCIES: Final[tuple[str, ...]] = ("PT1M", "PT5M", "PT15M", "PT30M", "PT1H")
+SEVERITIES: Final[range] = range(5)
+
+
+@dataclass
+class MetricAlertL0Config(ConstructConfigABC):
+    """
+    A configuration class for MetricAlertL0.
+
+    Attributes:
+        name (str): The name of the alert, unique per resource, e.g. `throttling`.
+        metric_namespace (str): The namespace of the metric, e.g. `Microsoft.Storage/storageAccounts`.
+        metric_name (str): The name of the metric, e.g. `Transactions`.
+        aggregation (str): The aggregation of the metric over the window.
+        operator (str): The operator comparing the aggregated metric to the threshold.
+        threshold (float): The threshold of the alert.
+        dimensions (dict[str, list[str]]): The dimension values to filter the metric on, e.g.
+            `{"ResponseType": ["ServerBusyError"]}`.
+        severity (int): The severity of the alert, from 0 (critical) to 4 (verbose).
+        window_size (str): The period the metric is aggregated over.
+        frequency (str): How often the alert is evaluated.
+        description (str): The description of the alert.
+    """
+
+    name: str
+    metric_namespace: str
+    metric_name: str
+    aggregation: str
+    operator: str
+    threshold: float
+    dimensions: dict[str, list[str]] = field(default_factory=dict)
+    severity: int = 2
+    window_size: str = "PT5M"
+    frequency: str = "PT1M"
+    description: str = ""
+
+    def __post_init__(self) -> None:
+        """
+        Validate the aggregation, operator, severity, window size and frequency.
+
+        Raises:
+            ValueError: If any of them is not accepted by Azure Monitor.
+        """
+        if self.aggregation not in AGGREGATIONS:
+            raise ValueError(f"Metric alert '{self.name}' aggregation must be one of {', '.join(AGGREGATIONS)}.")
+        if self.operator not in OPERATORS:
+            raise ValueError(f"Metric alert '{self.name}' operator must be one of {', '.join(OPERATORS)}.")
+        if self.severity not in SEVERITIES:
+            raise ValueError(f"Metric alert '{self.name}' severity must be between 0 and 4, got {self.severity}.")
+        if self.window_size not in WINDOW_SIZES:
+            raise ValueError(f"Metric alert '{self.name}' window_size must be one of {', '.join(WINDOW_SIZES)}.")
+        if self.frequency not in FREQUENCIES:
+            raise ValueError(f"Metric alert '{self.name}' frequency must be one of {', '.join(FREQUENCIES)}.")
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a MetricAlertL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "name": "<alert name>",
+            "metric_namespace": "<metric namespace>",
+            "metric_name": "<metric name>",
+            "aggregation": "<aggregation>",
+            "operator": "<operator>",
+            "threshold": <threshold>,
+            "dimensions": {"<dimension name>": ["<dimension value>"]},
+            "severity": <0-4>,
+            "window_size": "<ISO 8601 duration>",
+            "frequency": "<ISO 8601 duration>",
+            "description": "<description>"
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing metric alert configuration.
+
+        Returns:
+            MetricAlertL0Config: A fully-initialized MetricAlertL0Config.
+        """
+        return cls(
+            name=dict_[NAME_KEY],
+            metric_namespace=dict_[METRIC_NAMESPACE_KEY],
+            metric_name=dict_[METRIC_NAME_KEY],
+            aggregation=dict_[AGGREGATION_KEY],
+            operator=dict_[OPERATOR_KEY],
+            threshold=dict_[THRESHOLD_KEY],
+            dimensions=dict_.get(DIMENSIONS_KEY, {}),
+            severity=dict_.get(SEVERITY_KEY, cls.severity),
+            window_size=dict_.get(WINDOW_SIZE_KEY, cls.window_size),
+            frequency=dict_.get(FREQUENCY_KEY, cls.frequency),
+            description=dict_.get(DESCRIPTION_KEY, cls.description),
+        )
+
+
+class MetricAlertL0(Construct, ConstructABC, metaclass=CombinedMeta):
+    """
+    A level 0 construct that creates and manages an Azure Monitor metric alert on a single metric of a resource.
+
+    Attributes:
+        metric_alert (MonitorMetricAlert): The metric alert.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        _: str,  # unused env parameter; only present for consistency and to match signature
+        config: MetricAlertL0Config,
+        resource_id: str,
+        resource_name: str,
+        resource_group_name: str,
+        action_group_ids: list[str] | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Initializes the MetricAlertL0 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            config (MetricAlertL0Config): The configuration for the metric alert.
+            resource_id (str): The ID of the resource to monitor.
+            resource_name (str): The name of the resource to monitor.
+            resource_group_name (str): The name of the resource group to create the alert in.
+            action_group_ids (list[str] | None): The IDs of the action groups notified when the alert fires.
+            tags (dict[str, str] | None): The tags of the alert.
+        """
+        super().__init__(scope, id_)
+
+        self.full_name = f"{resource_name}-{config.name}-{AzureResource.METRIC_ALERT.abbr}"
+
+        self._metric_alert = MonitorMetricAlert(
+            self,
+            "MonitorMetricAlert",
+            name=self.full_name,
+            resource_group_name=resource_group_name,
+            scopes=[resource_id],
+            description=config.description or None,
+            severity=config.severity,
+            window_size=config.window_size,
+            frequency=config.frequency,
+            criteria=[
+                MonitorMetricAlertCriteria(
+                    metric_namespace=config.metric_namespace,
+                    metric_name=config.metric_name,
+                    aggregation=config.aggregation,
+                    operator=config.operator,
+                    threshold=config.threshold,
+                    dimension=[
+                        MonitorMetricAlertCriteriaDimension(name=name, operator="Include", values=values)
+                        for name, values in config.dimensions.items()
+                    ]
+                    or None,
+                )
+            ],
+            action=[MonitorMetricAlertAction(action_group_id=action_group_id) for action_group_id in action_group_ids]
+            if action_group_ids
+            else None,
+            tags=tags,
+        )
+
+    @property
+    def metric_alert(self) -> MonitorMetricAlert:
+        """Gets the metric alert."""
+        return self._metric_alert
@@ -0,0 +1,129 @@
+"""
+Module private_dns_zone
+
+This module defines the PrivateDnsZoneL0 class and the PrivateDnsZoneL0Config class,
+which are responsible for creating and managing a private DNS zone linked to virtual networks.
+
+Classes:
+    PrivateDnsZoneL0: A level 0 construct that creates and manages a private DNS zone and its virtual network links.
+    PrivateDnsZoneL0Config: A configuration class for PrivateDnsZoneL0.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from cdktf_cdktf_provider_azurerm.private_dns_zone import PrivateDnsZone
+from cdktf_cdktf_provider_azurerm.private_dns_zone_virtual_network_link import PrivateDnsZoneVirtualNetworkLink
+
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.logger import setup_logger
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+NAME_KEY: Final[str] = "name"
+VIRTUAL_NETWORK_IDS_KEY: Final[str] = "virtual_network_ids"
+REGISTRATION_ENABLED_KEY: Final[str] = "registration_enabled"
+
+
+@dataclass
+class PrivateDnsZoneL0Config(ConstructConfigABC):
+    """
+    A configuration class for PrivateDnsZoneL0.
+
+    Attributes:
+        name (str): The name of the private DNS zone, e.g. `privatelink.dfs.core.windows.net`.
+        virtual_network_ids (list[str]): The IDs of the virtual networks to link the zone to.
+        registration_enabled (bool): Whether virtual machines in the linked networks register their records.
+    """
+
+    name: str
+    virtual_network_ids: list[str] = field(default_factory=list)
+    registration_enabled: bool = False
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a PrivateDnsZoneL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "name": "<zone name>",
+            "virtual_network_ids": ["<virtual network id>"],
+            "registration_enabled": <bool>
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing private DNS zone configuration.
+
+        Returns:
+            PrivateDnsZoneL0Config: A fully-initialized PrivateDnsZoneL0Config.
+        """
+        name = dict_[NAME_KEY]
+        virtual_network_ids = dict_.get(VIRTUAL_NETWORK_IDS_KEY, [])
+        registration_enabled = dict_.get(REGISTRATION_ENABLED_KEY, cls.registration_enabled)
+        return cls(name=name, virtual_network_ids=virtual_network_ids, registration_enabled=registration_enabled)
+
+
+class PrivateDnsZoneL0(Construct, ConstructABC, metaclass=CombinedMeta):
+    """
+    A level 0 construct that creates and manages a private DNS zone and its virtual network links.
+
+    Attributes:
+        private_dns_zone (PrivateDnsZone): The private DNS zone.
+        virtual_network_links (list[PrivateDnsZoneVirtualNetworkLink]): The links of the zone to virtual networks.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        _: str,  # unused env parameter; only present for consistency and to match signature
+        config: PrivateDnsZoneL0Config,
+        resource_group_name: str,
+    ) -> None:
+        """
+        Initializes the PrivateDnsZoneL0 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            config (PrivateDnsZoneL0Config): The configuration for the private DNS zone.
+            resource_group_name (str): The name of the resource group to create the zone in.
+        """
+        super().__init__(scope, id_)
+
+        self.full_name = config.name
+
+        self._private_dns_zone = PrivateDnsZone(
+            self,
+            "PrivateDnsZone",
+            name=self.full_name,
+            resource_group_name=resource_group_name,
+        )
+
+        self._virtual_network_links: list[PrivateDnsZoneVirtualNetworkLink] = [
+            PrivateDnsZoneVirtualNetworkLink(
+                self,
+                f"PrivateDnsZoneVirtualNetworkLink_{index}",
+                name=f"{self.full_name}-{virtual_network_id.rstrip('/').rsplit('/', 1)[-1]}",
+                private_dns_zone_name=self._private_dns_zone.name,
+                resource_group_name=resource_group_name,
+                virtual_network_id=virtual_network_id,
+                registration_enabled=config.registration_enabled,
+            )
+            for index, virtual_network_id in enumerate(config.virtual_network_ids)
+        ]
+
+    @property
+    def private_dns_zone(self) -> PrivateDnsZone:
+        """Gets the private DNS zone."""
+        return self._private_dns_zone
+
+    @property
+    def virtual_network_links(self) -> list[PrivateDnsZoneVirtualNetworkLink]:
+        """Gets the links of the zone to virtual networks."""
+        return self._virtual_network_links
@@ -0,0 +1,136 @@
+"""
+Module private_endpoint
+
+This module defines the PrivateEndpointL0 class and the PrivateEndpointL0Config class,
+which are responsible for creating and managing a private endpoint for a sub-resource of an Azure resource.
+
+Classes:
+    PrivateEndpointL0: A level 0 construct that creates and manages a private endpoint.
+    PrivateEndpointL0Config: A configuration class for PrivateEndpointL0.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Final, Self
+
+from cdktf_cdktf_provider_azurerm.private_endpoint import (
+    PrivateEndpoint,
+    PrivateEndpointPrivateDnsZoneGroup,
+    PrivateEndpointPrivateServiceConnection,
+)
+
+from a1a_infra_base.constants import AzureLocation, AzureResource
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.logger import setup_logger
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+SUBRESOURCE_NAME_KEY: Final[str] = "subresource_name"
+SUBNET_ID_KEY: Final[str] = "subnet_id"
+
+
+@dataclass
+class PrivateEndpointL0Config(ConstructConfigABC):
+    """
+    A configuration class for PrivateEndpointL0.
+
+    Attributes:
+        subresource_name (str): The sub-resource to connect to, e.g. `dfs` or `blob` for a storage account.
+        subnet_id (str): The ID of the subnet to place the endpoint in.
+    """
+
+    subresource_name: str
+    subnet_id: str
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a PrivateEndpointL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "subresource_name": "<sub-resource>",
+            "subnet_id": "<subnet id>"
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing private endpoint configuration.
+
+        Returns:
+            PrivateEndpointL0Config: A fully-initialized PrivateEndpointL0Config.
+        """
+        subresource_name = dict_[SUBRESOURCE_NAME_KEY]
+        subnet_id = dict_[SUBNET_ID_KEY]
+        return cls(subresource_name=subresource_name, subnet_id=subnet_id)
+
+
+class PrivateEndpointL0(Construct, ConstructABC, metaclass=CombinedMeta):
+    """
+    A level 0 construct that creates and manages a private endpoint for a sub-resource of an Azure resource.
+
+    Attributes:
+        private_endpoint (PrivateEndpoint): The private endpoint.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        _: str,  # unused env parameter; only present for consistency and to match signature
+        config: PrivateEndpointL0Config,
+        resource_id: str,
+        resource_name: str,
+        location: AzureLocation,
+        resource_group_name: str,
+        private_dns_zone_id: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Initializes the PrivateEndpointL0 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            config (PrivateEndpointL0Config): The configuration for the private endpoint.
+            resource_id (str): The ID of the resource to connect to.
+            resource_name (str): The name of the resource to connect to.
+            location (AzureLocation): The Azure location of the endpoint, the same as the one of its subnet.
+            resource_group_name (str): The name of the resource group to create the endpoint in.
+            private_dns_zone_id (str | None): The ID of the private DNS zone to register the endpoint in, if any.
+            tags (dict[str, str] | None): The tags of the endpoint.
+        """
+        super().__init__(scope, id_)
+
+        self.full_name = f"{resource_name}-{config.subresource_name}-{AzureResource.PRIVATE_ENDPOINT.abbr}"
+
+        private_dns_zone_group = None
+        if private_dns_zone_id is not None:
+            private_dns_zone_group = PrivateEndpointPrivateDnsZoneGroup(
+                name=config.subresource_name,
+                private_dns_zone_ids=[private_dns_zone_id],
+            )
+
+        self._private_endpoint = PrivateEndpoint(
+            self,
+            "PrivateEndpoint",
+            name=self.full_name,
+            location=location.full_name,
+            resource_group_name=resource_group_name,
+            subnet_id=config.subnet_id,
+            private_service_connection=PrivateEndpointPrivateServiceConnection(
+                name=self.full_name,
+                private_connection_resource_id=resource_id,
+                subresource_names=[config.subresource_name],
+                is_manual_connection=False,
+            ),
+            private_dns_zone_group=private_dns_zone_group,
+            tags=tags,
+        )
+
+    @property
+    def private_endpoint(self) -> PrivateEndpoint:
+        """Gets the private endpoint."""
+        return self._private_endpoint
@@ -47,6 +47,18 @@ class ResourceGroupL0Config(ConstructConfigABC):
     location: AzureLocation
     sequence_number: str
 
+    def full_name(self, env: str) -> str:
+        """
+        Generates the full name for the resource group.
+
+        Args:
+            env (str): The environment name.
+
+        Returns:
+            str: The full name of the resource group.
+        """
+        return f"{AzureResource.RESOURCE_GROUP.abbr}-{self.name}-{env}-{self.location.abbr}-{self.sequence_number}"
+
     @classmethod
     def from_dict(cls, dict_: dict[str, Any]) -> Self:
         """
@@ -104,9 +116,7 @@ class ResourceGroupL0(Construct, ConstructABC, metaclass=CombinedMeta):
         """
         super().__init__(scope, id_)
 
-        self.full_name = (
-            f"{AzureResource.RESOURCE_GROUP.abbr}-{config.name}-{env}-{config.location.abbr}-{config.sequence_number}"
-        )
+        self.full_name = config.full_name(env)
 
         self._resource_group = ResourceGroup(
             self,
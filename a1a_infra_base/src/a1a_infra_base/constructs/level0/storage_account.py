@@ -7,19 +7,23 @@ which are responsible for creating and managing an Azure storage account with sp
 Classes:
     StorageAccountL0: A level 0 construct that creates and manages an Azure storage account.
     StorageAccountL0Config: A configuration class for StorageAccountL0.
+    NetworkRulesL0Config: A class to represent the network rules configuration.
+    RoutingL0Config: A class to represent the network routing preference configuration.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Final, Self
 
 from cdktf_cdktf_provider_azurerm.storage_account import (
     StorageAccount,
     StorageAccountBlobProperties,
     StorageAccountBlobPropertiesDeleteRetentionPolicy,
+    StorageAccountNetworkRules,
+    StorageAccountRouting,
 )
 
-from a1a_infra_base.constants import AzureLocation, AzureResource
+from a1a_infra_base.constants import AzureLocation, AzureResource, StoragePerformanceProfile
 from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructConfigABC
 from a1a_infra_base.logger import setup_logger
 from constructs import Construct
@@ -41,9 +45,26 @@ IS_HNS_ENABLED_KEY: Final[str] = "is_hns_enabled"
 LOCAL_USER_ENABLED_KEY: Final[str] = "local_user_enabled"
 INFRASTRUCTURE_ENCRYPTION_ENABLED_KEY: Final[str] = "infrastructure_encryption_enabled"
 SFTP_ENABLED_KEY: Final[str] = "sftp_enabled"
+PERFORMANCE_PROFILE_KEY: Final[str] = "performance_profile"
+NFSV3_ENABLED_KEY: Final[str] = "nfsv3_enabled"
+HTTPS_TRAFFIC_ONLY_ENABLED_KEY: Final[str] = "https_traffic_only_enabled"
+TAGS_KEY: Final[str] = "tags"
+NETWORK_RULES_L0_KEY: Final[str] = "network_rules_l0"
+DEFAULT_ACTION_KEY: Final[str] = "default_action"
+BYPASS_KEY: Final[str] = "bypass"
+IP_RULES_KEY: Final[str] = "ip_rules"
+VIRTUAL_NETWORK_SUBNET_IDS_KEY: Final[str] = "virtual_network_subnet_ids"
+ROUTING_L0_KEY: Final[str] = "routing_l0"
+CHOICE_KEY: Final[str] = "choice"
+PUBLISH_INTERNET_ENDPOINTS_KEY: Final[str] = "publish_internet_endpoints"
+PUBLISH_MICROSOFT_ENDPOINTS_KEY: Final[str] = "publish_microsoft_endpoints"
 BLOB_PROPERTIES_L0_KEY: Final[str] = "blob_properties_l0"
 DELETE_RETENTION_POLICY_L0_KEY: Final[str] = "delete_retention_policy_l0"
 DAYS_KEY: Final[str] = "days"
+LAST_ACCESS_TIME_ENABLED_KEY: Final[str] = "last_access_time_enabled"
+
+ACCOUNT_REPLICATION_TYPES: Final[tuple[str, ...]] = ("LRS", "ZRS", "GRS", "RAGRS", "GZRS", "RAGZRS")
+READ_ACCESS_REPLICATION_TYPES: Final[tuple[str, ...]] = ("RAGRS", "RAGZRS")
 
 
 @dataclass
@@ -79,9 +100,12 @@ class BlobPropertiesL0Config:
 
     Attributes:
         delete_retention_policy (DeleteRetentionPolicy): The delete retention policy configuration.
+        last_access_time_enabled (bool): Whether the last access time of blobs is tracked, so lifecycle management
+            rules can tier blobs by their actual read pattern.
     """
 
     delete_retention_policy_l0: DeleteRetentionPolicyL0Config | None = None
+    last_access_time_enabled: bool | None = None
 
     @classmethod
     def from_dict(cls, dict_: dict[str, Any]) -> Self:
@@ -100,8 +124,100 @@ class BlobPropertiesL0Config:
             if DELETE_RETENTION_POLICY_L0_KEY in dict_
             else cls.delete_retention_policy_l0
         )
+        last_access_time_enabled = dict_.get(LAST_ACCESS_TIME_ENABLED_KEY, cls.last_access_time_enabled)
+
+        return cls(
+            delete_retention_policy_l0=delete_retention_policy_l0, last_access_time_enabled=last_access_time_enabled
+        )
+
+
+@dataclass
+class NetworkRulesL0Config:
+    """
+    A class to represent the network rules configuration.
+
+    Attributes:
+        default_action (str): The action for traffic that matches no rule, `Deny` or `Allow`.
+        bypass (list[str]): The traffic that bypasses the rules, e.g. `AzureServices`.
+        ip_rules (list[str]): The public IP addresses or CIDR ranges that are allowed.
+        virtual_network_subnet_ids (list[str]): The IDs of the subnets that are allowed, e.g. the subnet that on-prem
+            HPC clusters reach through ExpressRoute.
+    """
+
+    default_action: str = "Deny"
+    bypass: list[str] = field(default_factory=lambda: ["AzureServices"])
+    ip_rules: list[str] = field(default_factory=list)
+    virtual_network_subnet_ids: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a NetworkRulesL0Config by unpacking parameters from a configuration dictionary.
+
+        Args:
+            dict_ (dict): A dictionary containing network rules configuration.
 
-        return cls(delete_retention_policy_l0=delete_retention_policy_l0)
+        Returns:
+            NetworkRulesL0Config: A fully-initialized NetworkRulesL0Config.
+        """
+        default_action = dict_.get(DEFAULT_ACTION_KEY, cls.default_action)
+        bypass = list(dict_.get(BYPASS_KEY, ["AzureServices"]))
+        ip_rules = list(dict_.get(IP_RULES_KEY, []))
+        virtual_network_subnet_ids = list(dict_.get(VIRTUAL_NETWORK_SUBNET_IDS_KEY, []))
+        return cls(
+            default_action=default_action,
+            bypass=bypass,
+            ip_rules=ip_rules,
+            virtual_network_subnet_ids=virtual_network_subnet_ids,
+        )
+
+
+@dataclass
+class RoutingL0Config:
+    """
+    A class to represent the network routing preference configuration.
+
+    Attributes:
+        choice (str): The routing of the default endpoints, `MicrosoftRouting` to keep traffic on the Microsoft
+            global network up to the point of presence closest to the client, or `InternetRouting` to hand it over
+            to the transit ISP closest to the storage account.
+        publish_internet_endpoints (bool): Whether to publish route-specific endpoints with internet routing.
+        publish_microsoft_endpoints (bool): Whether to publish route-specific endpoints with Microsoft routing.
+    """
+
+    choice: str = "MicrosoftRouting"
+    publish_internet_endpoints: bool = False
+    publish_microsoft_endpoints: bool = False
+
+    def __post_init__(self) -> None:
+        """
+        Validate the routing choice.
+
+        Raises:
+            ValueError: If the choice is not a known routing preference.
+        """
+        if self.choice not in ("MicrosoftRouting", "InternetRouting"):
+            raise ValueError(f"Routing choice '{self.choice}' is not one of MicrosoftRouting, InternetRouting.")
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a RoutingL0Config by unpacking parameters from a configuration dictionary.
+
+        Args:
+            dict_ (dict): A dictionary containing routing configuration.
+
+        Returns:
+            RoutingL0Config: A fully-initialized RoutingL0Config.
+        """
+        choice = dict_.get(CHOICE_KEY, cls.choice)
+        publish_internet_endpoints = dict_.get(PUBLISH_INTERNET_ENDPOINTS_KEY, cls.publish_internet_endpoints)
+        publish_microsoft_endpoints = dict_.get(PUBLISH_MICROSOFT_ENDPOINTS_KEY, cls.publish_microsoft_endpoints)
+        return cls(
+            choice=choice,
+            publish_internet_endpoints=publish_internet_endpoints,
+            publish_microsoft_endpoints=publish_microsoft_endpoints,
+        )
 
 
 @dataclass
@@ -125,6 +241,13 @@ class StorageAccountL0Config(ConstructConfigABC):
         infrastructure_encryption_enabled (bool): Whether infrastructure encryption is enabled.
         sftp_enabled (bool): Whether SFTP is enabled.
         blob_properties (BlobProperties): The blob properties configuration.
+        performance_profile (StoragePerformanceProfile | None): The performance profile the kind, tier, replication
+            and access tier must match. In a configuration dictionary, the profile provides the defaults for them.
+        nfsv3_enabled (bool): Whether NFS 3.0 is enabled, for mounting the account from on-prem bulk ingestion.
+        https_traffic_only_enabled (bool): Whether only HTTPS traffic is allowed, must be disabled for NFS 3.0.
+        network_rules_l0 (NetworkRulesL0Config): The network rules configuration.
+        routing_l0 (RoutingL0Config): The network routing preference configuration.
+        tags (dict[str, str]): The tags of the storage account.
     """
 
     # on changes, also update level1/storage.py
@@ -139,15 +262,79 @@ class StorageAccountL0Config(ConstructConfigABC):
     account_kind: str | None = None
     blob_properties_l0: BlobPropertiesL0Config | None = None
     cross_tenant_replication_enabled: bool | None = False
+    https_traffic_only_enabled: bool | None = True
     infrastructure_encryption_enabled: bool | None = True
     is_hns_enabled: bool | None = None
     local_user_enabled: bool | None = False
+    network_rules_l0: NetworkRulesL0Config | None = None
     nfsv3_enabled: bool | None = False
+    performance_profile: StoragePerformanceProfile | None = None
     public_network_access_enabled: bool | None = False
+    routing_l0: RoutingL0Config | None = None
     sftp_enabled: bool | None = False
     shared_access_key_enabled: bool | None = False
     tags: dict[str, str] | None = None
 
+    def __post_init__(self) -> None:
+        """
+        Validate the storage account configuration: the replication type, the performance profile and the NFS 3.0
+        requirements.
+
+        Raises:
+            ValueError: If the replication type is unknown, or the configuration does not match the performance
+                profile or NFS 3.0 requirements.
+        """
+        if self.account_replication_type not in ACCOUNT_REPLICATION_TYPES:
+            raise ValueError(
+                f"Storage account '{self.name}' has account_replication_type '{self.account_replication_type}', "
+                f"which is not one of {', '.join(ACCOUNT_REPLICATION_TYPES)}."
+            )
+        if self.performance_profile is not None:
+            self.performance_profile.validate(
+                account_kind=self.account_kind,
+                account_tier=self.account_tier,
+                account_replication_type=self.account_replication_type,
+                access_tier=self.access_tier,
+                is_hns_enabled=self.is_hns_enabled,
+            )
+        if self.nfsv3_enabled:
+            self._validate_nfsv3()
+
+    def _validate_nfsv3(self) -> None:
+        """
+        Validate the requirements of NFS 3.0: a hierarchical namespace, no secure transfer requirement and network
+        rules that deny by default. NFS 3.0 has no authentication of its own, so the account is reachable only from
+        the allowed subnets, or only through private endpoints when public network access is disabled.
+
+        Raises:
+            ValueError: If a requirement is not met.
+        """
+        errors: list[str] = []
+        if not self.is_hns_enabled:
+            errors.append("is_hns_enabled must be true")
+        if self.https_traffic_only_enabled:
+            errors.append("https_traffic_only_enabled must be false")
+        if self.network_rules_l0 is None or self.network_rules_l0.default_action != "Deny":
+            errors.append("network_rules_l0 must be set with default_action 'Deny'")
+        elif self.public_network_access_enabled and not self.network_rules_l0.virtual_network_subnet_ids:
+            errors.append("network_rules_l0 must allow at least one subnet while public network access is enabled")
+        if self.network_rules_l0 is not None and self.network_rules_l0.ip_rules:
+            errors.append("network_rules_l0 must not allow public IP ranges, NFS 3.0 is reached through subnets only")
+        if errors:
+            raise ValueError(f"Storage account '{self.name}' with nfsv3_enabled: {'; '.join(errors)}.")
+
+    def full_name(self, env: str) -> str:
+        """
+        Generates the full name for the storage account.
+
+        Args:
+            env (str): The environment name.
+
+        Returns:
+            str: The full name of the storage account.
+        """
+        return f"{AzureResource.STORAGE_ACCOUNT.abbr}{self.name}{env}{self.location.abbr}{self.sequence_number}"
+
     @classmethod
     def from_dict(cls, dict_: dict[str, Any]) -> Self:
         """
@@ -162,21 +349,44 @@ class StorageAccountL0Config(ConstructConfigABC):
         name = dict_[NAME_KEY]
         location = AzureLocation.from_full_name(dict_[LOCATION_KEY])
         sequence_number = dict_[SEQUENCE_NUMBER_KEY]
-        account_replication_type = dict_[ACCOUNT_REPLICATION_TYPE_KEY]
-        account_kind = dict_.get(ACCOUNT_KIND_KEY, cls.account_kind)
-        account_tier = dict_[ACCOUNT_TIER_KEY]
+
+        performance_profile = (
+            StoragePerformanceProfile.from_full_name(dict_[PERFORMANCE_PROFILE_KEY])
+            if PERFORMANCE_PROFILE_KEY in dict_
+            else cls.performance_profile
+        )
+        if performance_profile is None:
+            account_replication_type = dict_[ACCOUNT_REPLICATION_TYPE_KEY]
+            account_kind = dict_.get(ACCOUNT_KIND_KEY, cls.account_kind)
+            account_tier = dict_[ACCOUNT_TIER_KEY]
+            is_hns_enabled = dict_.get(IS_HNS_ENABLED_KEY, cls.is_hns_enabled)
+        else:
+            account_replication_type = dict_.get(ACCOUNT_REPLICATION_TYPE_KEY, performance_profile.replication_types[0])
+            account_kind = dict_.get(ACCOUNT_KIND_KEY, performance_profile.account_kind)
+            account_tier = dict_.get(ACCOUNT_TIER_KEY, performance_profile.account_tier)
+            is_hns_enabled = dict_.get(IS_HNS_ENABLED_KEY, True)
         cross_tenant_replication_enabled = dict_.get(
             CROSS_TENANT_REPLICATION_ENABLED_KEY, cls.cross_tenant_replication_enabled
         )
         access_tier = dict_.get(ACCESS_TIER_KEY, cls.access_tier)
         shared_access_key_enabled = dict_.get(SHARED_ACCESS_KEY_ENABLED_KEY, cls.shared_access_key_enabled)
         public_network_access_enabled = dict_.get(PUBLIC_NETWORK_ACCESS_ENABLED_KEY, cls.public_network_access_enabled)
-        is_hns_enabled = dict_.get(IS_HNS_ENABLED_KEY, cls.is_hns_enabled)
         local_user_enabled = dict_.get(LOCAL_USER_ENABLED_KEY, cls.local_user_enabled)
         infrastructure_encryption_enabled = dict_.get(
             INFRASTRUCTURE_ENCRYPTION_ENABLED_KEY, cls.infrastructure_encryption_enabled
         )
         sftp_enabled = dict_.get(SFTP_ENABLED_KEY, cls.sftp_enabled)
+        nfsv3_enabled = dict_.get(NFSV3_ENABLED_KEY, cls.nfsv3_enabled)
+        https_traffic_only_enabled = dict_.get(HTTPS_TRAFFIC_ONLY_ENABLED_KEY, cls.https_traffic_only_enabled)
+        tags = dict_.get(TAGS_KEY, cls.tags)
+
+        network_rules_l0 = (
+            NetworkRulesL0Config.from_dict(dict_[NETWORK_RULES_L0_KEY])
+            if NETWORK_RULES_L0_KEY in dict_
+            else cls.network_rules_l0
+        )
+
+        routing_l0 = RoutingL0Config.from_dict(dict_[ROUTING_L0_KEY]) if ROUTING_L0_KEY in dict_ else cls.routing_l0
 
         blob_properties_l0 = (
             BlobPropertiesL0Config.from_dict(dict_[BLOB_PROPERTIES_L0_KEY])
@@ -200,6 +410,12 @@ class StorageAccountL0Config(ConstructConfigABC):
             infrastructure_encryption_enabled=infrastructure_encryption_enabled,
             sftp_enabled=sftp_enabled,
             blob_properties_l0=blob_properties_l0,
+            performance_profile=performance_profile,
+            nfsv3_enabled=nfsv3_enabled,
+            https_traffic_only_enabled=https_traffic_only_enabled,
+            network_rules_l0=network_rules_l0,
+            routing_l0=routing_l0,
+            tags=tags,
         )
 
 
@@ -209,6 +425,8 @@ class StorageAccountL0(Construct, metaclass=CombinedMeta):
 
     Attributes:
         storage_account (StorageAccount): The Azure storage account.
+        endpoints (dict[str, str]): The published dfs and blob endpoints per routing variant, and the secondary
+            read endpoints of read-access geo-redundant accounts.
     """
 
     def __init__(
@@ -232,9 +450,7 @@ class StorageAccountL0(Construct, metaclass=CombinedMeta):
         """
         super().__init__(scope, id_)
 
-        self.full_name = (
-            f"{AzureResource.STORAGE_ACCOUNT.abbr}{config.name}{env}{config.location.abbr}{config.sequence_number}"
-        )
+        self.full_name = config.full_name(env)
 
         blob_properties = None
         if config.blob_properties_l0 is not None:
@@ -244,7 +460,27 @@ class StorageAccountL0(Construct, metaclass=CombinedMeta):
                     days=config.blob_properties_l0.delete_retention_policy_l0.days
                 )
 
-            blob_properties = StorageAccountBlobProperties(delete_retention_policy=delete_retention_policy)
+            blob_properties = StorageAccountBlobProperties(
+                delete_retention_policy=delete_retention_policy,
+                last_access_time_enabled=config.blob_properties_l0.last_access_time_enabled,
+            )
+
+        network_rules = None
+        if config.network_rules_l0 is not None:
+            network_rules = StorageAccountNetworkRules(
+                default_action=config.network_rules_l0.default_action,
+                bypass=config.network_rules_l0.bypass,
+                ip_rules=config.network_rules_l0.ip_rules,
+                virtual_network_subnet_ids=config.network_rules_l0.virtual_network_subnet_ids,
+            )
+
+        routing = None
+        if config.routing_l0 is not None:
+            routing = StorageAccountRouting(
+                choice=config.routing_l0.choice,
+                publish_internet_endpoints=config.routing_l0.publish_internet_endpoints,
+                publish_microsoft_endpoints=config.routing_l0.publish_microsoft_endpoints,
+            )
 
         self._storage_account = StorageAccount(
             self,
@@ -264,9 +500,33 @@ class StorageAccountL0(Construct, metaclass=CombinedMeta):
             infrastructure_encryption_enabled=config.infrastructure_encryption_enabled,
             sftp_enabled=config.sftp_enabled,
             blob_properties=blob_properties,
+            nfsv3_enabled=config.nfsv3_enabled,
+            https_traffic_only_enabled=config.https_traffic_only_enabled,
+            network_rules=network_rules,
+            routing=routing,
+            tags=config.tags,
         )
 
+        self._endpoints: dict[str, str] = {
+            "dfs": self._storage_account.primary_dfs_endpoint,
+            "blob": self._storage_account.primary_blob_endpoint,
+        }
+        if config.routing_l0 is not None and config.routing_l0.publish_microsoft_endpoints:
+            self._endpoints["dfs_microsoft"] = self._storage_account.primary_dfs_microsoft_endpoint
+            self._endpoints["blob_microsoft"] = self._storage_account.primary_blob_microsoft_endpoint
+        if config.routing_l0 is not None and config.routing_l0.publish_internet_endpoints:
+            self._endpoints["dfs_internet"] = self._storage_account.primary_dfs_internet_endpoint
+            self._endpoints["blob_internet"] = self._storage_account.primary_blob_internet_endpoint
+        if config.account_replication_type in READ_ACCESS_REPLICATION_TYPES:
+            self._endpoints["dfs_secondary"] = self._storage_account.secondary_dfs_endpoint
+            self._endpoints["blob_secondary"] = self._storage_account.secondary_blob_endpoint
+
     @property
     def storage_account(self) -> StorageAccount:
         """Gets the Azure storage account."""
         return self._storage_account
+
+    @property
+    def endpoints(self) -> dict[str, str]:
+        """Gets the published dfs and blob endpoints per variant, e.g. `dfs`, `dfs_microsoft` and `dfs_secondary`."""
+        return self._endpoints
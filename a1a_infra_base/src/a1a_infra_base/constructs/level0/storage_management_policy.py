@@ -0,0 +1,306 @@
+"""
+Module storage_management_policy
+
+This module defines the StorageManagementPolicyL0 class, the StorageManagementPolicyL0Config class and the
+ManagementPolicyRuleL0Config class, which are responsible for creating and managing the lifecycle management policy
+of an Azure storage account.
+
+Classes:
+    StorageManagementPolicyL0: A level 0 construct that creates and manages a lifecycle management policy.
+    StorageManagementPolicyL0Config: A configuration class for StorageManagementPolicyL0.
+    ManagementPolicyRuleL0Config: A class to represent a rule of the lifecycle management policy.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from cdktf_cdktf_provider_azurerm.storage_management_policy import (
+    StorageManagementPolicy,
+    StorageManagementPolicyRule,
+    StorageManagementPolicyRuleActions,
+    StorageManagementPolicyRuleActionsBaseBlob,
+    StorageManagementPolicyRuleActionsSnapshot,
+    StorageManagementPolicyRuleActionsVersion,
+    StorageManagementPolicyRuleFilters,
+)
+
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.logger import setup_logger
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+RULES_KEY: Final[str] = "rules"
+NAME_KEY: Final[str] = "name"
+ENABLED_KEY: Final[str] = "enabled"
+CONTAINER_NAMES_KEY: Final[str] = "container_names"
+PREFIXES_KEY: Final[str] = "prefixes"
+BLOB_TYPES_KEY: Final[str] = "blob_types"
+TIER_TO_COOL_AFTER_DAYS_SINCE_LAST_ACCESS_KEY: Final[str] = "tier_to_cool_after_days_since_last_access"
+TIER_TO_COLD_AFTER_DAYS_SINCE_LAST_ACCESS_KEY: Final[str] = "tier_to_cold_after_days_since_last_access"
+TIER_TO_ARCHIVE_AFTER_DAYS_SINCE_LAST_ACCESS_KEY: Final[str] = "tier_to_archive_after_days_since_last_access"
+AUTO_TIER_TO_HOT_FROM_COOL_ENABLED_KEY: Final[str] = "auto_tier_to_hot_from_cool_enabled"
+DELETE_AFTER_DAYS_SINCE_MODIFICATION_KEY: Final[str] = "delete_after_days_since_modification"
+DELETE_SNAPSHOTS_AFTER_DAYS_KEY: Final[str] = "delete_snapshots_after_days"
+DELETE_VERSIONS_AFTER_DAYS_KEY: Final[str] = "delete_versions_after_days"
+
+
+@dataclass
+class ManagementPolicyRuleL0Config:
+    """
+    A class to represent a rule of the lifecycle management policy.
+
+    Tiering follows the last access time of each blob, which requires `last_access_time_enabled` on the blob
+    properties of the storage account.
+
+    Attributes:
+        name (str): The name of the rule.
+        enabled (bool): Whether the rule is enabled.
+        container_names (list[str]): The containers the rule applies to, all containers if empty.
+        prefixes (list[str]): The blob prefixes within the containers the rule applies to, whole containers if empty.
+        blob_types (list[str]): The blob types the rule applies to.
+        tier_to_cool_after_days_since_last_access (int | None): Days without access before moving to the cool tier.
+        tier_to_cold_after_days_since_last_access (int | None): Days without access before moving to the cold tier.
+        tier_to_archive_after_days_since_last_access (int | None): Days without access before moving to the archive
+            tier.
+        auto_tier_to_hot_from_cool_enabled (bool | None): Whether a cool blob moves back to the hot tier when read.
+        delete_after_days_since_modification (int | None): Days without modification before deleting the blob.
+        delete_snapshots_after_days (int | None): Days after creation before deleting a snapshot.
+        delete_versions_after_days (int | None): Days after creation before deleting a previous version.
+    """
+
+    name: str
+    enabled: bool = True
+    container_names: list[str] = field(default_factory=list)
+    prefixes: list[str] = field(default_factory=list)
+    blob_types: list[str] = field(default_factory=lambda: ["blockBlob"])
+    tier_to_cool_after_days_since_last_access: int | None = None
+    tier_to_cold_after_days_since_last_access: int | None = None
+    tier_to_archive_after_days_since_last_access: int | None = None
+    auto_tier_to_hot_from_cool_enabled: bool | None = None
+    delete_after_days_since_modification: int | None = None
+    delete_snapshots_after_days: int | None = None
+    delete_versions_after_days: int | None = None
+
+    def __post_init__(self) -> None:
+        """
+        Validate the filters and that each tier follows the warmer tiers.
+
+        Raises:
+            ValueError: If prefixes are given without containers, or a tier is reached before a warmer one.
+        """
+        if self.prefixes and not self.container_names:
+            raise ValueError(f"Management policy rule '{self.name}' has prefixes but no container_names.")
+
+        tiers = [
+            (tier, days)
+            for tier, days in (
+                ("cool", self.tier_to_cool_after_days_since_last_access),
+                ("cold", self.tier_to_cold_after_days_since_last_access),
+                ("archive", self.tier_to_archive_after_days_since_last_access),
+            )
+            if days is not None
+        ]
+        for (warmer_tier, warmer_days), (colder_tier, colder_days) in zip(tiers, tiers[1:], strict=False):
+            if colder_days <= warmer_days:
+                raise ValueError(
+                    f"Management policy rule '{self.name}' moves to {colder_tier} after {colder_days} days, which must "
+                    f"be later than to {warmer_tier} after {warmer_days} days."
+                )
+
+    @property
+    def tiers_on_last_access(self) -> bool:
+        """Gets whether the rule tiers blobs based on their last access time."""
+        return any(
+            days is not None
+            for days in (
+                self.tier_to_cool_after_days_since_last_access,
+                self.tier_to_cold_after_days_since_last_access,
+                self.tier_to_archive_after_days_since_last_access,
+            )
+        )
+
+    @property
+    def prefix_match(self) -> list[str]:
+        """Gets the prefixes to match, each starting with a container name, e.g. `bronze/sales/`."""
+        return [
+            f"{container_name}/{prefix}"
+            for container_name in self.container_names
+            for prefix in (self.prefixes or [""])
+        ]
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a ManagementPolicyRuleL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "name": "<rule name>",
+            "container_names": ["<container name>"],
+            "prefixes": ["<prefix>"],
+            "tier_to_cool_after_days_since_last_access": <days>,
+            "tier_to_cold_after_days_since_last_access": <days>,
+            "tier_to_archive_after_days_since_last_access": <days>,
+            "delete_snapshots_after_days": <days>,
+            "delete_versions_after_days": <days>
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing management policy rule configuration.
+
+        Returns:
+            ManagementPolicyRuleL0Config: A fully-initialized ManagementPolicyRuleL0Config.
+        """
+        return cls(
+            name=dict_[NAME_KEY],
+            enabled=dict_.get(ENABLED_KEY, cls.enabled),
+            container_names=list(dict_.get(CONTAINER_NAMES_KEY, [])),
+            prefixes=list(dict_.get(PREFIXES_KEY, [])),
+            blob_types=list(dict_.get(BLOB_TYPES_KEY, ["blockBlob"])),
+            tier_to_cool_after_days_since_last_access=dict_.get(
+                TIER_TO_COOL_AFTER_DAYS_SINCE_LAST_ACCESS_KEY, cls.tier_to_cool_after_days_since_last_access
+            ),
+            tier_to_cold_after_days_since_last_access=dict_.get(
+                TIER_TO_COLD_AFTER_DAYS_SINCE_LAST_ACCESS_KEY, cls.tier_to_cold_after_days_since_last_access
+            ),
+            tier_to_archive_after_days_since_last_access=dict_.get(
+                TIER_TO_ARCHIVE_AFTER_DAYS_SINCE_LAST_ACCESS_KEY, cls.tier_to_archive_after_days_since_last_access
+            ),
+            auto_tier_to_hot_from_cool_enabled=dict_.get(
+                AUTO_TIER_TO_HOT_FROM_COOL_ENABLED_KEY, cls.auto_tier_to_hot_from_cool_enabled
+            ),
+            delete_after_days_since_modification=dict_.get(
+                DELETE_AFTER_DAYS_SINCE_MODIFICATION_KEY, cls.delete_after_days_since_modification
+            ),
+            delete_snapshots_after_days=dict_.get(DELETE_SNAPSHOTS_AFTER_DAYS_KEY, cls.delete_snapshots_after_days),
+            delete_versions_after_days=dict_.get(DELETE_VERSIONS_AFTER_DAYS_KEY, cls.delete_versions_after_days),
+        )
+
+
+@dataclass
+class StorageManagementPolicyL0Config(ConstructConfigABC):
+    """
+    A configuration class for StorageManagementPolicyL0.
+
+    Attributes:
+        rules (list[ManagementPolicyRuleL0Config]): The rules of the lifecycle management policy.
+    """
+
+    rules: list[ManagementPolicyRuleL0Config] = field(default_factory=list)
+
+    @property
+    def tiers_on_last_access(self) -> bool:
+        """Gets whether any rule tiers blobs based on their last access time."""
+        return any(rule.tiers_on_last_access for rule in self.rules)
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a StorageManagementPolicyL0Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "rules": [<rule>]
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing management policy configuration.
+
+        Returns:
+            StorageManagementPolicyL0Config: A fully-initialized StorageManagementPolicyL0Config.
+        """
+        rules = [ManagementPolicyRuleL0Config.from_dict(rule) for rule in dict_.get(RULES_KEY, [])]
+        return cls(rules=rules)
+
+
+class StorageManagementPolicyL0(Construct, ConstructABC, metaclass=CombinedMeta):
+    """
+    A level 0 construct that creates and manages the lifecycle management policy of an Azure storage account.
+
+    Attributes:
+        storage_management_policy (StorageManagementPolicy): The lifecycle management policy.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        _: str,  # unused env parameter; only present for consistency and to match signature
+        config: StorageManagementPolicyL0Config,
+        storage_account_id: str,
+    ) -> None:
+        """
+        Initializes the StorageManagementPolicyL0 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            config (StorageManagementPolicyL0Config): The configuration for the lifecycle management policy.
+            storage_account_id (str): The ID of the storage account to apply the policy to.
+        """
+        super().__init__(scope, id_)
+
+        self._storage_management_policy = StorageManagementPolicy(
+            self,
+            "StorageManagementPolicy",
+            storage_account_id=storage_account_id,
+            rule=[self._rule(rule_config) for rule_config in config.rules],
+        )
+
+    @staticmethod
+    def _rule(config: ManagementPolicyRuleL0Config) -> StorageManagementPolicyRule:
+        """
+        Create a rule of the lifecycle management policy.
+
+        Args:
+            config (ManagementPolicyRuleL0Config): The configuration of the rule.
+
+        Returns:
+            StorageManagementPolicyRule: The rule.
+        """
+        base_blob = None
+        if config.tiers_on_last_access or config.delete_after_days_since_modification is not None:
+            base_blob = StorageManagementPolicyRuleActionsBaseBlob(
+                tier_to_cool_after_days_since_last_access_time_greater_than=(
+                    config.tier_to_cool_after_days_since_last_access
+                ),
+                tier_to_cold_after_days_since_last_access_time_greater_than=(
+                    config.tier_to_cold_after_days_since_last_access
+                ),
+                tier_to_archive_after_days_since_last_access_time_greater_than=(
+                    config.tier_to_archive_after_days_since_last_access
+                ),
+                auto_tier_to_hot_from_cool_enabled=config.auto_tier_to_hot_from_cool_enabled,
+                delete_after_days_since_modification_greater_than=config.delete_after_days_since_modification,
+            )
+
+        snapshot = None
+        if config.delete_snapshots_after_days is not None:
+            snapshot = StorageManagementPolicyRuleActionsSnapshot(
+                delete_after_days_since_creation_greater_than=config.delete_snapshots_after_days
+            )
+
+        version = None
+        if config.delete_versions_after_days is not None:
+            version = StorageManagementPolicyRuleActionsVersion(
+                delete_after_days_since_creation=config.delete_versions_after_days
+            )
+
+        return StorageManagementPolicyRule(
+            name=config.name,
+            enabled=config.enabled,
+            filters=StorageManagementPolicyRuleFilters(
+                blob_types=config.blob_types,
+                prefix_match=config.prefix_match or None,
+            ),
+            actions=StorageManagementPolicyRuleActions(base_blob=base_blob, snapshot=snapshot, version=version),
+        )
+
+    @property
+    def storage_management_policy(self) -> StorageManagementPolicy:
+        """Gets the lifecycle management policy."""
+        return self._storage_management_policy
@@ -0,0 +1,307 @@
+"""
+Module alerts
+
+This module defines the StorageAlertsL1 class and the StorageAlertsL1Config class,
+which are responsible for alerting when a storage account approaches its scalability targets: the request rate,
+the ingress and egress bandwidth, the end-to-end latency and throttling.
+
+Classes:
+    StorageAlertsL1Config: A configuration class for StorageAlertsL1.
+    StorageAlertsL1: A level 1 construct that creates the metric alerts of a storage account.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructConfigABC
+from a1a_infra_base.constructs.level0.metric_alert import MetricAlertL0, MetricAlertL0Config
+from constructs import Construct
+
+# Constants for dictionary keys
+# root key
+STORAGE_ALERTS_L1_KEY: Final[str] = "alerts"
+# attributes
+ACTION_GROUP_IDS_KEY: Final[str] = "action_group_ids"
+WINDOW_SIZE_MINUTES_KEY: Final[str] = "window_size_minutes"
+UTILIZATION_KEY: Final[str] = "utilization"
+REQUEST_RATE_TARGET_PER_SECOND_KEY: Final[str] = "request_rate_target_per_second"
+INGRESS_LIMIT_GBPS_KEY: Final[str] = "ingress_limit_gbps"
+EGRESS_LIMIT_GBPS_KEY: Final[str] = "egress_limit_gbps"
+SUCCESS_E2E_LATENCY_MS_KEY: Final[str] = "success_e2e_latency_ms"
+SUCCESS_E2E_LATENCY_AGGREGATION_KEY: Final[str] = "success_e2e_latency_aggregation"
+THROTTLED_TRANSACTIONS_KEY: Final[str] = "throttled_transactions"
+SEVERITY_KEY: Final[str] = "severity"
+
+STORAGE_METRIC_NAMESPACE: Final[str] = "Microsoft.Storage/storageAccounts"
+# The response types of requests rejected because the account or a partition exceeded its scalability targets.
+THROTTLING_RESPONSE_TYPES: Final[list[str]] = [
+    "ServerBusyError",
+    "ClientThrottlingError",
+    "ClientAccountRequestThrottlingError",
+    "ClientAccountBandwidthThrottlingError",
+]
+# The window sizes in minutes, with their ISO 8601 durations, over which the metrics are aggregated.
+WINDOW_SIZES: Final[dict[int, str]] = {1: "PT1M", 5: "PT5M", 15: "PT15M", 30: "PT30M", 60: "PT1H"}
+LATENCY_AGGREGATIONS: Final[tuple[str, ...]] = ("Average", "Maximum")
+
+
+@dataclass
+class StorageAlertsL1Config(ConstructConfigABC):
+    """
+    A configuration class for StorageAlertsL1.
+
+    The scalability targets default to the conservative limits of a standard general-purpose v2 account, set them to
+    the limits of the region of the account or to the ones granted by a quota increase. An alert is left out by
+    setting its target to None.
+
+    Attributes:
+        action_group_ids (list[str]): The IDs of the action groups notified when an alert fires.
+        window_size_minutes (int): The period in minutes the metrics are aggregated over.
+        utilization (float): The fraction of a scalability target at which its alert fires, e.g. 0.8 for 80%.
+        request_rate_target_per_second (float | None): The request rate target of the account.
+        ingress_limit_gbps (float | None): The ingress bandwidth limit of the account in gigabits per second.
+        egress_limit_gbps (float | None): The egress bandwidth limit of the account in gigabits per second.
+        success_e2e_latency_ms (float | None): The end-to-end latency of successful requests in milliseconds.
+        success_e2e_latency_aggregation (str): The aggregation of the latency over the window, `Average` or
+            `Maximum`. Azure Monitor metric alerts do not aggregate percentiles.
+        throttled_transactions (float | None): The number of throttled requests within the window.
+        severity (int): The severity of the alerts, from 0 (critical) to 4 (verbose).
+    """
+
+    action_group_ids: list[str] = field(default_factory=list)
+    window_size_minutes: int = 5
+    utilization: float = 0.8
+    request_rate_target_per_second: float | None = 20_000
+    ingress_limit_gbps: float | None = 25
+    egress_limit_gbps: float | None = 50
+    success_e2e_latency_ms: float | None = 1_000
+    success_e2e_latency_aggregation: str = "Average"
+    throttled_transactions: float | None = 1
+    severity: int = 2
+
+    def __post_init__(self) -> None:
+        """
+        Validate the window size, utilization and latency aggregation.
+
+        Raises:
+            ValueError: If the window size is not accepted by Azure Monitor, the utilization is not a fraction or the
+                latency aggregation is unknown.
+        """
+        if self.window_size_minutes not in WINDOW_SIZES:
+            raise ValueError(
+                f"Alert window_size_minutes must be one of {', '.join(map(str, WINDOW_SIZES))}, "
+                f"got {self.window_size_minutes}."
+            )
+        if not 0 < self.utilization <= 1:
+            raise ValueError(f"Alert utilization must be within (0, 1], got {self.utilization}.")
+        if self.success_e2e_latency_aggregation not in LATENCY_AGGREGATIONS:
+            raise ValueError(
+                f"Alert success_e2e_latency_aggregation must be one of {', '.join(LATENCY_AGGREGATIONS)}, "
+                f"got '{self.success_e2e_latency_aggregation}'."
+            )
+
+    @property
+    def window_seconds(self) -> int:
+        """Gets the period in seconds the metrics are aggregated over."""
+        return self.window_size_minutes * 60
+
+    @property
+    def metric_alerts(self) -> list[MetricAlertL0Config]:
+        """
+        Gets the metric alerts of the configured targets.
+
+        The request rate and bandwidth targets are rates, while the `Transactions`, `Ingress` and `Egress` metrics
+        are totals, so their thresholds are the targets scaled to the window and the utilization.
+
+        Returns:
+            list[MetricAlertL0Config]: The metric alerts.
+        """
+        alerts: list[MetricAlertL0Config] = []
+        if self.request_rate_target_per_second is not None:
+            alerts.append(
+                self._metric_alert(
+                    "transactions",
+                    "Transactions",
+                    "Total",
+                    self.request_rate_target_per_second * self.window_seconds * self.utilization,
+                    f"Request rate above {self.utilization:.0%} of {self.request_rate_target_per_second:g} per second.",
+                )
+            )
+        if self.ingress_limit_gbps is not None:
+            alerts.append(
+                self._metric_alert(
+                    "ingress",
+                    "Ingress",
+                    "Total",
+                    self.ingress_limit_gbps * 1e9 / 8 * self.window_seconds * self.utilization,
+                    f"Ingress above {self.utilization:.0%} of {self.ingress_limit_gbps:g} Gbps.",
+                )
+            )
+        if self.egress_limit_gbps is not None:
+            alerts.append(
+                self._metric_alert(
+                    "egress",
+                    "Egress",
+                    "Total",
+                    self.egress_limit_gbps * 1e9 / 8 * self.window_seconds * self.utilization,
+                    f"Egress above {self.utilization:.0%} of {self.egress_limit_gbps:g} Gbps.",
+                )
+            )
+        if self.success_e2e_latency_ms is not None:
+            alerts.append(
+                self._metric_alert(
+                    "latency",
+                    "SuccessE2ELatency",
+                    self.success_e2e_latency_aggregation,
+                    self.success_e2e_latency_ms,
+                    f"{self.success_e2e_latency_aggregation} end-to-end latency above "
+                    f"{self.success_e2e_latency_ms:g} ms.",
+                )
+            )
+        if self.throttled_transactions is not None:
+            alerts.append(
+                self._metric_alert(
+                    "throttling",
+                    "Transactions",
+                    "Total",
+                    self.throttled_transactions,
+                    f"More than {self.throttled_transactions:g} throttled requests in "
+                    f"{self.window_size_minutes} minutes.",
+                    dimensions={"ResponseType": THROTTLING_RESPONSE_TYPES},
+                )
+            )
+        return alerts
+
+    def _metric_alert(
+        self,
+        name: str,
+        metric_name: str,
+        aggregation: str,
+        threshold: float,
+        description: str,
+        dimensions: dict[str, list[str]] | None = None,
+    ) -> MetricAlertL0Config:
+        """
+        Create the configuration of a metric alert that fires above the threshold within the window.
+
+        Args:
+            name (str): The name of the alert.
+            metric_name (str): The name of the storage account metric.
+            aggregation (str): The aggregation of the metric over the window.
+            threshold (float): The threshold of the alert.
+            description (str): The description of the alert.
+            dimensions (dict[str, list[str]] | None): The dimension values to filter the metric on.
+
+        Returns:
+            MetricAlertL0Config: The configuration of the metric alert.
+        """
+        return MetricAlertL0Config(
+            name=name,
+            metric_namespace=STORAGE_METRIC_NAMESPACE,
+            metric_name=metric_name,
+            aggregation=aggregation,
+            operator="GreaterThan",
+            threshold=threshold,
+            dimensions=dimensions or {},
+            severity=self.severity,
+            window_size=WINDOW_SIZES[self.window_size_minutes],
+            description=description,
+        )
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a StorageAlertsL1Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "action_group_ids": ["<action group id>"],
+            "window_size_minutes": <1, 5, 15, 30 or 60>,
+            "utilization": <fraction>,
+            "request_rate_target_per_second": <requests per second or null>,
+            "ingress_limit_gbps": <Gbps or null>,
+            "egress_limit_gbps": <Gbps or null>,
+            "success_e2e_latency_ms": <milliseconds or null>,
+            "success_e2e_latency_aggregation": "<Average or Maximum>",
+            "throttled_transactions": <requests or null>,
+            "severity": <0-4>
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing alert configuration.
+
+        Returns:
+            StorageAlertsL1Config: A fully-initialized StorageAlertsL1Config.
+        """
+        return cls(
+            action_group_ids=list(dict_.get(ACTION_GROUP_IDS_KEY, [])),
+            window_size_minutes=dict_.get(WINDOW_SIZE_MINUTES_KEY, cls.window_size_minutes),
+            utilization=dict_.get(UTILIZATION_KEY, cls.utilization),
+            request_rate_target_per_second=dict_.get(
+                REQUEST_RATE_TARGET_PER_SECOND_KEY, cls.request_rate_target_per_second
+            ),
+            ingress_limit_gbps=dict_.get(INGRESS_LIMIT_GBPS_KEY, cls.ingress_limit_gbps),
+            egress_limit_gbps=dict_.get(EGRESS_LIMIT_GBPS_KEY, cls.egress_limit_gbps),
+            success_e2e_latency_ms=dict_.get(SUCCESS_E2E_LATENCY_MS_KEY, cls.success_e2e_latency_ms),
+            success_e2e_latency_aggregation=dict_.get(
+                SUCCESS_E2E_LATENCY_AGGREGATION_KEY, cls.success_e2e_latency_aggregation
+            ),
+            throttled_transactions=dict_.get(THROTTLED_TRANSACTIONS_KEY, cls.throttled_transactions),
+            severity=dict_.get(SEVERITY_KEY, cls.severity),
+        )
+
+
+class StorageAlertsL1(Construct, metaclass=CombinedMeta):
+    """
+    A level 1 construct that creates a metric alert per scalability target of a storage account.
+
+    Attributes:
+        metric_alerts (dict[str, MetricAlertL0]): The metric alerts per alert name, e.g. `throttling`.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        config: StorageAlertsL1Config,
+        storage_account_id: str,
+        storage_account_name: str,
+        resource_group_name: str,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Initializes the StorageAlertsL1 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            env (str): The environment name.
+            config (StorageAlertsL1Config): The configuration for the alerts.
+            storage_account_id (str): The ID of the storage account.
+            storage_account_name (str): The name of the storage account.
+            resource_group_name (str): The name of the resource group to create the alerts in.
+            tags (dict[str, str] | None): The tags of the alerts.
+        """
+        super().__init__(scope, id_)
+
+        self._metric_alerts: dict[str, MetricAlertL0] = {
+            alert_config.name: MetricAlertL0(
+                self,
+                f"MetricAlertL0_{alert_config.name}",
+                _=env,
+                config=alert_config,
+                resource_id=storage_account_id,
+                resource_name=storage_account_name,
+                resource_group_name=resource_group_name,
+                action_group_ids=config.action_group_ids,
+                tags=tags,
+            )
+            for alert_config in config.metric_alerts
+        }
+
+    @property
+    def metric_alerts(self) -> dict[str, MetricAlertL0]:
+        """Gets the metric alerts per alert name."""
+        return self._metric_alerts
@@ -0,0 +1,283 @@
+"""
+Module monitoring
+
+This module defines the MonitoringL1 class, the StorageDiagnosticsL1 class and their configuration classes,
+which are responsible for sending the latency, throttling and transaction telemetry of storage accounts to a
+Log Analytics workspace.
+
+Classes:
+    StorageDiagnosticsL1Config: A configuration class for StorageDiagnosticsL1.
+    StorageDiagnosticsL1: A level 1 construct that attaches diagnostic settings to a storage account.
+    MonitoringL1Config: A configuration class for MonitoringL1.
+    MonitoringL1: A level 1 construct that creates or references the Log Analytics workspace.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructConfigABC
+from a1a_infra_base.constructs.level0.diagnostic_setting import DiagnosticSettingL0, DiagnosticSettingL0Config
+from a1a_infra_base.constructs.level0.log_analytics_workspace import (
+    LogAnalyticsWorkspaceL0,
+    LogAnalyticsWorkspaceL0Config,
+)
+from constructs import Construct
+
+# Constants for dictionary keys
+# root keys
+MONITORING_L1_KEY: Final[str] = "monitoring"
+STORAGE_DIAGNOSTICS_L1_KEY: Final[str] = "diagnostics"
+# attributes
+ACCOUNT_KEY: Final[str] = "account"
+BLOB_KEY: Final[str] = "blob"
+LOG_ANALYTICS_WORKSPACE_L0_KEY: Final[str] = "log_analytics_workspace"
+LOG_ANALYTICS_WORKSPACE_ID_KEY: Final[str] = "log_analytics_workspace_id"
+
+# The storage account itself only emits metrics, the logs of dfs and blob operations are both emitted by the blob
+# service as hierarchical namespace operations are served by the same service.
+BLOB_SERVICE_RESOURCE_SUFFIX: Final[str] = "/blobServices/default"
+
+
+def _default_account_diagnostics() -> DiagnosticSettingL0Config:
+    """Gets the default diagnostics of the storage account: the transaction metrics, which include throttling."""
+    return DiagnosticSettingL0Config(metric_categories=["Transaction"])
+
+
+def _default_blob_diagnostics() -> DiagnosticSettingL0Config:
+    """Gets the default diagnostics of the blob service: the per request logs, which include latency, and metrics."""
+    return DiagnosticSettingL0Config(
+        log_categories=["StorageRead", "StorageWrite", "StorageDelete"], metric_categories=["Transaction"]
+    )
+
+
+@dataclass
+class StorageDiagnosticsL1Config(ConstructConfigABC):
+    """
+    A configuration class for StorageDiagnosticsL1.
+
+    Attributes:
+        account (DiagnosticSettingL0Config): The metrics collected for the storage account.
+        blob (DiagnosticSettingL0Config): The logs and metrics collected for the blob service, which serves both the
+            blob and dfs endpoints.
+    """
+
+    account: DiagnosticSettingL0Config = field(default_factory=_default_account_diagnostics)
+    blob: DiagnosticSettingL0Config = field(default_factory=_default_blob_diagnostics)
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a StorageDiagnosticsL1Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "account": {"metric_categories": ["Transaction"]},
+            "blob": {
+                "log_categories": ["StorageRead", "StorageWrite", "StorageDelete"],
+                "metric_categories": ["Transaction"]
+            }
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing storage diagnostics configuration.
+
+        Returns:
+            StorageDiagnosticsL1Config: A fully-initialized StorageDiagnosticsL1Config.
+        """
+        account = (
+            DiagnosticSettingL0Config.from_dict(dict_[ACCOUNT_KEY])
+            if ACCOUNT_KEY in dict_
+            else _default_account_diagnostics()
+        )
+        blob = (
+            DiagnosticSettingL0Config.from_dict(dict_[BLOB_KEY]) if BLOB_KEY in dict_ else _default_blob_diagnostics()
+        )
+        return cls(account=account, blob=blob)
+
+
+class StorageDiagnosticsL1(Construct, metaclass=CombinedMeta):
+    """
+    A level 1 construct that sends the telemetry of a storage account and its blob service to a Log Analytics
+    workspace.
+
+    Attributes:
+        account_diagnostic_setting (DiagnosticSettingL0 | None): The diagnostic setting of the storage account, None
+            if no categories are configured.
+        blob_diagnostic_setting (DiagnosticSettingL0 | None): The diagnostic setting of the blob service, None if no
+            categories are configured.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        config: StorageDiagnosticsL1Config,
+        storage_account_id: str,
+        storage_account_name: str,
+        log_analytics_workspace_id: str,
+    ) -> None:
+        """
+        Initializes the StorageDiagnosticsL1 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            env (str): The environment name.
+            config (StorageDiagnosticsL1Config): The configuration for the diagnostics.
+            storage_account_id (str): The ID of the storage account.
+            storage_account_name (str): The name of the storage account.
+            log_analytics_workspace_id (str): The ID of the workspace to send the telemetry to.
+        """
+        super().__init__(scope, id_)
+
+        self._account_diagnostic_setting: DiagnosticSettingL0 | None = None
+        if config.account.log_categories or config.account.metric_categories:
+            self._account_diagnostic_setting = DiagnosticSettingL0(
+                self,
+                "DiagnosticSettingL0_account",
+                _=env,
+                config=config.account,
+                target_resource_id=storage_account_id,
+                resource_name=storage_account_name,
+                log_analytics_workspace_id=log_analytics_workspace_id,
+            )
+
+        self._blob_diagnostic_setting: DiagnosticSettingL0 | None = None
+        if config.blob.log_categories or config.blob.metric_categories:
+            self._blob_diagnostic_setting = DiagnosticSettingL0(
+                self,
+                "DiagnosticSettingL0_blob",
+                _=env,
+                config=config.blob,
+                target_resource_id=f"{storage_account_id}{BLOB_SERVICE_RESOURCE_SUFFIX}",
+                resource_name=f"{storage_account_name}-blob",
+                log_analytics_workspace_id=log_analytics_workspace_id,
+            )
+
+    @property
+    def account_diagnostic_setting(self) -> DiagnosticSettingL0 | None:
+        """Gets the diagnostic setting of the storage account."""
+        return self._account_diagnostic_setting
+
+    @property
+    def blob_diagnostic_setting(self) -> DiagnosticSettingL0 | None:
+        """Gets the diagnostic setting of the blob service."""
+        return self._blob_diagnostic_setting
+
+
+@dataclass
+class MonitoringL1Config(ConstructConfigABC):
+    """
+    A configuration class for MonitoringL1.
+
+    Attributes:
+        log_analytics_workspace_l0 (LogAnalyticsWorkspaceL0Config | None): The configuration for the workspace to
+            create, None to reference an existing one.
+        log_analytics_workspace_id (str | None): The ID of an existing workspace, e.g. a central one.
+        diagnostics_l1 (StorageDiagnosticsL1Config): The diagnostics of every storage account without its own.
+    """
+
+    log_analytics_workspace_l0: LogAnalyticsWorkspaceL0Config | None = None
+    log_analytics_workspace_id: str | None = None
+    diagnostics_l1: StorageDiagnosticsL1Config = field(default_factory=StorageDiagnosticsL1Config)
+
+    def __post_init__(self) -> None:
+        """
+        Validate that exactly one workspace is configured.
+
+        Raises:
+            ValueError: If both or neither of a workspace to create and an existing workspace are configured.
+        """
+        if (self.log_analytics_workspace_l0 is None) == (self.log_analytics_workspace_id is None):
+            raise ValueError(
+                f"Monitoring requires exactly one of '{LOG_ANALYTICS_WORKSPACE_L0_KEY}' or "
+                f"'{LOG_ANALYTICS_WORKSPACE_ID_KEY}'."
+            )
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a MonitoringL1Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "log_analytics_workspace": {<LogAnalyticsWorkspaceL0Config>},
+            "log_analytics_workspace_id": "<workspace id>",
+            "diagnostics": {<StorageDiagnosticsL1Config>}
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing monitoring configuration.
+
+        Returns:
+            MonitoringL1Config: A fully-initialized MonitoringL1Config.
+        """
+        log_analytics_workspace_l0 = (
+            LogAnalyticsWorkspaceL0Config.from_dict(dict_[LOG_ANALYTICS_WORKSPACE_L0_KEY])
+            if LOG_ANALYTICS_WORKSPACE_L0_KEY in dict_
+            else None
+        )
+        log_analytics_workspace_id = dict_.get(LOG_ANALYTICS_WORKSPACE_ID_KEY)
+        diagnostics_l1 = StorageDiagnosticsL1Config.from_dict(dict_.get(STORAGE_DIAGNOSTICS_L1_KEY, {}))
+        return cls(
+            log_analytics_workspace_l0=log_analytics_workspace_l0,
+            log_analytics_workspace_id=log_analytics_workspace_id,
+            diagnostics_l1=diagnostics_l1,
+        )
+
+
+class MonitoringL1(Construct, metaclass=CombinedMeta):
+    """
+    A level 1 construct that creates or references the Log Analytics workspace the storage telemetry is sent to.
+
+    Attributes:
+        log_analytics_workspace (LogAnalyticsWorkspaceL0 | None): The created workspace, None if an existing one is
+            referenced.
+        log_analytics_workspace_id (str): The ID of the workspace.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        config: MonitoringL1Config,
+        resource_group_name: str,
+    ) -> None:
+        """
+        Initializes the MonitoringL1 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            env (str): The environment name.
+            config (MonitoringL1Config): The configuration for the monitoring.
+            resource_group_name (str): The name of the resource group to create the workspace in.
+        """
+        super().__init__(scope, id_)
+
+        self._log_analytics_workspace: LogAnalyticsWorkspaceL0 | None = None
+        if config.log_analytics_workspace_l0 is not None:
+            self._log_analytics_workspace = LogAnalyticsWorkspaceL0(
+                self,
+                "LogAnalyticsWorkspaceL0",
+                env=env,
+                config=config.log_analytics_workspace_l0,
+                resource_group_name=resource_group_name,
+            )
+            self._log_analytics_workspace_id: str = self._log_analytics_workspace.log_analytics_workspace.id
+        else:
+            self._log_analytics_workspace_id = str(config.log_analytics_workspace_id)
+
+    @property
+    def log_analytics_workspace(self) -> LogAnalyticsWorkspaceL0 | None:
+        """Gets the created workspace, None if an existing one is referenced."""
+        return self._log_analytics_workspace
+
+    @property
+    def log_analytics_workspace_id(self) -> str:
+        """Gets the ID of the workspace."""
+        return self._log_analytics_workspace_id
@@ -0,0 +1,236 @@
+"""
+Module private_endpoints
+
+This module defines the PrivateEndpointsL1 class, the PrivateDnsZonesL1 class and the PrivateEndpointsL1Config class,
+which are responsible for reaching the data plane of a storage account over private endpoints, resolved through
+private DNS zones linked to the virtual networks of the compute.
+
+Classes:
+    PrivateEndpointsL1Config: A configuration class for PrivateEndpointsL1.
+    PrivateDnsZonesL1: A level 1 construct that creates a private DNS zone per storage sub-resource.
+    PrivateEndpointsL1: A level 1 construct that creates a private endpoint per storage sub-resource.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Final, Self
+
+from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructConfigABC
+from a1a_infra_base.constructs.level0.private_dns_zone import PrivateDnsZoneL0, PrivateDnsZoneL0Config
+from a1a_infra_base.constructs.level0.private_endpoint import PrivateEndpointL0, PrivateEndpointL0Config
+from constructs import Construct
+
+# Constants for dictionary keys
+# root key
+PRIVATE_ENDPOINTS_L1_KEY: Final[str] = "private_endpoints"
+# attributes
+SUBNET_ID_KEY: Final[str] = "subnet_id"
+VIRTUAL_NETWORK_IDS_KEY: Final[str] = "virtual_network_ids"
+SUBRESOURCES_KEY: Final[str] = "subresources"
+PRIVATE_DNS_ZONE_IDS_KEY: Final[str] = "private_dns_zone_ids"
+
+PRIVATE_DNS_ZONE_NAMES: Final[dict[str, str]] = {
+    "blob": "privatelink.blob.core.windows.net",
+    "dfs": "privatelink.dfs.core.windows.net",
+    "file": "privatelink.file.core.windows.net",
+    "queue": "privatelink.queue.core.windows.net",
+    "table": "privatelink.table.core.windows.net",
+    "web": "privatelink.web.core.windows.net",
+}
+
+
+@dataclass
+class PrivateEndpointsL1Config(ConstructConfigABC):
+    """
+    A configuration class for PrivateEndpointsL1.
+
+    Attributes:
+        subnet_id (str): The ID of the subnet to place the endpoints in.
+        virtual_network_ids (list[str]): The IDs of the virtual networks to link created private DNS zones to.
+        subresources (list[str]): The storage sub-resources to create endpoints for, `dfs` and `blob` by default.
+        private_dns_zone_ids (dict[str, str]): The IDs of existing private DNS zones per sub-resource, e.g. zones
+            managed by a central hub. No zone is created for these sub-resources.
+    """
+
+    subnet_id: str
+    virtual_network_ids: list[str] = field(default_factory=list)
+    subresources: list[str] = field(default_factory=lambda: ["dfs", "blob"])
+    private_dns_zone_ids: dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the sub-resources.
+
+        Raises:
+            ValueError: If a sub-resource has no known private DNS zone.
+        """
+        for subresource in [*self.subresources, *self.private_dns_zone_ids]:
+            if subresource not in PRIVATE_DNS_ZONE_NAMES:
+                raise ValueError(
+                    f"Storage sub-resource '{subresource}' is not one of {', '.join(PRIVATE_DNS_ZONE_NAMES)}."
+                )
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a PrivateEndpointsL1Config by unpacking parameters from a configuration dictionary.
+
+        Expected format of 'dict_':
+        {
+            "subnet_id": "<subnet id>",
+            "virtual_network_ids": ["<virtual network id>"],
+            "subresources": ["dfs", "blob"],
+            "private_dns_zone_ids": {"<sub-resource>": "<private dns zone id>"}
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A dictionary containing private endpoint configuration.
+
+        Returns:
+            PrivateEndpointsL1Config: A fully-initialized PrivateEndpointsL1Config.
+        """
+        subnet_id = dict_[SUBNET_ID_KEY]
+        virtual_network_ids = dict_.get(VIRTUAL_NETWORK_IDS_KEY, [])
+        subresources = dict_.get(SUBRESOURCES_KEY, ["dfs", "blob"])
+        private_dns_zone_ids = dict_.get(PRIVATE_DNS_ZONE_IDS_KEY, {})
+        return cls(
+            subnet_id=subnet_id,
+            virtual_network_ids=virtual_network_ids,
+            subresources=subresources,
+            private_dns_zone_ids=private_dns_zone_ids,
+        )
+
+
+class PrivateDnsZonesL1(Construct, metaclass=CombinedMeta):
+    """
+    A level 1 construct that creates a private DNS zone per storage sub-resource, linked to the virtual networks.
+
+    A zone holds the records of every storage account with an endpoint for its sub-resource, so the zones are created
+    once and shared by all storage accounts that resolve through the same virtual networks.
+
+    Attributes:
+        private_dns_zones (dict[str, PrivateDnsZoneL0]): The private DNS zones per sub-resource.
+        private_dns_zone_ids (dict[str, str]): The IDs of the private DNS zones per sub-resource.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        subresources: list[str],
+        virtual_network_ids: list[str],
+        resource_group_name: str,
+    ) -> None:
+        """
+        Initializes the PrivateDnsZonesL1 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            env (str): The environment name.
+            subresources (list[str]): The storage sub-resources to create zones for.
+            virtual_network_ids (list[str]): The IDs of the virtual networks to link the zones to.
+            resource_group_name (str): The name of the resource group to create the zones in.
+        """
+        super().__init__(scope, id_)
+
+        self._private_dns_zones: dict[str, PrivateDnsZoneL0] = {
+            subresource: PrivateDnsZoneL0(
+                self,
+                f"PrivateDnsZoneL0_{subresource}",
+                _=env,
+                config=PrivateDnsZoneL0Config(
+                    name=PRIVATE_DNS_ZONE_NAMES[subresource], virtual_network_ids=virtual_network_ids
+                ),
+                resource_group_name=resource_group_name,
+            )
+            for subresource in subresources
+        }
+
+    @property
+    def private_dns_zones(self) -> dict[str, PrivateDnsZoneL0]:
+        """Gets the private DNS zones per sub-resource."""
+        return self._private_dns_zones
+
+    @property
+    def private_dns_zone_ids(self) -> dict[str, str]:
+        """Gets the IDs of the private DNS zones per sub-resource."""
+        return {subresource: zone.private_dns_zone.id for subresource, zone in self._private_dns_zones.items()}
+
+
+class PrivateEndpointsL1(Construct, metaclass=CombinedMeta):
+    """
+    A level 1 construct that creates a private endpoint per storage sub-resource of a storage account.
+
+    The endpoints register in existing private DNS zones. A zone is shared by every storage account in its resource
+    group, so it is created once by the owner of those accounts, e.g. the data lake, and never per account.
+
+    Attributes:
+        private_endpoints (dict[str, PrivateEndpointL0]): The private endpoints per sub-resource.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        config: PrivateEndpointsL1Config,
+        resource_id: str,
+        resource_name: str,
+        location: AzureLocation,
+        resource_group_name: str,
+        private_dns_zone_ids: dict[str, str] | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Initializes the PrivateEndpointsL1 construct.
+
+        Args:
+            scope (Construct): The scope in which this construct is defined.
+            id_ (str): The scoped construct ID.
+            env (str): The environment name.
+            config (PrivateEndpointsL1Config): The configuration for the private endpoints.
+            resource_id (str): The ID of the storage account.
+            resource_name (str): The name of the storage account.
+            location (AzureLocation): The Azure location of the endpoints.
+            resource_group_name (str): The name of the resource group to create the endpoints in.
+            private_dns_zone_ids (dict[str, str] | None): The IDs of shared private DNS zones per sub-resource, e.g.
+                the zones of the data lake. The zones of the configuration take precedence over these.
+            tags (dict[str, str] | None): The tags of the endpoints.
+
+        Raises:
+            ValueError: If a sub-resource has no private DNS zone to register in.
+        """
+        super().__init__(scope, id_)
+
+        zone_ids = {**(private_dns_zone_ids or {}), **config.private_dns_zone_ids}
+        missing_subresources = [subresource for subresource in config.subresources if subresource not in zone_ids]
+        if missing_subresources:
+            raise ValueError(
+                f"Private endpoints of '{resource_name}' have no private DNS zone for sub-resources "
+                f"{', '.join(missing_subresources)}, set private_dns_zone_ids."
+            )
+
+        self._private_endpoints: dict[str, PrivateEndpointL0] = {
+            subresource: PrivateEndpointL0(
+                self,
+                f"PrivateEndpointL0_{subresource}",
+                _=env,
+                config=PrivateEndpointL0Config(subresource_name=subresource, subnet_id=config.subnet_id),
+                resource_id=resource_id,
+                resource_name=resource_name,
+                location=location,
+                resource_group_name=resource_group_name,
+                private_dns_zone_id=zone_ids[subresource],
+                tags=tags,
+            )
+            for subresource in config.subresources
+        }
+
+    @property
+    def private_endpoints(self) -> dict[str, PrivateEndpointL0]:
+        """Gets the private endpoints per sub-resource."""
+        return self._private_endpoints
@@ -11,13 +11,34 @@ Classes:
     StorageL1Config: A configuration class for StorageL1.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Final, Self
 
 from a1a_infra_base.constructs.ABC import CombinedMeta
 from a1a_infra_base.constructs.level0.management_lock import ManagementLockL0, ManagementLockL0Config
-from a1a_infra_base.constructs.level0.storage_account import StorageAccountL0, StorageAccountL0Config
+from a1a_infra_base.constructs.level0.storage_account import (
+    READ_ACCESS_REPLICATION_TYPES,
+    StorageAccountL0,
+    StorageAccountL0Config,
+)
 from a1a_infra_base.constructs.level0.storage_container import StorageContainerL0, StorageContainerL0Config
+from a1a_infra_base.constructs.level0.storage_management_policy import (
+    StorageManagementPolicyL0,
+    StorageManagementPolicyL0Config,
+)
+from a1a_infra_base.constructs.level1.alerts import STORAGE_ALERTS_L1_KEY, StorageAlertsL1, StorageAlertsL1Config
+from a1a_infra_base.constructs.level1.monitoring import (
+    STORAGE_DIAGNOSTICS_L1_KEY,
+    StorageDiagnosticsL1,
+    StorageDiagnosticsL1Config,
+)
+from a1a_infra_base.constructs.level1.private_endpoints import (
+    PRIVATE_ENDPOINTS_L1_KEY,
+    PrivateEndpointsL1,
+    PrivateEndpointsL1Config,
+)
+from a1a_infra_base.partitioning import route
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
 from constructs import Construct
 
 # Constants for dictionary keys
@@ -26,6 +47,9 @@ STORAGE_L1_KEY: Final[str] = "storage"
 # attributes
 STORAGE_ACCOUNT_L0_KEY: Final[str] = "storage_account"
 STORAGE_CONTAINERS_L0_KEY: Final[str] = "containers"
+STORAGE_MANAGEMENT_POLICY_L0_KEY: Final[str] = "management_policy"
+READ_REPLICA_KEY: Final[str] = "read_replica"
+PARTITIONS_KEY: Final[str] = "partitions"
 
 
 @dataclass
@@ -35,9 +59,100 @@ class StorageL1Config(StorageAccountL0Config):
 
     Attributes:
         containers (list[StorageContainerL0Config]): The configuration for the storage containers.
+        private_endpoints_l1 (PrivateEndpointsL1Config | None): The configuration for the private endpoints of the
+            data plane, None to reach the storage account over its public endpoints only.
+        management_policy_l0 (StorageManagementPolicyL0Config | None): The configuration for the lifecycle
+            management policy that tiers and deletes the blobs of the layer.
+        read_replica (bool): Whether consumers read from the secondary region, which requires read-access
+            geo-redundant replication. The secondary endpoints are published by the storage account.
+        diagnostics_l1 (StorageDiagnosticsL1Config | None): The telemetry categories sent to the Log Analytics
+            workspace, None to use the ones of the data lake monitoring.
+        alerts_l1 (StorageAlertsL1Config | None): The scalability targets and latency thresholds to alert on, None
+            to use the ones of the data lake.
+        partitions (int): The number of storage accounts the containers are spread over, each with its own request
+            rate and bandwidth targets. The accounts take consecutive sequence numbers.
     """
 
     containers: list[StorageContainerL0Config] = field(default_factory=list)
+    private_endpoints_l1: PrivateEndpointsL1Config | None = None
+    management_policy_l0: StorageManagementPolicyL0Config | None = None
+    read_replica: bool = False
+    diagnostics_l1: StorageDiagnosticsL1Config | None = None
+    alerts_l1: StorageAlertsL1Config | None = None
+    partitions: int = 1
+
+    def __post_init__(self) -> None:
+        """
+        Validate the storage account configuration and that it supports the partitioning, the read replica and the
+        lifecycle management policy.
+
+        Raises:
+            ValueError: If the partitioning is invalid, a read replica is requested without read-access geo-redundant
+                replication, or the policy tiers blobs on an account without access tiers or without last access
+                tracking.
+        """
+        super().__post_init__()
+        if self.partitions < 1:
+            raise ValueError(f"Storage account '{self.name}' must have at least 1 partition, got {self.partitions}.")
+        if self.partitions > 1 and not self.sequence_number.isdigit():
+            raise ValueError(
+                f"Storage account '{self.name}' is partitioned, which requires a numeric sequence_number, "
+                f"got '{self.sequence_number}'."
+            )
+        if self.read_replica and self.account_replication_type not in READ_ACCESS_REPLICATION_TYPES:
+            raise ValueError(
+                f"Storage account '{self.name}' has a read replica, which requires account_replication_type "
+                f"{' or '.join(READ_ACCESS_REPLICATION_TYPES)}, got '{self.account_replication_type}'."
+            )
+        if self.management_policy_l0 is None or not self.management_policy_l0.tiers_on_last_access:
+            return
+        if self.account_tier == "Premium":
+            raise ValueError(f"Storage account '{self.name}' is Premium, which has no access tiers to move blobs to.")
+        if self.blob_properties_l0 is None or not self.blob_properties_l0.last_access_time_enabled:
+            raise ValueError(
+                f"Storage account '{self.name}' tiers blobs on last access, which requires "
+                "blob_properties_l0.last_access_time_enabled."
+            )
+
+    @property
+    def container_partitions(self) -> dict[str, int]:
+        """Gets the index of the partition each container is placed on."""
+        return route((container.name for container in self.containers), self.partitions)
+
+    def partition(self, index: int) -> "StorageL1Config":
+        """
+        Get the configuration of a single partition: its sequence number, its containers and the lifecycle management
+        rules of those containers.
+
+        Args:
+            index (int): The index of the partition, from 0 up to the number of partitions.
+
+        Returns:
+            StorageL1Config: The configuration of the storage account of the partition.
+        """
+        if self.partitions == 1:
+            return self
+
+        container_partitions = self.container_partitions
+        containers = [container for container in self.containers if container_partitions[container.name] == index]
+
+        management_policy_l0 = self.management_policy_l0
+        if management_policy_l0 is not None:
+            container_names = {container.name for container in containers}
+            rules = [
+                replace(rule, container_names=[name for name in rule.container_names if name in container_names])
+                for rule in management_policy_l0.rules
+                if not rule.container_names or container_names.intersection(rule.container_names)
+            ]
+            management_policy_l0 = replace(management_policy_l0, rules=rules) if rules else None
+
+        return replace(
+            self,
+            sequence_number=f"{int(self.sequence_number) + index:0{len(self.sequence_number)}d}",
+            containers=containers,
+            management_policy_l0=management_policy_l0,
+            partitions=1,
+        )
 
     @classmethod
     def from_dict(cls, dict_: dict[str, Any]) -> Self:
@@ -52,6 +167,26 @@ class StorageL1Config(StorageAccountL0Config):
         """
         config = super().from_dict(dict_)
         containers = [StorageContainerL0Config.from_dict(container) for container in dict_.get("containers", [])]
+        management_policy_l0 = (
+            StorageManagementPolicyL0Config.from_dict(dict_[STORAGE_MANAGEMENT_POLICY_L0_KEY])
+            if STORAGE_MANAGEMENT_POLICY_L0_KEY in dict_
+            else None
+        )
+        read_replica = dict_.get(READ_REPLICA_KEY, cls.read_replica)
+        partitions = dict_.get(PARTITIONS_KEY, cls.partitions)
+        diagnostics_l1 = (
+            StorageDiagnosticsL1Config.from_dict(dict_[STORAGE_DIAGNOSTICS_L1_KEY])
+            if STORAGE_DIAGNOSTICS_L1_KEY in dict_
+            else None
+        )
+        alerts_l1 = (
+            StorageAlertsL1Config.from_dict(dict_[STORAGE_ALERTS_L1_KEY]) if STORAGE_ALERTS_L1_KEY in dict_ else None
+        )
+        private_endpoints_l1 = (
+            PrivateEndpointsL1Config.from_dict(dict_[PRIVATE_ENDPOINTS_L1_KEY])
+            if PRIVATE_ENDPOINTS_L1_KEY in dict_
+            else None
+        )
 
         return cls(
             sequence_number=config.sequence_number,
@@ -63,26 +198,41 @@ class StorageL1Config(StorageAccountL0Config):
             account_kind=config.account_kind,
             blob_properties_l0=config.blob_properties_l0,
             cross_tenant_replication_enabled=config.cross_tenant_replication_enabled,
+            https_traffic_only_enabled=config.https_traffic_only_enabled,
             infrastructure_encryption_enabled=config.infrastructure_encryption_enabled,
             is_hns_enabled=config.is_hns_enabled,
             local_user_enabled=config.local_user_enabled,
+            network_rules_l0=config.network_rules_l0,
             nfsv3_enabled=config.nfsv3_enabled,
+            performance_profile=config.performance_profile,
             public_network_access_enabled=config.public_network_access_enabled,
+            routing_l0=config.routing_l0,
             sftp_enabled=config.sftp_enabled,
             shared_access_key_enabled=config.shared_access_key_enabled,
             tags=config.tags,
             containers=containers,
+            private_endpoints_l1=private_endpoints_l1,
+            management_policy_l0=management_policy_l0,
+            read_replica=read_replica,
+            diagnostics_l1=diagnostics_l1,
+            alerts_l1=alerts_l1,
+            partitions=partitions,
         )
 
 
 class StorageL1(Construct, metaclass=CombinedMeta):
     """
-    A level 1 construct that creates and manages an Azure storage account with a management lock and storage containers.
+    A level 1 construct that creates and manages an Azure storage account with a management lock, storage containers
+    and, when configured, private endpoints, diagnostics and alerts.
 
     Attributes:
         storage_account (StorageAccountL0): The Azure storage account.
         management_lock (ManagementLockL0): The management lock applied to the storage account.
         storage_containers (list[StorageContainerL0]): The Azure storage containers.
+        private_endpoints_l1 (PrivateEndpointsL1 | None): The private endpoints of the data plane.
+        storage_management_policy (StorageManagementPolicyL0 | None): The lifecycle management policy.
+        storage_diagnostics_l1 (StorageDiagnosticsL1 | None): The diagnostic settings of the storage account.
+        storage_alerts_l1 (StorageAlertsL1 | None): The metric alerts of the storage account.
     """
 
     def __init__(
@@ -93,19 +243,28 @@ class StorageL1(Construct, metaclass=CombinedMeta):
         env: str,
         config: StorageL1Config,
         resource_group_name: str,
+        selection: ConstructSelection = SELECT_ALL,
+        private_dns_zone_ids: dict[str, str] | None = None,
+        log_analytics_workspace_id: str | None = None,
     ) -> None:
         """
         Initializes the StorageL1 construct.
 
+        The storage account is always created as the lock and containers depend on it.
+
         Args:
             scope (Construct): The scope in which this construct is defined.
             id_ (str): The scoped construct ID.
             env (str): The environment name.
             config (StorageL1Config): The configuration for the storage account and containers.
             resource_group_name (str): The name of the resource group to create the storage account in.
+            selection (ConstructSelection): The construct subtree to instantiate, defaults to everything.
+            private_dns_zone_ids (dict[str, str] | None): The IDs of shared private DNS zones per sub-resource for
+                the private endpoints.
+            log_analytics_workspace_id (str | None): The ID of the Log Analytics workspace to send the telemetry to,
+                None to collect no telemetry.
         """
         super().__init__(scope, id_)
-
         self._storage_account: StorageAccountL0 = StorageAccountL0(
             self,
             "StorageAccountL0",
@@ -114,14 +273,16 @@ class StorageL1(Construct, metaclass=CombinedMeta):
             resource_group_name=resource_group_name,
         )
 
-        self._management_lock: ManagementLockL0 = ManagementLockL0(
-            self,
-            "ManagementLockL0",
-            _=env,
-            config=ManagementLockL0Config(lock_level="CanNotDelete"),
-            resource_id=self._storage_account.storage_account.id,
-            resource_name=config.name,
-        )
+        self._management_lock: ManagementLockL0 | None = None
+        if selection.includes(f"{self.node.path}/ManagementLockL0"):
+            self._management_lock = ManagementLockL0(
+                self,
+                "ManagementLockL0",
+                _=env,
+                config=ManagementLockL0Config(lock_level="CanNotDelete"),
+                resource_id=self._storage_account.storage_account.id,
+                resource_name=config.name,
+            )
 
         self._storage_containers: list[StorageContainerL0] = [
             StorageContainerL0(
@@ -132,19 +293,96 @@ class StorageL1(Construct, metaclass=CombinedMeta):
                 storage_account_id=self._storage_account.storage_account.id,
             )
             for container_config in config.containers
+            if selection.includes(f"{self.node.path}/StorageContainerL0_{container_config.name}")
         ]
 
+        self._storage_management_policy: StorageManagementPolicyL0 | None = None
+        if config.management_policy_l0 is not None and selection.includes(
+            f"{self.node.path}/StorageManagementPolicyL0"
+        ):
+            self._storage_management_policy = StorageManagementPolicyL0(
+                self,
+                "StorageManagementPolicyL0",
+                _=env,
+                config=config.management_policy_l0,
+                storage_account_id=self._storage_account.storage_account.id,
+            )
+
+        self._private_endpoints_l1: PrivateEndpointsL1 | None = None
+        if config.private_endpoints_l1 is not None and selection.includes(f"{self.node.path}/PrivateEndpointsL1"):
+            self._private_endpoints_l1 = PrivateEndpointsL1(
+                self,
+                "PrivateEndpointsL1",
+                env=env,
+                config=config.private_endpoints_l1,
+                resource_id=self._storage_account.storage_account.id,
+                resource_name=self._storage_account.full_name,
+                location=config.location,
+                resource_group_name=resource_group_name,
+                private_dns_zone_ids=private_dns_zone_ids,
+                tags=config.tags,
+            )
+
+        self._storage_diagnostics_l1: StorageDiagnosticsL1 | None = None
+        if (
+            config.diagnostics_l1 is not None
+            and log_analytics_workspace_id is not None
+            and selection.includes(f"{self.node.path}/StorageDiagnosticsL1")
+        ):
+            self._storage_diagnostics_l1 = StorageDiagnosticsL1(
+                self,
+                "StorageDiagnosticsL1",
+                env=env,
+                config=config.diagnostics_l1,
+                storage_account_id=self._storage_account.storage_account.id,
+                storage_account_name=self._storage_account.full_name,
+                log_analytics_workspace_id=log_analytics_workspace_id,
+            )
+
+        self._storage_alerts_l1: StorageAlertsL1 | None = None
+        if config.alerts_l1 is not None and selection.includes(f"{self.node.path}/StorageAlertsL1"):
+            self._storage_alerts_l1 = StorageAlertsL1(
+                self,
+                "StorageAlertsL1",
+                env=env,
+                config=config.alerts_l1,
+                storage_account_id=self._storage_account.storage_account.id,
+                storage_account_name=self._storage_account.full_name,
+                resource_group_name=resource_group_name,
+                tags=config.tags,
+            )
+
     @property
     def storage_account(self) -> StorageAccountL0:
         """Gets the storage account."""
         return self._storage_account
 
     @property
-    def management_lock(self) -> ManagementLockL0:
-        """Gets the management lock."""
+    def management_lock(self) -> ManagementLockL0 | None:
+        """Gets the management lock, None if it was left out of the selection."""
         return self._management_lock
 
     @property
     def storage_containers(self) -> list[StorageContainerL0]:
         """Gets the storage containers."""
         return self._storage_containers
+
+    @property
+    def storage_management_policy(self) -> StorageManagementPolicyL0 | None:
+        """Gets the lifecycle management policy, None if it is not configured or was left out of the selection."""
+        return self._storage_management_policy
+
+    @property
+    def private_endpoints_l1(self) -> PrivateEndpointsL1 | None:
+        """Gets the private endpoints, None if they are not configured or were left out of the selection."""
+        return self._private_endpoints_l1
+
+    @property
+    def storage_diagnostics_l1(self) -> StorageDiagnosticsL1 | None:
+        """Gets the diagnostic settings, None if they are not configured or were left out of the selection."""
+        return self._storage_diagnostics_l1
+
+    @property
+    def storage_alerts_l1(self) -> StorageAlertsL1 | None:
+        """Gets the metric alerts, None if they are not configured or were left out of the selection."""
+        return self._storage_alerts_l1
@@ -7,15 +7,29 @@ for a data lake following the medallion architecture pattern.
 Classes:
     DataLakeL1: A construct that creates storage accounts for a data lake.
     DataLakeL1Config: A configuration class for DataLakeL1.
+    LazyDataLakeL2Config: A configuration class for DataLakeL2 that decodes each layer on first access.
+
+Functions:
+    get_partition_id: Get the construct ID, or layer name, of a partition of a layer storage.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from typing import Any, Final, Self
 
-from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC
+from a1a_infra_base.capacity import CapacityPlanConfig, PlannedAccount
+from a1a_infra_base.constructs.ABC import CombinedMeta, ConstructABC, ConstructConfigABC, LazyConfigABC
+from a1a_infra_base.constructs.level1.alerts import STORAGE_ALERTS_L1_KEY, StorageAlertsL1Config
+from a1a_infra_base.constructs.level1.monitoring import MONITORING_L1_KEY, MonitoringL1, MonitoringL1Config
+from a1a_infra_base.constructs.level1.private_endpoints import (
+    PRIVATE_ENDPOINTS_L1_KEY,
+    PrivateDnsZonesL1,
+    PrivateEndpointsL1Config,
+)
 from a1a_infra_base.constructs.level1.storage import StorageL1, StorageL1Config
 from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.selection import PATH_SEPARATOR, SELECT_ALL, ConstructSelection
 from constructs import Construct
 
 logger: logging.Logger = setup_logger(__name__)
@@ -28,6 +42,73 @@ SOURCE_STORAGE: Final[str] = "source_storage"
 BRONZE_STORAGE: Final[str] = "bronze_storage"
 SILVER_STORAGE: Final[str] = "silver_storage"
 GOLD_STORAGE: Final[str] = "gold_storage"
+PRIVATE_ENDPOINTS: Final[str] = PRIVATE_ENDPOINTS_L1_KEY
+READ_REPLICA_LAYERS: Final[str] = "read_replica_layers"
+MONITORING: Final[str] = MONITORING_L1_KEY
+ALERTS: Final[str] = STORAGE_ALERTS_L1_KEY
+CAPACITY_PLAN: Final[str] = "capacity_plan"
+
+LAYERS: Final[tuple[str, ...]] = ("source", "bronze", "silver", "gold")
+READ_ACCESS_REPLICATION_TYPE_UPGRADES: Final[dict[str, str]] = {"GRS": "RAGRS", "GZRS": "RAGZRS"}
+STORAGE_L1_ID_PREFIX: Final[str] = "StorageL1_"
+PARTITION_SEPARATOR: Final[str] = "_"
+
+
+def get_partition_id(id_: str, index: int) -> str:
+    """
+    Get the construct ID, or layer name, of a partition of a layer storage. The first partition keeps the ID of the
+    layer, so partitioning a layer does not move its existing storage account.
+
+    Args:
+        id_ (str): The construct ID or name of the layer, e.g. `StorageL1_Gold` or `gold`.
+        index (int): The index of the partition.
+
+    Returns:
+        str: The ID of the partition, e.g. `StorageL1_Gold_1` or `gold_1`.
+    """
+    return id_ if index == 0 else f"{id_}{PARTITION_SEPARATOR}{index}"
+
+
+def _read_replica_layers(dict_: dict[str, Any]) -> list[str]:
+    """
+    Get the layers with a read replica from a data lake configuration dictionary.
+
+    Args:
+        dict_ (dict[str, Any]): The data lake configuration dictionary.
+
+    Returns:
+        list[str]: The layer names, e.g. `["gold"]`.
+
+    Raises:
+        ValueError: If a layer name is unknown.
+    """
+    layers = list(dict_.get(READ_REPLICA_LAYERS, []))
+    for layer in layers:
+        if layer not in LAYERS:
+            raise ValueError(f"Read replica layer '{layer}' is not one of {', '.join(LAYERS)}.")
+    return layers
+
+
+def _capacity_plan(dict_: dict[str, Any]) -> CapacityPlanConfig | None:
+    """
+    Get the capacity plan from a data lake configuration dictionary.
+
+    Args:
+        dict_ (dict[str, Any]): The data lake configuration dictionary.
+
+    Returns:
+        CapacityPlanConfig | None: The projected loads per layer, None if no capacity plan is configured.
+
+    Raises:
+        ValueError: If a layer name is unknown.
+    """
+    if CAPACITY_PLAN not in dict_:
+        return None
+    capacity_plan = CapacityPlanConfig.from_dict(dict_[CAPACITY_PLAN])
+    for layer in capacity_plan.projected_loads:
+        if layer not in LAYERS:
+            raise ValueError(f"Capacity plan layer '{layer}' is not one of {', '.join(LAYERS)}.")
+    return capacity_plan
 
 
 @dataclass
@@ -40,12 +121,27 @@ class DataLakeL2Config(ConstructConfigABC):
         bronze_storage_l1_config (StorageL1Config): The configuration for the bronze storage account.
         silver_storage_l1_config (StorageL1Config): The configuration for the silver storage account.
         gold_storage_l1_config (StorageL1Config): The configuration for the gold storage account.
+        private_endpoints_l1_config (PrivateEndpointsL1Config | None): The configuration for the private endpoints of
+            every layer without its own, with private DNS zones shared by all layers.
+        read_replica_layers (list[str]): The layers whose consumers read from the secondary region. Their
+            geo-redundant replication is upgraded to read-access, e.g. GRS to RAGRS.
+        monitoring_l1_config (MonitoringL1Config | None): The configuration for the Log Analytics workspace every
+            layer sends its telemetry to, None to collect no telemetry.
+        alerts_l1_config (StorageAlertsL1Config | None): The alerts of every layer without its own, None to alert on
+            no layer without its own.
+        capacity_plan_config (CapacityPlanConfig | None): The projected loads per layer to check against the
+            scalability targets of a single storage account before synth, None to skip the check.
     """
 
     source_storage_l1_config: StorageL1Config
     bronze_storage_l1_config: StorageL1Config
     silver_storage_l1_config: StorageL1Config
     gold_storage_l1_config: StorageL1Config
+    private_endpoints_l1_config: PrivateEndpointsL1Config | None = None
+    read_replica_layers: list[str] = field(default_factory=list)
+    monitoring_l1_config: MonitoringL1Config | None = None
+    alerts_l1_config: StorageAlertsL1Config | None = None
+    capacity_plan_config: CapacityPlanConfig | None = None
 
     @classmethod
     def from_dict(cls, dict_: dict[str, Any]) -> Self:
@@ -66,15 +162,114 @@ class DataLakeL2Config(ConstructConfigABC):
         # the program will then crash later on calling the abbr getter I have added to the enum.
 
         source_storage_l1_config = StorageL1Config.from_dict(dict_[SOURCE_STORAGE])
-        bronze_storage_l1_config = StorageL1Config.from_dict(dict_[SOURCE_STORAGE])
-        silver_storage_l1_config = StorageL1Config.from_dict(dict_[SOURCE_STORAGE])
-        gold_storage_l1_config = StorageL1Config.from_dict(dict_[SOURCE_STORAGE])
+        bronze_storage_l1_config = StorageL1Config.from_dict(dict_[BRONZE_STORAGE])
+        silver_storage_l1_config = StorageL1Config.from_dict(dict_[SILVER_STORAGE])
+        gold_storage_l1_config = StorageL1Config.from_dict(dict_[GOLD_STORAGE])
+        private_endpoints_l1_config = (
+            PrivateEndpointsL1Config.from_dict(dict_[PRIVATE_ENDPOINTS]) if PRIVATE_ENDPOINTS in dict_ else None
+        )
+        monitoring_l1_config = MonitoringL1Config.from_dict(dict_[MONITORING]) if MONITORING in dict_ else None
+        alerts_l1_config = StorageAlertsL1Config.from_dict(dict_[ALERTS]) if ALERTS in dict_ else None
 
         return cls(
             source_storage_l1_config=source_storage_l1_config,
             bronze_storage_l1_config=bronze_storage_l1_config,
             silver_storage_l1_config=silver_storage_l1_config,
             gold_storage_l1_config=gold_storage_l1_config,
+            private_endpoints_l1_config=private_endpoints_l1_config,
+            read_replica_layers=_read_replica_layers(dict_),
+            monitoring_l1_config=monitoring_l1_config,
+            alerts_l1_config=alerts_l1_config,
+            capacity_plan_config=_capacity_plan(dict_),
+        )
+
+
+class LazyDataLakeL2Config(LazyConfigABC):
+    """
+    A configuration class for DataLakeL2 that decodes each layer on first access.
+
+    Attributes:
+        source_storage_l1_config (StorageL1Config): The configuration for the source storage account.
+        bronze_storage_l1_config (StorageL1Config): The configuration for the bronze storage account.
+        silver_storage_l1_config (StorageL1Config): The configuration for the silver storage account.
+        gold_storage_l1_config (StorageL1Config): The configuration for the gold storage account.
+        private_endpoints_l1_config (PrivateEndpointsL1Config | None): The configuration for the private endpoints of
+            every layer without its own.
+        read_replica_layers (list[str]): The layers whose consumers read from the secondary region.
+        monitoring_l1_config (MonitoringL1Config | None): The configuration for the Log Analytics workspace every
+            layer sends its telemetry to.
+        alerts_l1_config (StorageAlertsL1Config | None): The alerts of every layer without its own.
+        capacity_plan_config (CapacityPlanConfig | None): The projected loads per layer.
+    """
+
+    @cached_property
+    def source_storage_l1_config(self) -> StorageL1Config:
+        """Gets the configuration for the source storage account."""
+        return StorageL1Config.from_dict(self.dict_[SOURCE_STORAGE])
+
+    @cached_property
+    def bronze_storage_l1_config(self) -> StorageL1Config:
+        """Gets the configuration for the bronze storage account."""
+        return StorageL1Config.from_dict(self.dict_[BRONZE_STORAGE])
+
+    @cached_property
+    def silver_storage_l1_config(self) -> StorageL1Config:
+        """Gets the configuration for the silver storage account."""
+        return StorageL1Config.from_dict(self.dict_[SILVER_STORAGE])
+
+    @cached_property
+    def gold_storage_l1_config(self) -> StorageL1Config:
+        """Gets the configuration for the gold storage account."""
+        return StorageL1Config.from_dict(self.dict_[GOLD_STORAGE])
+
+    @cached_property
+    def private_endpoints_l1_config(self) -> PrivateEndpointsL1Config | None:
+        """Gets the configuration for the private endpoints of every layer without its own."""
+        if PRIVATE_ENDPOINTS not in self.dict_:
+            return None
+        return PrivateEndpointsL1Config.from_dict(self.dict_[PRIVATE_ENDPOINTS])
+
+    @cached_property
+    def read_replica_layers(self) -> list[str]:
+        """Gets the layers whose consumers read from the secondary region."""
+        return _read_replica_layers(self.dict_)
+
+    @cached_property
+    def monitoring_l1_config(self) -> MonitoringL1Config | None:
+        """Gets the configuration for the Log Analytics workspace every layer sends its telemetry to."""
+        if MONITORING not in self.dict_:
+            return None
+        return MonitoringL1Config.from_dict(self.dict_[MONITORING])
+
+    @cached_property
+    def alerts_l1_config(self) -> StorageAlertsL1Config | None:
+        """Gets the configuration for the alerts of every layer without its own."""
+        if ALERTS not in self.dict_:
+            return None
+        return StorageAlertsL1Config.from_dict(self.dict_[ALERTS])
+
+    @cached_property
+    def capacity_plan_config(self) -> CapacityPlanConfig | None:
+        """Gets the projected loads per layer."""
+        return _capacity_plan(self.dict_)
+
+    def materialize(self) -> DataLakeL2Config:
+        """
+        Decode all layers and return the eager configuration.
+
+        Returns:
+            DataLakeL2Config: A fully-initialized DataLakeL2Config.
+        """
+        return DataLakeL2Config(
+            source_storage_l1_config=self.source_storage_l1_config,
+            bronze_storage_l1_config=self.bronze_storage_l1_config,
+            silver_storage_l1_config=self.silver_storage_l1_config,
+            gold_storage_l1_config=self.gold_storage_l1_config,
+            private_endpoints_l1_config=self.private_endpoints_l1_config,
+            read_replica_layers=self.read_replica_layers,
+            monitoring_l1_config=self.monitoring_l1_config,
+            alerts_l1_config=self.alerts_l1_config,
+            capacity_plan_config=self.capacity_plan_config,
         )
 
 
@@ -88,6 +283,12 @@ class DataLakeL2(Construct, ConstructABC, metaclass=CombinedMeta):
         bronze_storage_l1 (StorageL1): The bronze storage account.
         silver_storage_l1 (StorageL1): The silver storage account.
         gold_storage_l1 (StorageL1): The gold storage account.
+        private_dns_zones_l1 (PrivateDnsZonesL1 | None): The private DNS zones shared by the layers.
+        monitoring_l1 (MonitoringL1 | None): The Log Analytics workspace shared by the layers.
+        storage_l1s (dict[str, StorageL1]): The storage accounts in the selection per layer name, e.g. `gold`, and
+            partition, e.g. `gold_1`.
+        container_routing (dict[str, dict[str, str]]): The name of the storage account of each container per layer.
+        planned_accounts (list[PlannedAccount]): The storage accounts in the selection with a projected load.
     """
 
     def __init__(
@@ -96,8 +297,9 @@ class DataLakeL2(Construct, ConstructABC, metaclass=CombinedMeta):
         id_: str,
         *,
         env: str,
-        config: DataLakeL2Config,
+        config: DataLakeL2Config | LazyDataLakeL2Config,
         resource_group_name: str,
+        selection: ConstructSelection = SELECT_ALL,
     ) -> None:
         """
         Initializes the DataLakeL1 construct.
@@ -108,53 +310,262 @@ class DataLakeL2(Construct, ConstructABC, metaclass=CombinedMeta):
             env (str): The environment name.
             config (DataLakeL1Config): The configuration for the data lake.
             resource_group_name (str): The name of the resource group to create the storage accounts in.
+            selection (ConstructSelection): The construct subtree to instantiate, defaults to everything.
         """
         super().__init__(scope, id_)
 
-        self._source_storage_l1 = StorageL1(
-            self,
+        self._private_endpoints_l1_config = config.private_endpoints_l1_config
+        # Every layer with private endpoints resolves through the same zones, so the zones of all layers are created
+        # once here, a zone created per layer would collide on its name in the resource group.
+        endpoints_l1_configs: list[PrivateEndpointsL1Config] = []
+        for storage_l1_config in (
+            config.source_storage_l1_config,
+            config.bronze_storage_l1_config,
+            config.silver_storage_l1_config,
+            config.gold_storage_l1_config,
+        ):
+            endpoints_l1_config = storage_l1_config.private_endpoints_l1 or self._private_endpoints_l1_config
+            if endpoints_l1_config is not None:
+                endpoints_l1_configs.append(endpoints_l1_config)
+        self._private_dns_zone_ids: dict[str, str] = (
+            dict(self._private_endpoints_l1_config.private_dns_zone_ids)
+            if self._private_endpoints_l1_config is not None
+            else {}
+        )
+        subresources = list(
+            dict.fromkeys(
+                subresource
+                for endpoints_l1_config in endpoints_l1_configs
+                for subresource in endpoints_l1_config.subresources
+                if subresource not in endpoints_l1_config.private_dns_zone_ids
+                and subresource not in self._private_dns_zone_ids
+            )
+        )
+        self._private_dns_zones_l1: PrivateDnsZonesL1 | None = None
+        if subresources and (
+            selection.includes(f"{self.node.path}/PrivateDnsZonesL1") or self._includes_storage(selection)
+        ):
+            # The zones are shared by every layer, so they are created with any layer that may register in them.
+            self._private_dns_zones_l1 = PrivateDnsZonesL1(
+                self,
+                "PrivateDnsZonesL1",
+                env=env,
+                subresources=subresources,
+                virtual_network_ids=list(
+                    dict.fromkeys(
+                        virtual_network_id
+                        for endpoints_l1_config in endpoints_l1_configs
+                        for virtual_network_id in endpoints_l1_config.virtual_network_ids
+                    )
+                ),
+                resource_group_name=resource_group_name,
+            )
+            self._private_dns_zone_ids.update(self._private_dns_zones_l1.private_dns_zone_ids)
+
+        self._capacity_plan_config = config.capacity_plan_config
+        self._storage_l1_configs: dict[str, StorageL1Config] = {}
+        self._storage_l1s: dict[str, StorageL1] = {}
+        self._container_routing: dict[str, dict[str, str]] = {}
+        self._partitions: dict[str, int] = {}
+        self._alerts_l1_config = config.alerts_l1_config
+        self._monitoring_l1_config = config.monitoring_l1_config
+        self._monitoring_l1: MonitoringL1 | None = None
+        if self._monitoring_l1_config is not None and (
+            selection.includes(f"{self.node.path}/MonitoringL1") or self._includes_storage(selection)
+        ):
+            # The workspace is shared by every layer, so it is created with any layer that may send telemetry to it.
+            self._monitoring_l1 = MonitoringL1(
+                self,
+                "MonitoringL1",
+                env=env,
+                config=self._monitoring_l1_config,
+                resource_group_name=resource_group_name,
+            )
+
+        self._source_storage_l1 = self._storage_l1(
             "StorageL1_Source",
+            layer="source",
             env=env,
             config=config.source_storage_l1_config,
             resource_group_name=resource_group_name,
+            selection=selection,
+            read_replica="source" in config.read_replica_layers,
         )
 
-        self._bronze_storage_l1 = StorageL1(
-            self,
+        self._bronze_storage_l1 = self._storage_l1(
             "StorageL1_Bronze",
+            layer="bronze",
             env=env,
             config=config.bronze_storage_l1_config,
             resource_group_name=resource_group_name,
+            selection=selection,
+            read_replica="bronze" in config.read_replica_layers,
         )
 
-        self._silver_storage_l1 = StorageL1(
-            self,
+        self._silver_storage_l1 = self._storage_l1(
             "StorageL1_Silver",
+            layer="silver",
             env=env,
             config=config.silver_storage_l1_config,
             resource_group_name=resource_group_name,
+            selection=selection,
+            read_replica="silver" in config.read_replica_layers,
         )
 
-        self._gold_storage_l1 = StorageL1(
-            self,
+        self._gold_storage_l1 = self._storage_l1(
             "StorageL1_Gold",
+            layer="gold",
             env=env,
             config=config.gold_storage_l1_config,
             resource_group_name=resource_group_name,
+            selection=selection,
+            read_replica="gold" in config.read_replica_layers,
         )
 
+    def _storage_l1(
+        self,
+        id_: str,
+        *,
+        layer: str,
+        env: str,
+        config: StorageL1Config,
+        resource_group_name: str,
+        selection: ConstructSelection,
+        read_replica: bool = False,
+    ) -> StorageL1 | None:
+        """
+        Creates the storage of a single layer, one storage account per partition that is part of the selection.
+
+        A layer without its own private endpoint configuration uses the one of the data lake. Every layer registers
+        its endpoints in the private DNS zones shared by the data lake. A layer with a read replica has its
+        geo-redundant replication upgraded to read-access. A layer without its own diagnostics or alerts uses the ones
+        of the data lake. The containers of a partitioned layer are placed on the partitions by consistent hashing of
+        their names.
+
+        Args:
+            id_ (str): The scoped construct ID of the layer storage.
+            layer (str): The name of the layer, e.g. `gold`.
+            env (str): The environment name.
+            config (StorageL1Config): The configuration for the layer storage.
+            resource_group_name (str): The name of the resource group to create the storage account in.
+            selection (ConstructSelection): The construct subtree to instantiate.
+            read_replica (bool): Whether the layer has a read replica in the secondary region.
+
+        Returns:
+            StorageL1 | None: The storage of the first partition, None if it was left out of the selection.
+        """
+        self._partitions[layer] = config.partitions
+        partitions = [config.partition(index) for index in range(config.partitions)]
+        self._container_routing[layer] = {
+            container.name: partition.full_name(env) for partition in partitions for container in partition.containers
+        }
+
+        for index, partition in enumerate(partitions):
+            partition_id = get_partition_id(id_, index)
+            if not selection.includes(f"{self.node.path}/{partition_id}"):
+                continue
+            if read_replica and not partition.read_replica:
+                partition = replace(
+                    partition,
+                    read_replica=True,
+                    account_replication_type=READ_ACCESS_REPLICATION_TYPE_UPGRADES.get(
+                        partition.account_replication_type, partition.account_replication_type
+                    ),
+                )
+            if partition.private_endpoints_l1 is None and self._private_endpoints_l1_config is not None:
+                partition = replace(partition, private_endpoints_l1=self._private_endpoints_l1_config)
+            if partition.diagnostics_l1 is None and self._monitoring_l1_config is not None:
+                partition = replace(partition, diagnostics_l1=self._monitoring_l1_config.diagnostics_l1)
+            if partition.alerts_l1 is None and self._alerts_l1_config is not None:
+                partition = replace(partition, alerts_l1=self._alerts_l1_config)
+            self._storage_l1_configs[partition_id] = partition
+            self._storage_l1s[get_partition_id(layer, index)] = StorageL1(
+                self,
+                partition_id,
+                env=env,
+                config=partition,
+                resource_group_name=resource_group_name,
+                selection=selection,
+                private_dns_zone_ids=self._private_dns_zone_ids,
+                log_analytics_workspace_id=(
+                    self._monitoring_l1.log_analytics_workspace_id if self._monitoring_l1 is not None else None
+                ),
+            )
+        return self._storage_l1s.get(layer)
+
+    def _includes_storage(self, selection: ConstructSelection) -> bool:
+        """
+        Check whether the selection includes the storage of any layer or any of its partitions.
+
+        Args:
+            selection (ConstructSelection): The construct subtree to instantiate.
+
+        Returns:
+            bool: True if the selection includes the data lake or lies inside the storage of a layer.
+        """
+        parts = tuple(part for part in self.node.path.split(PATH_SEPARATOR) if part)
+        if len(selection.parts) <= len(parts):
+            return selection.includes(self.node.path)
+        return selection.parts[: len(parts)] == parts and selection.parts[len(parts)].startswith(STORAGE_L1_ID_PREFIX)
+
     @property
-    def source_storage_l1(self) -> StorageL1:
+    def source_storage_l1(self) -> StorageL1 | None:
         return self._source_storage_l1
 
     @property
-    def bronze_storage_l1(self) -> StorageL1:
+    def bronze_storage_l1(self) -> StorageL1 | None:
         return self._bronze_storage_l1
 
     @property
-    def silver_storage_l1(self) -> StorageL1:
+    def silver_storage_l1(self) -> StorageL1 | None:
         return self._silver_storage_l1
 
     @property
-    def gold_storage_l1(self) -> StorageL1:
+    def gold_storage_l1(self) -> StorageL1 | None:
         return self._gold_storage_l1
+
+    @property
+    def private_dns_zones_l1(self) -> PrivateDnsZonesL1 | None:
+        return self._private_dns_zones_l1
+
+    @property
+    def monitoring_l1(self) -> MonitoringL1 | None:
+        return self._monitoring_l1
+
+    @property
+    def storage_l1s(self) -> dict[str, StorageL1]:
+        """Gets the storage accounts in the selection per layer name, e.g. `gold`, and partition, e.g. `gold_1`."""
+        return dict(self._storage_l1s)
+
+    @property
+    def container_routing(self) -> dict[str, dict[str, str]]:
+        """Gets the name of the storage account each container is placed on, per layer name."""
+        return self._container_routing
+
+    @property
+    def planned_accounts(self) -> list[PlannedAccount]:
+        """
+        Gets the storage accounts in the selection with a projected load, as configured after all upgrades. The load
+        of a partitioned layer is spread evenly over its partitions.
+        """
+        if self._capacity_plan_config is None:
+            return []
+        planned_accounts: list[PlannedAccount] = []
+        for layer in LAYERS:
+            if layer not in self._capacity_plan_config.projected_loads:
+                continue
+            partitions = self._partitions[layer]
+            load = self._capacity_plan_config.projected_loads[layer].spread(partitions)
+            for index in range(partitions):
+                storage_l1 = self._storage_l1s.get(get_partition_id(layer, index))
+                if storage_l1 is None:
+                    continue
+                planned_accounts.append(
+                    PlannedAccount(
+                        name=storage_l1.storage_account.full_name,
+                        config=self._storage_l1_configs[storage_l1.node.id],
+                        load=load,
+                        target_utilization=self._capacity_plan_config.target_utilization,
+                    )
+                )
+        return planned_accounts
@@ -0,0 +1,221 @@
+"""
+Module drift
+
+This module detects drift between the synthesized configuration of a stack and its local state without running
+`terraform plan`. The desired resources are indexed by address from `cdk.tf.json`, then the state file is streamed
+once, comparing each resource to its desired attributes as it is read. Only literal desired values are compared;
+references to other resources (`${...}`) are resolved by Terraform and skipped, as are attributes the configuration
+does not set.
+
+Classes:
+    AttributeDrift: A desired attribute value that differs from the value in the state.
+    DriftReport: The drift of a stack.
+
+Functions:
+    read_desired_resources: Index the desired resources of a synthesized stack by address.
+    detect_drift: Compare the desired resources of a synthesized stack to its local state.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.json_stream import iter_array, iter_object
+from a1a_infra_base.operations.manifest import SynthesizedStack, read_manifest
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys of the synthesized Terraform JSON
+RESOURCE_KEY: Final[str] = "resource"
+METADATA_KEY_PREFIX: Final[str] = "//"
+META_ARGUMENTS: Final[frozenset[str]] = frozenset({"count", "depends_on", "for_each", "lifecycle", "provider"})
+REFERENCE_MARKER: Final[str] = "${"
+
+# Constants for dictionary keys of the state
+RESOURCES_KEY: Final[str] = "resources"
+MODE_KEY: Final[str] = "mode"
+MANAGED_MODE: Final[str] = "managed"
+TYPE_KEY: Final[str] = "type"
+NAME_KEY: Final[str] = "name"
+INSTANCES_KEY: Final[str] = "instances"
+ATTRIBUTES_KEY: Final[str] = "attributes"
+INDEX_KEY_KEY: Final[str] = "index_key"
+
+
+@dataclass
+class AttributeDrift:
+    """
+    A desired attribute value that differs from the value in the state.
+
+    Attributes:
+        address (str): The address of the resource, e.g. `azurerm_storage_account.<logical ID>`.
+        attribute (str): The path of the attribute, e.g. `account_tier` or `network_rules.0.default_action`.
+        desired (Any): The value in the synthesized configuration.
+        actual (Any): The value in the state.
+    """
+
+    address: str
+    attribute: str
+    desired: Any
+    actual: Any
+
+
+@dataclass
+class DriftReport:
+    """
+    The drift of a stack.
+
+    Attributes:
+        differences (list[AttributeDrift]): The attributes whose state differs from the configuration.
+        missing (list[str]): The addresses in the configuration that are not in the state.
+        unmanaged (list[str]): The addresses in the state that are not in the configuration.
+    """
+
+    differences: list[AttributeDrift] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    unmanaged: list[str] = field(default_factory=list)
+
+    @property
+    def drifted(self) -> bool:
+        """Gets whether the state differs from the configuration."""
+        return bool(self.differences or self.missing or self.unmanaged)
+
+
+def read_desired_resources(synthesized_stack_path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Index the desired resources of a synthesized stack by address, without metadata and meta-arguments.
+
+    Args:
+        synthesized_stack_path (Path): The path of the synthesized `cdk.tf.json`.
+
+    Returns:
+        dict[str, dict[str, Any]]: The configured attributes per resource address.
+    """
+    desired: dict[str, dict[str, Any]] = {}
+    for type_, resources in iter_object(synthesized_stack_path, (RESOURCE_KEY,)):
+        for name, config in resources.items():
+            desired[f"{type_}.{name}"] = {
+                key: value
+                for key, value in config.items()
+                if not key.startswith(METADATA_KEY_PREFIX) and key not in META_ARGUMENTS
+            }
+    return desired
+
+
+def _compare(desired: Any, actual: Any, path: str) -> Iterator[tuple[str, Any, Any]]:
+    """
+    Compare a desired value to the value in the state, recursing into blocks.
+
+    Only keys set in the desired value are compared, computed attributes in the state are ignored.
+
+    Args:
+        desired (Any): The value in the synthesized configuration.
+        actual (Any): The value in the state.
+        path (str): The attribute path of the value.
+
+    Yields:
+        tuple[str, Any, Any]: The attribute path, desired value and actual value of every difference.
+    """
+    if isinstance(desired, str) and REFERENCE_MARKER in desired:
+        return
+    if isinstance(desired, dict) and isinstance(actual, list) and len(actual) == 1:
+        # Single nested blocks are objects in the configuration and lists of one object in the state.
+        actual = actual[0]
+    if isinstance(desired, dict) and isinstance(actual, dict):
+        for key, value in desired.items():
+            yield from _compare(value, actual.get(key), f"{path}.{key}" if path else key)
+    elif isinstance(desired, list) and isinstance(actual, list) and len(desired) == len(actual):
+        for index, (desired_item, actual_item) in enumerate(zip(desired, actual)):
+            yield from _compare(desired_item, actual_item, f"{path}.{index}")
+    elif desired != actual:
+        yield path, desired, actual
+
+
+def detect_drift(stack: SynthesizedStack, state_path: Path | None = None) -> DriftReport:
+    """
+    Compare the desired resources of a synthesized stack to its local state in a single pass over the state.
+
+    Args:
+        stack (SynthesizedStack): The synthesized stack.
+        state_path (Path | None): The state file, defaults to the path of the local backend of the stack.
+
+    Returns:
+        DriftReport: The drift of the stack.
+
+    Raises:
+        ValueError: If no state path is given and the stack does not use a local backend.
+    """
+    state_path = state_path or stack.local_state_path()
+    if state_path is None:
+        raise ValueError(f"Stack '{stack.name}' does not use a local backend, pass the state path explicitly.")
+
+    desired = read_desired_resources(stack.synthesized_stack_path)
+    report = DriftReport()
+    if not state_path.is_file():
+        report.missing = sorted(desired)
+        return report
+
+    for resource in iter_array(state_path, (RESOURCES_KEY,)):
+        if resource.get(MODE_KEY) != MANAGED_MODE:
+            continue
+        address = f"{resource[TYPE_KEY]}.{resource[NAME_KEY]}"
+        config = desired.pop(address, None)
+        if config is None:
+            report.unmanaged.append(address)
+            continue
+
+        for instance in resource.get(INSTANCES_KEY, []):
+            instance_address = address
+            if INDEX_KEY_KEY in instance:
+                instance_address = f"{address}[{json.dumps(instance[INDEX_KEY_KEY])}]"
+            for attribute, desired_value, actual_value in _compare(config, instance.get(ATTRIBUTES_KEY, {}), ""):
+                report.differences.append(
+                    AttributeDrift(
+                        address=instance_address, attribute=attribute, desired=desired_value, actual=actual_value
+                    )
+                )
+
+    report.missing = sorted(desired)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect drift between synthesized stacks and their local state.")
+    parser.add_argument("--outdir", default="cdktf.out", type=str, help="Output directory of the synth.")
+    parser.add_argument("--stack", default=None, type=str, help="Only check the stack with this name.")
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    drifted_ = False
+    for stack_ in read_manifest(Path(args.outdir)):
+        if args.stack is not None and stack_.name != args.stack:
+            continue
+        if stack_.local_state_path() is None:
+            logger.info("[%s] skipped, the stack does not use a local backend.", stack_.name)
+            continue
+
+        report_ = detect_drift(stack_)
+        drifted_ = drifted_ or report_.drifted
+        for difference in report_.differences:
+            logger.warning(
+                "[%s] %s.%s: desired %r, actual %r",
+                stack_.name,
+                difference.address,
+                difference.attribute,
+                difference.desired,
+                difference.actual,
+            )
+        for address in report_.missing:
+            logger.warning("[%s] %s: not in state", stack_.name, address)
+        for address in report_.unmanaged:
+            logger.warning("[%s] %s: not in configuration", stack_.name, address)
+        if not report_.drifted:
+            logger.info("[%s] no drift", stack_.name)
+    sys.exit(1 if drifted_ else 0)
@@ -0,0 +1,124 @@
+"""
+Module executor
+
+This module defines how Terraform commands are executed for a synthesized stack. The Terraform binary is pluggable,
+so a local fake executable or a simulated executor can stand in for Terraform in tests.
+
+Classes:
+    ExecutionResult: The outcome of a single Terraform command.
+    TerraformExecutorABC: Abstract base class for Terraform executors.
+    TerraformCliExecutor: Runs Terraform commands as a subprocess in the working directory of the stack.
+"""
+
+import logging
+import os
+import subprocess
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Final
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.manifest import SynthesizedStack
+
+logger: logging.Logger = setup_logger(__name__)
+
+TERRAFORM_BINARY: Final[str] = "terraform"
+# Environment variable pointing Terraform at a CLI configuration, e.g. one written by the provider_mirror module
+CLI_CONFIG_ENV: Final[str] = "TF_CLI_CONFIG_FILE"
+
+
+@dataclass
+class ExecutionResult:
+    """
+    The outcome of a single Terraform command.
+
+    Attributes:
+        returncode (int): The exit code of the command.
+        output (list[str]): The output lines of the command, stdout and stderr combined.
+    """
+
+    returncode: int
+    output: list[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        """Gets whether the command exited successfully."""
+        return self.returncode == 0
+
+
+class TerraformExecutorABC(ABC):
+    """
+    Abstract base class for Terraform executors.
+
+    Methods:
+        run: Run a Terraform command for a stack.
+    """
+
+    @abstractmethod
+    def run(
+        self, stack: SynthesizedStack, args: list[str], on_output: Callable[[str], None] | None = None
+    ) -> ExecutionResult:
+        """
+        Run a Terraform command for a stack.
+
+        Args:
+            stack (SynthesizedStack): The stack to run the command for.
+            args (list[str]): The Terraform arguments, e.g. `["plan", "-input=false"]`.
+            on_output (Callable[[str], None] | None): Called with every output line as soon as it is produced.
+
+        Returns:
+            ExecutionResult: The outcome of the command.
+        """
+
+
+class TerraformCliExecutor(TerraformExecutorABC):
+    """
+    Runs Terraform commands as a subprocess in the working directory of the stack.
+
+    Attributes:
+        binary (str): The Terraform executable, a name on the PATH or a path.
+        env (dict[str, str]): Extra environment variables for the subprocess, e.g. `TF_CLI_CONFIG_FILE`.
+    """
+
+    def __init__(self, binary: str = TERRAFORM_BINARY, env: dict[str, str] | None = None) -> None:
+        """
+        Initializes the executor.
+
+        Args:
+            binary (str): The Terraform executable, a name on the PATH or a path.
+            env (dict[str, str] | None): Extra environment variables for the subprocess.
+        """
+        self.binary: str = binary
+        self.env: dict[str, str] = env or {}
+
+    def run(
+        self, stack: SynthesizedStack, args: list[str], on_output: Callable[[str], None] | None = None
+    ) -> ExecutionResult:
+        """
+        Run a Terraform command for a stack, streaming its output line by line.
+
+        Args:
+            stack (SynthesizedStack): The stack to run the command for.
+            args (list[str]): The Terraform arguments.
+            on_output (Callable[[str], None] | None): Called with every output line as soon as it is produced.
+
+        Returns:
+            ExecutionResult: The outcome of the command.
+        """
+        output: list[str] = []
+        with subprocess.Popen(
+            [self.binary, *args],
+            cwd=stack.working_directory,
+            env={**os.environ, "TF_IN_AUTOMATION": "1", **self.env},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ) as process:
+            assert process.stdout is not None
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                output.append(line)
+                if on_output is not None:
+                    on_output(line)
+        return ExecutionResult(returncode=process.returncode, output=output)
@@ -0,0 +1,375 @@
+"""
+Module impact
+
+This module determines which Terraform resources are affected by a change to a configuration document, so that only
+those resources are refreshed and planned. The `stack` sections of two versions of a document are diffed, each changed
+key is mapped to the construct it configures, and each construct to the addresses of the Terraform resources in its
+subtree. Containers are mapped by name, so a change to one container targets only that container, on the partition of
+the layer it is placed on before and after the change. A change to the private endpoints of a layer also targets the
+private DNS zones the layers share.
+
+Changes that cannot be mapped to a construct, such as the provider or backend, require a full plan.
+
+Classes:
+    ImpactAnalysis: The constructs and Terraform resource addresses affected by a configuration change.
+
+Functions:
+    get_resource_addresses: Get the Terraform address of every resource in a stack, keyed by construct path.
+    analyze_impact: Analyze which resources are affected by the change between two configuration documents.
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+from cdktf import App, TerraformResource, TerraformStack
+
+from a1a_infra_base.constructs.level0.storage_container import NAME_KEY as CONTAINER_NAME_KEY
+from a1a_infra_base.constructs.level1.storage import PARTITIONS_KEY, STORAGE_CONTAINERS_L0_KEY, STORAGE_L1_KEY
+from a1a_infra_base.constructs.level2.data_lake import (
+    ALERTS,
+    BRONZE_STORAGE,
+    CAPACITY_PLAN,
+    DATA_LAKE_KEY,
+    GOLD_STORAGE,
+    MONITORING,
+    PRIVATE_ENDPOINTS,
+    READ_REPLICA_LAYERS,
+    SILVER_STORAGE,
+    SOURCE_STORAGE,
+    get_partition_id,
+)
+from a1a_infra_base.file import FileHandlerFactory
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.executor import TERRAFORM_BINARY, TerraformCliExecutor
+from a1a_infra_base.operations.manifest import read_manifest
+from a1a_infra_base.operations.orchestrator import APPLY_COMMANDS, PLAN_COMMANDS, Orchestrator, StackStatus
+from a1a_infra_base.operations.throttling import AimdLimit, ThrottleAwareOrchestrator
+from a1a_infra_base.partitioning import get_partition
+from a1a_infra_base.selection import PATH_SEPARATOR
+from a1a_infra_base.stacks.ABC import CONSTRUCTS_KEY
+from a1a_infra_base.synth import ENV_KEY, NAME_KEY, STACK_KEY, build_stack, decode_stack_config, get_stack_definition
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Construct paths, relative to the stack, configured by a key path in the `stack` section of a document.
+CONSTRUCT_PATHS: Final[dict[str, dict[tuple[str, ...], str]]] = {
+    "lake_house": {
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, SOURCE_STORAGE): "DataLakeL2/StorageL1_Source",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, BRONZE_STORAGE): "DataLakeL2/StorageL1_Bronze",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, SILVER_STORAGE): "DataLakeL2/StorageL1_Silver",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, GOLD_STORAGE): "DataLakeL2/StorageL1_Gold",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, PRIVATE_ENDPOINTS): "DataLakeL2",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, READ_REPLICA_LAYERS): "DataLakeL2",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, MONITORING): "DataLakeL2",
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, ALERTS): "DataLakeL2",
+    },
+    "terraform_backend": {
+        (CONSTRUCTS_KEY, STORAGE_L1_KEY): "StorageL1",
+    },
+}
+# Key paths in the `stack` section of a document that configure no resources, e.g. the capacity check before synth.
+UNPROVISIONED_KEY_PATHS: Final[dict[str, set[tuple[str, ...]]]] = {
+    "lake_house": {(CONSTRUCTS_KEY, DATA_LAKE_KEY, CAPACITY_PLAN)},
+}
+# Key paths in the `stack` section of a document that configure a layer storage which may be partitioned.
+PARTITIONED_KEY_PATHS: Final[dict[str, set[tuple[str, ...]]]] = {
+    "lake_house": {
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, SOURCE_STORAGE),
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, BRONZE_STORAGE),
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, SILVER_STORAGE),
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, GOLD_STORAGE),
+    },
+}
+# Constructs, relative to the stack, shared by several layers and configured by a key path of each of them. The private
+# DNS zones of the data lake serve the private endpoints of every layer, so a layer that gains a sub-resource also needs
+# the zone and its virtual network links.
+SHARED_CONSTRUCT_PATHS: Final[dict[str, dict[tuple[str, ...], str]]] = {
+    "lake_house": {
+        (CONSTRUCTS_KEY, DATA_LAKE_KEY, layer, PRIVATE_ENDPOINTS): "DataLakeL2/PrivateDnsZonesL1"
+        for layer in (SOURCE_STORAGE, BRONZE_STORAGE, SILVER_STORAGE, GOLD_STORAGE)
+    },
+}
+CONTAINER_CONSTRUCT_ID_PREFIX: Final[str] = "StorageContainerL0_"
+
+
+@dataclass
+class ImpactAnalysis:
+    """
+    The constructs and Terraform resource addresses affected by a configuration change.
+
+    Attributes:
+        stack_id (str): The construct ID of the analyzed stack.
+        full_plan (bool): Whether the change requires a full plan instead of a targeted one.
+        reasons (list[str]): Why a full plan is required, one entry per unmapped change.
+        construct_paths (list[str]): The construct paths affected by the change.
+        targets (list[str]): The Terraform addresses of the resources affected by the change.
+    """
+
+    stack_id: str
+    full_plan: bool = False
+    reasons: list[str] = field(default_factory=list)
+    construct_paths: list[str] = field(default_factory=list)
+    targets: list[str] = field(default_factory=list)
+
+    @property
+    def unchanged(self) -> bool:
+        """Gets whether the change affects no resources at all."""
+        return not self.full_plan and not self.targets
+
+    def target_args(self) -> list[str]:
+        """
+        Get the `-target` arguments for `terraform plan`.
+
+        Returns:
+            list[str]: One `-target=<address>` per affected resource, empty for a full plan.
+        """
+        if self.full_plan:
+            return []
+        return [f"-target={target}" for target in self.targets]
+
+
+def get_resource_addresses(stack: TerraformStack) -> dict[str, str]:
+    """
+    Get the Terraform address of every resource in a stack, keyed by construct path.
+
+    Args:
+        stack (TerraformStack): The instantiated stack.
+
+    Returns:
+        dict[str, str]: The address, e.g. `azurerm_storage_container.<logical ID>`, per construct path.
+    """
+    return {
+        construct.node.path: f"{construct.terraform_resource_type}.{stack.get_logical_id(construct)}"
+        for construct in stack.node.find_all()
+        if isinstance(construct, TerraformResource)
+    }
+
+
+def _changed_key_paths(old: Any, new: Any, path: tuple[str, ...] = ()) -> list[tuple[str, ...]]:
+    """
+    Get the key paths whose values differ between two nested dictionaries. Lists are compared as a whole.
+
+    Args:
+        old (Any): The old value.
+        new (Any): The new value.
+        path (tuple[str, ...]): The key path of the values.
+
+    Returns:
+        list[tuple[str, ...]]: The key paths of the changed values.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed: list[tuple[str, ...]] = []
+        for key in sorted(old.keys() | new.keys()):
+            changed.extend(_changed_key_paths(old.get(key), new.get(key), (*path, key)))
+        return changed
+    return [path] if old != new else []
+
+
+def _changed_container_names(old: list[dict[str, Any]] | None, new: list[dict[str, Any]] | None) -> list[str]:
+    """
+    Get the names of the containers that were added, removed or changed.
+
+    Args:
+        old (list[dict[str, Any]] | None): The old container configurations.
+        new (list[dict[str, Any]] | None): The new container configurations.
+
+    Returns:
+        list[str]: The changed container names, sorted.
+    """
+    old_by_name = {container[CONTAINER_NAME_KEY]: container for container in old or []}
+    new_by_name = {container[CONTAINER_NAME_KEY]: container for container in new or []}
+    return sorted(
+        name for name in old_by_name.keys() | new_by_name.keys() if old_by_name.get(name) != new_by_name.get(name)
+    )
+
+
+def _get(dict_: dict[str, Any], path: tuple[str, ...]) -> Any:
+    """
+    Get the value at a key path of a nested dictionary.
+
+    Args:
+        dict_ (dict[str, Any]): The nested dictionary.
+        path (tuple[str, ...]): The key path.
+
+    Returns:
+        Any: The value, or None if the path does not exist.
+    """
+    value: Any = dict_
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _get_construct_paths(
+    name: str, stack_id: str, key_path: tuple[str, ...], *, old_stack: dict[str, Any], new_stack: dict[str, Any]
+) -> list[str] | None:
+    """
+    Get the construct paths configured by a changed key path, including the shared constructs it configures.
+
+    A partitioned layer is affected on its partitions both before and after the change, and a changed container only
+    on the partition it is placed on.
+
+    Args:
+        name (str): The stack name of the document.
+        stack_id (str): The construct ID of the stack.
+        key_path (tuple[str, ...]): The changed key path in the `stack` section.
+        old_stack (dict[str, Any]): The old `stack` section.
+        new_stack (dict[str, Any]): The new `stack` section.
+
+    Returns:
+        list[str] | None: The affected construct paths, or None if the key path is not mapped to a construct.
+    """
+    construct_paths = CONSTRUCT_PATHS.get(name, {})
+    prefix = next(
+        (key_path[:length] for length in range(len(key_path), 0, -1) if key_path[:length] in construct_paths), None
+    )
+    if prefix is None:
+        return None
+
+    construct_path = f"{stack_id}{PATH_SEPARATOR}{construct_paths[prefix]}"
+    partitions = {1}
+    if prefix in PARTITIONED_KEY_PATHS.get(name, set()):
+        partitions = {_get(stack, (*prefix, PARTITIONS_KEY)) or 1 for stack in (old_stack, new_stack)}
+
+    affected: list[str] = [
+        f"{stack_id}{PATH_SEPARATOR}{shared_path}"
+        for shared_prefix, shared_path in SHARED_CONSTRUCT_PATHS.get(name, {}).items()
+        if key_path[: len(shared_prefix)] == shared_prefix
+    ]
+    if key_path[len(prefix) :] == (STORAGE_CONTAINERS_L0_KEY,):
+        changed_names = _changed_container_names(_get(old_stack, key_path), _get(new_stack, key_path))
+        affected.extend(
+            f"{get_partition_id(construct_path, get_partition(container_name, count))}"
+            f"{PATH_SEPARATOR}{CONTAINER_CONSTRUCT_ID_PREFIX}{container_name}"
+            for container_name in changed_names
+            for count in partitions
+        )
+    else:
+        affected.extend(get_partition_id(construct_path, index) for index in range(max(partitions)))
+    return affected
+
+
+def analyze_impact(old: dict[str, Any], new: dict[str, Any], env: str | None = None) -> ImpactAnalysis:
+    """
+    Analyze which resources are affected by the change between two versions of a configuration document.
+
+    Addresses are collected from both versions, so resources that are removed by the change are targeted too.
+
+    Args:
+        old (dict[str, Any]): The old configuration document.
+        new (dict[str, Any]): The new configuration document.
+        env (str | None): The environment name, defaults to the `env` of the new document.
+
+    Returns:
+        ImpactAnalysis: The affected constructs and resource addresses.
+    """
+    name: str = new[NAME_KEY]
+    env = env or new[ENV_KEY]
+    stack_id = get_stack_definition(name).id_
+    impact = ImpactAnalysis(stack_id=stack_id)
+
+    if old[NAME_KEY] != name:
+        impact.full_plan = True
+        impact.reasons.append(f"stack name changed from '{old[NAME_KEY]}' to '{name}'")
+        return impact
+
+    old_stack: dict[str, Any] = old[STACK_KEY]
+    new_stack: dict[str, Any] = new[STACK_KEY]
+    unprovisioned_key_paths = UNPROVISIONED_KEY_PATHS.get(name, set())
+
+    for key_path in _changed_key_paths(old_stack, new_stack):
+        if any(key_path[:length] in unprovisioned_key_paths for length in range(1, len(key_path) + 1)):
+            continue
+        construct_paths = _get_construct_paths(name, stack_id, key_path, old_stack=old_stack, new_stack=new_stack)
+        if construct_paths is None:
+            impact.full_plan = True
+            impact.reasons.append(f"'{'.'.join(key_path)}' is not mapped to a construct")
+            continue
+        impact.construct_paths.extend(construct_paths)
+
+    impact.construct_paths = sorted(set(impact.construct_paths))
+    if impact.full_plan or not impact.construct_paths:
+        return impact
+
+    addresses: set[str] = set()
+    # The app is only built to look up addresses, so it writes its output to a directory that is removed afterwards
+    with tempfile.TemporaryDirectory() as outdir:
+        for document in (old_stack, new_stack):
+            stack = build_stack(
+                App(outdir=outdir, skip_validation=True),
+                name=name,
+                env=env,
+                config=decode_stack_config(name=name, dict_=document),
+            )
+            for resource_path, address in get_resource_addresses(stack).items():
+                if any(
+                    resource_path == construct_path or resource_path.startswith(f"{construct_path}{PATH_SEPARATOR}")
+                    for construct_path in impact.construct_paths
+                ):
+                    addresses.add(address)
+    impact.targets = sorted(addresses)
+    return impact
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plan only the resources affected by a configuration change.")
+    parser.add_argument("--old-config-filepath", required=True, type=str, help="Path to the previous config file.")
+    parser.add_argument("--new-config-filepath", required=True, type=str, help="Path to the changed config file.")
+    parser.add_argument("--env", default=None, type=str, help="Environment name, defaults to env of the new config.")
+    parser.add_argument(
+        "--run",
+        choices=["plan", "apply"],
+        default=None,
+        help="Run a targeted plan or apply of the synthesized stacks in --outdir instead of printing the targets.",
+    )
+    parser.add_argument("--outdir", default="cdktf.out", type=str, help="Output directory of the synth.")
+    parser.add_argument("--terraform-binary", default=TERRAFORM_BINARY, type=str, help="Terraform executable to run.")
+    parser.add_argument(
+        "--max-writes-per-subscription",
+        default=None,
+        type=float,
+        help="Adapt concurrency to ARM throttling, starting at this many concurrent writes per subscription.",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    impact_ = analyze_impact(
+        old=FileHandlerFactory.create(filepath=args.old_config_filepath).read(),
+        new=FileHandlerFactory.create(filepath=args.new_config_filepath).read(),
+        env=args.env,
+    )
+    for reason in impact_.reasons:
+        logger.info("Full plan required: %s.", reason)
+
+    if args.run is None:
+        print("\n".join(impact_.target_args()))
+        sys.exit(0)
+    if impact_.unchanged:
+        logger.info("No resources affected, nothing to run.")
+        sys.exit(0)
+
+    stacks_ = [stack_ for stack_ in read_manifest(Path(args.outdir)) if stack_.name == impact_.stack_id]
+    executor_ = TerraformCliExecutor(binary=args.terraform_binary)
+    commands_ = PLAN_COMMANDS if args.run == "plan" else APPLY_COMMANDS
+    targets_ = {impact_.stack_id: impact_.targets} if not impact_.full_plan else None
+    orchestrator: Orchestrator
+    if args.max_writes_per_subscription is None:
+        orchestrator = Orchestrator(stacks=stacks_, executor=executor_, commands=commands_, targets=targets_)
+    else:
+        orchestrator = ThrottleAwareOrchestrator(
+            stacks=stacks_,
+            executor=executor_,
+            commands=commands_,
+            targets=targets_,
+            limit=AimdLimit(value=args.max_writes_per_subscription),
+        )
+    stack_results = orchestrator.run()
+    sys.exit(0 if all(result.status is StackStatus.SUCCEEDED for result in stack_results.values()) else 1)
@@ -0,0 +1,273 @@
+"""
+Module json_stream
+
+This module reads large JSON documents, such as Terraform state and plan files, incrementally. Only the current chunk
+and the value being decoded are held in memory: values outside of the requested key path are skipped by scanning for
+structural characters, and the members of the requested object or array are decoded one at a time.
+
+Classes:
+    JsonStream: An incremental reader over a JSON text file.
+
+Functions:
+    iter_array: Iterate over the elements of the array at a key path of a JSON file.
+    iter_object: Iterate over the members of the object at a key path of a JSON file.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Final, TextIO
+
+CHUNK_SIZE: Final[int] = 1 << 16
+WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s*")
+STRUCTURAL_PATTERN: Final[re.Pattern[str]] = re.compile(r'["{}\[\]]')
+STRING_PATTERN: Final[re.Pattern[str]] = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+class JsonStream:
+    """
+    An incremental reader over a JSON text file.
+
+    The reader keeps a buffer of unread text and a position in it. Methods that yield keys leave the position at the
+    corresponding value, which the caller consumes with `read_value` or `skip_value` before advancing.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Initializes the reader.
+
+        Args:
+            file (TextIO): The file to read, positioned at the start of a JSON value.
+            chunk_size (int): The minimum number of characters read from the file at a time.
+        """
+        self._file: TextIO = file
+        self._chunk_size: int = chunk_size
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._consumed: int = 0
+        self._eof: bool = False
+        self._decoder = json.JSONDecoder()
+
+    @property
+    def offset(self) -> int:
+        """Gets the number of characters consumed from the file so far."""
+        return self._consumed + self._pos
+
+    def _read_more(self) -> bool:
+        """
+        Drop the consumed text from the buffer and append the next chunk of the file.
+
+        The chunk grows with the unread part of the buffer, so decoding a large value retries a logarithmic number
+        of times.
+
+        Returns:
+            bool: False if the end of the file was reached.
+        """
+        chunk = self._file.read(max(self._chunk_size, len(self._buffer) - self._pos))
+        self._consumed += self._pos
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        if not chunk:
+            self._eof = True
+        return bool(chunk)
+
+    def _peek(self) -> str:
+        """
+        Skip whitespace and get the next character without consuming it.
+
+        Returns:
+            str: The next character, or an empty string at the end of the file.
+        """
+        while True:
+            match = WHITESPACE_PATTERN.match(self._buffer, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        """
+        Consume the next non-whitespace character, which must be the given character.
+
+        Args:
+            char (str): The expected character.
+
+        Raises:
+            ValueError: If the next character is a different one.
+        """
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found}' in JSON stream.")
+        self._pos += 1
+
+    def _advance_separator(self, closing: str) -> bool:
+        """
+        Consume the separator after a member or element.
+
+        Args:
+            closing (str): The closing character of the enclosing object or array.
+
+        Returns:
+            bool: True if another member or element follows, False if the enclosing value ended.
+
+        Raises:
+            ValueError: If the next character is neither a comma nor the closing character.
+        """
+        char = self._peek()
+        if char not in (",", closing):
+            raise ValueError(f"Expected ',' or '{closing}' but found '{char}' in JSON stream.")
+        self._pos += 1
+        return char == ","
+
+    def read_value(self) -> Any:
+        """
+        Decode the next value.
+
+        Returns:
+            Any: The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the value is not valid JSON.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and not self._eof:
+                self._read_more()
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """
+        Skip the next value without decoding it.
+
+        Raises:
+            ValueError: If the file ends inside the value.
+        """
+        if self._peek() not in ("{", "["):
+            self.read_value()
+            return
+
+        depth = 0
+        while True:
+            match = STRUCTURAL_PATTERN.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._read_more():
+                    raise ValueError("Unexpected end of JSON stream.")
+                continue
+
+            char = match.group()
+            if char == '"':
+                string = STRING_PATTERN.match(self._buffer, match.start())
+                if string is None:
+                    self._pos = match.start()
+                    if not self._read_more():
+                        raise ValueError("Unexpected end of JSON stream.")
+                    continue
+                self._pos = string.end()
+                continue
+
+            self._pos = match.end()
+            depth += 1 if char in ("{", "[") else -1
+            if depth == 0:
+                return
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next object. The caller consumes each value before requesting the next key.
+
+        Yields:
+            str: The key of each member, with the position at its value.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self._expect(":")
+            yield key
+            if not self._advance_separator("}"):
+                return
+
+    def iter_elements(self) -> Iterator[Any]:
+        """
+        Iterate over the elements of the next array, decoding one element at a time.
+
+        Yields:
+            Any: Each decoded element.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if not self._advance_separator("]"):
+                return
+
+    def seek(self, keys: tuple[str, ...]) -> bool:
+        """
+        Move to the value at a key path of the next object, skipping all members before it.
+
+        Args:
+            keys (tuple[str, ...]): The key path, e.g. `("resource",)`.
+
+        Returns:
+            bool: True if the key path exists, with the position at its value.
+        """
+        for key in keys:
+            if self._peek() != "{":
+                return False
+            for candidate in self.iter_keys():
+                if candidate == key:
+                    break
+                self.skip_value()
+            else:
+                return False
+        return True
+
+
+def iter_array(path: Path, keys: tuple[str, ...]) -> Iterator[Any]:
+    """
+    Iterate over the elements of the array at a key path of a JSON file, e.g. the `resources` of a state file.
+
+    Args:
+        path (Path): The JSON file.
+        keys (tuple[str, ...]): The key path of the array.
+
+    Yields:
+        Any: Each decoded element, nothing if the key path does not exist.
+    """
+    with path.open(encoding="utf-8") as file:
+        stream = JsonStream(file)
+        if stream.seek(keys):
+            yield from stream.iter_elements()
+
+
+def iter_object(path: Path, keys: tuple[str, ...]) -> Iterator[tuple[str, Any]]:
+    """
+    Iterate over the members of the object at a key path of a JSON file, e.g. the `resource` of `cdk.tf.json`.
+
+    Args:
+        path (Path): The JSON file.
+        keys (tuple[str, ...]): The key path of the object.
+
+    Yields:
+        tuple[str, Any]: Each key with its decoded value, nothing if the key path does not exist.
+    """
+    with path.open(encoding="utf-8") as file:
+        stream = JsonStream(file)
+        if stream.seek(keys):
+            for key in stream.iter_keys():
+                yield key, stream.read_value()
@@ -0,0 +1,121 @@
+"""
+Module manifest
+
+This module reads the manifest that `app.synth()` writes to the output directory, listing the synthesized stacks,
+their working directories and their cross-stack dependencies.
+
+Classes:
+    SynthesizedStack: A stack as synthesized to the output directory.
+
+Functions:
+    read_manifest: Read the synthesized stacks from the manifest in an output directory.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final, Self
+
+from a1a_infra_base.file import FileHandlerFactory
+
+# Constants for dictionary keys
+MANIFEST_FILENAME: Final[str] = "manifest.json"
+STACKS_KEY: Final[str] = "stacks"
+NAME_KEY: Final[str] = "name"
+WORKING_DIRECTORY_KEY: Final[str] = "workingDirectory"
+SYNTHESIZED_STACK_PATH_KEY: Final[str] = "synthesizedStackPath"
+DEPENDENCIES_KEY: Final[str] = "dependencies"
+
+# Constants for dictionary keys of the synthesized Terraform JSON
+TERRAFORM_KEY: Final[str] = "terraform"
+BACKEND_KEY: Final[str] = "backend"
+LOCAL_KEY: Final[str] = "local"
+PATH_KEY: Final[str] = "path"
+
+
+@dataclass
+class SynthesizedStack:
+    """
+    A stack as synthesized to the output directory.
+
+    Attributes:
+        name (str): The name of the stack.
+        working_directory (Path): The directory to run Terraform in.
+        synthesized_stack_path (Path): The path of the synthesized `cdk.tf.json`.
+        dependencies (list[str]): The names of the stacks this stack depends on.
+    """
+
+    name: str
+    working_directory: Path
+    synthesized_stack_path: Path
+    dependencies: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any], outdir: Path) -> Self:
+        """
+        Create a SynthesizedStack by unpacking a stack entry of the manifest.
+
+        Expected format of 'dict_':
+        {
+            "name": "<stack name>",
+            "workingDirectory": "<path relative to outdir>",
+            "synthesizedStackPath": "<path relative to outdir>",
+            "dependencies": ["<stack name>", ...]
+        }
+
+        Args:
+            dict_ (dict[str, Any]): A stack entry of the manifest.
+            outdir (Path): The output directory the manifest paths are relative to.
+
+        Returns:
+            SynthesizedStack: A fully-initialized SynthesizedStack.
+        """
+        name = dict_[NAME_KEY]
+        working_directory = outdir / dict_[WORKING_DIRECTORY_KEY]
+        synthesized_stack_path = outdir / dict_[SYNTHESIZED_STACK_PATH_KEY]
+        dependencies = list(dict_.get(DEPENDENCIES_KEY, []))
+        return cls(
+            name=name,
+            working_directory=working_directory,
+            synthesized_stack_path=synthesized_stack_path,
+            dependencies=dependencies,
+        )
+
+    def read(self) -> dict[str, Any]:
+        """
+        Read the synthesized Terraform JSON of the stack.
+
+        Returns:
+            dict[str, Any]: The contents of `cdk.tf.json`.
+        """
+        return FileHandlerFactory.create(filepath=str(self.synthesized_stack_path)).read()
+
+    def local_state_path(self, synthesized: dict[str, Any] | None = None) -> Path | None:
+        """
+        Get the path of the state file of the stack if it uses a local backend.
+
+        Args:
+            synthesized (dict[str, Any] | None): The synthesized Terraform JSON, read from disk if not given.
+
+        Returns:
+            Path | None: The state file, relative paths resolved against the working directory, or None if the stack
+                does not use a local backend.
+        """
+        synthesized = synthesized if synthesized is not None else self.read()
+        local_backend = synthesized.get(TERRAFORM_KEY, {}).get(BACKEND_KEY, {}).get(LOCAL_KEY)
+        if local_backend is None:
+            return None
+        return self.working_directory / local_backend[PATH_KEY]
+
+
+def read_manifest(outdir: Path) -> list[SynthesizedStack]:
+    """
+    Read the synthesized stacks from the manifest in an output directory.
+
+    Args:
+        outdir (Path): The output directory of the synth, usually `cdktf.out`.
+
+    Returns:
+        list[SynthesizedStack]: The synthesized stacks, in manifest order.
+    """
+    manifest = FileHandlerFactory.create(filepath=str(outdir / MANIFEST_FILENAME)).read()
+    return [SynthesizedStack.from_dict(stack, outdir=outdir) for stack in manifest[STACKS_KEY].values()]
@@ -0,0 +1,386 @@
+"""
+Module orchestrator
+
+This module runs `terraform init`, `plan` and `apply` over the synthesized stacks concurrently on a worker pool. A
+stack starts once all stacks it depends on have succeeded; dependents of a failed stack are skipped. The output of
+each stack is streamed to the log with the stack name as prefix. With a plan cache, stacks whose inputs did not change
+since their last plan reuse the saved plan instead of planning again.
+
+Classes:
+    StackStatus: The state of a stack during an orchestrated run.
+    StackResult: The outcome of an orchestrated run for a single stack.
+    Orchestrator: Runs Terraform commands over synthesized stacks in dependency order with bounded parallelism.
+"""
+
+import argparse
+import json
+import logging
+import shutil
+import sys
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Final
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.executor import (
+    CLI_CONFIG_ENV,
+    TERRAFORM_BINARY,
+    ExecutionResult,
+    TerraformCliExecutor,
+    TerraformExecutorABC,
+)
+from a1a_infra_base.operations.manifest import SynthesizedStack, read_manifest
+from a1a_infra_base.operations.plan_cache import PLAN_FILENAME, PlanCache, summarize_plan
+
+logger: logging.Logger = setup_logger(__name__)
+
+COMMANDS: Final[dict[str, list[str]]] = {
+    "init": ["init", "-input=false"],
+    "plan": ["plan", "-input=false", f"-out={PLAN_FILENAME}"],
+    "apply": ["apply", "-input=false", "-auto-approve", PLAN_FILENAME],
+}
+SHOW_PLAN_ARGS: Final[list[str]] = ["show", "-json", PLAN_FILENAME]
+PLAN_COMMANDS: Final[list[str]] = ["init", "plan"]
+APPLY_COMMANDS: Final[list[str]] = ["init", "plan", "apply"]
+
+
+class StackStatus(Enum):
+    """
+    The state of a stack during an orchestrated run.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class StackResult:
+    """
+    The outcome of an orchestrated run for a single stack.
+
+    Attributes:
+        name (str): The name of the stack.
+        status (StackStatus): The final state of the stack.
+        failed_command (str | None): The command that failed, if any.
+        output (list[str]): The output lines of all commands that ran for the stack.
+    """
+
+    name: str
+    status: StackStatus
+    failed_command: str | None = None
+    output: list[str] = field(default_factory=list)
+
+
+class Orchestrator:
+    """
+    Runs Terraform commands over synthesized stacks in dependency order with bounded parallelism.
+
+    Subclasses can shape scheduling through `_admit`, `_on_output` and `_on_finished`, which are called for every
+    stack that is about to start, every output line and every finished stack respectively.
+
+    Attributes:
+        stacks (dict[str, SynthesizedStack]): The stacks to run, keyed by name.
+        executor (TerraformExecutorABC): The executor that runs Terraform commands.
+        commands (list[str]): The commands to run per stack, keys of `COMMANDS`.
+        parallelism (int): The maximum number of stacks running at the same time.
+        plan_cache (PlanCache | None): The cache of saved plans, None to always plan.
+        targets (dict[str, list[str]]): Resource addresses to restrict the plan to, per stack name.
+    """
+
+    def __init__(
+        self,
+        stacks: Iterable[SynthesizedStack],
+        executor: TerraformExecutorABC,
+        commands: list[str] | None = None,
+        parallelism: int = 4,
+        plan_cache: PlanCache | None = None,
+        targets: dict[str, list[str]] | None = None,
+    ) -> None:
+        """
+        Initializes the orchestrator.
+
+        Args:
+            stacks (Iterable[SynthesizedStack]): The stacks to run.
+            executor (TerraformExecutorABC): The executor that runs Terraform commands.
+            commands (list[str] | None): The commands to run per stack, defaults to init, plan and apply.
+            parallelism (int): The maximum number of stacks running at the same time.
+            plan_cache (PlanCache | None): The cache of saved plans, None to always plan.
+            targets (dict[str, list[str]] | None): Resource addresses to restrict the plan to, per stack name.
+                Targeted plans are partial, so they bypass the plan cache.
+
+        Raises:
+            ValueError: If a command is unknown, parallelism is below one, or the dependencies contain a cycle.
+        """
+        self.stacks: dict[str, SynthesizedStack] = {stack.name: stack for stack in stacks}
+        self.executor: TerraformExecutorABC = executor
+        self.commands: list[str] = commands if commands is not None else list(APPLY_COMMANDS)
+        self.parallelism: int = parallelism
+        self.plan_cache: PlanCache | None = plan_cache
+        self.targets: dict[str, list[str]] = targets or {}
+
+        unknown_commands = [command for command in self.commands if command not in COMMANDS]
+        if unknown_commands:
+            raise ValueError(f"Unknown commands {unknown_commands}, supported are {sorted(COMMANDS)}.")
+        if parallelism < 1:
+            raise ValueError(f"Parallelism must be at least 1, got {parallelism}.")
+
+        self._dependencies: dict[str, set[str]] = {}
+        for stack in self.stacks.values():
+            unknown = [dependency for dependency in stack.dependencies if dependency not in self.stacks]
+            if unknown:
+                logger.warning(
+                    "[%s] dependencies %s are not part of this run, treating them as satisfied.", stack.name, unknown
+                )
+            self._dependencies[stack.name] = {
+                dependency for dependency in stack.dependencies if dependency in self.stacks
+            }
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        """
+        Check the stack dependencies form a directed acyclic graph.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle.
+        """
+        remaining = {name: set(dependencies) for name, dependencies in self._dependencies.items()}
+        while remaining:
+            ready = [name for name, dependencies in remaining.items() if not dependencies]
+            if not ready:
+                raise ValueError(f"Stack dependencies contain a cycle between {sorted(remaining)}.")
+            for name in ready:
+                del remaining[name]
+            for dependencies in remaining.values():
+                dependencies.difference_update(ready)
+
+    def run(self) -> dict[str, StackResult]:
+        """
+        Run the commands for all stacks.
+
+        Returns:
+            dict[str, StackResult]: The outcome per stack, keyed by name.
+        """
+        status: dict[str, StackStatus] = {name: StackStatus.PENDING for name in self.stacks}
+        results: dict[str, StackResult] = {}
+        running: dict[Future[StackResult], str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.parallelism, thread_name_prefix="terraform") as pool:
+            while True:
+                for name in self._ready(status):
+                    if len(running) >= self.parallelism:
+                        break
+                    if not self._admit(self.stacks[name]):
+                        continue
+                    status[name] = StackStatus.RUNNING
+                    running[pool.submit(self._run_stack, self.stacks[name])] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result = future.result()
+                    status[name] = result.status
+                    results[name] = result
+                    self._on_finished(self.stacks[name], result)
+                    if result.status is StackStatus.FAILED:
+                        self._skip_dependents(name, status, results)
+
+        for name, stack_status in status.items():
+            if stack_status is StackStatus.PENDING:
+                results[name] = StackResult(name=name, status=StackStatus.SKIPPED)
+        return {name: results[name] for name in self.stacks}
+
+    def _ready(self, status: dict[str, StackStatus]) -> list[str]:
+        """
+        Get the pending stacks whose dependencies have all succeeded.
+
+        Args:
+            status (dict[str, StackStatus]): The current state per stack.
+
+        Returns:
+            list[str]: The names of the stacks that can start.
+        """
+        return [
+            name
+            for name, stack_status in status.items()
+            if stack_status is StackStatus.PENDING
+            and all(status[dependency] is StackStatus.SUCCEEDED for dependency in self._dependencies[name])
+        ]
+
+    def _skip_dependents(self, name: str, status: dict[str, StackStatus], results: dict[str, StackResult]) -> None:
+        """
+        Mark all stacks that directly or transitively depend on a failed stack as skipped.
+
+        Args:
+            name (str): The name of the failed stack.
+            status (dict[str, StackStatus]): The current state per stack, updated in place.
+            results (dict[str, StackResult]): The outcome per stack, updated in place.
+        """
+        for dependent, dependencies in self._dependencies.items():
+            if name in dependencies and status[dependent] is StackStatus.PENDING:
+                logger.error("[%s] skipped because dependency '%s' did not succeed.", dependent, name)
+                status[dependent] = StackStatus.SKIPPED
+                results[dependent] = StackResult(name=dependent, status=StackStatus.SKIPPED)
+                self._skip_dependents(dependent, status, results)
+
+    def _run_stack(self, stack: SynthesizedStack) -> StackResult:
+        """
+        Run the commands for a single stack, stopping at the first failing command.
+
+        Args:
+            stack (SynthesizedStack): The stack to run.
+
+        Returns:
+            StackResult: The outcome for the stack.
+        """
+        output: list[str] = []
+        for command in self.commands:
+            logger.info("[%s] terraform %s", stack.name, command)
+            targets = self.targets.get(stack.name, []) if command == "plan" else []
+            if command == "plan" and self.plan_cache is not None and not targets:
+                result = self._run_plan_cached(stack, self.plan_cache)
+            else:
+                result = self.executor.run(
+                    stack,
+                    [*COMMANDS[command], *(f"-target={target}" for target in targets)],
+                    on_output=lambda line: self._on_output(stack, line),
+                )
+            output.extend(result.output)
+            if not result.succeeded:
+                logger.error("[%s] terraform %s failed with exit code %d.", stack.name, command, result.returncode)
+                return StackResult(name=stack.name, status=StackStatus.FAILED, failed_command=command, output=output)
+        return StackResult(name=stack.name, status=StackStatus.SUCCEEDED, output=output)
+
+    def _run_plan_cached(self, stack: SynthesizedStack, plan_cache: PlanCache) -> ExecutionResult:
+        """
+        Restore the saved plan of a stack from the cache, or plan it and store the saved plan on a miss.
+
+        Args:
+            stack (SynthesizedStack): The stack to plan.
+            plan_cache (PlanCache): The cache of saved plans.
+
+        Returns:
+            ExecutionResult: The outcome of the plan, a successful result without running Terraform on a cache hit.
+        """
+        plan_path = stack.working_directory / PLAN_FILENAME
+        key = plan_cache.key(stack)
+        entry = plan_cache.get(key) if key is not None else None
+        if entry is not None:
+            shutil.copyfile(entry.plan_path, plan_path)
+            line = f"Plan restored from cache entry {key}."
+            self._on_output(stack, line)
+            return ExecutionResult(returncode=0, output=[line])
+
+        result = self.executor.run(stack, COMMANDS["plan"], on_output=lambda line: self._on_output(stack, line))
+        if result.succeeded and key is not None:
+            show = self.executor.run(stack, SHOW_PLAN_ARGS)
+            if show.succeeded:
+                plan_cache.put(key, plan_path, summarize_plan(json.loads("\n".join(show.output))))
+        return result
+
+    def _admit(self, stack: SynthesizedStack) -> bool:  # pylint: disable=unused-argument
+        """
+        Decide whether a ready stack may start now. Called from the scheduling thread.
+
+        Args:
+            stack (SynthesizedStack): The stack about to start.
+
+        Returns:
+            bool: True to start the stack now, False to keep it pending.
+        """
+        return True
+
+    def _on_output(self, stack: SynthesizedStack, line: str) -> None:
+        """
+        Handle an output line of a stack. Called from worker threads.
+
+        Args:
+            stack (SynthesizedStack): The stack that produced the line.
+            line (str): The output line.
+        """
+        logger.info("[%s] %s", stack.name, line)
+
+    def _on_finished(self, stack: SynthesizedStack, result: StackResult) -> None:
+        """
+        Handle a finished stack. Called from the scheduling thread.
+
+        Args:
+            stack (SynthesizedStack): The stack that finished.
+            result (StackResult): The outcome for the stack.
+        """
+        logger.info("[%s] %s", stack.name, result.status.value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Terraform over the stacks synthesized by a1a_infra_base.")
+    parser.add_argument(
+        "command",
+        choices=["plan", "apply"],
+        help="plan runs init and plan per stack, apply runs init, plan and apply per stack.",
+    )
+    parser.add_argument(
+        "--outdir",
+        default="cdktf.out",
+        type=str,
+        help="Output directory of the synth containing manifest.json.",
+    )
+    parser.add_argument(
+        "--parallelism",
+        default=4,
+        type=int,
+        help="Maximum number of stacks running at the same time.",
+    )
+    parser.add_argument(
+        "--terraform-binary",
+        default=TERRAFORM_BINARY,
+        type=str,
+        help="Terraform executable to run, a name on the PATH or a path.",
+    )
+    parser.add_argument(
+        "--cli-config-file",
+        default=None,
+        type=str,
+        help="Terraform CLI configuration for every command, e.g. the one written by the provider_mirror module.",
+    )
+    parser.add_argument(
+        "--plan-cache-dir",
+        default=None,
+        type=str,
+        help="Reuse saved plans of stacks whose synthesized JSON, lock file and local state are unchanged.",
+    )
+    parser.add_argument(
+        "--plan-cache-ttl",
+        default=None,
+        type=float,
+        help="Seconds a cached plan stays valid, by default until the stack inputs change.",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    stacks_arg = read_manifest(Path(args.outdir))
+    executor_env = {} if args.cli_config_file is None else {CLI_CONFIG_ENV: str(Path(args.cli_config_file).resolve())}
+    executor_arg = TerraformCliExecutor(binary=args.terraform_binary, env=executor_env)
+    commands_arg = PLAN_COMMANDS if args.command == "plan" else APPLY_COMMANDS
+    plan_cache_arg = None
+    if args.plan_cache_dir is not None:
+        plan_cache_arg = PlanCache(directory=Path(args.plan_cache_dir), ttl=args.plan_cache_ttl)
+    orchestrator = Orchestrator(
+        stacks=stacks_arg,
+        executor=executor_arg,
+        commands=commands_arg,
+        parallelism=args.parallelism,
+        plan_cache=plan_cache_arg,
+    )
+    stack_results = orchestrator.run()
+    for stack_result in stack_results.values():
+        logger.info("%s: %s", stack_result.name, stack_result.status.value)
+    sys.exit(0 if all(result.status is StackStatus.SUCCEEDED for result in stack_results.values()) else 1)
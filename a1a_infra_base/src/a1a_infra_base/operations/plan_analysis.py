@@ -0,0 +1,280 @@
+"""
+Module plan_analysis
+
+This module analyzes the output of `terraform show -json <plan>` in a single streaming pass. Only the elements of
+`resource_changes` are decoded, one at a time; the other sections, such as `prior_state` and `planned_values`, are
+skipped and only measured. Memory use therefore depends on the size of the largest single resource change rather
+than on the size of the plan.
+
+Destructive changes are matched against the scopes of the management locks in the plan, which the ManagementLockL0
+construct places on resource groups and storage accounts.
+
+Classes:
+    LockedChange: A destructive change to a resource that lies within the scope of a management lock.
+    PlanSize: Size statistics of a plan.
+    PlanAnalysis: The outcome of analyzing a plan.
+
+Functions:
+    get_action: Get the action name of a resource change.
+    analyze_plan: Analyze the output of `terraform show -json <plan>` in a single streaming pass.
+"""
+
+import argparse
+import logging
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final, TextIO
+
+from cdktf_cdktf_provider_azurerm.management_lock import ManagementLock
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.json_stream import CHUNK_SIZE, JsonStream
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys of the plan
+RESOURCE_CHANGES_KEY: Final[str] = "resource_changes"
+ADDRESS_KEY: Final[str] = "address"
+TYPE_KEY: Final[str] = "type"
+CHANGE_KEY: Final[str] = "change"
+ACTIONS_KEY: Final[str] = "actions"
+BEFORE_KEY: Final[str] = "before"
+AFTER_KEY: Final[str] = "after"
+ID_KEY: Final[str] = "id"
+RESOURCE_MANAGER_ID_KEY: Final[str] = "resource_manager_id"
+SCOPE_KEY: Final[str] = "scope"
+
+REPLACE_ACTION: Final[str] = "replace"
+DESTRUCTIVE_ACTIONS: Final[frozenset[str]] = frozenset({"delete", REPLACE_ACTION})
+
+
+@dataclass
+class LockedChange:
+    """
+    A destructive change to a resource that lies within the scope of a management lock.
+
+    Attributes:
+        address (str): The address of the changed resource.
+        action (str): The planned action, `delete` or `replace`.
+        lock_address (str): The address of the management lock whose scope contains the resource.
+    """
+
+    address: str
+    action: str
+    lock_address: str
+
+
+@dataclass
+class PlanSize:
+    """
+    Size statistics of a plan.
+
+    Attributes:
+        total_bytes (int): The number of characters in the plan.
+        section_bytes (dict[str, int]): The number of characters per top-level section, e.g. `prior_state`.
+        resource_changes (int): The number of resource changes.
+        largest_change_bytes (int): The number of characters of the largest single resource change.
+        largest_change_address (str): The address of the largest single resource change.
+    """
+
+    total_bytes: int = 0
+    section_bytes: dict[str, int] = field(default_factory=dict)
+    resource_changes: int = 0
+    largest_change_bytes: int = 0
+    largest_change_address: str = ""
+
+
+@dataclass
+class PlanAnalysis:
+    """
+    The outcome of analyzing a plan.
+
+    Attributes:
+        actions (dict[str, dict[str, int]]): The number of changes per resource type and action.
+        locked_changes (list[LockedChange]): The destructive changes to locked resources.
+        size (PlanSize): Size statistics of the plan.
+    """
+
+    actions: dict[str, dict[str, int]] = field(default_factory=dict)
+    locked_changes: list[LockedChange] = field(default_factory=list)
+    size: PlanSize = field(default_factory=PlanSize)
+
+
+def get_action(actions: list[str]) -> str:
+    """
+    Get the action name of a resource change, combining delete and create into replace.
+
+    Args:
+        actions (list[str]): The actions of the change, e.g. `["delete", "create"]`.
+
+    Returns:
+        str: The action name, e.g. `create`, `update`, `delete`, `replace`, `read` or `no-op`.
+    """
+    if len(actions) == 2 and set(actions) == {"create", "delete"}:
+        return REPLACE_ACTION
+    return "-".join(actions)
+
+
+def _resource_ids(change: dict[str, Any]) -> list[str]:
+    """
+    Get the Azure resource IDs of the resource before the change.
+
+    Args:
+        change (dict[str, Any]): The `change` of a resource change.
+
+    Returns:
+        list[str]: The IDs, lower-cased since Azure resource IDs are case-insensitive.
+    """
+    before = change.get(BEFORE_KEY) or {}
+    return [before[key].lower() for key in (ID_KEY, RESOURCE_MANAGER_ID_KEY) if isinstance(before.get(key), str)]
+
+
+def _in_scope(resource_id: str, scope: str) -> bool:
+    """
+    Check whether a resource lies within the scope of a lock.
+
+    Args:
+        resource_id (str): The lower-cased Azure resource ID.
+        scope (str): The lower-cased scope of the lock.
+
+    Returns:
+        bool: True if the resource is the scope itself or a descendant of it.
+    """
+    scope = scope.rstrip("/")
+    return resource_id == scope or resource_id.startswith(f"{scope}/")
+
+
+def _collect_resource_change(
+    resource_change: dict[str, Any],
+    change_bytes: int,
+    size: PlanSize,
+    actions: defaultdict[str, defaultdict[str, int]],
+    *,
+    lock_scopes: list[tuple[str, str]],
+    destructive: list[tuple[str, str, list[str]]],
+) -> None:
+    """
+    Record a single resource change in the size statistics and action counts, and collect the scopes of management
+    locks and the destructive changes to match against each other once the whole plan is read.
+
+    Args:
+        resource_change (dict[str, Any]): The resource change.
+        change_bytes (int): The number of characters of the resource change in the plan JSON.
+        size (PlanSize): The size statistics to update.
+        actions (defaultdict[str, defaultdict[str, int]]): The action counts per resource type to update.
+        lock_scopes (list[tuple[str, str]]): The lock address and lower-cased scope of every lock, appended to.
+        destructive (list[tuple[str, str, list[str]]]): The address, action and resource IDs of every destructive
+            change, appended to.
+    """
+    address: str = resource_change[ADDRESS_KEY]
+    change: dict[str, Any] = resource_change[CHANGE_KEY]
+    action = get_action(change[ACTIONS_KEY])
+
+    size.resource_changes += 1
+    if change_bytes > size.largest_change_bytes:
+        size.largest_change_bytes = change_bytes
+        size.largest_change_address = address
+    actions[resource_change[TYPE_KEY]][action] += 1
+
+    if resource_change[TYPE_KEY] == ManagementLock.TF_RESOURCE_TYPE:
+        for state in (change.get(BEFORE_KEY), change.get(AFTER_KEY)):
+            if state and isinstance(state.get(SCOPE_KEY), str):
+                lock_scopes.append((address, state[SCOPE_KEY].lower()))
+    if action in DESTRUCTIVE_ACTIONS:
+        destructive.append((address, action, _resource_ids(change)))
+
+
+def _match_locks(
+    destructive: list[tuple[str, str, list[str]]], lock_scopes: list[tuple[str, str]]
+) -> list[LockedChange]:
+    """
+    Match destructive changes against the scopes of the management locks in the plan.
+
+    Args:
+        destructive (list[tuple[str, str, list[str]]]): The address, action and resource IDs of every destructive
+            change.
+        lock_scopes (list[tuple[str, str]]): The lock address and lower-cased scope of every lock.
+
+    Returns:
+        list[LockedChange]: The destructive changes to resources within the scope of another lock.
+    """
+    locked_changes: list[LockedChange] = []
+    for address, action, resource_ids in destructive:
+        lock_address = next(
+            (
+                lock_address
+                for lock_address, scope in lock_scopes
+                if lock_address != address and any(_in_scope(resource_id, scope) for resource_id in resource_ids)
+            ),
+            None,
+        )
+        if lock_address is not None:
+            locked_changes.append(LockedChange(address=address, action=action, lock_address=lock_address))
+    return locked_changes
+
+
+def analyze_plan(file: TextIO, chunk_size: int = CHUNK_SIZE) -> PlanAnalysis:
+    """
+    Analyze the output of `terraform show -json <plan>` in a single streaming pass.
+
+    Args:
+        file (TextIO): The plan JSON.
+        chunk_size (int): The minimum number of characters read from the file at a time.
+
+    Returns:
+        PlanAnalysis: The action counts, destructive changes to locked resources and size statistics.
+    """
+    analysis = PlanAnalysis()
+    actions: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+    lock_scopes: list[tuple[str, str]] = []
+    destructive: list[tuple[str, str, list[str]]] = []
+
+    stream = JsonStream(file, chunk_size=chunk_size)
+    for key in stream.iter_keys():
+        start = stream.offset
+        if key != RESOURCE_CHANGES_KEY:
+            stream.skip_value()
+            analysis.size.section_bytes[key] = stream.offset - start
+            continue
+
+        previous = stream.offset
+        for resource_change in stream.iter_elements():
+            change_bytes = stream.offset - previous
+            previous = stream.offset
+            _collect_resource_change(
+                resource_change, change_bytes, analysis.size, actions, lock_scopes=lock_scopes, destructive=destructive
+            )
+        analysis.size.section_bytes[key] = stream.offset - start
+    analysis.size.total_bytes = stream.offset
+
+    analysis.actions = {type_: dict(counts) for type_, counts in sorted(actions.items())}
+    analysis.locked_changes = _match_locks(destructive, lock_scopes)
+    return analysis
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze the output of terraform show -json <plan> incrementally.")
+    parser.add_argument("plan_filepath", type=str, help="Path to the plan JSON, or - to read from stdin.")
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    if args.plan_filepath == "-":
+        analysis_ = analyze_plan(sys.stdin)
+    else:
+        with Path(args.plan_filepath).open(encoding="utf-8") as plan_file:
+            analysis_ = analyze_plan(plan_file)
+
+    for type_, counts in analysis_.actions.items():
+        print(type_, " ".join(f"{action}={count}" for action, count in sorted(counts.items())))
+    for locked_change in analysis_.locked_changes:
+        print(f"LOCKED {locked_change.action} {locked_change.address} (lock {locked_change.lock_address})")
+    print(
+        f"size total={analysis_.size.total_bytes} resource_changes={analysis_.size.resource_changes} "
+        f"largest_change={analysis_.size.largest_change_bytes} ({analysis_.size.largest_change_address})"
+    )
+    for section, section_bytes in analysis_.size.section_bytes.items():
+        print(f"size {section}={section_bytes}")
+    sys.exit(1 if analysis_.locked_changes else 0)
@@ -0,0 +1,204 @@
+"""
+Module plan_cache
+
+This module caches saved Terraform plans so a stack whose synthesized configuration, provider lock file and state have
+not changed since its last plan is not planned again. The cache key is a hash of the synthesized `cdk.tf.json`, the
+`.terraform.lock.hcl` and the `serial` and `lineage` of the local state file, which Terraform bumps on every state
+write. Only stacks with a local backend are cached; remote state cannot be checked without a refresh.
+
+Classes:
+    PlanCacheEntry: A saved plan and its summary stored in the cache.
+    PlanCache: A directory of saved plans keyed by stack inputs, with an optional time to live.
+
+Functions:
+    read_state_head: Read the serial and lineage from the head of a state file.
+    summarize_plan: Reduce the output of `terraform show -json` to the planned actions per resource.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import shutil
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.manifest import SynthesizedStack
+
+logger: logging.Logger = setup_logger(__name__)
+
+LOCK_FILENAME: Final[str] = ".terraform.lock.hcl"
+PLAN_FILENAME: Final[str] = "plan.tfplan"
+SUMMARY_FILENAME: Final[str] = "summary.json"
+METADATA_FILENAME: Final[str] = "metadata.json"
+
+# Terraform writes `serial` and `lineage` before the resources, so they are found in the first bytes of the state.
+STATE_HEAD_BYTES: Final[int] = 4096
+SERIAL_PATTERN: Final[re.Pattern[str]] = re.compile(r'"serial"\s*:\s*(\d+)')
+LINEAGE_PATTERN: Final[re.Pattern[str]] = re.compile(r'"lineage"\s*:\s*"([^"]*)"')
+
+# Constants for dictionary keys
+RESOURCE_CHANGES_KEY: Final[str] = "resource_changes"
+ADDRESS_KEY: Final[str] = "address"
+CHANGE_KEY: Final[str] = "change"
+ACTIONS_KEY: Final[str] = "actions"
+CREATED_KEY: Final[str] = "created"
+
+
+@dataclass
+class PlanCacheEntry:
+    """
+    A saved plan and its summary stored in the cache.
+
+    Attributes:
+        key (str): The cache key of the plan.
+        plan_path (Path): The path of the saved plan file in the cache.
+        summary (dict[str, Any]): The summary of the plan, see `summarize_plan`.
+        created (float): The time the plan was stored, in seconds since the epoch.
+    """
+
+    key: str
+    plan_path: Path
+    summary: dict[str, Any]
+    created: float
+
+
+def read_state_head(path: Path) -> tuple[int, str] | None:
+    """
+    Read the serial and lineage from the head of a state file without reading the whole file.
+
+    Args:
+        path (Path): The path of the state file.
+
+    Returns:
+        tuple[int, str] | None: The serial and lineage, or None if the state file does not exist or has no serial.
+    """
+    if not path.is_file():
+        return None
+    with path.open(encoding="utf-8") as file:
+        head = file.read(STATE_HEAD_BYTES)
+
+    serial = SERIAL_PATTERN.search(head)
+    lineage = LINEAGE_PATTERN.search(head)
+    if serial is None:
+        return None
+    return int(serial.group(1)), lineage.group(1) if lineage else ""
+
+
+def summarize_plan(plan: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce the output of `terraform show -json <plan>` to the planned actions per resource address.
+
+    Args:
+        plan (dict[str, Any]): The output of `terraform show -json <plan>`.
+
+    Returns:
+        dict[str, Any]: The summary, e.g. `{"resource_changes": [{"address": "...", "actions": ["create"]}]}`.
+    """
+    return {
+        RESOURCE_CHANGES_KEY: [
+            {ADDRESS_KEY: change[ADDRESS_KEY], ACTIONS_KEY: change[CHANGE_KEY][ACTIONS_KEY]}
+            for change in plan.get(RESOURCE_CHANGES_KEY, [])
+        ]
+    }
+
+
+class PlanCache:
+    """
+    A directory of saved plans keyed by stack inputs, with an optional time to live.
+
+    Every entry is a directory named after its key holding the saved plan, its summary and the time it was stored.
+
+    Attributes:
+        directory (Path): The cache directory.
+        ttl (float | None): The number of seconds an entry stays valid, None to keep entries until the inputs change.
+    """
+
+    def __init__(self, directory: Path, ttl: float | None = None, clock: Callable[[], float] = time.time) -> None:
+        """
+        Initializes the plan cache.
+
+        Args:
+            directory (Path): The cache directory, created when the first plan is stored.
+            ttl (float | None): The number of seconds an entry stays valid, None to keep entries until inputs change.
+            clock (Callable[[], float]): Returns the current time in seconds since the epoch.
+        """
+        self.directory: Path = directory
+        self.ttl: float | None = ttl
+        self._clock: Callable[[], float] = clock
+
+    def key(self, stack: SynthesizedStack) -> str | None:
+        """
+        Compute the cache key of a stack from its synthesized JSON, provider lock file and local state.
+
+        Args:
+            stack (SynthesizedStack): The stack to compute the key for, after `terraform init`.
+
+        Returns:
+            str | None: The hex digest, or None if the stack does not use a local backend.
+        """
+        synthesized_bytes = stack.synthesized_stack_path.read_bytes()
+        state_path = stack.local_state_path(json.loads(synthesized_bytes))
+        if state_path is None:
+            return None
+
+        lock_path = stack.working_directory / LOCK_FILENAME
+        state_head = read_state_head(state_path)
+
+        digest = hashlib.sha256()
+        digest.update(synthesized_bytes)
+        digest.update(b"\0")
+        digest.update(lock_path.read_bytes() if lock_path.is_file() else b"")
+        digest.update(b"\0")
+        digest.update(repr(state_head).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> PlanCacheEntry | None:
+        """
+        Get the entry stored under a key, if present and not expired.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            PlanCacheEntry | None: The entry, or None on a cache miss.
+        """
+        entry_directory = self.directory / key
+        metadata_path = entry_directory / METADATA_FILENAME
+        if not metadata_path.is_file():
+            return None
+
+        created: float = json.loads(metadata_path.read_text(encoding="utf-8"))[CREATED_KEY]
+        if self.ttl is not None and self._clock() - created > self.ttl:
+            logger.info("Plan cache entry %s expired.", key)
+            return None
+
+        summary = json.loads((entry_directory / SUMMARY_FILENAME).read_text(encoding="utf-8"))
+        return PlanCacheEntry(key=key, plan_path=entry_directory / PLAN_FILENAME, summary=summary, created=created)
+
+    def put(self, key: str, plan_path: Path, summary: dict[str, Any]) -> PlanCacheEntry:
+        """
+        Store a saved plan and its summary under a key, replacing any previous entry.
+
+        Args:
+            key (str): The cache key.
+            plan_path (Path): The saved plan file to copy into the cache.
+            summary (dict[str, Any]): The summary of the plan.
+
+        Returns:
+            PlanCacheEntry: The stored entry.
+        """
+        entry_directory = self.directory / key
+        entry_directory.mkdir(parents=True, exist_ok=True)
+        (entry_directory / METADATA_FILENAME).unlink(missing_ok=True)
+        created = self._clock()
+
+        shutil.copyfile(plan_path, entry_directory / PLAN_FILENAME)
+        (entry_directory / SUMMARY_FILENAME).write_text(json.dumps(summary), encoding="utf-8")
+        # Written last, an entry without metadata is incomplete and treated as a miss.
+        (entry_directory / METADATA_FILENAME).write_text(json.dumps({CREATED_KEY: created}), encoding="utf-8")
+        return PlanCacheEntry(key=key, plan_path=entry_directory / PLAN_FILENAME, summary=summary, created=created)
@@ -0,0 +1,335 @@
+"""
+Module provider_mirror
+
+This module builds a filesystem provider mirror and a shared plugin cache for the stacks synthesized by
+a1a_infra_base, and writes a Terraform CLI configuration that points every `terraform init` at them. Each stack then
+links the provider from the shared cache instead of downloading and unpacking its own copy, so init is near-instant
+and works without access to the registry.
+
+The mirror is filled either from a directory of staged provider packages, as downloaded from the registry release
+pages, or by running `terraform providers mirror` once per distinct set of required providers.
+
+Classes:
+    ProviderRequirement: A provider version required by the synthesized stacks.
+
+Functions:
+    get_current_platform: Get the Terraform platform of this machine.
+    get_provider_requirements: Get the provider versions required by the synthesized stacks.
+    build_mirror: Copy staged provider packages into a filesystem mirror.
+    mirror_with_terraform: Fill a filesystem mirror with `terraform providers mirror`.
+    write_cli_config: Write a Terraform CLI configuration that installs the mirrored providers from the mirror.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import shutil
+import sys
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Final, Self
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.executor import (
+    CLI_CONFIG_ENV,
+    TERRAFORM_BINARY,
+    TerraformCliExecutor,
+    TerraformExecutorABC,
+)
+from a1a_infra_base.operations.manifest import TERRAFORM_KEY, SynthesizedStack, read_manifest
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys of the synthesized Terraform JSON
+REQUIRED_PROVIDERS_KEY: Final[str] = "required_providers"
+SOURCE_KEY: Final[str] = "source"
+VERSION_KEY: Final[str] = "version"
+
+DEFAULT_HOSTNAME: Final[str] = "registry.terraform.io"
+DEFAULT_NAMESPACE: Final[str] = "hashicorp"
+ARCHITECTURES: Final[dict[str, str]] = {"x86_64": "amd64", "amd64": "amd64", "aarch64": "arm64", "arm64": "arm64"}
+
+
+@dataclass(frozen=True, order=True)
+class ProviderRequirement:
+    """
+    A provider version required by the synthesized stacks.
+
+    Attributes:
+        address (str): The fully qualified provider address, e.g. `registry.terraform.io/hashicorp/azurerm`.
+        version (str): The exact provider version, as pinned by the generated provider bindings.
+    """
+
+    address: str
+    version: str
+
+    @classmethod
+    def from_source(cls, source: str, version: str) -> Self:
+        """
+        Create a requirement from the source of a `required_providers` entry.
+
+        Args:
+            source (str): The provider source, e.g. `azurerm`, `hashicorp/azurerm` or a fully qualified address.
+            version (str): The provider version.
+
+        Returns:
+            ProviderRequirement: The requirement with a fully qualified address.
+        """
+        parts = source.lower().split("/")
+        if len(parts) == 1:
+            parts = [DEFAULT_HOSTNAME, DEFAULT_NAMESPACE, *parts]
+        elif len(parts) == 2:
+            parts = [DEFAULT_HOSTNAME, *parts]
+        return cls(address="/".join(parts), version=version)
+
+    @property
+    def type_(self) -> str:
+        """Gets the provider type, e.g. `azurerm`."""
+        return self.address.rsplit("/", 1)[-1]
+
+    def package_name(self, platform_: str) -> str:
+        """
+        Get the file name of the provider package for a platform.
+
+        Args:
+            platform_ (str): The Terraform platform, e.g. `linux_amd64`.
+
+        Returns:
+            str: The package name, e.g. `terraform-provider-azurerm_4.31.0_linux_amd64.zip`.
+        """
+        return f"terraform-provider-{self.type_}_{self.version}_{platform_}.zip"
+
+
+def get_current_platform() -> str:
+    """
+    Get the Terraform platform of this machine.
+
+    Returns:
+        str: The platform, e.g. `linux_amd64`.
+    """
+    machine = platform.machine().lower()
+    return f"{platform.system().lower()}_{ARCHITECTURES.get(machine, machine)}"
+
+
+def _read_requirements(stack: SynthesizedStack) -> set[ProviderRequirement]:
+    """
+    Read the provider requirements of a synthesized stack.
+
+    Args:
+        stack (SynthesizedStack): The stack.
+
+    Returns:
+        set[ProviderRequirement]: The providers the stack requires.
+    """
+    required_providers = stack.read().get(TERRAFORM_KEY, {}).get(REQUIRED_PROVIDERS_KEY, {})
+    return {
+        ProviderRequirement.from_source(provider.get(SOURCE_KEY, name), provider[VERSION_KEY])
+        for name, provider in required_providers.items()
+    }
+
+
+def get_provider_requirements(stacks: list[SynthesizedStack]) -> list[ProviderRequirement]:
+    """
+    Get the provider versions required by the synthesized stacks.
+
+    Args:
+        stacks (list[SynthesizedStack]): The synthesized stacks.
+
+    Returns:
+        list[ProviderRequirement]: The distinct requirements, sorted by address and version.
+    """
+    return sorted(set().union(*(_read_requirements(stack) for stack in stacks)))
+
+
+def build_mirror(
+    requirements: list[ProviderRequirement], mirror_dir: Path, packages_dir: Path, platforms: list[str]
+) -> list[Path]:
+    """
+    Copy staged provider packages into a filesystem mirror with the packed layout
+    `HOSTNAME/NAMESPACE/TYPE/terraform-provider-TYPE_VERSION_PLATFORM.zip`.
+
+    Packages already in the mirror with the same size are not copied again.
+
+    Args:
+        requirements (list[ProviderRequirement]): The providers to mirror.
+        mirror_dir (Path): The mirror directory.
+        packages_dir (Path): The directory with the staged provider packages.
+        platforms (list[str]): The platforms to mirror, e.g. `["linux_amd64"]`.
+
+    Returns:
+        list[Path]: The packages in the mirror.
+
+    Raises:
+        FileNotFoundError: If a package is not staged.
+    """
+    mirrored: list[Path] = []
+    for requirement in requirements:
+        for platform_ in platforms:
+            package = packages_dir / requirement.package_name(platform_)
+            if not package.is_file():
+                raise FileNotFoundError(f"Provider package {package} is not staged for {requirement.address}.")
+
+            target = mirror_dir / requirement.address / package.name
+            if target.is_file() and target.stat().st_size == package.stat().st_size:
+                logger.info("Provider package %s is already mirrored.", target)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(package, target)
+                logger.info("Mirrored provider package %s.", target)
+            mirrored.append(target)
+    return mirrored
+
+
+def _log_output(name: str, line: str) -> None:
+    """
+    Log a line of Terraform output, prefixed with the name of its stack.
+
+    Args:
+        name (str): The name of the stack.
+        line (str): The output line.
+    """
+    logger.info("[%s] %s", name, line)
+
+
+def mirror_with_terraform(
+    stacks: list[SynthesizedStack], mirror_dir: Path, executor: TerraformExecutorABC, platforms: list[str]
+) -> bool:
+    """
+    Fill a filesystem mirror with `terraform providers mirror`, running it once per distinct set of required providers
+    instead of once per stack.
+
+    Args:
+        stacks (list[SynthesizedStack]): The synthesized stacks.
+        mirror_dir (Path): The mirror directory.
+        executor (TerraformExecutorABC): The executor to run Terraform with.
+        platforms (list[str]): The platforms to mirror, e.g. `["linux_amd64"]`.
+
+    Returns:
+        bool: True if every mirror command succeeded.
+    """
+    mirrored: set[frozenset[ProviderRequirement]] = set()
+    succeeded = True
+    for stack in stacks:
+        requirements = frozenset(_read_requirements(stack))
+        if not requirements or requirements in mirrored:
+            continue
+
+        mirror_args = [
+            "providers",
+            "mirror",
+            *(f"-platform={platform_}" for platform_ in platforms),
+            str(mirror_dir.resolve()),
+        ]
+        result = executor.run(stack, mirror_args, on_output=partial(_log_output, stack.name))
+        if not result.succeeded:
+            logger.error("Mirroring the providers of %s failed.", stack.name)
+            succeeded = False
+            continue
+        mirrored.add(requirements)
+    return succeeded
+
+
+def write_cli_config(
+    path: Path, mirror_dir: Path, plugin_cache_dir: Path, requirements: list[ProviderRequirement]
+) -> Path:
+    """
+    Write a Terraform CLI configuration that installs the mirrored providers from the mirror, never from the
+    registry, and shares one plugin cache between all stacks. Other providers are still installed directly.
+
+    Args:
+        path (Path): The path of the CLI configuration file.
+        mirror_dir (Path): The mirror directory.
+        plugin_cache_dir (Path): The shared plugin cache directory, created if needed.
+        requirements (list[ProviderRequirement]): The mirrored providers.
+
+    Returns:
+        Path: The path of the CLI configuration file, to set as `TF_CLI_CONFIG_FILE`.
+    """
+    plugin_cache_dir.mkdir(parents=True, exist_ok=True)
+    addresses = json.dumps(sorted({requirement.address for requirement in requirements}))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"plugin_cache_dir = {json.dumps(str(plugin_cache_dir.resolve()))}\n"
+        "plugin_cache_may_break_dependency_lock_file = true\n"
+        "\n"
+        "provider_installation {\n"
+        "  filesystem_mirror {\n"
+        f"    path    = {json.dumps(str(mirror_dir.resolve()))}\n"
+        f"    include = {addresses}\n"
+        "  }\n"
+        "  direct {\n"
+        f"    exclude = {addresses}\n"
+        "  }\n"
+        "}\n",
+        encoding="utf-8",
+    )
+    logger.info("Wrote Terraform CLI configuration %s.", path)
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build a provider mirror and shared plugin cache for the synthesized stacks."
+    )
+    parser.add_argument(
+        "--outdir",
+        default="cdktf.out",
+        type=str,
+        help="Output directory of the synth containing manifest.json.",
+    )
+    parser.add_argument(
+        "--mirror-dir",
+        default=".terraform.d/mirror",
+        type=str,
+        help="Directory of the filesystem provider mirror.",
+    )
+    parser.add_argument(
+        "--plugin-cache-dir",
+        default=".terraform.d/plugin-cache",
+        type=str,
+        help="Directory of the plugin cache shared by all stacks.",
+    )
+    parser.add_argument(
+        "--cli-config-file",
+        default=".terraform.d/terraformrc",
+        type=str,
+        help="Path of the Terraform CLI configuration to write.",
+    )
+    parser.add_argument(
+        "--packages-dir",
+        default=None,
+        type=str,
+        help="Directory of staged provider packages. Without it, terraform providers mirror downloads them.",
+    )
+    parser.add_argument(
+        "--platform",
+        action="append",
+        default=[],
+        help="Platform to mirror, e.g. linux_amd64. Can be repeated, defaults to this machine.",
+    )
+    parser.add_argument(
+        "--terraform-binary",
+        default=TERRAFORM_BINARY,
+        type=str,
+        help="Terraform executable to run, a name on the PATH or a path.",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    stacks_arg = read_manifest(Path(args.outdir))
+    platforms_arg = args.platform or [get_current_platform()]
+    requirements_arg = get_provider_requirements(stacks_arg)
+    if args.packages_dir is not None:
+        build_mirror(requirements_arg, Path(args.mirror_dir), Path(args.packages_dir), platforms_arg)
+    elif not mirror_with_terraform(
+        stacks_arg, Path(args.mirror_dir), TerraformCliExecutor(binary=args.terraform_binary), platforms_arg
+    ):
+        sys.exit(1)
+
+    cli_config = write_cli_config(
+        Path(args.cli_config_file), Path(args.mirror_dir), Path(args.plugin_cache_dir), requirements_arg
+    )
+    print(f"export {CLI_CONFIG_ENV}={cli_config.resolve()}")
@@ -0,0 +1,313 @@
+"""
+Module state_index
+
+This module ingests local Terraform state files into a SQLite database so operational questions, such as which
+storage accounts have HNS disabled or which containers belong to which account, are answered with an indexed query
+instead of a full parse of every state file. State files are streamed, one resource at a time, and only re-ingested
+when their `serial` or `lineage` changed since the last ingest.
+
+Classes:
+    IndexedInstance: A resource instance as stored in the index.
+    StateIndex: A SQLite index over the resources, instances and attributes of local state files.
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.json_stream import iter_array
+from a1a_infra_base.operations.plan_cache import read_state_head
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys of the state
+RESOURCES_KEY: Final[str] = "resources"
+MODE_KEY: Final[str] = "mode"
+TYPE_KEY: Final[str] = "type"
+NAME_KEY: Final[str] = "name"
+PROVIDER_KEY: Final[str] = "provider"
+INSTANCES_KEY: Final[str] = "instances"
+ATTRIBUTES_KEY: Final[str] = "attributes"
+INDEX_KEY_KEY: Final[str] = "index_key"
+
+SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    serial INTEGER NOT NULL,
+    lineage TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    file_path TEXT NOT NULL REFERENCES files (path) ON DELETE CASCADE,
+    mode TEXT NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    provider TEXT
+);
+CREATE TABLE IF NOT EXISTS instances (
+    id INTEGER PRIMARY KEY,
+    resource_id INTEGER NOT NULL REFERENCES resources (id) ON DELETE CASCADE,
+    index_key TEXT,
+    attributes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    instance_id INTEGER NOT NULL REFERENCES instances (id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS resources_file_path ON resources (file_path);
+CREATE INDEX IF NOT EXISTS resources_type_name ON resources (type, name);
+CREATE INDEX IF NOT EXISTS instances_resource_id ON instances (resource_id);
+CREATE INDEX IF NOT EXISTS attributes_instance_id ON attributes (instance_id);
+CREATE INDEX IF NOT EXISTS attributes_key_value ON attributes (key, value);
+"""
+
+
+@dataclass
+class IndexedInstance:
+    """
+    A resource instance as stored in the index.
+
+    Attributes:
+        file_path (str): The state file the instance was ingested from.
+        address (str): The address of the instance, e.g. `azurerm_storage_account.<name>`.
+        attributes (dict[str, Any]): The attributes of the instance.
+    """
+
+    file_path: str
+    address: str
+    attributes: dict[str, Any]
+
+
+def _flatten(value: Any, key: str = "") -> Iterator[tuple[str, str]]:
+    """
+    Flatten nested attributes into dotted keys with JSON-encoded scalar values.
+
+    Args:
+        value (Any): The attribute value.
+        key (str): The dotted key of the value.
+
+    Yields:
+        tuple[str, str]: The dotted key, e.g. `network_rules.0.default_action`, and the JSON-encoded value.
+    """
+    if isinstance(value, dict):
+        for child_key, child in value.items():
+            yield from _flatten(child, f"{key}.{child_key}" if key else child_key)
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            yield from _flatten(child, f"{key}.{index}")
+    else:
+        yield key, json.dumps(value)
+
+
+def parse_value(value: str) -> Any:
+    """
+    Parse an attribute value given on the command line.
+
+    Args:
+        value (str): A JSON literal such as `false` or `3`, anything else is taken as a string.
+
+    Returns:
+        Any: The parsed value.
+    """
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+class StateIndex:
+    """
+    A SQLite index over the resources, instances and attributes of local state files.
+
+    Attributes:
+        database (Path): The path of the SQLite database.
+    """
+
+    def __init__(self, database: Path) -> None:
+        """
+        Initializes the index, creating the database and its schema if needed.
+
+        Args:
+            database (Path): The path of the SQLite database.
+        """
+        self.database: Path = database
+        self._connection = sqlite3.connect(database)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def ingest(self, state_paths: Iterable[Path]) -> list[Path]:
+        """
+        Ingest state files whose serial or lineage changed since they were last ingested.
+
+        Args:
+            state_paths (Iterable[Path]): The state files to ingest.
+
+        Returns:
+            list[Path]: The state files that were (re-)ingested.
+        """
+        ingested: list[Path] = []
+        for state_path in state_paths:
+            key = str(state_path.resolve())
+            head = read_state_head(state_path)
+            if head is None:
+                logger.warning("Skipping %s, it is not a state file.", state_path)
+                continue
+
+            serial, lineage = head
+            row = self._connection.execute("SELECT serial, lineage FROM files WHERE path = ?", (key,)).fetchone()
+            if row == (serial, lineage):
+                logger.info("Skipping %s, serial %d is already indexed.", state_path, serial)
+                continue
+
+            with self._connection:
+                self._connection.execute("DELETE FROM files WHERE path = ?", (key,))
+                self._connection.execute(
+                    "INSERT INTO files (path, serial, lineage) VALUES (?, ?, ?)", (key, serial, lineage)
+                )
+                for resource in iter_array(state_path, (RESOURCES_KEY,)):
+                    self._insert_resource(key, resource)
+            logger.info("Indexed %s at serial %d.", state_path, serial)
+            ingested.append(state_path)
+        return ingested
+
+    def _insert_resource(self, file_path: str, resource: dict[str, Any]) -> None:
+        """
+        Insert a resource with its instances and flattened attributes.
+
+        Args:
+            file_path (str): The state file the resource was read from.
+            resource (dict[str, Any]): A resource of the state.
+        """
+        cursor = self._connection.execute(
+            "INSERT INTO resources (file_path, mode, type, name, provider) VALUES (?, ?, ?, ?, ?)",
+            (file_path, resource[MODE_KEY], resource[TYPE_KEY], resource[NAME_KEY], resource.get(PROVIDER_KEY)),
+        )
+        resource_id = cursor.lastrowid
+        for instance in resource.get(INSTANCES_KEY, []):
+            attributes = instance.get(ATTRIBUTES_KEY, {})
+            index_key = json.dumps(instance[INDEX_KEY_KEY]) if INDEX_KEY_KEY in instance else None
+            cursor = self._connection.execute(
+                "INSERT INTO instances (resource_id, index_key, attributes) VALUES (?, ?, ?)",
+                (resource_id, index_key, json.dumps(attributes)),
+            )
+            self._connection.executemany(
+                "INSERT INTO attributes (instance_id, key, value) VALUES (?, ?, ?)",
+                ((cursor.lastrowid, key, value) for key, value in _flatten(attributes)),
+            )
+
+    def find(
+        self,
+        type_: str | None = None,
+        name: str | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[IndexedInstance]:
+        """
+        Find the instances of managed resources by type, name and attribute values.
+
+        Args:
+            type_ (str | None): The resource type, e.g. `azurerm_storage_account`.
+            name (str | None): The resource name.
+            where (dict[str, Any] | None): Attribute values the instance must have, keyed by dotted attribute key.
+
+        Returns:
+            list[IndexedInstance]: The matching instances, ordered by state file and address.
+        """
+        query = (
+            "SELECT resources.file_path, resources.type, resources.name, instances.index_key, instances.attributes "
+            "FROM instances JOIN resources ON resources.id = instances.resource_id WHERE resources.mode = 'managed'"
+        )
+        params: list[Any] = []
+        if type_ is not None:
+            query += " AND resources.type = ?"
+            params.append(type_)
+        if name is not None:
+            query += " AND resources.name = ?"
+            params.append(name)
+        for key, value in (where or {}).items():
+            query += " AND EXISTS (SELECT 1 FROM attributes WHERE instance_id = instances.id AND key = ? AND value = ?)"
+            params.extend((key, json.dumps(value)))
+        query += " ORDER BY resources.file_path, resources.type, resources.name, instances.index_key"
+
+        return [
+            IndexedInstance(
+                file_path=file_path,
+                address=f"{type_}.{name}" + (f"[{index_key}]" if index_key is not None else ""),
+                attributes=json.loads(attributes),
+            )
+            for file_path, type_, name, index_key, attributes in self._connection.execute(query, params)
+        ]
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> list[tuple[Any, ...]]:
+        """
+        Run a read-only SQL query against the index.
+
+        Args:
+            sql (str): The SQL query, over the tables `files`, `resources`, `instances` and `attributes`.
+            params (Iterable[Any]): The query parameters.
+
+        Returns:
+            list[tuple[Any, ...]]: The result rows.
+
+        Raises:
+            sqlite3.OperationalError: If the query attempts to modify the index.
+        """
+        self._connection.execute("PRAGMA query_only = ON")
+        try:
+            return self._connection.execute(sql, tuple(params)).fetchall()
+        finally:
+            self._connection.execute("PRAGMA query_only = OFF")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index local Terraform state files in SQLite and query them.")
+    parser.add_argument("--database", default="tfstate.db", type=str, help="Path to the SQLite database.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = subparsers.add_parser("ingest", help="Ingest state files whose serial changed.")
+    ingest_parser.add_argument("state_filepaths", nargs="+", help="State files to ingest.")
+
+    find_parser = subparsers.add_parser("find", help="Find resource instances by type, name and attributes.")
+    find_parser.add_argument("--type", default=None, type=str, help="Resource type, e.g. azurerm_storage_account.")
+    find_parser.add_argument("--name", default=None, type=str, help="Resource name.")
+    find_parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Attribute value to match, e.g. is_hns_enabled=false. Can be repeated.",
+    )
+    find_parser.add_argument(
+        "--select", action="append", default=[], metavar="KEY", help="Attribute to print. Can be repeated."
+    )
+
+    sql_parser = subparsers.add_parser("sql", help="Run a read-only SQL query.")
+    sql_parser.add_argument("sql", type=str, help="The SQL query.")
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    index = StateIndex(database=Path(args.database))
+    try:
+        if args.command == "ingest":
+            index.ingest(Path(state_filepath) for state_filepath in args.state_filepaths)
+        elif args.command == "find":
+            where_ = {key: parse_value(value) for key, value in (item.split("=", 1) for item in args.where)}
+            for instance_ in index.find(type_=args.type, name=args.name, where=where_):
+                selected = {key: instance_.attributes.get(key) for key in args.select}
+                print(instance_.file_path, instance_.address, json.dumps(selected) if selected else "")
+        else:
+            for row_ in index.query(args.sql):
+                print("\t".join(str(column) for column in row_))
+    finally:
+        index.close()
@@ -0,0 +1,307 @@
+"""
+Module throttling
+
+This module schedules Terraform runs around Azure Resource Manager write throttling. ARM throttles writes per
+subscription, so stacks are grouped by the `subscription_id` of their azurerm provider and each subscription gets its
+own budget of concurrent write operations. The budget adapts using additive increase, multiplicative decrease (AIMD):
+it grows after every stack that finishes without throttling and halves as soon as Terraform output reports throttling
+or retries.
+
+Run `python -m a1a_infra_base.operations.throttling plan|apply` in place of the orchestrator module to throttle a run.
+
+Classes:
+    AimdLimit: A concurrency limit that adapts using additive increase, multiplicative decrease.
+    ThrottleAwareOrchestrator: An orchestrator that bounds concurrent writes per subscription with an AIMD limit.
+
+Functions:
+    estimate_writes: Estimate the number of concurrent write operations of a synthesized stack.
+    get_subscription_id: Get the subscription ID of the azurerm provider of a synthesized stack.
+"""
+
+import argparse
+import logging
+import re
+import sys
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Final
+
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.operations.executor import (
+    CLI_CONFIG_ENV,
+    TERRAFORM_BINARY,
+    TerraformCliExecutor,
+    TerraformExecutorABC,
+)
+from a1a_infra_base.operations.manifest import SynthesizedStack, read_manifest
+from a1a_infra_base.operations.orchestrator import (
+    APPLY_COMMANDS,
+    PLAN_COMMANDS,
+    Orchestrator,
+    StackResult,
+    StackStatus,
+)
+from a1a_infra_base.operations.plan_cache import PlanCache
+from a1a_infra_base.terraform_provider import SUBSCRIPTION_ID
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys of the synthesized Terraform JSON
+PROVIDER_KEY: Final[str] = "provider"
+AZURERM_KEY: Final[str] = "azurerm"
+RESOURCE_KEY: Final[str] = "resource"
+
+# Terraform walks the graph with at most this many concurrent operations per run, its `-parallelism` default.
+TERRAFORM_PARALLELISM: Final[int] = 10
+DEFAULT_WRITE_LIMIT: Final[float] = 20
+THROTTLE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\b429\b|too ?many ?requests|throttl|retrying", re.IGNORECASE)
+
+
+@dataclass
+class AimdLimit:
+    """
+    A concurrency limit that adapts using additive increase, multiplicative decrease.
+
+    Attributes:
+        value (float): The current limit.
+        minimum (float): The lower bound of the limit.
+        maximum (float): The upper bound of the limit.
+        increase (float): The amount added to the limit on success.
+        decrease_factor (float): The factor the limit is multiplied with on throttling.
+    """
+
+    value: float
+    minimum: float = 1
+    maximum: float = 200
+    increase: float = 5
+    decrease_factor: float = 0.5
+
+    def on_success(self) -> None:
+        """Raise the limit additively, up to the maximum."""
+        self.value = min(self.maximum, self.value + self.increase)
+
+    def on_throttle(self) -> None:
+        """Lower the limit multiplicatively, down to the minimum."""
+        self.value = max(self.minimum, self.value * self.decrease_factor)
+
+
+def estimate_writes(synthesized: dict[str, Any]) -> int:
+    """
+    Estimate the number of concurrent write operations of a synthesized stack.
+
+    Every managed resource is one write; Terraform performs at most `TERRAFORM_PARALLELISM` of them at a time.
+
+    Args:
+        synthesized (dict[str, Any]): The synthesized Terraform JSON of the stack.
+
+    Returns:
+        int: The estimated number of concurrent write operations, at least one.
+    """
+    resources = sum(len(instances) for instances in synthesized.get(RESOURCE_KEY, {}).values())
+    return max(1, min(resources, TERRAFORM_PARALLELISM))
+
+
+def get_subscription_id(synthesized: dict[str, Any]) -> str:
+    """
+    Get the subscription ID of the azurerm provider of a synthesized stack.
+
+    Args:
+        synthesized (dict[str, Any]): The synthesized Terraform JSON of the stack.
+
+    Returns:
+        str: The subscription ID, or an empty string if the stack has no azurerm provider.
+    """
+    providers: list[dict[str, Any]] = synthesized.get(PROVIDER_KEY, {}).get(AZURERM_KEY, [])
+    return providers[0].get(SUBSCRIPTION_ID, "") if providers else ""
+
+
+class ThrottleAwareOrchestrator(Orchestrator):
+    """
+    An orchestrator that bounds concurrent writes per subscription with an AIMD limit.
+
+    A stack is admitted when its estimated writes fit in the remaining budget of its subscription, or when nothing
+    else runs in that subscription so that large stacks cannot starve.
+
+    Attributes:
+        limits (dict[str, AimdLimit]): The write limit per subscription ID.
+    """
+
+    def __init__(
+        self,
+        stacks: Iterable[SynthesizedStack],
+        executor: TerraformExecutorABC,
+        commands: list[str] | None = None,
+        parallelism: int = 4,
+        plan_cache: PlanCache | None = None,
+        targets: dict[str, list[str]] | None = None,
+        limit: AimdLimit | None = None,
+    ) -> None:
+        """
+        Initializes the orchestrator.
+
+        Args:
+            stacks (Iterable[SynthesizedStack]): The stacks to run.
+            executor (TerraformExecutorABC): The executor that runs Terraform commands.
+            commands (list[str] | None): The commands to run per stack, defaults to init, plan and apply.
+            parallelism (int): The maximum number of stacks running at the same time across subscriptions.
+            plan_cache (PlanCache | None): The cache of saved plans, None to always plan.
+            targets (dict[str, list[str]] | None): Resource addresses to restrict the plan to, per stack name.
+            limit (AimdLimit | None): The write limit each subscription starts with, defaults to 20 concurrent writes.
+        """
+        super().__init__(
+            stacks=stacks,
+            executor=executor,
+            commands=commands,
+            parallelism=parallelism,
+            plan_cache=plan_cache,
+            targets=targets,
+        )
+        limit = limit or AimdLimit(value=DEFAULT_WRITE_LIMIT)
+
+        self._subscriptions: dict[str, str] = {}
+        self._writes: dict[str, int] = {}
+        for stack in self.stacks.values():
+            synthesized = stack.read()
+            self._subscriptions[stack.name] = get_subscription_id(synthesized)
+            self._writes[stack.name] = estimate_writes(synthesized)
+
+        self.limits: dict[str, AimdLimit] = {
+            subscription: replace(limit) for subscription in set(self._subscriptions.values())
+        }
+        self._in_flight: dict[str, int] = dict.fromkeys(self.limits, 0)
+        self._throttled: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _admit(self, stack: SynthesizedStack) -> bool:
+        """
+        Admit a stack when its estimated writes fit in the remaining budget of its subscription.
+
+        Args:
+            stack (SynthesizedStack): The stack about to start.
+
+        Returns:
+            bool: True to start the stack now, False to keep it pending.
+        """
+        subscription = self._subscriptions[stack.name]
+        writes = self._writes[stack.name]
+        with self._lock:
+            in_flight = self._in_flight[subscription]
+            if in_flight and in_flight + writes > self.limits[subscription].value:
+                return False
+            self._in_flight[subscription] = in_flight + writes
+        return True
+
+    def _on_output(self, stack: SynthesizedStack, line: str) -> None:
+        """
+        Lower the write limit of the subscription the first time a stack reports throttling.
+
+        Args:
+            stack (SynthesizedStack): The stack that produced the line.
+            line (str): The output line.
+        """
+        super()._on_output(stack, line)
+        if not THROTTLE_PATTERN.search(line):
+            return
+
+        subscription = self._subscriptions[stack.name]
+        with self._lock:
+            if stack.name in self._throttled:
+                return
+            self._throttled.add(stack.name)
+            limit = self.limits[subscription]
+            limit.on_throttle()
+        logger.warning(
+            "[%s] throttled, write limit of subscription '%s' lowered to %.1f.", stack.name, subscription, limit.value
+        )
+
+    def _on_finished(self, stack: SynthesizedStack, result: StackResult) -> None:
+        """
+        Release the writes of a finished stack and raise the write limit if it was not throttled.
+
+        Args:
+            stack (SynthesizedStack): The stack that finished.
+            result (StackResult): The outcome for the stack.
+        """
+        super()._on_finished(stack, result)
+        subscription = self._subscriptions[stack.name]
+        with self._lock:
+            self._in_flight[subscription] -= self._writes[stack.name]
+            if stack.name in self._throttled:
+                self._throttled.discard(stack.name)
+            elif result.status is StackStatus.SUCCEEDED:
+                self.limits[subscription].on_success()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run Terraform over the stacks synthesized by a1a_infra_base, adapting to ARM throttling."
+    )
+    parser.add_argument(
+        "command",
+        choices=["plan", "apply"],
+        help="plan runs init and plan per stack, apply runs init, plan and apply per stack.",
+    )
+    parser.add_argument(
+        "--outdir",
+        default="cdktf.out",
+        type=str,
+        help="Output directory of the synth containing manifest.json.",
+    )
+    parser.add_argument(
+        "--parallelism",
+        default=4,
+        type=int,
+        help="Maximum number of stacks running at the same time across subscriptions.",
+    )
+    parser.add_argument(
+        "--terraform-binary",
+        default=TERRAFORM_BINARY,
+        type=str,
+        help="Terraform executable to run, a name on the PATH or a path.",
+    )
+    parser.add_argument(
+        "--cli-config-file",
+        default=None,
+        type=str,
+        help="Terraform CLI configuration for every command, e.g. the one written by the provider_mirror module.",
+    )
+    parser.add_argument(
+        "--max-writes-per-subscription",
+        default=DEFAULT_WRITE_LIMIT,
+        type=float,
+        help="Concurrent writes per subscription to start at, adapted to ARM throttling during the run.",
+    )
+    parser.add_argument(
+        "--plan-cache-dir",
+        default=None,
+        type=str,
+        help="Reuse saved plans of stacks whose synthesized JSON, lock file and local state are unchanged.",
+    )
+    parser.add_argument(
+        "--plan-cache-ttl",
+        default=None,
+        type=float,
+        help="Seconds a cached plan stays valid, by default until the stack inputs change.",
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+    logger.info("Parsed arguments: %s", args)
+
+    executor_env = {} if args.cli_config_file is None else {CLI_CONFIG_ENV: str(Path(args.cli_config_file).resolve())}
+    plan_cache_arg = None
+    if args.plan_cache_dir is not None:
+        plan_cache_arg = PlanCache(directory=Path(args.plan_cache_dir), ttl=args.plan_cache_ttl)
+    orchestrator = ThrottleAwareOrchestrator(
+        stacks=read_manifest(Path(args.outdir)),
+        executor=TerraformCliExecutor(binary=args.terraform_binary, env=executor_env),
+        commands=PLAN_COMMANDS if args.command == "plan" else APPLY_COMMANDS,
+        parallelism=args.parallelism,
+        plan_cache=plan_cache_arg,
+        limit=AimdLimit(value=args.max_writes_per_subscription),
+    )
+    stack_results = orchestrator.run()
+    for stack_result in stack_results.values():
+        logger.info("%s: %s", stack_result.name, stack_result.status.value)
+    sys.exit(0 if all(result.status is StackStatus.SUCCEEDED for result in stack_results.values()) else 1)
@@ -0,0 +1,70 @@
+"""
+Module partitioning
+
+This module places keys, such as container names, on one of a number of partitions, such as the storage accounts of a
+data lake layer. Placement uses rendezvous (highest random weight) hashing: every partition scores every key and the
+key is placed on the partition with the highest score. Growing from N to N + 1 partitions only moves the keys for which
+the new partition scores highest, every other key keeps its partition.
+
+The scores are derived from a cryptographic digest instead of `hash()`, so placement is identical across processes and
+Python versions.
+
+Functions:
+    get_partition: Get the partition a key is placed on.
+    route: Get the partition of every key.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Final
+
+# 8 bytes of digest give 64-bit scores, ties between partitions are practically impossible.
+DIGEST_SIZE: Final[int] = 8
+
+
+def _score(key: str, partition: int) -> int:
+    """
+    Score a key on a partition.
+
+    Args:
+        key (str): The key, e.g. a container name.
+        partition (int): The index of the partition.
+
+    Returns:
+        int: The score, the key is placed on the partition with the highest score.
+    """
+    digest = hashlib.blake2b(f"{partition}/{key}".encode(), digest_size=DIGEST_SIZE).digest()
+    return int.from_bytes(digest, "big")
+
+
+def get_partition(key: str, partitions: int) -> int:
+    """
+    Get the partition a key is placed on.
+
+    Args:
+        key (str): The key, e.g. a container name.
+        partitions (int): The number of partitions.
+
+    Returns:
+        int: The index of the partition, from 0 up to the number of partitions.
+
+    Raises:
+        ValueError: If the number of partitions is less than one.
+    """
+    if partitions < 1:
+        raise ValueError(f"The number of partitions must be at least 1, got {partitions}.")
+    return max(range(partitions), key=lambda partition: _score(key, partition))
+
+
+def route(keys: Iterable[str], partitions: int) -> dict[str, int]:
+    """
+    Get the partition of every key.
+
+    Args:
+        keys (Iterable[str]): The keys, e.g. the container names of a layer.
+        partitions (int): The number of partitions.
+
+    Returns:
+        dict[str, int]: The index of the partition per key.
+    """
+    return {key: get_partition(key, partitions) for key in keys}
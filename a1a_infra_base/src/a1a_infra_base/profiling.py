@@ -0,0 +1,328 @@
+"""
+Profiler with a simple factory pattern.
+
+This module provides CPU and memory profilers that can be switched on from the command line to find out where a synth
+run spends its time and memory.
+
+Classes:
+    ProfilerBase: Abstract base class for profilers.
+    CpuProfiler: Runs cProfile and a stack sampler, writes a `.pstats` file and a collapsed-stack file.
+    MemoryProfiler: Takes tracemalloc snapshots at checkpoints and reports the top allocating sites.
+    CombinedProfiler: Runs the CPU and memory profiler together.
+    ProfilerFactory: Factory for creating profilers based on the profile mode.
+"""
+
+import cProfile
+import logging
+import sys
+import threading
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Final
+
+from a1a_infra_base.logger import setup_logger
+
+logger: logging.Logger = setup_logger(__name__)
+
+CPU_MODE: Final[str] = "cpu"
+MEM_MODE: Final[str] = "mem"
+BOTH_MODE: Final[str] = "both"
+
+SAMPLE_INTERVAL_SECONDS: Final[float] = 0.005
+TOP_ALLOCATIONS: Final[int] = 25
+
+
+class ProfilerBase(ABC):
+    """Base class for profilers."""
+
+    def __init__(self, output_dir: Path, name: str) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir (Path): The directory to write profile output to.
+            name (str): The name used as prefix for all output files, e.g. the config file stem.
+        """
+        self.output_dir: Path = output_dir
+        self.name: str = name
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start profiling."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def checkpoint(self, label: str) -> None:
+        """
+        Mark a named point in the run, such as after config load or after synth.
+
+        Args:
+            label (str): The name of the checkpoint.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stop(self) -> list[Path]:
+        """
+        Stop profiling and write the output files.
+
+        Returns:
+            list[Path]: The files that were written.
+        """
+        raise NotImplementedError
+
+    def _output_path(self, suffix: str) -> Path:
+        """
+        Get the output path for a file with the given suffix, creating the output directory if needed.
+
+        Args:
+            suffix (str): The file suffix, e.g. ".pstats".
+
+        Returns:
+            Path: The path of the output file.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / f"{self.name}{suffix}"
+
+
+class _StackSampler(threading.Thread):
+    """Background thread that periodically samples the call stack of a target thread."""
+
+    def __init__(self, target_thread_id: int, interval: float = SAMPLE_INTERVAL_SECONDS) -> None:
+        """
+        Initialize the sampler.
+
+        Args:
+            target_thread_id (int): The ident of the thread to sample.
+            interval (float): Seconds between samples.
+        """
+        super().__init__(name="a1a_infra_base-stack-sampler", daemon=True)
+        self.target_thread_id: int = target_thread_id
+        self.interval: float = interval
+        self.samples: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """Sample the target thread until stopped."""
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the thread to finish."""
+        self._stopped.set()
+        self.join()
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> str:
+        """
+        Collapse a frame into a `root;...;leaf` string as used by flamegraph tooling.
+
+        Args:
+            frame (FrameType | None): The innermost frame.
+
+        Returns:
+            str: The collapsed stack.
+        """
+        names: list[str] = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+class CpuProfiler(ProfilerBase):
+    """Runs cProfile together with a stack sampler for flamegraph output."""
+
+    def __init__(self, output_dir: Path, name: str) -> None:
+        """
+        Initialize the CPU profiler.
+
+        Args:
+            output_dir (Path): The directory to write profile output to.
+            name (str): The name used as prefix for all output files.
+        """
+        super().__init__(output_dir=output_dir, name=name)
+        self._profile = cProfile.Profile()
+        self._sampler: _StackSampler | None = None
+
+    def start(self) -> None:
+        """Start cProfile and the stack sampler."""
+        self._sampler = _StackSampler(target_thread_id=threading.get_ident())
+        self._sampler.start()
+        self._profile.enable()
+
+    def checkpoint(self, label: str) -> None:
+        """
+        CPU profiles cover the whole run; checkpoints are only logged.
+
+        Args:
+            label (str): The name of the checkpoint.
+        """
+        logger.debug("CPU profile checkpoint: %s", label)
+
+    def stop(self) -> list[Path]:
+        """
+        Stop profiling, write the `.pstats` file and the collapsed-stack file.
+
+        Returns:
+            list[Path]: The written `.pstats` and `.collapsed` files.
+        """
+        self._profile.disable()
+        pstats_path = self._output_path(".pstats")
+        self._profile.dump_stats(pstats_path)
+
+        collapsed_path = self._output_path(".collapsed")
+        samples: Counter[str] = Counter()
+        if self._sampler is not None:
+            self._sampler.stop()
+            samples = self._sampler.samples
+        with open(collapsed_path, "w", encoding="utf-8") as file:
+            for stack, count in samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+        logger.info("CPU profile written to '%s' and '%s'.", pstats_path, collapsed_path)
+        return [pstats_path, collapsed_path]
+
+
+class MemoryProfiler(ProfilerBase):
+    """Takes tracemalloc snapshots at checkpoints and reports the top allocating sites."""
+
+    def __init__(self, output_dir: Path, name: str, top: int = TOP_ALLOCATIONS) -> None:
+        """
+        Initialize the memory profiler.
+
+        Args:
+            output_dir (Path): The directory to write profile output to.
+            name (str): The name used as prefix for all output files.
+            top (int): The number of allocating sites to report per checkpoint.
+        """
+        super().__init__(output_dir=output_dir, name=name)
+        self.top: int = top
+        self._snapshots: list[tuple[str, tracemalloc.Snapshot]] = []
+        self._started_tracing: bool = False
+
+    def start(self) -> None:
+        """Start tracing memory allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def checkpoint(self, label: str) -> None:
+        """
+        Take a snapshot of the current allocations.
+
+        Args:
+            label (str): The name of the checkpoint.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+        self._snapshots.append((label, snapshot))
+
+    def stop(self) -> list[Path]:
+        """
+        Stop tracing and write a report with the top allocating sites per checkpoint.
+
+        Returns:
+            list[Path]: The written `.mem.txt` report.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+
+        report_path = self._output_path(".mem.txt")
+        with open(report_path, "w", encoding="utf-8") as file:
+            previous: tracemalloc.Snapshot | None = None
+            for label, snapshot in self._snapshots:
+                total = sum(stat.size for stat in snapshot.statistics("filename"))
+                file.write(f"== {label} (total traced: {total / 1024:.1f} KiB)\n")
+                for stat in snapshot.statistics("lineno")[: self.top]:
+                    file.write(f"{stat}\n")
+                if previous is not None:
+                    file.write("-- growth since previous checkpoint\n")
+                    for diff in snapshot.compare_to(previous, "lineno")[: self.top]:
+                        file.write(f"{diff}\n")
+                file.write("\n")
+                previous = snapshot
+
+        logger.info("Memory profile written to '%s'.", report_path)
+        return [report_path]
+
+
+class CombinedProfiler(ProfilerBase):
+    """Runs the CPU and memory profiler together."""
+
+    def __init__(self, output_dir: Path, name: str) -> None:
+        """
+        Initialize the combined profiler.
+
+        Args:
+            output_dir (Path): The directory to write profile output to.
+            name (str): The name used as prefix for all output files.
+        """
+        super().__init__(output_dir=output_dir, name=name)
+        self._profilers: list[ProfilerBase] = [
+            MemoryProfiler(output_dir=output_dir, name=name),
+            CpuProfiler(output_dir=output_dir, name=name),
+        ]
+
+    def start(self) -> None:
+        """Start all profilers."""
+        for profiler in self._profilers:
+            profiler.start()
+
+    def checkpoint(self, label: str) -> None:
+        """
+        Pass the checkpoint on to all profilers.
+
+        Args:
+            label (str): The name of the checkpoint.
+        """
+        for profiler in self._profilers:
+            profiler.checkpoint(label)
+
+    def stop(self) -> list[Path]:
+        """
+        Stop all profilers in reverse start order.
+
+        Returns:
+            list[Path]: The files written by all profilers.
+        """
+        paths: list[Path] = []
+        for profiler in reversed(self._profilers):
+            paths.extend(profiler.stop())
+        return paths
+
+
+class ProfilerFactory:
+    """Factory for creating profilers based on the profile mode."""
+
+    SUPPORTED_MODES: dict[str, type[ProfilerBase]] = {
+        CPU_MODE: CpuProfiler,
+        MEM_MODE: MemoryProfiler,
+        BOTH_MODE: CombinedProfiler,
+    }
+
+    @classmethod
+    def create(cls, mode: str, output_dir: Path, name: str) -> ProfilerBase:
+        """
+        Create a profiler based on the profile mode.
+
+        Args:
+            mode (str): The profile mode, one of `cpu`, `mem` or `both`.
+            output_dir (Path): The directory to write profile output to.
+            name (str): The name used as prefix for all output files.
+
+        Returns:
+            ProfilerBase: An instance of the appropriate profiler.
+
+        Raises:
+            NotImplementedError: If the profile mode is not supported.
+        """
+        profiler_class = cls.SUPPORTED_MODES.get(mode)
+        if profiler_class is None:
+            raise NotImplementedError(f"Profile mode '{mode}' is not supported.")
+        return profiler_class(output_dir=output_dir, name=name)
@@ -0,0 +1,52 @@
+"""
+Module selection
+
+This module defines the ConstructSelection class, which restricts construct instantiation to a single construct path
+so that a subtree of a stack can be synthesized on its own.
+
+Classes:
+    ConstructSelection: A selection of a construct subtree by construct path.
+"""
+
+from dataclasses import dataclass
+from typing import Final
+
+PATH_SEPARATOR: Final[str] = "/"
+
+
+@dataclass(frozen=True)
+class ConstructSelection:
+    """
+    A selection of a construct subtree by construct path, e.g. `LakeHouseStack/DataLakeL2/StorageL1_Gold`.
+
+    A construct is included when it lies on the path towards the selected construct or inside its subtree.
+    Constructs outside of that are left out; parents replace references to them with stubbed values.
+    An empty path selects everything.
+
+    Attributes:
+        path (str): The construct path of the selected construct.
+    """
+
+    path: str = ""
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Gets the construct IDs that make up the selected path."""
+        return tuple(part for part in self.path.split(PATH_SEPARATOR) if part)
+
+    def includes(self, path: str) -> bool:
+        """
+        Check whether the construct at the given path should be instantiated.
+
+        Args:
+            path (str): The construct path of the candidate, e.g. `f"{self.node.path}/StorageL1_Gold"`.
+
+        Returns:
+            bool: True if the candidate is an ancestor of, equal to or a descendant of the selected construct.
+        """
+        candidate = tuple(part for part in path.split(PATH_SEPARATOR) if part)
+        length = min(len(candidate), len(self.parts))
+        return candidate[:length] == self.parts[:length]
+
+
+SELECT_ALL: Final[ConstructSelection] = ConstructSelection()
@@ -15,6 +15,7 @@ from typing import Any, Final, Self
 from jsii import JSIIMeta
 
 from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
 from constructs import Construct
 
 logger: logging.Logger = setup_logger(__name__)
@@ -66,7 +67,15 @@ class StackABC(ABC):
     """
 
     @abstractmethod
-    def __init__(self, scope: Construct, id_: str, *, env: str, config: StackConfigABC) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        id_: str,
+        *,
+        env: str,
+        config: StackConfigABC,
+        selection: ConstructSelection = SELECT_ALL,
+    ) -> None:
         """
         Initializes the StackABC construct.
 
@@ -75,4 +84,5 @@ class StackABC(ABC):
             id_ (str): The scoped construct ID.
             env (str): The environment name.
             config (StackConfigABC): The configuration for the stack.
+            selection (ConstructSelection): The construct subtree to instantiate, defaults to everything.
         """
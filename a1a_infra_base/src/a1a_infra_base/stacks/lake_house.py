@@ -6,29 +6,35 @@ This module defines the DataLakeStack class, which creates a data lake with mult
 
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Self
 
-from cdktf import LocalBackend, TerraformStack
-from cdktf_cdktf_provider_azurerm.provider import AzurermProvider
+from cdktf import TerraformOutput, TerraformStack
 
 from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constructs.ABC import LazyConfigABC
 from a1a_infra_base.constructs.level0.management_lock import ManagementLockL0, ManagementLockL0Config
 from a1a_infra_base.constructs.level0.resource_group import ResourceGroupL0, ResourceGroupL0Config
 
 # from a1a_infra_base.constructs.level0.storage_account import StorageAccountL0, StorageAccountL0Config
-from a1a_infra_base.constructs.level2.data_lake import DATA_LAKE_KEY, DataLakeL2, DataLakeL2Config
+from a1a_infra_base.constructs.level2.data_lake import (
+    DATA_LAKE_KEY,
+    DataLakeL2,
+    DataLakeL2Config,
+    LazyDataLakeL2Config,
+)
 from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
 from a1a_infra_base.stacks.ABC import (
     AZURERM_KEY,
     BACKEND_KEY,
     CONSTRUCTS_KEY,
-    LOCAL_KEY,
     PROVIDER_KEY,
     CombinedMeta,
     StackABC,
     StackConfigABC,
 )
-from a1a_infra_base.terraform_backend import TerraformBackendLocalConfig
+from a1a_infra_base.terraform_backend import TerraformBackendConfig, backend_config_from_dict
 from a1a_infra_base.terraform_provider import TerraformProviderAzurermConfig
 from constructs import Construct
 
@@ -72,12 +78,12 @@ class LakeHouseStackConfig(StackConfigABC):
     Configuration class for DataLakeStack.
 
     Attributes:
-        backend_local_config (TerraformBackendLocalConfig): Configuration for the local Terraform backend.
+        backend_config (TerraformBackendConfig): Configuration for the Terraform backend.
         provider_azurerm_config (TerraformProviderAzurermConfig): Configuration for the Azure provider.
         constructs_config (LakeHouseStackConstructsConfig): Configuration for the lake house constructs.
     """
 
-    backend_local_config: TerraformBackendLocalConfig
+    backend_config: TerraformBackendConfig
     provider_azurerm_config: TerraformProviderAzurermConfig
     constructs_config: LakeHouseStackConstructsConfig
 
@@ -93,12 +99,106 @@ class LakeHouseStackConfig(StackConfigABC):
             DataLakeStackConfig: A new instance of DataLakeStackConfig.
         """
         return cls(
-            backend_local_config=TerraformBackendLocalConfig.from_dict(dict_[BACKEND_KEY][LOCAL_KEY]),
+            backend_config=backend_config_from_dict(dict_[BACKEND_KEY]),
             provider_azurerm_config=TerraformProviderAzurermConfig.from_dict(dict_[PROVIDER_KEY][AZURERM_KEY]),
             constructs_config=LakeHouseStackConstructsConfig.from_dict(dict_[CONSTRUCTS_KEY]),
         )
 
 
+class LazyLakeHouseStackConstructsConfig(LazyConfigABC):
+    """
+    Configuration class for the lake house constructs that decodes each section on first access.
+
+    Attributes:
+        rg_storage (ResourceGroupL0Config): Configuration for the storage resource group.
+        rg_storage_lock (ManagementLockL0Config): Configuration for the storage resource group lock.
+        data_lake (LazyDataLakeL2Config): Lazy configuration for the data lake.
+    """
+
+    @cached_property
+    def rg_storage(self) -> ResourceGroupL0Config:
+        """Gets the configuration for the storage resource group."""
+        return ResourceGroupL0Config(name="storage", location=AzureLocation.GERMANY_WEST_CENTRAL, sequence_number="01")
+
+    @cached_property
+    def rg_storage_lock(self) -> ManagementLockL0Config:
+        """Gets the configuration for the storage resource group lock."""
+        return ManagementLockL0Config(lock_level="CanNotDelete")
+
+    @cached_property
+    def data_lake(self) -> LazyDataLakeL2Config:
+        """Gets the lazy configuration for the data lake."""
+        return LazyDataLakeL2Config(self.dict_[DATA_LAKE_KEY])
+
+    def materialize(self) -> LakeHouseStackConstructsConfig:
+        """
+        Decode all sections and return the eager configuration.
+
+        Returns:
+            LakeHouseStackConstructsConfig: A fully-initialized LakeHouseStackConstructsConfig.
+        """
+        return LakeHouseStackConstructsConfig(
+            rg_storage=self.rg_storage,
+            rg_storage_lock=self.rg_storage_lock,
+            data_lake=self.data_lake.materialize(),
+        )
+
+
+class LazyLakeHouseStackConfig(LazyConfigABC, StackConfigABC):
+    """
+    Configuration class for LakeHouseStack that decodes each section on first access.
+
+    Read-only tooling that needs a single section, such as the provider, only pays for decoding that section.
+    The stack accepts this class in place of LakeHouseStackConfig.
+
+    Attributes:
+        backend_config (TerraformBackendConfig): Configuration for the Terraform backend.
+        provider_azurerm_config (TerraformProviderAzurermConfig): Configuration for the Azure provider.
+        constructs_config (LazyLakeHouseStackConstructsConfig): Lazy configuration for the lake house constructs.
+    """
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Creates a LazyLakeHouseStackConfig instance from a dictionary without decoding any section.
+
+        Args:
+            dict_ (dict[str, Any]): The dictionary containing the configuration.
+
+        Returns:
+            LazyLakeHouseStackConfig: A new instance of LazyLakeHouseStackConfig.
+        """
+        return cls(dict_)
+
+    @cached_property
+    def backend_config(self) -> TerraformBackendConfig:
+        """Gets the configuration for the Terraform backend."""
+        return backend_config_from_dict(self.dict_[BACKEND_KEY])
+
+    @cached_property
+    def provider_azurerm_config(self) -> TerraformProviderAzurermConfig:
+        """Gets the configuration for the Azure provider."""
+        return TerraformProviderAzurermConfig.from_dict(self.dict_[PROVIDER_KEY][AZURERM_KEY])
+
+    @cached_property
+    def constructs_config(self) -> LazyLakeHouseStackConstructsConfig:
+        """Gets the lazy configuration for the lake house constructs."""
+        return LazyLakeHouseStackConstructsConfig(self.dict_[CONSTRUCTS_KEY])
+
+    def materialize(self) -> LakeHouseStackConfig:
+        """
+        Decode all sections and return the eager configuration.
+
+        Returns:
+            LakeHouseStackConfig: A fully-initialized LakeHouseStackConfig.
+        """
+        return LakeHouseStackConfig(
+            backend_config=self.backend_config,
+            provider_azurerm_config=self.provider_azurerm_config,
+            constructs_config=self.constructs_config.materialize(),
+        )
+
+
 class LakeHouseStack(TerraformStack, StackABC, metaclass=CombinedMeta):
     """
     A Terraform stack that creates a data lake following the medallion architecture pattern.
@@ -123,7 +223,8 @@ class LakeHouseStack(TerraformStack, StackABC, metaclass=CombinedMeta):
         id_: str = "LakeHouseStack",
         *,
         env: str,
-        config: LakeHouseStackConfig,
+        config: LakeHouseStackConfig | LazyLakeHouseStackConfig,
+        selection: ConstructSelection = SELECT_ALL,
     ) -> None:
         """
         Initializes the DataLakeStack construct.
@@ -133,61 +234,83 @@ class LakeHouseStack(TerraformStack, StackABC, metaclass=CombinedMeta):
             id_ (str): The scoped construct ID.
             env (str): The environment name.
             config (DataLakeStackConfig): The configuration for the data lake stack.
+            selection (ConstructSelection): The construct subtree to instantiate, defaults to everything. Excluded
+                constructs the selected ones depend on, such as the resource group, are replaced by their names.
         """
         TerraformStack.__init__(self, scope, id_)
 
-        # Set up the local backend
-        LocalBackend(self, path=config.backend_local_config.path)
+        # Set up the backend
+        config.backend_config.create_backend(self, env=env)
 
         # Set up the Azure provider
-        AzurermProvider(
-            self,
-            "AzureRM",
-            features=[{}],
-            tenant_id=config.provider_azurerm_config.tenant_id,
-            subscription_id=config.provider_azurerm_config.subscription_id,
-            client_id=config.provider_azurerm_config.client_id,
-            client_secret=config.provider_azurerm_config.client_secret,
-        )
-
-        # Create the resource group
-        self._resource_group = ResourceGroupL0(
-            self,
-            "ResourceGroupL0",
-            env=env,
-            config=config.constructs_config.rg_storage,
-        )
+        config.provider_azurerm_config.create_provider(self)
+
+        # Create the resource group, or stub its name when it is left out of the selection
+        self._resource_group: ResourceGroupL0 | None = None
+        resource_group_name: str = config.constructs_config.rg_storage.full_name(env)
+        if selection.includes(f"{self.node.path}/ResourceGroupL0") or selection.includes(
+            f"{self.node.path}/ManagementLockL0"
+        ):
+            self._resource_group = ResourceGroupL0(
+                self,
+                "ResourceGroupL0",
+                env=env,
+                config=config.constructs_config.rg_storage,
+            )
+            resource_group_name = self._resource_group.resource_group.name
 
         # Create the management lock for the resource group
-        self._management_lock = ManagementLockL0(
-            self,
-            "ManagementLockL0",
-            _=env,
-            config=config.constructs_config.rg_storage_lock,
-            resource_id=self._resource_group.resource_group.id,
-            resource_name=config.constructs_config.rg_storage.name,
-        )
+        self._management_lock: ManagementLockL0 | None = None
+        if self._resource_group is not None and selection.includes(f"{self.node.path}/ManagementLockL0"):
+            self._management_lock = ManagementLockL0(
+                self,
+                "ManagementLockL0",
+                _=env,
+                config=config.constructs_config.rg_storage_lock,
+                resource_id=self._resource_group.resource_group.id,
+                resource_name=config.constructs_config.rg_storage.name,
+            )
 
         # Create the data lake storage accounts
-        self._data_lake = DataLakeL2(
-            self,
-            "DataLakeL2",
-            env=env,
-            config=config.constructs_config.data_lake,
-            resource_group_name=self._resource_group.resource_group.name,
-        )
+        self._data_lake: DataLakeL2 | None = None
+        if selection.includes(f"{self.node.path}/DataLakeL2"):
+            self._data_lake = DataLakeL2(
+                self,
+                "DataLakeL2",
+                env=env,
+                config=config.constructs_config.data_lake,
+                resource_group_name=resource_group_name,
+                selection=selection,
+            )
+
+            # Publish the endpoints of every layer, so consumers can pick the variant with the lowest latency
+            for layer, storage_l1 in self._data_lake.storage_l1s.items():
+                for variant, endpoint in storage_l1.storage_account.endpoints.items():
+                    TerraformOutput(
+                        self,
+                        f"{layer}_{variant}_endpoint",
+                        value=endpoint,
+                        description=f"The {variant.replace('_', ' ')} endpoint of the {layer} storage account.",
+                    )
+            # Publish where every container lives, so jobs can resolve the account of a partitioned layer
+            TerraformOutput(
+                self,
+                "container_routing",
+                value=self._data_lake.container_routing,
+                description="The name of the storage account of each container, per layer.",
+            )
 
     @property
-    def resource_group(self) -> ResourceGroupL0:
-        """Gets the resource group."""
+    def resource_group(self) -> ResourceGroupL0 | None:
+        """Gets the resource group, None if it was left out of the selection."""
         return self._resource_group
 
     @property
-    def management_lock(self) -> ManagementLockL0:
-        """Gets the management lock."""
+    def management_lock(self) -> ManagementLockL0 | None:
+        """Gets the management lock, None if it was left out of the selection."""
         return self._management_lock
 
     @property
-    def data_lake(self) -> DataLakeL2:
-        """Gets the data lake construct."""
+    def data_lake(self) -> DataLakeL2 | None:
+        """Gets the data lake construct, None if it was left out of the selection."""
         return self._data_lake
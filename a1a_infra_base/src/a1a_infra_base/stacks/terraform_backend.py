@@ -2,10 +2,10 @@
 Module terraform_backend_stack
 
 This module defines the TerraformBackendStack class, which initializes the Terraform stack
-with a local backend, an Azure provider, and creates a resource group and a locked storage account.
+with a backend, an Azure provider, and creates a resource group and a locked storage account.
 
 Classes:
-    TerraformBackendStack: A Terraform stack that sets up the local backend, Azure provider,
+    TerraformBackendStack: A Terraform stack that sets up the backend, Azure provider,
                            and creates a resource group and a locked storage account.
     TerraformBackendStackConfig: A configuration class for TerraformBackendStack.
 """
@@ -14,25 +14,24 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Self
 
-from cdktf import LocalBackend, TerraformStack
-from cdktf_cdktf_provider_azurerm.provider import AzurermProvider
+from cdktf import TerraformStack
 
 from a1a_infra_base.constants import AzureLocation
 from a1a_infra_base.constructs.level0.management_lock import ManagementLockL0, ManagementLockL0Config
 from a1a_infra_base.constructs.level0.resource_group import ResourceGroupL0, ResourceGroupL0Config
 from a1a_infra_base.constructs.level1.storage import STORAGE_L1_KEY, StorageL1, StorageL1Config
 from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
 from a1a_infra_base.stacks.ABC import (
     AZURERM_KEY,
     BACKEND_KEY,
     CONSTRUCTS_KEY,
-    LOCAL_KEY,
     PROVIDER_KEY,
     CombinedMeta,
     StackABC,
     StackConfigABC,
 )
-from a1a_infra_base.terraform_backend import TerraformBackendLocalConfig
+from a1a_infra_base.terraform_backend import TerraformBackendConfig, backend_config_from_dict
 from a1a_infra_base.terraform_provider import TerraformProviderAzurermConfig
 from constructs import Construct
 
@@ -75,12 +74,12 @@ class TerraformBackendStackConfig(StackConfigABC):
     This class is responsible for unpacking parameters from a configuration dictionary.
 
     Attributes:
-        backend_local_config (TerraformBackendLocalConfig): The configuration for the Terraform backend.
+        backend_config (TerraformBackendConfig): The configuration for the Terraform backend.
         provider_azurerm_config (TerraformProviderAzurermConfig): The configuration for the Terraform AzureRM provider.
         constructs_config (TerraformBackendL1Config): The configuration for the Terraform backend L1 construct.
     """
 
-    backend_local_config: TerraformBackendLocalConfig
+    backend_config: TerraformBackendConfig
     provider_azurerm_config: TerraformProviderAzurermConfig
     constructs_config: TerraformBackendStackConstructsConfig
 
@@ -95,12 +94,12 @@ class TerraformBackendStackConfig(StackConfigABC):
         Returns:
             TerraformBackendStackConfig: A fully-initialized TerraformBackendStackConfig.
         """
-        backend_local_config = TerraformBackendLocalConfig.from_dict(dict_[BACKEND_KEY][LOCAL_KEY])
+        backend_config = backend_config_from_dict(dict_[BACKEND_KEY])
         provider_azurerm_config = TerraformProviderAzurermConfig.from_dict(dict_[PROVIDER_KEY][AZURERM_KEY])
         constructs_config = TerraformBackendStackConstructsConfig.from_dict(dict_[CONSTRUCTS_KEY])
 
         return cls(
-            backend_local_config=backend_local_config,
+            backend_config=backend_config,
             provider_azurerm_config=provider_azurerm_config,
             constructs_config=constructs_config,
         )
@@ -108,7 +107,7 @@ class TerraformBackendStackConfig(StackConfigABC):
 
 class TerraformBackendStack(TerraformStack, StackABC, metaclass=CombinedMeta):
     """
-    A Terraform stack that sets up the local backend, Azure provider, and creates a resource group
+    A Terraform stack that sets up the backend, Azure provider, and creates a resource group
     and a locked storage account based on a given configuration dictionary.
 
     Attributes:
@@ -122,6 +121,7 @@ class TerraformBackendStack(TerraformStack, StackABC, metaclass=CombinedMeta):
         *,
         env: str,
         config: TerraformBackendStackConfig,
+        selection: ConstructSelection = SELECT_ALL,
     ) -> None:
         """
         Initializes the TerraformBackendStack construct.
@@ -131,46 +131,51 @@ class TerraformBackendStack(TerraformStack, StackABC, metaclass=CombinedMeta):
             id_ (str): The scoped construct ID.
             env (str): The environment name.
             config (TerraformBackendStackConfig): The configuration for the Terraform backend stack.
+            selection (ConstructSelection): The construct subtree to instantiate, defaults to everything. Excluded
+                constructs the selected ones depend on, such as the resource group, are replaced by their names.
         """
         TerraformStack.__init__(self, scope, id_)
 
-        # Set up the local backend
-        LocalBackend(self, path=config.backend_local_config.path)
+        # Set up the backend
+        config.backend_config.create_backend(self, env=env)
 
         # Set up the Azure provider
-        AzurermProvider(
-            self,
-            "AzureRM",
-            features=[{}],
-            tenant_id=config.provider_azurerm_config.tenant_id,
-            subscription_id=config.provider_azurerm_config.subscription_id,
-            client_id=config.provider_azurerm_config.client_id,
-            client_secret=config.provider_azurerm_config.client_secret,
-        )
-
-        # Create the resource group
-        self._resource_group = ResourceGroupL0(
-            self,
-            "ResourceGroupL0",
-            env=env,
-            config=config.constructs_config.resource_group,
-        )
+        config.provider_azurerm_config.create_provider(self)
+
+        # Create the resource group, or stub its name when it is left out of the selection
+        self._resource_group: ResourceGroupL0 | None = None
+        resource_group_name: str = config.constructs_config.resource_group.full_name(env)
+        if selection.includes(f"{self.node.path}/ResourceGroupL0") or selection.includes(
+            f"{self.node.path}/ManagementLockL0"
+        ):
+            self._resource_group = ResourceGroupL0(
+                self,
+                "ResourceGroupL0",
+                env=env,
+                config=config.constructs_config.resource_group,
+            )
+            resource_group_name = self._resource_group.resource_group.name
 
         # Create the management lock for the resource group
-        self._management_lock = ManagementLockL0(
-            self,
-            "ManagementLockL0",
-            _=env,
-            config=config.constructs_config.rg_lock,
-            resource_id=self._resource_group.resource_group.id,
-            resource_name=config.constructs_config.resource_group.name,
-        )
+        self._management_lock: ManagementLockL0 | None = None
+        if self._resource_group is not None and selection.includes(f"{self.node.path}/ManagementLockL0"):
+            self._management_lock = ManagementLockL0(
+                self,
+                "ManagementLockL0",
+                _=env,
+                config=config.constructs_config.rg_lock,
+                resource_id=self._resource_group.resource_group.id,
+                resource_name=config.constructs_config.resource_group.name,
+            )
 
         # Create the storage account
-        self.storage_l1 = StorageL1(
-            self,
-            "StorageL1",
-            env=env,
-            config=config.constructs_config.storage,
-            resource_group_name=self._resource_group.resource_group.name,
-        )
+        self.storage_l1: StorageL1 | None = None
+        if selection.includes(f"{self.node.path}/StorageL1"):
+            self.storage_l1 = StorageL1(
+                self,
+                "StorageL1",
+                env=env,
+                config=config.constructs_config.storage,
+                resource_group_name=resource_group_name,
+                selection=selection,
+            )
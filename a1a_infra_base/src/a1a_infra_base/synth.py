@@ -0,0 +1,262 @@
+"""
+Module synth
+
+This module maps the `name` of a configuration document to the stack it describes and builds that stack.
+It also provides an in-memory synth that returns the Terraform JSON of each stack without leaving `cdktf.out`, and
+a matrix build that instantiates the same configuration once per environment in a single app.
+
+Classes:
+    StackDefinition: The configuration class, stack class and construct ID belonging to a stack name.
+
+Functions:
+    get_stack_definition: Get the stack definition registered under a stack name.
+    decode_stack_config: Decode the `stack` section of a configuration document.
+    build_stack: Instantiate the stack registered under a stack name in the given scope.
+    build_matrix: Instantiate one stack per environment from a shared configuration in the given scope.
+    synthesize: Build the stack of a configuration document in an isolated app and return its Terraform JSON.
+    check_capacity: Check the projected load of every data lake in a scope against the storage scalability targets.
+"""
+
+import json
+import logging
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Final
+
+from cdktf import App, TerraformStack, Testing
+
+from a1a_infra_base.capacity import AccountCapacity, log_capacity_plan, plan_capacity
+from a1a_infra_base.constructs.level2.data_lake import DataLakeL2
+from a1a_infra_base.logger import setup_logger
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
+from a1a_infra_base.stacks.ABC import StackConfigABC
+from a1a_infra_base.stacks.lake_house import LakeHouseStack, LakeHouseStackConfig
+from a1a_infra_base.stacks.terraform_backend import TerraformBackendStack, TerraformBackendStackConfig
+from constructs import Construct
+
+logger: logging.Logger = setup_logger(__name__)
+
+# Constants for dictionary keys
+ENV_KEY: Final[str] = "env"
+NAME_KEY: Final[str] = "name"
+STACK_KEY: Final[str] = "stack"
+
+
+@dataclass(frozen=True)
+class StackDefinition:
+    """
+    The configuration class, stack class and construct ID belonging to a stack name.
+
+    Attributes:
+        config_class (type[StackConfigABC]): The configuration class to decode the `stack` section with.
+        stack_class (type[TerraformStack]): The stack class to instantiate.
+        id_ (str): The construct ID of the stack.
+    """
+
+    config_class: type[StackConfigABC]
+    stack_class: type[TerraformStack]
+    id_: str
+
+
+STACKS: Final[dict[str, StackDefinition]] = {
+    "lake_house": StackDefinition(config_class=LakeHouseStackConfig, stack_class=LakeHouseStack, id_="LakeHouseStack"),
+    "terraform_backend": StackDefinition(
+        config_class=TerraformBackendStackConfig, stack_class=TerraformBackendStack, id_="TerraformBackendStack"
+    ),
+}
+
+
+def get_stack_definition(name: str) -> StackDefinition:
+    """
+    Get the stack definition registered under a stack name.
+
+    Args:
+        name (str): The stack name from the configuration document, e.g. `lake_house`.
+
+    Returns:
+        StackDefinition: The registered stack definition.
+
+    Raises:
+        ValueError: If no stack is registered under the given name.
+    """
+    definition = STACKS.get(name)
+    if definition is None:
+        raise ValueError(f"No stack with name '{name}' found.")
+    return definition
+
+
+def decode_stack_config(*, name: str, dict_: dict[str, Any]) -> StackConfigABC:
+    """
+    Decode the `stack` section of a configuration document into the configuration class of its stack.
+
+    Args:
+        name (str): The stack name from the configuration document.
+        dict_ (dict[str, Any]): The `stack` section of the configuration document.
+
+    Returns:
+        StackConfigABC: A fully-initialized stack configuration.
+    """
+    return get_stack_definition(name).config_class.from_dict(dict_=dict_)
+
+
+def build_stack(
+    scope: Construct,
+    *,
+    name: str,
+    env: str,
+    config: StackConfigABC,
+    selection: ConstructSelection = SELECT_ALL,
+    id_: str | None = None,
+) -> TerraformStack:
+    """
+    Instantiate the stack registered under a stack name in the given scope.
+
+    Args:
+        scope (Construct): The scope, usually the app, to create the stack in.
+        name (str): The stack name from the configuration document.
+        env (str): The environment name.
+        config (StackConfigABC): The decoded stack configuration.
+        selection (ConstructSelection): The construct subtree to instantiate, defaults to everything.
+        id_ (str | None): The construct ID of the stack, defaults to the ID of the stack definition.
+
+    Returns:
+        TerraformStack: The instantiated stack.
+
+    Raises:
+        ValueError: If the selected construct path does not exist in the stack.
+    """
+    definition = get_stack_definition(name)
+    id_ = id_ or definition.id_
+    stack = definition.stack_class(scope, id_, env=env, config=config, selection=selection)  # type: ignore
+
+    construct_paths = {construct.node.path for construct in stack.node.find_all()}
+    if selection.parts and "/".join(selection.parts) not in construct_paths:
+        raise ValueError(f"No construct with path '{selection.path}' found in stack '{id_}'.")
+    return stack
+
+
+def build_matrix(
+    scope: Construct,
+    *,
+    name: str,
+    dict_: dict[str, Any],
+    envs: list[str],
+    overlays: dict[str, dict[str, Any]] | None = None,
+    selection: ConstructSelection = SELECT_ALL,
+) -> list[TerraformStack]:
+    """
+    Instantiate one stack per environment from a shared configuration in the given scope.
+
+    The `stack` section is decoded once and shared by all environments without an overlay. An overlay is merged over
+    the `stack` section and decoded separately. Each stack gets the ID `<stack ID>_<env>`, so it is synthesized to its
+    own directory, and its backend separates the state per environment like a single stack does.
+
+    Args:
+        scope (Construct): The scope, usually the app, to create the stacks in.
+        name (str): The stack name from the configuration document.
+        dict_ (dict[str, Any]): The `stack` section of the configuration document.
+        envs (list[str]): The environment names to create a stack for.
+        overlays (dict[str, dict[str, Any]] | None): Partial `stack` sections per environment.
+        selection (ConstructSelection): The construct subtree to instantiate, defaults to everything.
+
+    Returns:
+        list[TerraformStack]: The instantiated stacks, in the order of the environments.
+    """
+    overlays = overlays or {}
+    definition = get_stack_definition(name)
+    base_config = decode_stack_config(name=name, dict_=dict_)
+
+    stacks: list[TerraformStack] = []
+    for env in envs:
+        id_ = f"{definition.id_}_{env}"
+        if not selection.includes(id_):
+            continue
+
+        config = base_config
+        if env in overlays:
+            config = decode_stack_config(name=name, dict_=_deep_merge(dict_, overlays[env]))
+
+        stacks.append(build_stack(scope, name=name, env=env, config=config, selection=selection, id_=id_))
+    return stacks
+
+
+def _deep_merge(base: dict[str, Any], overlay: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge an overlay over a base dictionary, recursing into nested dictionaries; other values are replaced.
+
+    Args:
+        base (dict[str, Any]): The base dictionary, left unchanged.
+        overlay (dict[str, Any]): The dictionary with overriding values.
+
+    Returns:
+        dict[str, Any]: The merged dictionary.
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def synthesize(
+    config: dict[str, Any], env: str, selection: ConstructSelection = SELECT_ALL
+) -> dict[str, dict[str, Any]]:
+    """
+    Build the stack of a configuration document in an isolated app and return its Terraform JSON.
+
+    Nothing is left on disk: each stack is synthesized in memory instead of through `app.synth()`, and the output
+    directory the app creates on construction is a temporary directory that is removed afterwards.
+
+    Expected format of 'config':
+    {
+        "name": "<stack name>",
+        "stack": {...}
+    }
+
+    Args:
+        config (dict[str, Any]): The configuration document, as read from the configuration file.
+        env (str): The environment name.
+        selection (ConstructSelection): The construct subtree to synthesize, defaults to everything.
+
+    Returns:
+        dict[str, dict[str, Any]]: The Terraform JSON of each synthesized stack, keyed by stack ID.
+    """
+    name: str = config[NAME_KEY]
+    stack_config = decode_stack_config(name=name, dict_=config[STACK_KEY])
+
+    synthesized: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as outdir:
+        app = App(outdir=outdir, skip_validation=True)
+        build_stack(app, name=name, env=env, config=stack_config, selection=selection)
+
+        for child in app.node.children:
+            if TerraformStack.is_stack(child):
+                synthesized[child.node.id] = json.loads(Testing.synth(child))  # type: ignore
+    return synthesized
+
+
+def check_capacity(scope: Construct) -> list[AccountCapacity]:
+    """
+    Check the projected load of every data lake in a scope against the scalability targets of its storage accounts.
+
+    The accounts of all data lakes, e.g. of every environment of a matrix build, are planned in one pass. Layers that
+    need more than one account are logged as warnings and layers without published targets are skipped; nothing is
+    changed and nothing is raised, so this runs before synth.
+
+    Args:
+        scope (Construct): The scope, usually the app, with the built stacks.
+
+    Returns:
+        list[AccountCapacity]: The capacity of each storage account with a projected load and published targets.
+    """
+    accounts = [
+        account
+        for construct in scope.node.find_all()
+        if isinstance(construct, DataLakeL2)
+        for account in construct.planned_accounts
+    ]
+    plan = plan_capacity(accounts)
+    log_capacity_plan(plan)
+    return plan
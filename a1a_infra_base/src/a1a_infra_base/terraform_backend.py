@@ -6,15 +6,39 @@ the backend configuration for Terraform stacks.
 
 Classes:
     BackendConfig: A class to represent the backend configuration.
+    TerraformBackendAzurermConfig: A class to represent the Azure Storage backend configuration.
+
+Functions:
+    backend_config_from_dict: Create the backend configuration of the backend type in a configuration dictionary.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from pathlib import PurePosixPath
 from typing import Any, Final, Self
 
+from cdktf import AzurermBackend, LocalBackend, TerraformBackend, TerraformStack
+
 # Constants for dictionary keys
+LOCAL_KEY: Final[str] = "local"
+AZURERM_KEY: Final[str] = "azurerm"
+
 PATH_KEY: Final[str] = "path"
 
+STORAGE_ACCOUNT_NAME_KEY: Final[str] = "storage_account_name"
+CONTAINER_NAME_KEY: Final[str] = "container_name"
+KEY_KEY: Final[str] = "key"
+RESOURCE_GROUP_NAME_KEY: Final[str] = "resource_group_name"
+SUBSCRIPTION_ID_KEY: Final[str] = "subscription_id"
+TENANT_ID_KEY: Final[str] = "tenant_id"
+USE_AZUREAD_AUTH_KEY: Final[str] = "use_azuread_auth"
+
+# Placeholder that is replaced by the environment name in per-environment backends
+ENV_PLACEHOLDER: Final[str] = "{env}"
+# Placeholder that is replaced by the stack ID, so stacks sharing a configuration each get their own state
+STACK_PLACEHOLDER: Final[str] = "{stack}"
+DEFAULT_STATE_KEY: Final[str] = f"{STACK_PLACEHOLDER}.tfstate"
+
 
 @dataclass
 class TerraformBackendConfigABC(ABC):
@@ -23,6 +47,8 @@ class TerraformBackendConfigABC(ABC):
 
     Methods:
         from_dict: Create a configuration instance by unpacking parameters from a backend configuration dictionary.
+        for_env: Create a copy of the configuration whose state is separated for the given environment.
+        create_backend: Create the backend of a stack.
     """
 
     @classmethod
@@ -38,6 +64,31 @@ class TerraformBackendConfigABC(ABC):
             backendConfigABC: A fully-initialized backend configuration instance.
         """
 
+    @abstractmethod
+    def for_env(self, env: str) -> Self:
+        """
+        Create a copy of the configuration whose state is separated for the given environment.
+
+        Args:
+            env (str): The environment name.
+
+        Returns:
+            backendConfigABC: The backend configuration for the environment.
+        """
+
+    @abstractmethod
+    def create_backend(self, stack: TerraformStack, env: str) -> TerraformBackend:
+        """
+        Create the backend of a stack, with its state separated for the environment of the stack.
+
+        Args:
+            stack (TerraformStack): The stack to create the backend in.
+            env (str): The environment name.
+
+        Returns:
+            TerraformBackend: The backend.
+        """
+
 
 @dataclass
 class TerraformBackendLocalConfig(TerraformBackendConfigABC):
@@ -63,3 +114,159 @@ class TerraformBackendLocalConfig(TerraformBackendConfigABC):
         """
         path = dict_[PATH_KEY]
         return cls(path=path)
+
+    def for_env(self, env: str) -> Self:
+        """
+        Create a copy of the configuration whose state file is separated for the given environment.
+
+        A `{env}` placeholder in the path is replaced by the environment name. Without a placeholder the state file is
+        placed in a directory named after the environment, e.g. `tfstate/dev/data_lake.tfstate`.
+
+        Args:
+            env (str): The environment name.
+
+        Returns:
+            TerraformBackendLocalConfig: The backend configuration for the environment.
+        """
+        if ENV_PLACEHOLDER in self.path:
+            return replace(self, path=self.path.replace(ENV_PLACEHOLDER, env))
+
+        path = PurePosixPath(self.path)
+        return replace(self, path=str(path.parent / env / path.name))
+
+    def create_backend(self, stack: TerraformStack, env: str) -> LocalBackend:
+        """
+        Create the local backend of a stack, with its state file separated for the environment and a `{stack}`
+        placeholder in the path replaced by the stack ID.
+
+        Args:
+            stack (TerraformStack): The stack to create the backend in.
+            env (str): The environment name.
+
+        Returns:
+            LocalBackend: The backend.
+        """
+        config = self.for_env(env)
+        return LocalBackend(stack, path=config.path.replace(STACK_PLACEHOLDER, stack.node.id))
+
+
+@dataclass
+class TerraformBackendAzurermConfig(TerraformBackendConfigABC):
+    """
+    A class to represent the Azure Storage backend configuration.
+
+    Every stack stores its state in its own blob, so each stack is locked by its own blob lease and stacks can be
+    planned and applied concurrently by different agents. The `{stack}` placeholder in the key is replaced by the
+    stack ID and the `{env}` placeholder by the environment name.
+
+    Attributes:
+        storage_account_name (str): The name of the storage account holding the state.
+        container_name (str): The name of the container holding the state.
+        key (str): The name of the state blob, defaults to `{stack}.tfstate`.
+        resource_group_name (str | None): The resource group of the storage account, needed to look up access keys.
+        subscription_id (str | None): The subscription of the storage account.
+        tenant_id (str | None): The tenant to authenticate against.
+        use_azuread_auth (bool): Whether to access the state with Entra ID instead of access keys.
+    """
+
+    storage_account_name: str
+    container_name: str
+    key: str = DEFAULT_STATE_KEY
+    resource_group_name: str | None = None
+    subscription_id: str | None = None
+    tenant_id: str | None = None
+    use_azuread_auth: bool = True
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a TerraformBackendAzurermConfig instance from a configuration dictionary.
+
+        Args:
+            dict_ (dict): A dictionary containing backend configuration.
+
+        Returns:
+            TerraformBackendAzurermConfig: A fully-initialized TerraformBackendAzurermConfig instance.
+        """
+        return cls(
+            storage_account_name=dict_[STORAGE_ACCOUNT_NAME_KEY],
+            container_name=dict_[CONTAINER_NAME_KEY],
+            key=dict_.get(KEY_KEY, DEFAULT_STATE_KEY),
+            resource_group_name=dict_.get(RESOURCE_GROUP_NAME_KEY),
+            subscription_id=dict_.get(SUBSCRIPTION_ID_KEY),
+            tenant_id=dict_.get(TENANT_ID_KEY),
+            use_azuread_auth=dict_.get(USE_AZUREAD_AUTH_KEY, True),
+        )
+
+    def for_env(self, env: str) -> Self:
+        """
+        Create a copy of the configuration whose state blob is separated for the given environment.
+
+        A `{env}` placeholder in the key is replaced by the environment name. Without a placeholder the state blob is
+        placed in a virtual directory named after the environment, e.g. `dev/{stack}.tfstate`.
+
+        Args:
+            env (str): The environment name.
+
+        Returns:
+            TerraformBackendAzurermConfig: The backend configuration for the environment.
+        """
+        if ENV_PLACEHOLDER in self.key:
+            return replace(self, key=self.key.replace(ENV_PLACEHOLDER, env))
+        return replace(self, key=str(PurePosixPath(env) / self.key))
+
+    def create_backend(self, stack: TerraformStack, env: str) -> AzurermBackend:
+        """
+        Create the Azure Storage backend of a stack, with its state blob separated for the environment and a `{stack}`
+        placeholder in the key replaced by the stack ID.
+
+        Args:
+            stack (TerraformStack): The stack to create the backend in.
+            env (str): The environment name.
+
+        Returns:
+            AzurermBackend: The backend.
+        """
+        config = self.for_env(env)
+        return AzurermBackend(
+            stack,
+            storage_account_name=config.storage_account_name,
+            container_name=config.container_name,
+            key=config.key.replace(STACK_PLACEHOLDER, stack.node.id),
+            resource_group_name=config.resource_group_name,
+            subscription_id=config.subscription_id,
+            tenant_id=config.tenant_id,
+            use_azuread_auth=config.use_azuread_auth,
+        )
+
+
+TerraformBackendConfig = TerraformBackendLocalConfig | TerraformBackendAzurermConfig
+
+
+def backend_config_from_dict(dict_: dict[str, Any]) -> TerraformBackendConfig:
+    """
+    Create the backend configuration of the backend type in a configuration dictionary.
+
+    Expected format of 'dict_', with exactly one backend type:
+    {
+        "local": {...} | "azurerm": {...}
+    }
+
+    Args:
+        dict_ (dict[str, Any]): The `terraform_backend` section of a stack configuration.
+
+    Returns:
+        TerraformBackendConfig: The backend configuration.
+
+    Raises:
+        ValueError: If the section does not configure exactly one known backend type.
+    """
+    backend_types: dict[str, type[TerraformBackendLocalConfig] | type[TerraformBackendAzurermConfig]] = {
+        LOCAL_KEY: TerraformBackendLocalConfig,
+        AZURERM_KEY: TerraformBackendAzurermConfig,
+    }
+    if len(dict_) != 1 or next(iter(dict_)) not in backend_types:
+        raise ValueError(f"Expected exactly one backend of {sorted(backend_types)}, got {sorted(dict_)}.")
+
+    backend_type, backend_dict = next(iter(dict_.items()))
+    return backend_types[backend_type].from_dict(backend_dict)
@@ -5,17 +5,39 @@ This module defines the ProviderConfig class for Terraform providers.
 
 Classes:
     ProviderConfig: A class to represent the provider configuration.
+    TerraformProviderAzurermFeaturesConfig: A class to represent the `features` block of the Azurerm provider.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Final, Self
 
+from cdktf import TerraformProvider, TerraformStack
+from cdktf_cdktf_provider_azurerm.provider import (
+    AzurermProvider,
+    AzurermProviderFeatures,
+    AzurermProviderFeaturesResourceGroup,
+    AzurermProviderFeaturesStorage,
+)
+
 # Constants for dictionary keys
 TENANT_ID: Final[str] = "tenant_id"
 SUBSCRIPTION_ID: Final[str] = "subscription_id"
 CLIENT_ID: Final[str] = "client_id"
 CLIENT_SECRET: Final[str] = "client_secret"
+RESOURCE_PROVIDER_REGISTRATIONS: Final[str] = "resource_provider_registrations"
+RESOURCE_PROVIDERS_TO_REGISTER: Final[str] = "resource_providers_to_register"
+STORAGE_USE_AZUREAD: Final[str] = "storage_use_azuread"
+DISABLE_TERRAFORM_PARTNER_ID: Final[str] = "disable_terraform_partner_id"
+FEATURES: Final[str] = "features"
+
+RESOURCE_GROUP: Final[str] = "resource_group"
+PREVENT_DELETION_IF_CONTAINS_RESOURCES: Final[str] = "prevent_deletion_if_contains_resources"
+STORAGE: Final[str] = "storage"
+DATA_PLANE_AVAILABLE: Final[str] = "data_plane_available"
+
+# Registration modes of the provider, from fastest to slowest provider startup
+RESOURCE_PROVIDER_REGISTRATION_MODES: Final[tuple[str, ...]] = ("none", "core", "legacy", "extended", "all")
 
 
 @dataclass
@@ -25,6 +47,7 @@ class TerraformProviderConfigABC(ABC):
 
     Methods:
         from_dict: Create a configuration instance by unpacking parameters from a provider configuration dictionary.
+        create_provider: Create the provider of a stack.
     """
 
     @classmethod
@@ -40,20 +63,114 @@ class TerraformProviderConfigABC(ABC):
             ProviderConfigABC: A fully-initialized provider configuration instance.
         """
 
+    @abstractmethod
+    def create_provider(self, stack: TerraformStack) -> TerraformProvider:
+        """
+        Create the provider of a stack.
+
+        Args:
+            stack (TerraformStack): The stack to create the provider in.
+
+        Returns:
+            TerraformProvider: The provider.
+        """
+
+
+@dataclass
+class TerraformProviderAzurermFeaturesConfig:
+    """
+    A class to represent the `features` block of the Azurerm provider.
+
+    Attributes:
+        prevent_deletion_if_contains_resources (bool): Whether deleting a resource group that still contains resources
+            unknown to Terraform fails.
+        storage_data_plane_available (bool): Whether the provider reads storage account properties from the data plane.
+            Disabled by default: the constructs only manage ARM properties, and skipping the data-plane reads saves
+            several calls per storage account on every refresh.
+    """
+
+    prevent_deletion_if_contains_resources: bool = True
+    storage_data_plane_available: bool = False
+
+    @classmethod
+    def from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """
+        Create a TerraformProviderAzurermFeaturesConfig instance from a configuration dictionary.
+
+        Args:
+            dict_ (dict): A dictionary containing the features configuration, keyed by features sub-block.
+
+        Returns:
+            TerraformProviderAzurermFeaturesConfig: A fully-initialized TerraformProviderAzurermFeaturesConfig.
+        """
+        return cls(
+            prevent_deletion_if_contains_resources=dict_.get(RESOURCE_GROUP, {}).get(
+                PREVENT_DELETION_IF_CONTAINS_RESOURCES, True
+            ),
+            storage_data_plane_available=dict_.get(STORAGE, {}).get(DATA_PLANE_AVAILABLE, False),
+        )
+
+    def to_features(self) -> AzurermProviderFeatures:
+        """
+        Get the `features` block as passed to AzurermProvider.
+
+        Returns:
+            AzurermProviderFeatures: The features block.
+        """
+        return AzurermProviderFeatures(
+            resource_group=[
+                AzurermProviderFeaturesResourceGroup(
+                    prevent_deletion_if_contains_resources=self.prevent_deletion_if_contains_resources
+                )
+            ],
+            storage=[AzurermProviderFeaturesStorage(data_plane_available=self.storage_data_plane_available)],
+        )
+
 
 @dataclass
 class TerraformProviderAzurermConfig(TerraformProviderConfigABC):
     """
     A class to represent the Azurerm provider configuration.
 
+    The defaults are tuned for fast plans: resource providers are assumed to be registered on the subscription
+    beforehand, storage is accessed with Entra ID instead of listing account keys through ARM, and the partner
+    telemetry ID is not sent.
+
     Attributes:
-        path (str): The path for the local provider.
+        tenant_id (str): The tenant to authenticate against.
+        subscription_id (str): The subscription to deploy to.
+        client_id (str): The client ID of the service principal.
+        client_secret (str): The client secret of the service principal.
+        resource_provider_registrations (str): The set of resource providers registered on startup, one of `none`,
+            `core`, `legacy`, `extended` or `all`.
+        resource_providers_to_register (list[str]): Additional resource providers to register on startup.
+        storage_use_azuread (bool): Whether storage data-plane calls authenticate with Entra ID.
+        disable_terraform_partner_id (bool): Whether the Terraform partner ID is left out of requests.
+        features (TerraformProviderAzurermFeaturesConfig): The `features` block.
     """
 
     tenant_id: str
     subscription_id: str
     client_id: str
     client_secret: str
+    resource_provider_registrations: str = "none"
+    resource_providers_to_register: list[str] = field(default_factory=list)
+    storage_use_azuread: bool = True
+    disable_terraform_partner_id: bool = True
+    features: TerraformProviderAzurermFeaturesConfig = field(default_factory=TerraformProviderAzurermFeaturesConfig)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the resource provider registration mode.
+
+        Raises:
+            ValueError: If the registration mode is unknown.
+        """
+        if self.resource_provider_registrations not in RESOURCE_PROVIDER_REGISTRATION_MODES:
+            raise ValueError(
+                f"resource_provider_registrations must be one of {RESOURCE_PROVIDER_REGISTRATION_MODES}, "
+                f"got '{self.resource_provider_registrations}'."
+            )
 
     @classmethod
     def from_dict(cls, dict_: dict[str, Any]) -> Self:
@@ -71,5 +188,37 @@ class TerraformProviderAzurermConfig(TerraformProviderConfigABC):
         client_id: str = dict_[CLIENT_ID]
         client_secret: str = dict_[CLIENT_SECRET]
         return cls(
-            tenant_id=tenant_id, subscription_id=subscription_id, client_id=client_id, client_secret=client_secret
+            tenant_id=tenant_id,
+            subscription_id=subscription_id,
+            client_id=client_id,
+            client_secret=client_secret,
+            resource_provider_registrations=dict_.get(RESOURCE_PROVIDER_REGISTRATIONS, "none"),
+            resource_providers_to_register=list(dict_.get(RESOURCE_PROVIDERS_TO_REGISTER, [])),
+            storage_use_azuread=dict_.get(STORAGE_USE_AZUREAD, True),
+            disable_terraform_partner_id=dict_.get(DISABLE_TERRAFORM_PARTNER_ID, True),
+            features=TerraformProviderAzurermFeaturesConfig.from_dict(dict_.get(FEATURES, {})),
+        )
+
+    def create_provider(self, stack: TerraformStack) -> AzurermProvider:
+        """
+        Create the Azurerm provider of a stack.
+
+        Args:
+            stack (TerraformStack): The stack to create the provider in.
+
+        Returns:
+            AzurermProvider: The provider.
+        """
+        return AzurermProvider(
+            stack,
+            "AzureRM",
+            features=[self.features.to_features()],
+            tenant_id=self.tenant_id,
+            subscription_id=self.subscription_id,
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            resource_provider_registrations=self.resource_provider_registrations,
+            resource_providers_to_register=self.resource_providers_to_register or None,
+            storage_use_azuread=self.storage_use_azuread,
+            disable_terraform_partner_id=self.disable_terraform_partner_id,
         )
@@ -7,4 +7,5 @@ pytest_plugins: list[str] = [
     "tests.constructs.level0.test_resource_group",
     "tests.constructs.level0.test_storage_account",
     "tests.constructs.level0.test_storage_container",
+    "tests.constructs.level1.test_storage",
 ]
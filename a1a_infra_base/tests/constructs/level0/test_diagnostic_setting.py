@@ -0,0 +1,88 @@
+"""
+Module for testing the DiagnosticSettingL0 and DiagnosticSettingL0Config classes.
+
+This module contains unit tests for the DiagnosticSettingL0 construct, which is used to send the logs and metrics of
+a resource to a Log Analytics workspace, and the DiagnosticSettingL0Config class, which is used to configure the
+DiagnosticSettingL0 construct.
+
+Tests:
+    - TestDiagnosticSettingL0Config:
+        - test__diagnostic_setting_config__from_dict: Tests the from_dict method of the DiagnosticSettingL0Config class.
+    - TestDiagnosticSettingL0:
+        - test__diagnostic_setting__creation: Tests that a DiagnosticSettingL0 construct enables the categories.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.monitor_diagnostic_setting import MonitorDiagnosticSetting
+
+from a1a_infra_base.constructs.level0.diagnostic_setting import DiagnosticSettingL0, DiagnosticSettingL0Config
+
+
+@pytest.fixture(name="diagnostic_setting_l0_config__dict")
+def fixture__diagnostic_setting_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for DiagnosticSettingL0Config.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {"log_categories": ["StorageRead", "StorageWrite"], "metric_categories": ["Transaction"]}
+
+
+class TestDiagnosticSettingL0Config:
+    """
+    Test suite for the DiagnosticSettingL0Config class.
+    """
+
+    def test__diagnostic_setting_config__from_dict(self, diagnostic_setting_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test the from_dict method of the DiagnosticSettingL0Config class.
+
+        Args:
+            diagnostic_setting_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = DiagnosticSettingL0Config.from_dict(diagnostic_setting_l0_config__dict)
+        assert config.log_categories == ["StorageRead", "StorageWrite"]
+        assert config.metric_categories == ["Transaction"]
+        assert DiagnosticSettingL0Config.from_dict({}) == DiagnosticSettingL0Config()
+
+
+class TestDiagnosticSettingL0:
+    """
+    Test suite for the DiagnosticSettingL0 construct.
+    """
+
+    def test__diagnostic_setting__creation(self, diagnostic_setting_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test that a DiagnosticSettingL0 construct sends the configured categories to the workspace.
+
+        Args:
+            diagnostic_setting_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        app = App()
+        stack = TerraformStack(app, "test-stack")
+        diagnostic_setting = DiagnosticSettingL0(
+            stack,
+            "test-diagnostic-setting",
+            _="dev",
+            config=DiagnosticSettingL0Config.from_dict(diagnostic_setting_l0_config__dict),
+            target_resource_id="/subscriptions/test/storageAccounts/sabronzedevgwc01",
+            resource_name="sabronzedevgwc01",
+            log_analytics_workspace_id="/subscriptions/test/workspaces/log-lakehouse-dev-gwc-01",
+        )
+        synthesized = Testing.synth(stack)
+        assert diagnostic_setting.full_name == "sabronzedevgwc01-diag"
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=MonitorDiagnosticSetting.TF_RESOURCE_TYPE,
+            properties={
+                "name": "sabronzedevgwc01-diag",
+                "target_resource_id": "/subscriptions/test/storageAccounts/sabronzedevgwc01",
+                "log_analytics_workspace_id": "/subscriptions/test/workspaces/log-lakehouse-dev-gwc-01",
+                "enabled_log": [{"category": "StorageRead"}, {"category": "StorageWrite"}],
+                "enabled_metric": [{"category": "Transaction"}],
+            },
+        )
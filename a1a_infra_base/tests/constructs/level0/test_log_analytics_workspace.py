@@ -0,0 +1,98 @@
+"""
+Module for testing the LogAnalyticsWorkspaceL0 and LogAnalyticsWorkspaceL0Config classes.
+
+This module contains unit tests for the LogAnalyticsWorkspaceL0 construct, which is used to create Log Analytics
+workspaces, and the LogAnalyticsWorkspaceL0Config class, which is used to configure the LogAnalyticsWorkspaceL0
+construct.
+
+Tests:
+    - TestLogAnalyticsWorkspaceL0Config:
+        - test__log_analytics_workspace_config__from_dict: Tests the from_dict method of the config class.
+    - TestLogAnalyticsWorkspaceL0:
+        - test__log_analytics_workspace__creation: Tests that a LogAnalyticsWorkspaceL0 construct creates a workspace.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.log_analytics_workspace import LogAnalyticsWorkspace
+
+from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constructs.level0.log_analytics_workspace import (
+    LogAnalyticsWorkspaceL0,
+    LogAnalyticsWorkspaceL0Config,
+)
+
+
+@pytest.fixture(name="log_analytics_workspace_l0_config__dict")
+def fixture__log_analytics_workspace_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for LogAnalyticsWorkspaceL0Config.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "name": "lakehouse",
+        "location": "germany west central",
+        "sequence_number": "01",
+        "retention_in_days": 90,
+    }
+
+
+class TestLogAnalyticsWorkspaceL0Config:
+    """
+    Test suite for the LogAnalyticsWorkspaceL0Config class.
+    """
+
+    def test__log_analytics_workspace_config__from_dict(
+        self, log_analytics_workspace_l0_config__dict: dict[str, Any]
+    ) -> None:
+        """
+        Test the from_dict method of the LogAnalyticsWorkspaceL0Config class.
+
+        Args:
+            log_analytics_workspace_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = LogAnalyticsWorkspaceL0Config.from_dict(log_analytics_workspace_l0_config__dict)
+        assert config.location == AzureLocation.GERMANY_WEST_CENTRAL
+        assert config.sku == "PerGB2018"
+        assert config.retention_in_days == 90
+        assert config.daily_quota_gb is None
+        assert config.full_name("dev") == "log-lakehouse-dev-gwc-01"
+
+
+class TestLogAnalyticsWorkspaceL0:
+    """
+    Test suite for the LogAnalyticsWorkspaceL0 construct.
+    """
+
+    def test__log_analytics_workspace__creation(self, log_analytics_workspace_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test that a LogAnalyticsWorkspaceL0 construct creates a workspace with the configured retention.
+
+        Args:
+            log_analytics_workspace_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        app = App()
+        stack = TerraformStack(app, "test-stack")
+        workspace = LogAnalyticsWorkspaceL0(
+            stack,
+            "test-workspace",
+            env="dev",
+            config=LogAnalyticsWorkspaceL0Config.from_dict(log_analytics_workspace_l0_config__dict),
+            resource_group_name="test-rg",
+        )
+        synthesized = Testing.synth(stack)
+        assert workspace.full_name == "log-lakehouse-dev-gwc-01"
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=LogAnalyticsWorkspace.TF_RESOURCE_TYPE,
+            properties={
+                "name": "log-lakehouse-dev-gwc-01",
+                "resource_group_name": "test-rg",
+                "sku": "PerGB2018",
+                "retention_in_days": 90,
+            },
+        )
@@ -0,0 +1,136 @@
+"""
+Module for testing the MetricAlertL0 and MetricAlertL0Config classes.
+
+This module contains unit tests for the MetricAlertL0 construct, which is used to create Azure Monitor metric alerts,
+and the MetricAlertL0Config class, which is used to configure the MetricAlertL0 construct.
+
+Tests:
+    - TestMetricAlertL0Config:
+        - test__metric_alert_config__from_dict: Tests the from_dict method of the MetricAlertL0Config class.
+        - test__metric_alert_config__invalid: Tests settings not accepted by Azure Monitor raise a ValueError.
+    - TestMetricAlertL0:
+        - test__metric_alert__creation: Tests that a MetricAlertL0 construct creates a filtered alert with actions.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.monitor_metric_alert import MonitorMetricAlert
+
+from a1a_infra_base.constructs.level0.metric_alert import MetricAlertL0, MetricAlertL0Config
+
+
+@pytest.fixture(name="metric_alert_l0_config__dict")
+def fixture__metric_alert_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for MetricAlertL0Config.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "name": "throttling",
+        "metric_namespace": "Microsoft.Storage/storageAccounts",
+        "metric_name": "Transactions",
+        "aggregation": "Total",
+        "operator": "GreaterThan",
+        "threshold": 10,
+        "dimensions": {"ResponseType": ["ServerBusyError", "ClientThrottlingError"]},
+    }
+
+
+class TestMetricAlertL0Config:
+    """
+    Test suite for the MetricAlertL0Config class.
+    """
+
+    def test__metric_alert_config__from_dict(self, metric_alert_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test the from_dict method of the MetricAlertL0Config class.
+
+        Args:
+            metric_alert_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = MetricAlertL0Config.from_dict(metric_alert_l0_config__dict)
+        assert config.threshold == 10
+        assert config.severity == 2
+        assert config.window_size == "PT5M"
+        assert config.frequency == "PT1M"
+
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            ({"aggregation": "P99"}, "aggregation"),
+            ({"operator": "Above"}, "operator"),
+            ({"severity": 5}, "severity"),
+            ({"window_size": "PT2M"}, "window_size"),
+            ({"frequency": "P1D"}, "frequency"),
+        ],
+    )
+    def test__metric_alert_config__invalid(
+        self, metric_alert_l0_config__dict: dict[str, Any], overrides: dict[str, Any], match: str
+    ) -> None:
+        """
+        Test settings not accepted by Azure Monitor raise a ValueError.
+
+        Args:
+            metric_alert_l0_config__dict (dict[str, Any]): The configuration dictionary.
+            overrides (dict[str, Any]): The invalid settings.
+            match (str): The expected part of the error message.
+        """
+        metric_alert_l0_config__dict.update(overrides)
+
+        with pytest.raises(ValueError, match=match):
+            MetricAlertL0Config.from_dict(metric_alert_l0_config__dict)
+
+
+class TestMetricAlertL0:
+    """
+    Test suite for the MetricAlertL0 construct.
+    """
+
+    def test__metric_alert__creation(self, metric_alert_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test that a MetricAlertL0 construct creates an alert filtered on the dimensions that notifies the action group.
+
+        Args:
+            metric_alert_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        app = App()
+        stack = TerraformStack(app, "test-stack")
+        metric_alert = MetricAlertL0(
+            stack,
+            "test-metric-alert",
+            _="dev",
+            config=MetricAlertL0Config.from_dict(metric_alert_l0_config__dict),
+            resource_id="/subscriptions/test/storageAccounts/sabronzedevgwc01",
+            resource_name="sabronzedevgwc01",
+            resource_group_name="test-rg",
+            action_group_ids=["/subscriptions/test/actionGroups/ag-oncall"],
+        )
+        synthesized = Testing.synth(stack)
+        assert metric_alert.full_name == "sabronzedevgwc01-throttling-alert"
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=MonitorMetricAlert.TF_RESOURCE_TYPE,
+            properties={
+                "name": "sabronzedevgwc01-throttling-alert",
+                "scopes": ["/subscriptions/test/storageAccounts/sabronzedevgwc01"],
+                "criteria": [
+                    {
+                        "metric_name": "Transactions",
+                        "aggregation": "Total",
+                        "threshold": 10,
+                        "dimension": [
+                            {
+                                "name": "ResponseType",
+                                "operator": "Include",
+                                "values": ["ServerBusyError", "ClientThrottlingError"],
+                            }
+                        ],
+                    }
+                ],
+                "action": [{"action_group_id": "/subscriptions/test/actionGroups/ag-oncall"}],
+            },
+        )
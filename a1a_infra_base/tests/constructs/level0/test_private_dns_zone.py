@@ -0,0 +1,95 @@
+"""
+Module for testing the PrivateDnsZoneL0 and PrivateDnsZoneL0Config classes.
+
+This module contains unit tests for the PrivateDnsZoneL0 construct, which is used to create private DNS zones linked
+to virtual networks, and the PrivateDnsZoneL0Config class, which is used to configure the PrivateDnsZoneL0 construct.
+
+Tests:
+    - TestPrivateDnsZoneL0Config:
+        - test__private_dns_zone_config__from_dict: Tests the from_dict method of the PrivateDnsZoneL0Config class.
+    - TestPrivateDnsZoneL0:
+        - test__private_dns_zone__creation: Tests that a PrivateDnsZoneL0 construct creates a zone and its links.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.private_dns_zone import PrivateDnsZone
+from cdktf_cdktf_provider_azurerm.private_dns_zone_virtual_network_link import PrivateDnsZoneVirtualNetworkLink
+
+from a1a_infra_base.constructs.level0.private_dns_zone import PrivateDnsZoneL0, PrivateDnsZoneL0Config
+
+
+@pytest.fixture(name="private_dns_zone_l0_config__dict")
+def fixture__private_dns_zone_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for PrivateDnsZoneL0Config.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "name": "privatelink.dfs.core.windows.net",
+        "virtual_network_ids": [
+            "/subscriptions/test/virtualNetworks/vnet-hub",
+            "/subscriptions/test/virtualNetworks/vnet-spoke",
+        ],
+    }
+
+
+class TestPrivateDnsZoneL0Config:
+    """
+    Test suite for the PrivateDnsZoneL0Config class.
+    """
+
+    def test__private_dns_zone_config__from_dict(self, private_dns_zone_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test the from_dict method of the PrivateDnsZoneL0Config class.
+
+        Args:
+            private_dns_zone_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = PrivateDnsZoneL0Config.from_dict(private_dns_zone_l0_config__dict)
+        assert config.name == "privatelink.dfs.core.windows.net"
+        assert len(config.virtual_network_ids) == 2
+        assert config.registration_enabled is False
+
+
+class TestPrivateDnsZoneL0:
+    """
+    Test suite for the PrivateDnsZoneL0 construct.
+    """
+
+    def test__private_dns_zone__creation(self, private_dns_zone_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test that a PrivateDnsZoneL0 construct creates a private DNS zone linked to every virtual network.
+
+        Args:
+            private_dns_zone_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        app = App()
+        stack = TerraformStack(app, "test-stack")
+        zone = PrivateDnsZoneL0(
+            stack,
+            "test-zone",
+            _="dev",
+            config=PrivateDnsZoneL0Config.from_dict(private_dns_zone_l0_config__dict),
+            resource_group_name="test-rg",
+        )
+        synthesized = Testing.synth(stack)
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=PrivateDnsZone.TF_RESOURCE_TYPE,
+            properties={"name": "privatelink.dfs.core.windows.net", "resource_group_name": "test-rg"},
+        )
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=PrivateDnsZoneVirtualNetworkLink.TF_RESOURCE_TYPE,
+            properties={
+                "name": "privatelink.dfs.core.windows.net-vnet-spoke",
+                "virtual_network_id": "/subscriptions/test/virtualNetworks/vnet-spoke",
+                "registration_enabled": False,
+            },
+        )
+        assert len(zone.virtual_network_links) == 2
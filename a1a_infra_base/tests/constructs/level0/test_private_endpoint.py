@@ -0,0 +1,97 @@
+"""
+Module for testing the PrivateEndpointL0 and PrivateEndpointL0Config classes.
+
+This module contains unit tests for the PrivateEndpointL0 construct, which is used to create private endpoints for
+sub-resources of Azure resources, and the PrivateEndpointL0Config class, which is used to configure the
+PrivateEndpointL0 construct.
+
+Tests:
+    - TestPrivateEndpointL0Config:
+        - test__private_endpoint_config__from_dict: Tests the from_dict method of the PrivateEndpointL0Config class.
+    - TestPrivateEndpointL0:
+        - test__private_endpoint__creation: Tests that a PrivateEndpointL0 construct creates a private endpoint.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.private_endpoint import PrivateEndpoint
+
+from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constructs.level0.private_endpoint import PrivateEndpointL0, PrivateEndpointL0Config
+
+
+@pytest.fixture(name="private_endpoint_l0_config__dict")
+def fixture__private_endpoint_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for PrivateEndpointL0Config.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "subresource_name": "dfs",
+        "subnet_id": "test-subnet-id",
+    }
+
+
+class TestPrivateEndpointL0Config:
+    """
+    Test suite for the PrivateEndpointL0Config class.
+    """
+
+    def test__private_endpoint_config__from_dict(self, private_endpoint_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test the from_dict method of the PrivateEndpointL0Config class.
+
+        Args:
+            private_endpoint_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = PrivateEndpointL0Config.from_dict(private_endpoint_l0_config__dict)
+        assert config.subresource_name == "dfs"
+        assert config.subnet_id == "test-subnet-id"
+
+
+class TestPrivateEndpointL0:
+    """
+    Test suite for the PrivateEndpointL0 construct.
+    """
+
+    def test__private_endpoint__creation(self, private_endpoint_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test that a PrivateEndpointL0 construct creates a private endpoint registered in the private DNS zone.
+
+        Args:
+            private_endpoint_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        app = App()
+        stack = TerraformStack(app, "test-stack")
+        PrivateEndpointL0(
+            stack,
+            "test-endpoint",
+            _="dev",
+            config=PrivateEndpointL0Config.from_dict(private_endpoint_l0_config__dict),
+            resource_id="test-id",
+            resource_name="satestdevgwc01",
+            location=AzureLocation.GERMANY_WEST_CENTRAL,
+            resource_group_name="test-rg",
+            private_dns_zone_id="test-zone-id",
+        )
+        synthesized = Testing.synth(stack)
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=PrivateEndpoint.TF_RESOURCE_TYPE,
+            properties={
+                "name": "satestdevgwc01-dfs-pep",
+                "location": "germany west central",
+                "subnet_id": "test-subnet-id",
+                "private_service_connection": {
+                    "name": "satestdevgwc01-dfs-pep",
+                    "private_connection_resource_id": "test-id",
+                    "subresource_names": ["dfs"],
+                    "is_manual_connection": False,
+                },
+                "private_dns_zone_group": {"name": "dfs", "private_dns_zone_ids": ["test-zone-id"]},
+            },
+        )
@@ -9,12 +9,21 @@ the StorageAccountL0 construct.
 Tests:
     - TestStorageAccountL0Config:
         - test__storage_account_config__from_dict: Tests the from_dict method of the StorageAccountL0Config class.
+        - test__storage_account_config__performance_profile: Tests a profile provides the kind, tier and replication.
+        - test__storage_account_config__performance_profile__invalid: Tests combinations a profile forbids raise.
+        - test__storage_account_config__nfsv3__invalid: Tests NFS 3.0 without its requirements raises.
+        - test__storage_account_config__replication_type__invalid: Tests an unknown replication type raises.
     - TestBlobPropertiesL0Config:
         - test__blob_properties__from_dict: Tests the from_dict method of the BlobProperties class.
+    - TestRoutingL0Config:
+        - test__routing__from_dict: Tests the from_dict method of the RoutingL0Config class.
+        - test__routing__invalid_choice: Tests an unknown routing choice raises.
     - TestDeleteRetentionPolicyL0Config:
         - test__delete_retention_policy__from_dict: Tests the from_dict method of the DeleteRetentionPolicy class.
     - TestStorageAccountL0:
         - test__storage_account__creation: Tests that a StorageAccountL0 construct creates a storage account
+        - test__storage_account__nfsv3: Tests NFS 3.0 and its network rules are passed to the storage account.
+        - test__storage_account__routing: Tests the routing preference is passed and its endpoints are published.
 """
 
 from typing import Any
@@ -23,10 +32,12 @@ import pytest
 from cdktf import App, TerraformStack, Testing
 from cdktf_cdktf_provider_azurerm.storage_account import StorageAccount
 
-from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constants import AzureLocation, StoragePerformanceProfile
 from a1a_infra_base.constructs.level0.storage_account import (
     BlobPropertiesL0Config,
     DeleteRetentionPolicyL0Config,
+    NetworkRulesL0Config,
+    RoutingL0Config,
     StorageAccountL0,
     StorageAccountL0Config,
 )
@@ -40,7 +51,7 @@ def fixture__blob_properties_l0_config__dict() -> dict[str, Any]:
     Returns:
         dict[str, Any]: A configuration dictionary.
     """
-    return {"delete_retention_policy_l0": {"days": 7}}
+    return {"delete_retention_policy_l0": {"days": 7}, "last_access_time_enabled": True}
 
 
 class TestBlobPropertiesL0Config:
@@ -58,6 +69,29 @@ class TestBlobPropertiesL0Config:
         blob_properties = BlobPropertiesL0Config.from_dict(blob_properties_l0_config__dict)
         assert blob_properties.delete_retention_policy_l0 is not None
         assert blob_properties.delete_retention_policy_l0.days == 7
+        assert blob_properties.last_access_time_enabled is True
+
+
+class TestRoutingL0Config:
+    """
+    Test suite for the RoutingL0Config class.
+    """
+
+    def test__routing__from_dict(self) -> None:
+        """
+        Test the from_dict method of the RoutingL0Config class.
+        """
+        config = RoutingL0Config.from_dict({"publish_microsoft_endpoints": True})
+        assert config == RoutingL0Config(
+            choice="MicrosoftRouting", publish_internet_endpoints=False, publish_microsoft_endpoints=True
+        )
+
+    def test__routing__invalid_choice(self) -> None:
+        """
+        Test an unknown routing choice raises a ValueError.
+        """
+        with pytest.raises(ValueError, match="Routing choice"):
+            RoutingL0Config.from_dict({"choice": "ShortestRouting"})
 
 
 @pytest.fixture(name="delete_retention_policy_l0_config__dict")
@@ -148,6 +182,132 @@ class TestStorageAccountL0Config:
         assert config.blob_properties_l0.delete_retention_policy_l0 is not None
         assert config.blob_properties_l0.delete_retention_policy_l0.days == 7
 
+    @pytest.mark.parametrize(
+        "profile, expected",
+        [
+            ("standard-hns", ("StorageV2", "Standard", "LRS")),
+            ("premium-hns", ("BlockBlobStorage", "Premium", "LRS")),
+            ("premium-zrs", ("BlockBlobStorage", "Premium", "ZRS")),
+        ],
+    )
+    def test__storage_account_config__performance_profile(self, profile: str, expected: tuple[str, str, str]) -> None:
+        """
+        Test a performance profile provides the kind, tier and replication, and enables the hierarchical namespace.
+
+        Args:
+            profile (str): The performance profile.
+            expected (tuple[str, str, str]): The expected kind, tier and replication type.
+        """
+        config = StorageAccountL0Config.from_dict(
+            {
+                "name": "bronze",
+                "location": "germany west central",
+                "sequence_number": "01",
+                "performance_profile": profile,
+            }
+        )
+
+        assert config.performance_profile == StoragePerformanceProfile.from_full_name(profile)
+        assert (config.account_kind, config.account_tier, config.account_replication_type) == expected
+        assert config.is_hns_enabled is True
+
+    @pytest.mark.parametrize(
+        "profile, overrides",
+        [
+            ("premium-hns", {"account_replication_type": "GRS"}),
+            ("premium-hns", {"access_tier": "Cool"}),
+            ("premium-zrs", {"account_replication_type": "LRS"}),
+            ("premium-zrs", {"account_kind": "StorageV2"}),
+            ("standard-hns", {"account_tier": "Premium"}),
+            ("standard-hns", {"is_hns_enabled": False}),
+        ],
+    )
+    def test__storage_account_config__performance_profile__invalid(
+        self, profile: str, overrides: dict[str, Any]
+    ) -> None:
+        """
+        Test combinations a performance profile does not allow raise a ValueError.
+
+        Args:
+            profile (str): The performance profile.
+            overrides (dict[str, Any]): The settings conflicting with the profile.
+        """
+        with pytest.raises(ValueError):
+            StorageAccountL0Config.from_dict(
+                {
+                    "name": "bronze",
+                    "location": "germany west central",
+                    "sequence_number": "01",
+                    "performance_profile": profile,
+                    **overrides,
+                }
+            )
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"is_hns_enabled": False},
+            {"https_traffic_only_enabled": True},
+            {"network_rules_l0": None},
+            {"network_rules_l0": {"default_action": "Allow", "virtual_network_subnet_ids": ["subnet"]}},
+            {"network_rules_l0": {"virtual_network_subnet_ids": []}},
+            {"network_rules_l0": {"virtual_network_subnet_ids": ["subnet"], "ip_rules": ["203.0.113.0/24"]}},
+        ],
+    )
+    def test__storage_account_config__nfsv3__invalid(
+        self, nfsv3_storage_account_l0_config__dict: dict[str, Any], overrides: dict[str, Any]
+    ) -> None:
+        """
+        Test NFS 3.0 without a hierarchical namespace, with secure transfer required or without deny-by-default subnet
+        rules raises a ValueError.
+
+        Args:
+            nfsv3_storage_account_l0_config__dict (dict[str, Any]): A valid NFS 3.0 configuration dictionary.
+            overrides (dict[str, Any]): The settings breaking an NFS 3.0 requirement.
+        """
+        StorageAccountL0Config.from_dict(nfsv3_storage_account_l0_config__dict)
+        config__dict = {**nfsv3_storage_account_l0_config__dict, **overrides}
+        if config__dict["network_rules_l0"] is None:
+            del config__dict["network_rules_l0"]
+
+        with pytest.raises(ValueError):
+            StorageAccountL0Config.from_dict(config__dict)
+
+    def test__storage_account_config__replication_type__invalid(
+        self, storage_account_l0_config__dict: dict[str, Any]
+    ) -> None:
+        """
+        Test an unknown replication type raises a ValueError.
+
+        Args:
+            storage_account_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_account_l0_config__dict["account_replication_type"] = "RA-GRS"
+
+        with pytest.raises(ValueError, match="account_replication_type 'RA-GRS'"):
+            StorageAccountL0Config.from_dict(storage_account_l0_config__dict)
+
+
+@pytest.fixture(name="nfsv3_storage_account_l0_config__dict")
+def fixture__nfsv3_storage_account_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for a storage account mounted over NFS 3.0.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "name": "ingest",
+        "location": "germany west central",
+        "sequence_number": "01",
+        "performance_profile": "premium-hns",
+        "public_network_access_enabled": True,
+        "nfsv3_enabled": True,
+        "https_traffic_only_enabled": False,
+        "network_rules_l0": {"virtual_network_subnet_ids": ["/subscriptions/0/resourceGroups/rg/subnets/hpc"]},
+        "tags": {"workload": "hpc-ingest"},
+    }
+
 
 @pytest.fixture(name="storage_account_l0_config__instance")
 def fixture__storage_account_l0_config__instance() -> StorageAccountL0Config:
@@ -218,3 +378,66 @@ class TestStorageAccountL0:
         )
 
         # assert Testing.to_be_valid_terraform(synthesized)
+
+    def test__storage_account__nfsv3(self, nfsv3_storage_account_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test NFS 3.0, the network rules and the tags are passed to the storage account.
+
+        Args:
+            nfsv3_storage_account_l0_config__dict (dict[str, Any]): A valid NFS 3.0 configuration dictionary.
+        """
+        config = StorageAccountL0Config.from_dict(nfsv3_storage_account_l0_config__dict)
+        assert config.network_rules_l0 == NetworkRulesL0Config(
+            default_action="Deny",
+            bypass=["AzureServices"],
+            virtual_network_subnet_ids=["/subscriptions/0/resourceGroups/rg/subnets/hpc"],
+        )
+
+        stack = TerraformStack(App(), "test-stack")
+        StorageAccountL0(stack, "test-account", env="dev", config=config, resource_group_name="test")
+
+        assert Testing.to_have_resource_with_properties(
+            received=Testing.synth(stack),
+            resource_type=StorageAccount.TF_RESOURCE_TYPE,
+            properties={
+                "account_kind": "BlockBlobStorage",
+                "is_hns_enabled": True,
+                "nfsv3_enabled": True,
+                "https_traffic_only_enabled": False,
+                "network_rules": {
+                    "default_action": "Deny",
+                    "bypass": ["AzureServices"],
+                    "virtual_network_subnet_ids": ["/subscriptions/0/resourceGroups/rg/subnets/hpc"],
+                },
+                "tags": {"workload": "hpc-ingest"},
+            },
+        )
+
+    def test__storage_account__routing(self, storage_account_l0_config__dict: dict[str, Any]) -> None:
+        """
+        Test the routing preference is passed to the storage account and its route-specific endpoints are published.
+
+        Args:
+            storage_account_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_account_l0_config__dict["routing_l0"] = {
+            "choice": "InternetRouting",
+            "publish_microsoft_endpoints": True,
+        }
+        config = StorageAccountL0Config.from_dict(storage_account_l0_config__dict)
+
+        stack = TerraformStack(App(), "test-stack")
+        storage_account = StorageAccountL0(stack, "test-account", env="dev", config=config, resource_group_name="test")
+
+        assert Testing.to_have_resource_with_properties(
+            received=Testing.synth(stack),
+            resource_type=StorageAccount.TF_RESOURCE_TYPE,
+            properties={
+                "routing": {
+                    "choice": "InternetRouting",
+                    "publish_internet_endpoints": False,
+                    "publish_microsoft_endpoints": True,
+                },
+            },
+        )
+        assert list(storage_account.endpoints) == ["dfs", "blob", "dfs_microsoft", "blob_microsoft"]
@@ -0,0 +1,162 @@
+"""
+Module for testing the StorageManagementPolicyL0 and StorageManagementPolicyL0Config classes.
+
+This module contains unit tests for the StorageManagementPolicyL0 construct, which is used to create lifecycle
+management policies for Azure storage accounts, and the configuration classes of its rules.
+
+Tests:
+    - TestManagementPolicyRuleL0Config:
+        - test__management_policy_rule__from_dict: Tests the from_dict method of the ManagementPolicyRuleL0Config class.
+        - test__management_policy_rule__invalid: Tests invalid filters and tier orders raise.
+    - TestStorageManagementPolicyL0:
+        - test__storage_management_policy__creation: Tests that a StorageManagementPolicyL0 construct creates a policy.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.storage_management_policy import StorageManagementPolicy
+
+from a1a_infra_base.constructs.level0.storage_management_policy import (
+    ManagementPolicyRuleL0Config,
+    StorageManagementPolicyL0,
+    StorageManagementPolicyL0Config,
+)
+
+
+@pytest.fixture(name="storage_management_policy_l0_config__dict")
+def fixture__storage_management_policy_l0_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for StorageManagementPolicyL0Config.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "rules": [
+            {
+                "name": "tier-raw",
+                "container_names": ["landing"],
+                "prefixes": ["sales/", "finance/"],
+                "tier_to_cool_after_days_since_last_access": 30,
+                "tier_to_cold_after_days_since_last_access": 90,
+                "tier_to_archive_after_days_since_last_access": 180,
+                "auto_tier_to_hot_from_cool_enabled": True,
+            },
+            {
+                "name": "cleanup",
+                "delete_snapshots_after_days": 30,
+                "delete_versions_after_days": 60,
+            },
+        ]
+    }
+
+
+class TestManagementPolicyRuleL0Config:
+    """
+    Test suite for the ManagementPolicyRuleL0Config class.
+    """
+
+    def test__management_policy_rule__from_dict(
+        self, storage_management_policy_l0_config__dict: dict[str, Any]
+    ) -> None:
+        """
+        Test the from_dict method of the ManagementPolicyRuleL0Config class.
+
+        Args:
+            storage_management_policy_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = StorageManagementPolicyL0Config.from_dict(storage_management_policy_l0_config__dict)
+
+        tier_rule, cleanup_rule = config.rules
+        assert tier_rule.prefix_match == ["landing/sales/", "landing/finance/"]
+        assert tier_rule.tiers_on_last_access
+        assert cleanup_rule.prefix_match == []
+        assert not cleanup_rule.tiers_on_last_access
+        assert config.tiers_on_last_access
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            {"name": "no-container", "prefixes": ["sales/"]},
+            {
+                "name": "cold-before-cool",
+                "tier_to_cool_after_days_since_last_access": 90,
+                "tier_to_cold_after_days_since_last_access": 30,
+            },
+            {
+                "name": "archive-with-cool",
+                "tier_to_cool_after_days_since_last_access": 30,
+                "tier_to_archive_after_days_since_last_access": 30,
+            },
+        ],
+    )
+    def test__management_policy_rule__invalid(self, rule: dict[str, Any]) -> None:
+        """
+        Test prefixes without containers and tiers reached before warmer tiers raise a ValueError.
+
+        Args:
+            rule (dict[str, Any]): An invalid rule configuration dictionary.
+        """
+        with pytest.raises(ValueError, match=rule["name"]):
+            ManagementPolicyRuleL0Config.from_dict(rule)
+
+
+class TestStorageManagementPolicyL0:
+    """
+    Test suite for the StorageManagementPolicyL0 construct.
+    """
+
+    def test__storage_management_policy__creation(
+        self, storage_management_policy_l0_config__dict: dict[str, Any]
+    ) -> None:
+        """
+        Test that a StorageManagementPolicyL0 construct creates a policy with tiering and cleanup rules.
+
+        Args:
+            storage_management_policy_l0_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        stack = TerraformStack(App(), "test-stack")
+        StorageManagementPolicyL0(
+            stack,
+            "test-policy",
+            _="dev",
+            config=StorageManagementPolicyL0Config.from_dict(storage_management_policy_l0_config__dict),
+            storage_account_id="test-id",
+        )
+
+        assert Testing.to_have_resource_with_properties(
+            received=Testing.synth(stack),
+            resource_type=StorageManagementPolicy.TF_RESOURCE_TYPE,
+            properties={
+                "storage_account_id": "test-id",
+                "rule": [
+                    {
+                        "name": "tier-raw",
+                        "enabled": True,
+                        "filters": {
+                            "blob_types": ["blockBlob"],
+                            "prefix_match": ["landing/sales/", "landing/finance/"],
+                        },
+                        "actions": {
+                            "base_blob": {
+                                "tier_to_cool_after_days_since_last_access_time_greater_than": 30,
+                                "tier_to_cold_after_days_since_last_access_time_greater_than": 90,
+                                "tier_to_archive_after_days_since_last_access_time_greater_than": 180,
+                                "auto_tier_to_hot_from_cool_enabled": True,
+                            }
+                        },
+                    },
+                    {
+                        "name": "cleanup",
+                        "enabled": True,
+                        "filters": {"blob_types": ["blockBlob"]},
+                        "actions": {
+                            "snapshot": {"delete_after_days_since_creation_greater_than": 30},
+                            "version": {"delete_after_days_since_creation": 60},
+                        },
+                    },
+                ],
+            },
+        )
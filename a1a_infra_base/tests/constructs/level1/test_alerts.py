@@ -0,0 +1,101 @@
+"""
+Module for testing the StorageAlertsL1 and StorageAlertsL1Config classes.
+
+Tests:
+    - TestStorageAlertsL1Config:
+        - test__storage_alerts_config__thresholds: Tests the rate targets are scaled to the window and utilization.
+        - test__storage_alerts_config__disabled: Tests an alert is left out when its target is None.
+        - test__storage_alerts_config__invalid: Tests an invalid window, utilization or aggregation raises.
+    - TestStorageAlertsL1:
+        - test__storage_alerts__creation: Tests a metric alert is created per target on the storage account.
+"""
+
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack
+
+from a1a_infra_base.constructs.level1.alerts import StorageAlertsL1, StorageAlertsL1Config
+
+
+class TestStorageAlertsL1Config:
+    """
+    Test suite for the StorageAlertsL1Config class.
+    """
+
+    def test__storage_alerts_config__thresholds(self) -> None:
+        """
+        Test the request rate and bandwidth targets are scaled to totals over the window at the utilization.
+        """
+        config = StorageAlertsL1Config.from_dict(
+            {
+                "window_size_minutes": 1,
+                "utilization": 0.5,
+                "request_rate_target_per_second": 1_000,
+                "egress_limit_gbps": 8,
+            }
+        )
+
+        alerts = {alert.name: alert for alert in config.metric_alerts}
+        assert list(alerts) == ["transactions", "ingress", "egress", "latency", "throttling"]
+        assert alerts["transactions"].threshold == 30_000
+        assert alerts["egress"].threshold == 30e9
+        assert alerts["latency"].metric_name == "SuccessE2ELatency"
+        assert alerts["throttling"].dimensions["ResponseType"]
+        assert {alert.window_size for alert in alerts.values()} == {"PT1M"}
+
+    def test__storage_alerts_config__disabled(self) -> None:
+        """
+        Test an alert is left out when its target is None.
+        """
+        config = StorageAlertsL1Config.from_dict({"ingress_limit_gbps": None, "egress_limit_gbps": None})
+
+        assert [alert.name for alert in config.metric_alerts] == ["transactions", "latency", "throttling"]
+
+    @pytest.mark.parametrize(
+        ("dict_", "match"),
+        [
+            ({"window_size_minutes": 10}, "window_size_minutes"),
+            ({"utilization": 1.5}, "utilization"),
+            ({"success_e2e_latency_aggregation": "P99"}, "success_e2e_latency_aggregation"),
+        ],
+    )
+    def test__storage_alerts_config__invalid(self, dict_: dict[str, Any], match: str) -> None:
+        """
+        Test an invalid window, utilization or latency aggregation raises a ValueError.
+
+        Args:
+            dict_ (dict[str, Any]): The invalid configuration dictionary.
+            match (str): The expected part of the error message.
+        """
+        with pytest.raises(ValueError, match=match):
+            StorageAlertsL1Config.from_dict(dict_)
+
+
+class TestStorageAlertsL1:
+    """
+    Test suite for the StorageAlertsL1 construct.
+    """
+
+    def test__storage_alerts__creation(self) -> None:
+        """
+        Test a metric alert is created per target on the storage account, notifying the action group.
+        """
+        stack = TerraformStack(App(), "test-stack")
+        alerts = StorageAlertsL1(
+            stack,
+            "test-alerts",
+            env="dev",
+            config=StorageAlertsL1Config(action_group_ids=["/subscriptions/test/actionGroups/ag-oncall"]),
+            storage_account_id="/subscriptions/test/storageAccounts/sagolddevgwc01",
+            storage_account_name="sagolddevgwc01",
+            resource_group_name="test-rg",
+        )
+
+        assert [alert.full_name for alert in alerts.metric_alerts.values()] == [
+            "sagolddevgwc01-transactions-alert",
+            "sagolddevgwc01-ingress-alert",
+            "sagolddevgwc01-egress-alert",
+            "sagolddevgwc01-latency-alert",
+            "sagolddevgwc01-throttling-alert",
+        ]
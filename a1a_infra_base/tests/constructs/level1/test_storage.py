@@ -0,0 +1,233 @@
+"""
+Module for testing the StorageL1 and StorageL1Config classes.
+
+Tests:
+    - TestStorageL1Config:
+        - test__storage_config__management_policy__invalid: Tests tiering without its requirements raises.
+        - test__storage_config__read_replica__invalid: Tests a read replica without read-access replication raises.
+        - test__storage_config__partition: Tests a partition gets its containers, rules and sequence number.
+        - test__storage_config__partitions__invalid: Tests partitioning without a numeric sequence number raises.
+    - TestStorageL1:
+        - test__storage__management_policy: Tests the lifecycle management policy is attached to the storage account.
+        - test__storage__read_replica: Tests the secondary endpoints of a read replica are published.
+        - test__storage__private_endpoints__no_zone: Tests private endpoints without a private DNS zone raise.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+from cdktf_cdktf_provider_azurerm.storage_account import StorageAccount
+from cdktf_cdktf_provider_azurerm.storage_management_policy import StorageManagementPolicy
+
+from a1a_infra_base.constructs.level1.storage import StorageL1, StorageL1Config
+
+
+@pytest.fixture(name="storage_l1_config__factory")
+def fixture__storage_l1_config__factory() -> Callable[..., dict[str, Any]]:
+    """
+    Fixture that provides a factory of configuration dictionaries for StorageL1Config, e.g. one per data lake layer.
+
+    Returns:
+        Callable[..., dict[str, Any]]: A factory taking the name of the storage account and settings to override.
+    """
+
+    def factory(name: str, **overrides: Any) -> dict[str, Any]:
+        return {
+            "name": name,
+            "location": "germany west central",
+            "sequence_number": "01",
+            "account_replication_type": "LRS",
+            "account_tier": "Standard",
+            "is_hns_enabled": True,
+            "containers": [{"name": "test"}],
+            **overrides,
+        }
+
+    return factory
+
+
+@pytest.fixture(name="storage_l1_config__dict")
+def fixture__storage_l1_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for StorageL1Config with a tiering management policy.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "name": "bronze",
+        "location": "germany west central",
+        "sequence_number": "01",
+        "account_replication_type": "LRS",
+        "account_tier": "Standard",
+        "is_hns_enabled": True,
+        "blob_properties_l0": {"last_access_time_enabled": True},
+        "containers": [{"name": "landing"}],
+        "management_policy": {
+            "rules": [
+                {
+                    "name": "tier-landing",
+                    "container_names": ["landing"],
+                    "tier_to_cool_after_days_since_last_access": 30,
+                }
+            ]
+        },
+    }
+
+
+class TestStorageL1Config:
+    """
+    Test suite for the StorageL1Config class.
+    """
+
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            ({"blob_properties_l0": {}}, "last_access_time_enabled"),
+            ({"performance_profile": "premium-hns", "account_tier": "Premium"}, "no access tiers"),
+        ],
+    )
+    def test__storage_config__management_policy__invalid(
+        self, storage_l1_config__dict: dict[str, Any], overrides: dict[str, Any], match: str
+    ) -> None:
+        """
+        Test tiering on last access raises a ValueError without last access tracking or on a Premium account.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+            overrides (dict[str, Any]): The invalid settings.
+            match (str): The expected part of the error message.
+        """
+        storage_l1_config__dict.update(overrides)
+
+        with pytest.raises(ValueError, match=match):
+            StorageL1Config.from_dict(storage_l1_config__dict)
+
+    def test__storage_config__read_replica__invalid(self, storage_l1_config__dict: dict[str, Any]) -> None:
+        """
+        Test a read replica without read-access geo-redundant replication raises a ValueError.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_l1_config__dict.update({"read_replica": True, "account_replication_type": "GRS"})
+
+        with pytest.raises(ValueError, match="read replica"):
+            StorageL1Config.from_dict(storage_l1_config__dict)
+
+    def test__storage_config__partition(self, storage_l1_config__dict: dict[str, Any]) -> None:
+        """
+        Test each partition gets the containers placed on it, the management policy rules of those containers and a
+        consecutive sequence number, while every container is placed on exactly one partition.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_l1_config__dict["partitions"] = 3
+        storage_l1_config__dict["containers"] = [{"name": f"container{index}"} for index in range(12)]
+        storage_l1_config__dict["management_policy"]["rules"][0]["container_names"] = ["container0"]
+        config = StorageL1Config.from_dict(storage_l1_config__dict)
+
+        partitions = [config.partition(index) for index in range(3)]
+
+        assert [partition.sequence_number for partition in partitions] == ["01", "02", "03"]
+        assert all(partition.partitions == 1 for partition in partitions)
+        assert sorted(container.name for partition in partitions for container in partition.containers) == sorted(
+            container.name for container in config.containers
+        )
+        index = config.container_partitions["container0"]
+        for partition in partitions:
+            rules = partition.management_policy_l0.rules if partition.management_policy_l0 is not None else []
+            assert [rule.container_names for rule in rules] == (
+                [["container0"]] if partition is partitions[index] else []
+            )
+
+    def test__storage_config__partitions__invalid(self, storage_l1_config__dict: dict[str, Any]) -> None:
+        """
+        Test partitioning raises a ValueError without a numeric sequence number to number the accounts with.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_l1_config__dict.update({"partitions": 2, "sequence_number": "a"})
+
+        with pytest.raises(ValueError, match="numeric sequence_number"):
+            StorageL1Config.from_dict(storage_l1_config__dict)
+
+
+class TestStorageL1:
+    """
+    Test suite for the StorageL1 construct.
+    """
+
+    def test__storage__management_policy(self, storage_l1_config__dict: dict[str, Any]) -> None:
+        """
+        Test the lifecycle management policy is attached to the storage account, which tracks last access time.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        stack = TerraformStack(App(), "test-stack")
+        storage = StorageL1(
+            stack,
+            "test-storage",
+            env="dev",
+            config=StorageL1Config.from_dict(storage_l1_config__dict),
+            resource_group_name="test",
+        )
+
+        synthesized = Testing.synth(stack)
+        assert storage.storage_management_policy is not None
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=StorageAccount.TF_RESOURCE_TYPE,
+            properties={"blob_properties": {"last_access_time_enabled": True}},
+        )
+        assert Testing.to_have_resource_with_properties(
+            received=synthesized,
+            resource_type=StorageManagementPolicy.TF_RESOURCE_TYPE,
+            properties={"rule": [{"name": "tier-landing", "filters": {"prefix_match": ["landing/"]}}]},
+        )
+
+    def test__storage__read_replica(self, storage_l1_config__dict: dict[str, Any]) -> None:
+        """
+        Test the secondary dfs and blob endpoints of a read replica are published by the storage account.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_l1_config__dict.update({"read_replica": True, "account_replication_type": "RAGZRS"})
+        stack = TerraformStack(App(), "test-stack")
+        storage = StorageL1(
+            stack,
+            "test-storage",
+            env="dev",
+            config=StorageL1Config.from_dict(storage_l1_config__dict),
+            resource_group_name="test",
+        )
+
+        assert list(storage.storage_account.endpoints) == ["dfs", "blob", "dfs_secondary", "blob_secondary"]
+
+    def test__storage__private_endpoints__no_zone(self, storage_l1_config__dict: dict[str, Any]) -> None:
+        """
+        Test private endpoints without a private DNS zone to register in raise a ValueError, as the storage account
+        does not create zones that other accounts in the resource group would collide with.
+
+        Args:
+            storage_l1_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        storage_l1_config__dict["private_endpoints"] = {
+            "subnet_id": "test-subnet-id",
+            "private_dns_zone_ids": {"dfs": "test-zone-id"},
+        }
+
+        with pytest.raises(ValueError, match="no private DNS zone for sub-resources blob"):
+            StorageL1(
+                TerraformStack(App(), "test-stack"),
+                "test-storage",
+                env="dev",
+                config=StorageL1Config.from_dict(storage_l1_config__dict),
+                resource_group_name="test",
+            )
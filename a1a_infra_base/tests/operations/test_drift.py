@@ -0,0 +1,139 @@
+"""
+Module for testing the offline drift detector.
+
+Tests:
+    - TestDetectDrift:
+        - test__detect_drift__in_sync: Tests a state matching the configuration reports no drift.
+        - test__detect_drift: Tests changed attributes, missing and unmanaged resources are reported.
+        - test__detect_drift__no_state: Tests all resources are missing when there is no state yet.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cdktf import App
+
+from a1a_infra_base.file import FileHandlerFactory
+from a1a_infra_base.operations.drift import detect_drift
+from a1a_infra_base.operations.manifest import SynthesizedStack, read_manifest
+from a1a_infra_base.synth import build_stack, decode_stack_config
+
+CONFIG_FILEPATH = Path(__file__).parents[2] / "values" / "test.yaml"
+
+
+@pytest.fixture(name="stack")
+def fixture__stack(tmp_path: Path) -> SynthesizedStack:
+    """
+    Fixture that synthesizes the lake house test configuration to a temporary output directory.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Returns:
+        SynthesizedStack: The synthesized lake house stack.
+    """
+    document = FileHandlerFactory.create(filepath=str(CONFIG_FILEPATH)).read()
+    app = App(outdir=str(tmp_path / "cdktf.out"), skip_validation=True)
+    build_stack(
+        app,
+        name=document["name"],
+        env="dev",
+        config=decode_stack_config(name=document["name"], dict_=document["stack"]),
+    )
+    app.synth()
+    return read_manifest(tmp_path / "cdktf.out")[0]
+
+
+def _state(stack: SynthesizedStack) -> dict[str, Any]:
+    """
+    Create a state in which every resource has exactly its configured attributes plus computed ones.
+
+    Args:
+        stack (SynthesizedStack): The synthesized stack.
+
+    Returns:
+        dict[str, Any]: The state document.
+    """
+    resources = []
+    for type_, configs in stack.read()["resource"].items():
+        for name, config in configs.items():
+            attributes = {key: value for key, value in config.items() if not key.startswith("//")}
+            attributes["id"] = f"/subscriptions/0/{name}"
+            resources.append(
+                {"mode": "managed", "type": type_, "name": name, "instances": [{"attributes": attributes}]}
+            )
+    return {"version": 4, "serial": 3, "lineage": "abc", "outputs": {}, "resources": resources}
+
+
+def _write_state(stack: SynthesizedStack, state: dict[str, Any]) -> None:
+    """
+    Write a state document to the local backend path of a stack.
+
+    Args:
+        stack (SynthesizedStack): The synthesized stack.
+        state (dict[str, Any]): The state document.
+    """
+    state_path = stack.local_state_path()
+    assert state_path is not None
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+
+class TestDetectDrift:
+    """
+    Test suite for the detect_drift function.
+    """
+
+    def test__detect_drift__in_sync(self, stack: SynthesizedStack) -> None:
+        """
+        Test a state matching the configuration reports no drift.
+
+        Args:
+            stack (SynthesizedStack): The synthesized stack.
+        """
+        _write_state(stack, _state(stack))
+
+        assert not detect_drift(stack).drifted
+
+    def test__detect_drift(self, stack: SynthesizedStack) -> None:
+        """
+        Test changed attributes, missing and unmanaged resources are reported.
+
+        Args:
+            stack (SynthesizedStack): The synthesized stack.
+        """
+        state = _state(stack)
+        accounts = [resource for resource in state["resources"] if resource["type"] == "azurerm_storage_account"]
+        accounts[0]["instances"][0]["attributes"]["account_tier"] = "Premium"
+        locks = [resource for resource in state["resources"] if resource["type"] == "azurerm_management_lock"]
+        locks[0]["instances"][0]["attributes"]["lock_level"] = "ReadOnly"
+        containers = [resource for resource in state["resources"] if resource["type"] == "azurerm_storage_container"]
+        state["resources"].remove(containers[0])
+        state["resources"].append(
+            {"mode": "managed", "type": "azurerm_storage_container", "name": "old", "instances": [{"attributes": {}}]}
+        )
+        state["resources"].append({"mode": "data", "type": "azurerm_client_config", "name": "current", "instances": []})
+        _write_state(stack, state)
+
+        report = detect_drift(stack)
+
+        assert sorted((drift.attribute, drift.desired, drift.actual) for drift in report.differences) == [
+            ("account_tier", "Standard", "Premium"),
+            ("lock_level", "CanNotDelete", "ReadOnly"),
+        ]
+        assert report.missing == [f"azurerm_storage_container.{containers[0]['name']}"]
+        assert report.unmanaged == ["azurerm_storage_container.old"]
+
+    def test__detect_drift__no_state(self, stack: SynthesizedStack) -> None:
+        """
+        Test all resources are missing when there is no state yet.
+
+        Args:
+            stack (SynthesizedStack): The synthesized stack.
+        """
+        report = detect_drift(stack)
+
+        assert len(report.missing) == sum(len(configs) for configs in stack.read()["resource"].values())
+        assert not report.differences
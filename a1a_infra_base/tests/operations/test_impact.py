@@ -0,0 +1,273 @@
+"""
+Module for testing the change-impact analysis of configuration documents.
+
+Tests:
+    - TestAnalyzeImpact:
+        - test__analyze_impact__container_added: Tests an added container targets only that container.
+        - test__analyze_impact__container_removed: Tests a removed container is targeted by its old address.
+        - test__analyze_impact__storage_changed: Tests a changed storage attribute targets the layer subtree.
+        - test__analyze_impact__provider_changed: Tests a provider change requires a full plan.
+        - test__analyze_impact__unchanged: Tests an unchanged document affects nothing.
+        - test__analyze_impact__capacity_plan_changed: Tests a changed capacity plan affects nothing.
+        - test__analyze_impact__partitioned_container_added: Tests an added container targets only its partition.
+        - test__analyze_impact__partitions_added: Tests added partitions target every partition of the layer.
+        - test__analyze_impact__private_endpoints_changed: Tests a layer endpoint change targets the shared DNS zones.
+    - TestOrchestratorTargets:
+        - test__run__targets: Tests the orchestrator passes the targets to terraform plan only.
+"""
+
+import copy
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a1a_infra_base.operations.executor import ExecutionResult, TerraformExecutorABC
+from a1a_infra_base.operations.impact import analyze_impact
+from a1a_infra_base.operations.manifest import SynthesizedStack
+from a1a_infra_base.operations.orchestrator import Orchestrator
+from a1a_infra_base.partitioning import get_partition
+
+
+@pytest.fixture(name="lake_house__dict")
+def fixture__lake_house__dict(storage_l1_config__factory: Callable[..., dict[str, Any]]) -> dict[str, Any]:
+    """
+    Fixture that provides a lake house configuration document.
+
+    Args:
+        storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+
+    Returns:
+        dict[str, Any]: A configuration document.
+    """
+    return {
+        "env": "dev",
+        "name": "lake_house",
+        "stack": {
+            "terraform_provider": {
+                "azurerm": {
+                    "tenant_id": "test-tenant-id",
+                    "subscription_id": "test-sub-id",
+                    "client_id": "test-client-id",
+                    "client_secret": "test-client-secret",
+                }
+            },
+            "terraform_backend": {"local": {"path": "tfstate/test.tfstate"}},
+            "constructs": {
+                "data_lake": {
+                    "source_storage": storage_l1_config__factory("source"),
+                    "bronze_storage": storage_l1_config__factory("bronze"),
+                    "silver_storage": storage_l1_config__factory("silver"),
+                    "gold_storage": storage_l1_config__factory("gold"),
+                }
+            },
+        },
+    }
+
+
+class TestAnalyzeImpact:
+    """
+    Test suite for the analyze_impact function.
+    """
+
+    def test__analyze_impact__container_added(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an added container targets only that container.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["gold_storage"]["containers"].append({"name": "reports"})
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert not impact.full_plan
+        assert impact.construct_paths == ["LakeHouseStack/DataLakeL2/StorageL1_Gold/StorageContainerL0_reports"]
+        assert len(impact.targets) == 1
+        assert impact.targets[0].startswith(
+            "azurerm_storage_container.DataLakeL2_StorageL1_Gold_StorageContainerL0_reports_StorageContainer_reports_"
+        )
+        assert impact.target_args() == [f"-target={impact.targets[0]}"]
+
+    def test__analyze_impact__container_removed(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a removed container is targeted by its address in the old document.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["silver_storage"]["containers"] = []
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert impact.construct_paths == ["LakeHouseStack/DataLakeL2/StorageL1_Silver/StorageContainerL0_test"]
+        assert len(impact.targets) == 1
+        assert "StorageL1_Silver_StorageContainerL0_test" in impact.targets[0]
+
+    def test__analyze_impact__storage_changed(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a changed storage attribute targets all resources of the layer subtree.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["bronze_storage"]["account_replication_type"] = "ZRS"
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert impact.construct_paths == ["LakeHouseStack/DataLakeL2/StorageL1_Bronze"]
+        assert sorted(target.split(".")[0] for target in impact.targets) == [
+            "azurerm_management_lock",
+            "azurerm_storage_account",
+            "azurerm_storage_container",
+        ]
+        assert all("StorageL1_Bronze" in target for target in impact.targets)
+
+    def test__analyze_impact__provider_changed(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a provider change requires a full plan.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["terraform_provider"]["azurerm"]["subscription_id"] = "other-sub-id"
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert impact.full_plan
+        assert impact.reasons == ["'terraform_provider.azurerm.subscription_id' is not mapped to a construct"]
+        assert impact.target_args() == []
+
+    def test__analyze_impact__unchanged(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an unchanged document affects nothing.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        impact = analyze_impact(lake_house__dict, copy.deepcopy(lake_house__dict))
+
+        assert impact.unchanged
+
+    def test__analyze_impact__capacity_plan_changed(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a changed capacity plan affects nothing, as it is only checked before synth.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["capacity_plan"] = {"layers": {"gold": {"capacity_tib": 100}}}
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert impact.unchanged
+
+    def test__analyze_impact__partitioned_container_added(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an added container of a partitioned layer targets only that container on the partition it is placed on.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        lake_house__dict["stack"]["constructs"]["data_lake"]["gold_storage"]["partitions"] = 2
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["gold_storage"]["containers"].append({"name": "reports"})
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        partition_id = "StorageL1_Gold_1" if get_partition("reports", 2) else "StorageL1_Gold"
+        assert impact.construct_paths == [f"LakeHouseStack/DataLakeL2/{partition_id}/StorageContainerL0_reports"]
+        assert len(impact.targets) == 1
+        assert f"{partition_id}_StorageContainerL0_reports" in impact.targets[0]
+
+    def test__analyze_impact__partitions_added(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test adding partitions to a layer targets every partition, as containers move to the new accounts.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["gold_storage"]["partitions"] = 3
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert impact.construct_paths == [
+            "LakeHouseStack/DataLakeL2/StorageL1_Gold",
+            "LakeHouseStack/DataLakeL2/StorageL1_Gold_1",
+            "LakeHouseStack/DataLakeL2/StorageL1_Gold_2",
+        ]
+        assert {target.split(".")[0] for target in impact.targets if "StorageL1_Gold_2" in target} == {
+            "azurerm_management_lock",
+            "azurerm_storage_account",
+        }
+
+    def test__analyze_impact__private_endpoints_changed(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a sub-resource added to the private endpoints of a layer targets the private DNS zones the layers share,
+        so the zone and its virtual network links are created with the endpoint that registers in them.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        lake_house__dict["stack"]["constructs"]["data_lake"]["gold_storage"]["private_endpoints"] = {
+            "subnet_id": "test-subnet-id",
+            "subresources": ["dfs"],
+            "virtual_network_ids": ["/subscriptions/test/virtualNetworks/vnet-databricks"],
+        }
+        new = copy.deepcopy(lake_house__dict)
+        new["stack"]["constructs"]["data_lake"]["gold_storage"]["private_endpoints"]["subresources"].append("blob")
+
+        impact = analyze_impact(lake_house__dict, new)
+
+        assert not impact.full_plan
+        assert impact.construct_paths == [
+            "LakeHouseStack/DataLakeL2/PrivateDnsZonesL1",
+            "LakeHouseStack/DataLakeL2/StorageL1_Gold",
+        ]
+        assert [target for target in impact.targets if "blob" in target.lower()]
+        assert {target.split(".")[0] for target in impact.targets} >= {
+            "azurerm_private_dns_zone",
+            "azurerm_private_dns_zone_virtual_network_link",
+            "azurerm_private_endpoint",
+        }
+
+
+class TestOrchestratorTargets:
+    """
+    Test suite for the target integration of the Orchestrator class.
+    """
+
+    def test__run__targets(self, tmp_path: Path) -> None:
+        """
+        Test the orchestrator passes the targets to terraform plan only.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        calls: list[list[str]] = []
+
+        class RecordingExecutor(TerraformExecutorABC):
+            """Executor that records the arguments of every command."""
+
+            def run(
+                self, stack: SynthesizedStack, args: list[str], on_output: Callable[[str], None] | None = None
+            ) -> ExecutionResult:
+                calls.append(args)
+                return ExecutionResult(returncode=0)
+
+        stack = SynthesizedStack(
+            name="LakeHouseStack", working_directory=tmp_path, synthesized_stack_path=tmp_path / "cdk.tf.json"
+        )
+
+        Orchestrator([stack], RecordingExecutor(), targets={"LakeHouseStack": ["azurerm_storage_container.a"]}).run()
+
+        assert [call[0] for call in calls] == ["init", "plan", "apply"]
+        assert calls[1][-1] == "-target=azurerm_storage_container.a"
+        assert not [arg for call in (calls[0], calls[2]) for arg in call if arg.startswith("-target")]
@@ -0,0 +1,95 @@
+"""
+Module for testing the incremental JSON reader.
+
+Tests:
+    - TestJsonStream:
+        - test__iter_array: Tests array elements are decoded one at a time across chunk boundaries.
+        - test__iter_object: Tests object members are decoded after skipping nested values before them.
+        - test__seek__missing: Tests a missing key path yields nothing.
+        - test__read_value__truncated: Tests a truncated document raises an error.
+"""
+
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a1a_infra_base.operations.json_stream import JsonStream, iter_array, iter_object
+
+DOCUMENT: dict[str, Any] = {
+    "version": 4,
+    "outputs": {"resources": {"value": ['{"resources": [1]}', 'a \\" [ { quoted'], "type": ["list", "string"]}},
+    "serial": 1234567890,
+    "resources": [
+        {"type": "azurerm_storage_account", "name": f"account{index}", "attributes": {"tier": "Standard", "n": index}}
+        for index in range(50)
+    ],
+    "trailing": 12.5e3,
+}
+
+
+class TestJsonStream:
+    """
+    Test suite for the JsonStream class.
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test__iter_array(self, chunk_size: int) -> None:
+        """
+        Test array elements are decoded one at a time, also when values span chunk boundaries.
+
+        Args:
+            chunk_size (int): The number of characters read at a time.
+        """
+        stream = JsonStream(io.StringIO(json.dumps(DOCUMENT, indent=2)), chunk_size=chunk_size)
+
+        assert stream.seek(("resources",))
+        assert list(stream.iter_elements()) == DOCUMENT["resources"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test__iter_object(self, chunk_size: int) -> None:
+        """
+        Test object members are decoded after skipping the nested values before them.
+
+        Args:
+            chunk_size (int): The number of characters read at a time.
+        """
+        stream = JsonStream(io.StringIO(json.dumps(DOCUMENT)), chunk_size=chunk_size)
+
+        keys = []
+        for key in stream.iter_keys():
+            keys.append(key)
+            if key == "serial":
+                assert stream.read_value() == DOCUMENT["serial"]
+            elif key == "trailing":
+                assert stream.read_value() == DOCUMENT["trailing"]
+            else:
+                stream.skip_value()
+
+        assert keys == list(DOCUMENT)
+
+    def test__seek__missing(self, tmp_path: Path) -> None:
+        """
+        Test a missing key path yields nothing.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps(DOCUMENT), encoding="utf-8")
+
+        assert not list(iter_array(path, ("missing",)))
+        assert not list(iter_object(path, ("version", "nested")))
+        assert dict(iter_object(path, ("outputs",))) == DOCUMENT["outputs"]
+
+    def test__read_value__truncated(self) -> None:
+        """
+        Test a truncated document raises an error.
+        """
+        stream = JsonStream(io.StringIO(json.dumps(DOCUMENT)[:-40]), chunk_size=16)
+
+        with pytest.raises(ValueError):
+            stream.seek(("resources",))
+            list(stream.iter_elements())
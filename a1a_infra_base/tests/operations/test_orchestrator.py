@@ -0,0 +1,224 @@
+"""
+Module for testing the orchestrator of Terraform commands over synthesized stacks.
+
+Tests:
+    - TestReadManifest:
+        - test__read_manifest: Tests the stacks, paths and dependencies are read from the manifest.
+    - TestOrchestrator:
+        - test__run__dependency_order: Tests a stack starts only after its dependencies have finished.
+        - test__run__failure_skips_dependents: Tests the dependents of a failed stack are skipped.
+        - test__run__parallelism: Tests no more stacks than the parallelism limit run at the same time.
+        - test__init__cycle: Tests a dependency cycle raises a ValueError.
+        - test__init__unknown_command: Tests an unknown command raises a ValueError.
+"""
+
+import json
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from a1a_infra_base.operations.executor import TerraformCliExecutor
+from a1a_infra_base.operations.manifest import SynthesizedStack, read_manifest
+from a1a_infra_base.operations.orchestrator import PLAN_COMMANDS, Orchestrator, StackStatus
+
+# Fake terraform: records start and end of every command in a shared log, sleeps briefly so runs overlap, and fails
+# when a file named `fail_<command>` exists in the working directory.
+FAKE_TERRAFORM = f"""#!{sys.executable}
+import os, sys, time
+from pathlib import Path
+
+command = sys.argv[1]
+log = Path(os.environ["FAKE_TERRAFORM_LOG"])
+name = Path.cwd().name
+with log.open("a") as file:
+    file.write(f"start {{name}} {{command}}\\n")
+print(f"running {{command}}")
+time.sleep(0.05)
+with log.open("a") as file:
+    file.write(f"end {{name}} {{command}}\\n")
+sys.exit(1 if Path(f"fail_{{command}}").exists() else 0)
+"""
+
+
+@pytest.fixture(name="fake_terraform")
+def fixture__fake_terraform(tmp_path: Path) -> TerraformCliExecutor:
+    """
+    Fixture that provides an executor running a fake terraform executable.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Returns:
+        TerraformCliExecutor: An executor logging to `terraform.log` in the temporary directory.
+    """
+    binary = tmp_path / "terraform"
+    binary.write_text(FAKE_TERRAFORM, encoding="utf-8")
+    binary.chmod(binary.stat().st_mode | stat.S_IEXEC)
+    return TerraformCliExecutor(binary=str(binary), env={"FAKE_TERRAFORM_LOG": str(tmp_path / "terraform.log")})
+
+
+def _stack(tmp_path: Path, name: str, dependencies: list[str] | None = None) -> SynthesizedStack:
+    """
+    Create a synthesized stack with its working directory.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+        name (str): The name of the stack.
+        dependencies (list[str] | None): The names of the stacks it depends on.
+
+    Returns:
+        SynthesizedStack: The stack.
+    """
+    working_directory = tmp_path / "stacks" / name
+    working_directory.mkdir(parents=True, exist_ok=True)
+    return SynthesizedStack(
+        name=name,
+        working_directory=working_directory,
+        synthesized_stack_path=working_directory / "cdk.tf.json",
+        dependencies=dependencies or [],
+    )
+
+
+def _events(tmp_path: Path) -> list[str]:
+    """
+    Read the events logged by the fake terraform executable.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Returns:
+        list[str]: The logged events, e.g. `start backend init`.
+    """
+    return (tmp_path / "terraform.log").read_text(encoding="utf-8").splitlines()
+
+
+class TestReadManifest:
+    """
+    Test suite for the read_manifest function.
+    """
+
+    def test__read_manifest(self, tmp_path: Path) -> None:
+        """
+        Test the stacks, paths and dependencies are read from the manifest.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        manifest = {
+            "version": "0.20.12",
+            "stacks": {
+                "LakeHouseStack": {
+                    "name": "LakeHouseStack",
+                    "workingDirectory": "stacks/LakeHouseStack",
+                    "synthesizedStackPath": "stacks/LakeHouseStack/cdk.tf.json",
+                    "dependencies": ["TerraformBackendStack"],
+                }
+            },
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+        stacks = read_manifest(tmp_path)
+
+        assert stacks == [
+            SynthesizedStack(
+                name="LakeHouseStack",
+                working_directory=tmp_path / "stacks" / "LakeHouseStack",
+                synthesized_stack_path=tmp_path / "stacks" / "LakeHouseStack" / "cdk.tf.json",
+                dependencies=["TerraformBackendStack"],
+            )
+        ]
+
+
+class TestOrchestrator:
+    """
+    Test suite for the Orchestrator class.
+    """
+
+    def test__run__dependency_order(self, tmp_path: Path, fake_terraform: TerraformCliExecutor) -> None:
+        """
+        Test a stack starts only after all commands of its dependencies have finished.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+            fake_terraform (TerraformCliExecutor): Executor running the fake terraform executable.
+        """
+        stacks = [_stack(tmp_path, "lake", ["backend"]), _stack(tmp_path, "backend")]
+
+        results = Orchestrator(stacks, fake_terraform, parallelism=2).run()
+
+        assert {name: result.status for name, result in results.items()} == {
+            "lake": StackStatus.SUCCEEDED,
+            "backend": StackStatus.SUCCEEDED,
+        }
+        assert results["lake"].output == ["running init", "running plan", "running apply"]
+        events = _events(tmp_path)
+        assert events.index("end backend apply") < events.index("start lake init")
+
+    def test__run__failure_skips_dependents(self, tmp_path: Path, fake_terraform: TerraformCliExecutor) -> None:
+        """
+        Test the dependents of a failed stack are skipped, transitively, while independent stacks still run.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+            fake_terraform (TerraformCliExecutor): Executor running the fake terraform executable.
+        """
+        stacks = [
+            _stack(tmp_path, "backend"),
+            _stack(tmp_path, "lake", ["backend"]),
+            _stack(tmp_path, "reporting", ["lake"]),
+            _stack(tmp_path, "other"),
+        ]
+        (tmp_path / "stacks" / "backend" / "fail_plan").touch()
+
+        results = Orchestrator(stacks, fake_terraform, commands=PLAN_COMMANDS).run()
+
+        assert results["backend"].status is StackStatus.FAILED
+        assert results["backend"].failed_command == "plan"
+        assert results["lake"].status is StackStatus.SKIPPED
+        assert results["reporting"].status is StackStatus.SKIPPED
+        assert results["other"].status is StackStatus.SUCCEEDED
+        assert not [event for event in _events(tmp_path) if " lake " in event or " reporting " in event]
+
+    def test__run__parallelism(self, tmp_path: Path, fake_terraform: TerraformCliExecutor) -> None:
+        """
+        Test no more stacks than the parallelism limit run at the same time.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+            fake_terraform (TerraformCliExecutor): Executor running the fake terraform executable.
+        """
+        stacks = [_stack(tmp_path, f"stack{index}") for index in range(4)]
+
+        Orchestrator(stacks, fake_terraform, commands=["init"], parallelism=2).run()
+
+        concurrent, peak = 0, 0
+        for event in _events(tmp_path):
+            concurrent += 1 if event.startswith("start") else -1
+            peak = max(peak, concurrent)
+        assert peak == 2
+
+    def test__init__cycle(self, tmp_path: Path, fake_terraform: TerraformCliExecutor) -> None:
+        """
+        Test a dependency cycle raises a ValueError.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+            fake_terraform (TerraformCliExecutor): Executor running the fake terraform executable.
+        """
+        stacks = [_stack(tmp_path, "a", ["b"]), _stack(tmp_path, "b", ["a"])]
+
+        with pytest.raises(ValueError):
+            Orchestrator(stacks, fake_terraform)
+
+    def test__init__unknown_command(self, tmp_path: Path, fake_terraform: TerraformCliExecutor) -> None:
+        """
+        Test an unknown command raises a ValueError.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+            fake_terraform (TerraformCliExecutor): Executor running the fake terraform executable.
+        """
+        with pytest.raises(ValueError):
+            Orchestrator([_stack(tmp_path, "a")], fake_terraform, commands=["destroy"])
@@ -0,0 +1,193 @@
+"""
+Module for testing the streaming plan analyzer.
+
+Tests:
+    - TestGetAction:
+        - test__get_action: Tests delete and create are combined into replace.
+    - TestAnalyzePlan:
+        - test__analyze_plan__actions: Tests changes are counted per resource type and action.
+        - test__analyze_plan__locked_changes: Tests destructive changes within a lock scope are reported.
+        - test__analyze_plan__size: Tests the size of the plan and its sections is measured.
+        - test__analyze_plan__memory: Tests memory use does not grow with the size of skipped sections.
+"""
+
+import io
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a1a_infra_base.operations.plan_analysis import analyze_plan, get_action
+
+RESOURCE_GROUP_ID = "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/rg-lakehouse-dev"
+ACCOUNT_ID = f"{RESOURCE_GROUP_ID}/providers/Microsoft.Storage/storageAccounts/sagolddev"
+
+
+def _change(type_: str, name: str, actions: list[str], before: Any = None, after: Any = None) -> dict[str, Any]:
+    """
+    Create a resource change of a plan.
+
+    Args:
+        type_ (str): The resource type.
+        name (str): The resource name.
+        actions (list[str]): The planned actions.
+        before (Any): The attributes before the change.
+        after (Any): The attributes after the change.
+
+    Returns:
+        dict[str, Any]: The resource change.
+    """
+    return {
+        "address": f"{type_}.{name}",
+        "mode": "managed",
+        "type": type_,
+        "name": name,
+        "change": {"actions": actions, "before": before, "after": after},
+    }
+
+
+def _plan(prior_state_resources: int = 0) -> dict[str, Any]:
+    """
+    Create a plan with a locked resource group, a replaced storage account and a few other changes.
+
+    Args:
+        prior_state_resources (int): The number of resources in the prior state, to inflate the plan.
+
+    Returns:
+        dict[str, Any]: The plan.
+    """
+    return {
+        "format_version": "1.2",
+        "prior_state": {
+            "values": {
+                "root_module": {
+                    "resources": [
+                        {"address": f"azurerm_storage_container.c{index}", "values": {"name": f"c{index}" * 20}}
+                        for index in range(prior_state_resources)
+                    ]
+                }
+            }
+        },
+        "resource_changes": [
+            _change("azurerm_resource_group", "rg", ["no-op"], before={"id": RESOURCE_GROUP_ID}),
+            _change(
+                "azurerm_management_lock",
+                "rg_lock",
+                ["no-op"],
+                before={"scope": RESOURCE_GROUP_ID},
+                after={"scope": RESOURCE_GROUP_ID},
+            ),
+            _change("azurerm_storage_account", "gold", ["delete", "create"], before={"id": ACCOUNT_ID}),
+            _change(
+                "azurerm_storage_container", "gold", ["delete"], before={"resource_manager_id": ACCOUNT_ID.upper()}
+            ),
+            _change("azurerm_storage_container", "silver", ["create"], after={"name": "silver"}),
+            _change("azurerm_storage_account", "silver", ["update"], before={"id": "x"}, after={"id": "x"}),
+            _change("azurerm_storage_account", "other", ["delete"], before={"id": "/subscriptions/other/rg"}),
+        ],
+        "configuration": {"root_module": {}},
+    }
+
+
+class TestGetAction:
+    """
+    Test suite for the get_action function.
+    """
+
+    @pytest.mark.parametrize(
+        ("actions", "expected"),
+        [
+            (["create"], "create"),
+            (["delete", "create"], "replace"),
+            (["create", "delete"], "replace"),
+            (["no-op"], "no-op"),
+        ],
+    )
+    def test__get_action(self, actions: list[str], expected: str) -> None:
+        """
+        Test delete and create are combined into replace in either order.
+
+        Args:
+            actions (list[str]): The planned actions.
+            expected (str): The expected action name.
+        """
+        assert get_action(actions) == expected
+
+
+class TestAnalyzePlan:
+    """
+    Test suite for the analyze_plan function.
+    """
+
+    @pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+    def test__analyze_plan__actions(self, chunk_size: int) -> None:
+        """
+        Test changes are counted per resource type and action, also when changes span chunk boundaries.
+
+        Args:
+            chunk_size (int): The number of characters read at a time.
+        """
+        analysis = analyze_plan(io.StringIO(json.dumps(_plan(), indent=2)), chunk_size=chunk_size)
+
+        assert analysis.actions == {
+            "azurerm_management_lock": {"no-op": 1},
+            "azurerm_resource_group": {"no-op": 1},
+            "azurerm_storage_account": {"replace": 1, "update": 1, "delete": 1},
+            "azurerm_storage_container": {"delete": 1, "create": 1},
+        }
+
+    def test__analyze_plan__locked_changes(self) -> None:
+        """
+        Test destructive changes within the scope of a lock are reported, matching IDs case-insensitively.
+        """
+        analysis = analyze_plan(io.StringIO(json.dumps(_plan())))
+
+        assert [(change.address, change.action, change.lock_address) for change in analysis.locked_changes] == [
+            ("azurerm_storage_account.gold", "replace", "azurerm_management_lock.rg_lock"),
+            ("azurerm_storage_container.gold", "delete", "azurerm_management_lock.rg_lock"),
+        ]
+
+    def test__analyze_plan__size(self) -> None:
+        """
+        Test the size of the plan, its sections and its largest resource change is measured.
+        """
+        text = json.dumps(_plan(prior_state_resources=10), separators=(",", ":"))
+
+        analysis = analyze_plan(io.StringIO(text))
+
+        assert analysis.size.total_bytes == len(text)
+        assert analysis.size.resource_changes == 7
+        assert set(analysis.size.section_bytes) == {
+            "format_version",
+            "prior_state",
+            "resource_changes",
+            "configuration",
+        }
+        assert analysis.size.section_bytes["prior_state"] == len(
+            json.dumps(_plan(10)["prior_state"], separators=(",", ":"))
+        )
+        assert analysis.size.largest_change_address == "azurerm_management_lock.rg_lock"
+
+    def test__analyze_plan__memory(self, tmp_path: Path) -> None:
+        """
+        Test the peak memory of the analysis stays far below the size of a multi-megabyte plan.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        plan_path = tmp_path / "plan.json"
+        plan_path.write_text(json.dumps(_plan(prior_state_resources=30000)), encoding="utf-8")
+        assert plan_path.stat().st_size > 4_000_000
+
+        tracemalloc.start()
+        try:
+            with plan_path.open(encoding="utf-8") as file:
+                analysis = analyze_plan(file)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert analysis.size.total_bytes == plan_path.stat().st_size
+        assert peak < 1_000_000
@@ -0,0 +1,224 @@
+"""
+Module for testing the cache of saved Terraform plans.
+
+Tests:
+    - TestReadStateHead:
+        - test__read_state_head: Tests the serial and lineage are read from the head of the state.
+        - test__read_state_head__missing: Tests a missing state file returns None.
+    - TestPlanCache:
+        - test__key__changes_with_inputs: Tests the key changes with the synthesized JSON, lock file and state serial.
+        - test__key__remote_backend: Tests stacks without a local backend are not cached.
+        - test__get__hit: Tests a stored plan is returned with its summary.
+        - test__get__expired: Tests an entry older than the TTL is a miss.
+    - TestOrchestratorPlanCache:
+        - test__run__plan_cache: Tests an unchanged stack is planned once and restored from the cache afterwards.
+"""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a1a_infra_base.operations.executor import ExecutionResult, TerraformExecutorABC
+from a1a_infra_base.operations.manifest import SynthesizedStack
+from a1a_infra_base.operations.orchestrator import PLAN_COMMANDS, Orchestrator, StackStatus
+from a1a_infra_base.operations.plan_cache import PLAN_FILENAME, PlanCache, read_state_head
+
+PLAN_JSON: dict[str, Any] = {
+    "format_version": "1.2",
+    "resource_changes": [
+        {"address": "azurerm_storage_container.test", "change": {"actions": ["create"], "after": {"name": "test"}}}
+    ],
+}
+
+
+class PlanningExecutor(TerraformExecutorABC):
+    """
+    Executor that writes a plan file on `plan` and prints `PLAN_JSON` on `show`, recording the commands it ran.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+
+    def run(
+        self, stack: SynthesizedStack, args: list[str], on_output: Callable[[str], None] | None = None
+    ) -> ExecutionResult:
+        self.commands.append(args[0])
+        if args[0] == "plan":
+            (stack.working_directory / PLAN_FILENAME).write_bytes(b"saved plan")
+        if args[0] == "show":
+            return ExecutionResult(returncode=0, output=[json.dumps(PLAN_JSON)])
+        return ExecutionResult(returncode=0)
+
+
+@pytest.fixture(name="stack")
+def fixture__stack(tmp_path: Path) -> SynthesizedStack:
+    """
+    Fixture that provides a synthesized stack with a local backend, a lock file and a state file.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Returns:
+        SynthesizedStack: The stack.
+    """
+    working_directory = tmp_path / "stacks" / "LakeHouseStack"
+    working_directory.mkdir(parents=True)
+    synthesized_stack_path = working_directory / "cdk.tf.json"
+    synthesized = {"terraform": {"backend": {"local": {"path": "terraform.tfstate"}}}, "resource": {}}
+    synthesized_stack_path.write_text(json.dumps(synthesized), encoding="utf-8")
+    (working_directory / ".terraform.lock.hcl").write_text('provider "azurerm" {}', encoding="utf-8")
+    _write_state(working_directory, serial=1)
+    return SynthesizedStack(
+        name="LakeHouseStack", working_directory=working_directory, synthesized_stack_path=synthesized_stack_path
+    )
+
+
+def _write_state(working_directory: Path, serial: int) -> None:
+    """
+    Write a local state file with the given serial.
+
+    Args:
+        working_directory (Path): The working directory of the stack.
+        serial (int): The state serial.
+    """
+    state = {"version": 4, "terraform_version": "1.9.0", "serial": serial, "lineage": "abc", "resources": []}
+    (working_directory / "terraform.tfstate").write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+
+class TestReadStateHead:
+    """
+    Test suite for the read_state_head function.
+    """
+
+    def test__read_state_head(self, stack: SynthesizedStack) -> None:
+        """
+        Test the serial and lineage are read from the head of the state.
+
+        Args:
+            stack (SynthesizedStack): The stack.
+        """
+        assert read_state_head(stack.working_directory / "terraform.tfstate") == (1, "abc")
+
+    def test__read_state_head__missing(self, tmp_path: Path) -> None:
+        """
+        Test a missing state file returns None.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        assert read_state_head(tmp_path / "terraform.tfstate") is None
+
+
+class TestPlanCache:
+    """
+    Test suite for the PlanCache class.
+    """
+
+    def test__key__changes_with_inputs(self, stack: SynthesizedStack, tmp_path: Path) -> None:
+        """
+        Test the key changes with the synthesized JSON, the lock file and the state serial.
+
+        Args:
+            stack (SynthesizedStack): The stack.
+            tmp_path (Path): Temporary directory.
+        """
+        cache = PlanCache(directory=tmp_path / "cache")
+        keys = [cache.key(stack)]
+
+        _write_state(stack.working_directory, serial=2)
+        keys.append(cache.key(stack))
+        (stack.working_directory / ".terraform.lock.hcl").write_text('provider "azurerm" {version = "4"}')
+        keys.append(cache.key(stack))
+        stack.synthesized_stack_path.write_text(
+            json.dumps({"terraform": {"backend": {"local": {"path": "terraform.tfstate"}}}, "resource": {"a": {}}})
+        )
+        keys.append(cache.key(stack))
+
+        assert None not in keys
+        assert len(set(keys)) == 4
+
+    def test__key__remote_backend(self, stack: SynthesizedStack, tmp_path: Path) -> None:
+        """
+        Test stacks without a local backend are not cached.
+
+        Args:
+            stack (SynthesizedStack): The stack.
+            tmp_path (Path): Temporary directory.
+        """
+        stack.synthesized_stack_path.write_text(json.dumps({"terraform": {"backend": {"azurerm": {}}}}))
+
+        assert PlanCache(directory=tmp_path / "cache").key(stack) is None
+
+    def test__get__hit(self, stack: SynthesizedStack, tmp_path: Path) -> None:
+        """
+        Test a stored plan is returned with its summary.
+
+        Args:
+            stack (SynthesizedStack): The stack.
+            tmp_path (Path): Temporary directory.
+        """
+        cache = PlanCache(directory=tmp_path / "cache")
+        plan_path = stack.working_directory / PLAN_FILENAME
+        plan_path.write_bytes(b"saved plan")
+
+        cache.put("key", plan_path, {"resource_changes": []})
+        entry = cache.get("key")
+
+        assert entry is not None
+        assert entry.plan_path.read_bytes() == b"saved plan"
+        assert entry.summary == {"resource_changes": []}
+
+    def test__get__expired(self, stack: SynthesizedStack, tmp_path: Path) -> None:
+        """
+        Test an entry older than the TTL is a miss.
+
+        Args:
+            stack (SynthesizedStack): The stack.
+            tmp_path (Path): Temporary directory.
+        """
+        now = [1000.0]
+        cache = PlanCache(directory=tmp_path / "cache", ttl=60, clock=lambda: now[0])
+        plan_path = stack.working_directory / PLAN_FILENAME
+        plan_path.write_bytes(b"saved plan")
+        cache.put("key", plan_path, {})
+
+        now[0] += 59
+        assert cache.get("key") is not None
+        now[0] += 2
+        assert cache.get("key") is None
+
+
+class TestOrchestratorPlanCache:
+    """
+    Test suite for the plan cache integration of the Orchestrator class.
+    """
+
+    def test__run__plan_cache(self, stack: SynthesizedStack, tmp_path: Path) -> None:
+        """
+        Test an unchanged stack is planned once and restored from the cache afterwards, until its state changes.
+
+        Args:
+            stack (SynthesizedStack): The stack.
+            tmp_path (Path): Temporary directory.
+        """
+        cache = PlanCache(directory=tmp_path / "cache")
+        executor = PlanningExecutor()
+
+        first = Orchestrator([stack], executor, commands=PLAN_COMMANDS, plan_cache=cache).run()
+        (stack.working_directory / PLAN_FILENAME).unlink()
+        second = Orchestrator([stack], executor, commands=PLAN_COMMANDS, plan_cache=cache).run()
+        _write_state(stack.working_directory, serial=2)
+        Orchestrator([stack], executor, commands=PLAN_COMMANDS, plan_cache=cache).run()
+
+        assert first["LakeHouseStack"].status is StackStatus.SUCCEEDED
+        assert second["LakeHouseStack"].status is StackStatus.SUCCEEDED
+        assert executor.commands == ["init", "plan", "show", "init", "init", "plan", "show"]
+        assert (stack.working_directory / PLAN_FILENAME).read_bytes() == b"saved plan"
+        entry = cache.get(cache.key(stack) or "")
+        assert entry is not None
+        assert entry.summary == {
+            "resource_changes": [{"address": "azurerm_storage_container.test", "actions": ["create"]}]
+        }
@@ -0,0 +1,273 @@
+"""
+Module for testing the provider mirror and plugin cache generation.
+
+Tests:
+    - TestProviderRequirement:
+        - test__from_source: Tests provider sources are expanded to fully qualified addresses.
+    - TestGetProviderRequirements:
+        - test__get_provider_requirements: Tests requirements are collected once across stacks.
+    - TestBuildMirror:
+        - test__build_mirror: Tests staged packages are copied into the packed mirror layout once.
+        - test__build_mirror__missing_package: Tests a package that is not staged raises an error.
+    - TestMirrorWithTerraform:
+        - test__mirror_with_terraform: Tests terraform providers mirror runs once per distinct set of providers.
+    - TestWriteCliConfig:
+        - test__write_cli_config: Tests the CLI configuration points at the mirror and the plugin cache.
+        - test__terraform_init__offline: Tests terraform init installs a fake provider from the mirror.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from a1a_infra_base.operations.executor import ExecutionResult, TerraformExecutorABC
+from a1a_infra_base.operations.manifest import SynthesizedStack
+from a1a_infra_base.operations.provider_mirror import (
+    ProviderRequirement,
+    build_mirror,
+    get_provider_requirements,
+    mirror_with_terraform,
+    write_cli_config,
+)
+
+AZURERM = ProviderRequirement(address="registry.terraform.io/hashicorp/azurerm", version="4.31.0")
+RANDOM = ProviderRequirement(address="registry.terraform.io/hashicorp/random", version="3.6.3")
+
+
+class RecordingExecutor(TerraformExecutorABC):
+    """
+    Executor that records the stacks and arguments it ran.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[str]]] = []
+
+    def run(
+        self, stack: SynthesizedStack, args: list[str], on_output: Callable[[str], None] | None = None
+    ) -> ExecutionResult:
+        self.calls.append((stack.name, args))
+        return ExecutionResult(returncode=0)
+
+
+def _stack(tmp_path: Path, name: str, required_providers: dict[str, dict[str, str]]) -> SynthesizedStack:
+    """
+    Create a synthesized stack with the given required providers.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+        name (str): The stack name.
+        required_providers (dict[str, dict[str, str]]): The `required_providers` of the stack.
+
+    Returns:
+        SynthesizedStack: The stack.
+    """
+    working_directory = tmp_path / "cdktf.out" / "stacks" / name
+    working_directory.mkdir(parents=True)
+    synthesized_stack_path = working_directory / "cdk.tf.json"
+    synthesized = {"terraform": {"required_providers": required_providers}}
+    synthesized_stack_path.write_text(json.dumps(synthesized), encoding="utf-8")
+    return SynthesizedStack(
+        name=name, working_directory=working_directory, synthesized_stack_path=synthesized_stack_path
+    )
+
+
+@pytest.fixture(name="stacks")
+def fixture__stacks(tmp_path: Path) -> list[SynthesizedStack]:
+    """
+    Fixture that provides three stacks requiring azurerm, the last of which also requires random.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Returns:
+        list[SynthesizedStack]: The stacks.
+    """
+    azurerm = {"azurerm": {"source": "azurerm", "version": "4.31.0"}}
+    return [
+        _stack(tmp_path, "LakeHouseStack_dev", azurerm),
+        _stack(tmp_path, "LakeHouseStack_prd", azurerm),
+        _stack(
+            tmp_path, "TerraformBackendStack", {**azurerm, "random": {"source": "hashicorp/random", "version": "3.6.3"}}
+        ),
+    ]
+
+
+def _stage_package(packages_dir: Path, requirement: ProviderRequirement, platform_: str) -> Path:
+    """
+    Stage a fake provider package containing a placeholder executable.
+
+    Args:
+        packages_dir (Path): The directory to stage the package in.
+        requirement (ProviderRequirement): The provider.
+        platform_ (str): The platform of the package.
+
+    Returns:
+        Path: The staged package.
+    """
+    packages_dir.mkdir(parents=True, exist_ok=True)
+    package = packages_dir / requirement.package_name(platform_)
+    with zipfile.ZipFile(package, "w") as archive:
+        archive.writestr(f"terraform-provider-{requirement.type_}_v{requirement.version}", "#!/bin/sh\nexit 1\n")
+    return package
+
+
+class TestProviderRequirement:
+    """
+    Test suite for the ProviderRequirement class.
+    """
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("azurerm", "registry.terraform.io/hashicorp/azurerm"),
+            ("databricks/databricks", "registry.terraform.io/databricks/databricks"),
+            ("example.com/Team/Custom", "example.com/team/custom"),
+        ],
+    )
+    def test__from_source(self, source: str, expected: str) -> None:
+        """
+        Test provider sources are expanded to fully qualified, lower-cased addresses.
+
+        Args:
+            source (str): The provider source.
+            expected (str): The expected address.
+        """
+        assert ProviderRequirement.from_source(source, "1.0.0").address == expected
+
+
+class TestGetProviderRequirements:
+    """
+    Test suite for the get_provider_requirements function.
+    """
+
+    def test__get_provider_requirements(self, stacks: list[SynthesizedStack]) -> None:
+        """
+        Test requirements are collected once across stacks.
+
+        Args:
+            stacks (list[SynthesizedStack]): The stacks.
+        """
+        assert get_provider_requirements(stacks) == [AZURERM, RANDOM]
+
+
+class TestBuildMirror:
+    """
+    Test suite for the build_mirror function.
+    """
+
+    def test__build_mirror(self, tmp_path: Path) -> None:
+        """
+        Test staged packages are copied into the packed mirror layout, and not copied again when unchanged.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        for platform_ in ("linux_amd64", "darwin_arm64"):
+            _stage_package(tmp_path / "packages", AZURERM, platform_)
+
+        mirrored = build_mirror([AZURERM], tmp_path / "mirror", tmp_path / "packages", ["linux_amd64", "darwin_arm64"])
+
+        assert mirrored == [
+            tmp_path
+            / "mirror/registry.terraform.io/hashicorp/azurerm/terraform-provider-azurerm_4.31.0_linux_amd64.zip",
+            tmp_path
+            / "mirror/registry.terraform.io/hashicorp/azurerm/terraform-provider-azurerm_4.31.0_darwin_arm64.zip",
+        ]
+        modified = mirrored[0].stat().st_mtime_ns
+        assert build_mirror([AZURERM], tmp_path / "mirror", tmp_path / "packages", ["linux_amd64"]) == mirrored[:1]
+        assert mirrored[0].stat().st_mtime_ns == modified
+
+    def test__build_mirror__missing_package(self, tmp_path: Path) -> None:
+        """
+        Test a package that is not staged raises a FileNotFoundError.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        _stage_package(tmp_path / "packages", AZURERM, "linux_amd64")
+
+        with pytest.raises(FileNotFoundError):
+            build_mirror([AZURERM, RANDOM], tmp_path / "mirror", tmp_path / "packages", ["linux_amd64"])
+
+
+class TestMirrorWithTerraform:
+    """
+    Test suite for the mirror_with_terraform function.
+    """
+
+    def test__mirror_with_terraform(self, stacks: list[SynthesizedStack], tmp_path: Path) -> None:
+        """
+        Test terraform providers mirror runs once per distinct set of required providers.
+
+        Args:
+            stacks (list[SynthesizedStack]): The stacks.
+            tmp_path (Path): Temporary directory.
+        """
+        executor = RecordingExecutor()
+
+        assert mirror_with_terraform(stacks, tmp_path / "mirror", executor, ["linux_amd64", "windows_amd64"])
+
+        mirror_args = ["-platform=linux_amd64", "-platform=windows_amd64", str((tmp_path / "mirror").resolve())]
+        assert executor.calls == [
+            ("LakeHouseStack_dev", ["providers", "mirror", *mirror_args]),
+            ("TerraformBackendStack", ["providers", "mirror", *mirror_args]),
+        ]
+
+
+class TestWriteCliConfig:
+    """
+    Test suite for the write_cli_config function.
+    """
+
+    def test__write_cli_config(self, tmp_path: Path) -> None:
+        """
+        Test the CLI configuration points at the mirror and the plugin cache, and excludes the mirrored providers from
+        direct installation.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        path = write_cli_config(tmp_path / "terraformrc", tmp_path / "mirror", tmp_path / "cache", [AZURERM, RANDOM])
+
+        text = path.read_text(encoding="utf-8")
+        assert f'plugin_cache_dir = "{(tmp_path / "cache").resolve()}"' in text
+        assert f'path    = "{(tmp_path / "mirror").resolve()}"' in text
+        addresses = '["registry.terraform.io/hashicorp/azurerm", "registry.terraform.io/hashicorp/random"]'
+        assert f"include = {addresses}" in text
+        assert f"exclude = {addresses}" in text
+        assert (tmp_path / "cache").is_dir()
+
+    @pytest.mark.skipif(shutil.which("terraform") is None, reason="terraform is not installed.")
+    def test__terraform_init__offline(self, stacks: list[SynthesizedStack], tmp_path: Path) -> None:
+        """
+        Test terraform init installs a locally staged fake provider from the mirror, without the registry.
+
+        Args:
+            stacks (list[SynthesizedStack]): The stacks.
+            tmp_path (Path): Temporary directory.
+        """
+        requirements = get_provider_requirements(stacks[:1])
+        version = subprocess.run(["terraform", "version", "-json"], check=True, capture_output=True, text=True)
+        platform_ = json.loads(version.stdout)["platform"]
+        _stage_package(tmp_path / "packages", AZURERM, platform_)
+        build_mirror(requirements, tmp_path / "mirror", tmp_path / "packages", [platform_])
+        cli_config = write_cli_config(tmp_path / "terraformrc", tmp_path / "mirror", tmp_path / "cache", requirements)
+
+        for stack in stacks[:2]:
+            result = subprocess.run(
+                ["terraform", "init", "-input=false", "-backend=false"],
+                cwd=stack.working_directory,
+                env={**os.environ, "TF_CLI_CONFIG_FILE": str(cli_config), "TF_IN_AUTOMATION": "1"},
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            assert result.returncode == 0, result.stdout + result.stderr
+
+        assert list((tmp_path / "cache").rglob(f"terraform-provider-azurerm_v{AZURERM.version}"))
@@ -0,0 +1,169 @@
+"""
+Module for testing the SQLite index over local state files.
+
+Tests:
+    - TestStateIndex:
+        - test__find__by_attribute: Tests instances are found by type and attribute value.
+        - test__find__nested_attribute: Tests nested attributes are matched by dotted key.
+        - test__ingest__incremental: Tests a state file is only re-ingested when its serial changes.
+        - test__query__read_only: Tests raw queries cannot modify the index.
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a1a_infra_base.operations.state_index import StateIndex
+
+
+def _account(name: str, is_hns_enabled: bool) -> dict[str, Any]:
+    """
+    Create a storage account resource of a state file.
+
+    Args:
+        name (str): The name of the storage account.
+        is_hns_enabled (bool): Whether HNS is enabled.
+
+    Returns:
+        dict[str, Any]: The state resource.
+    """
+    return {
+        "mode": "managed",
+        "type": "azurerm_storage_account",
+        "name": name,
+        "provider": 'provider["registry.terraform.io/hashicorp/azurerm"]',
+        "instances": [
+            {
+                "attributes": {
+                    "name": name,
+                    "is_hns_enabled": is_hns_enabled,
+                    "network_rules": [{"default_action": "Deny", "bypass": ["AzureServices"]}],
+                }
+            }
+        ],
+    }
+
+
+def _container(name: str, account: str) -> dict[str, Any]:
+    """
+    Create a storage container resource of a state file.
+
+    Args:
+        name (str): The name of the container.
+        account (str): The name of the storage account it belongs to.
+
+    Returns:
+        dict[str, Any]: The state resource.
+    """
+    return {
+        "mode": "managed",
+        "type": "azurerm_storage_container",
+        "name": name,
+        "instances": [{"attributes": {"name": name, "storage_account_name": account}}],
+    }
+
+
+def _write_state(path: Path, serial: int, resources: list[dict[str, Any]]) -> Path:
+    """
+    Write a state file.
+
+    Args:
+        path (Path): The path of the state file.
+        serial (int): The state serial.
+        resources (list[dict[str, Any]]): The state resources.
+
+    Returns:
+        Path: The path of the state file.
+    """
+    state = {"version": 4, "serial": serial, "lineage": "abc", "outputs": {}, "resources": resources}
+    path.write_text(json.dumps(state), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(name="index")
+def fixture__index(tmp_path: Path) -> Iterator[StateIndex]:
+    """
+    Fixture that provides an index with two state files ingested.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+
+    Yields:
+        StateIndex: The index.
+    """
+    index = StateIndex(database=tmp_path / "tfstate.db")
+    index.ingest(
+        [
+            _write_state(tmp_path / "dev.tfstate", 1, [_account("sagolddev", True), _container("gold", "sagolddev")]),
+            _write_state(tmp_path / "prd.tfstate", 1, [_account("sagoldprd", False), _container("gold", "sagoldprd")]),
+        ]
+    )
+    yield index
+    index.close()
+
+
+class TestStateIndex:
+    """
+    Test suite for the StateIndex class.
+    """
+
+    def test__find__by_attribute(self, index: StateIndex) -> None:
+        """
+        Test instances are found by type and attribute value.
+
+        Args:
+            index (StateIndex): The index.
+        """
+        instances = index.find(type_="azurerm_storage_account", where={"is_hns_enabled": False})
+
+        assert [instance.address for instance in instances] == ["azurerm_storage_account.sagoldprd"]
+        assert instances[0].file_path.endswith("prd.tfstate")
+
+        containers = index.find(type_="azurerm_storage_container", where={"storage_account_name": "sagolddev"})
+        assert [instance.attributes["name"] for instance in containers] == ["gold"]
+
+    def test__find__nested_attribute(self, index: StateIndex) -> None:
+        """
+        Test nested attributes are matched by dotted key.
+
+        Args:
+            index (StateIndex): The index.
+        """
+        instances = index.find(where={"network_rules.0.bypass.0": "AzureServices"})
+
+        assert len(instances) == 2
+
+    def test__ingest__incremental(self, index: StateIndex, tmp_path: Path) -> None:
+        """
+        Test a state file is only re-ingested when its serial changes, replacing its previous rows.
+
+        Args:
+            index (StateIndex): The index.
+            tmp_path (Path): Temporary directory.
+        """
+        assert not index.ingest([tmp_path / "dev.tfstate", tmp_path / "prd.tfstate"])
+
+        _write_state(tmp_path / "dev.tfstate", 2, [_account("sagolddev", False)])
+        assert index.ingest([tmp_path / "dev.tfstate", tmp_path / "prd.tfstate"]) == [tmp_path / "dev.tfstate"]
+
+        assert len(index.find(type_="azurerm_storage_account", where={"is_hns_enabled": False})) == 2
+        assert len(index.find(type_="azurerm_storage_container")) == 1
+        assert index.query("SELECT COUNT(*) FROM attributes WHERE instance_id NOT IN (SELECT id FROM instances)") == [
+            (0,)
+        ]
+
+    def test__query__read_only(self, index: StateIndex) -> None:
+        """
+        Test raw queries cannot modify the index.
+
+        Args:
+            index (StateIndex): The index.
+        """
+        with pytest.raises(sqlite3.OperationalError):
+            index.query("DELETE FROM resources")
+
+        assert index.query("SELECT COUNT(*) FROM resources") == [(4,)]
@@ -0,0 +1,217 @@
+"""
+Module for testing the ARM-throttling-aware orchestrator.
+
+Tests:
+    - TestAimdLimit:
+        - test__on_success: Tests the limit increases additively up to the maximum.
+        - test__on_throttle: Tests the limit decreases multiplicatively down to the minimum.
+    - TestEstimateWrites:
+        - test__estimate_writes: Tests the writes are counted from resources and capped at Terraform parallelism.
+    - TestThrottleAwareOrchestrator:
+        - test__run__groups_by_subscription: Tests the write limit applies per subscription.
+        - test__run__backs_off_on_throttling: Tests concurrency drops after the executor reports 429 responses.
+        - test__run__targets: Tests the targets are passed to terraform plan.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a1a_infra_base.operations.executor import ExecutionResult, TerraformExecutorABC
+from a1a_infra_base.operations.manifest import SynthesizedStack
+from a1a_infra_base.operations.orchestrator import StackStatus
+from a1a_infra_base.operations.throttling import (
+    TERRAFORM_PARALLELISM,
+    AimdLimit,
+    ThrottleAwareOrchestrator,
+    estimate_writes,
+    get_subscription_id,
+)
+
+
+class SimulatedArmExecutor(TerraformExecutorABC):
+    """
+    Executor that simulates ARM: it reports a 429 when more stacks than the capacity run in one subscription.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.running: dict[str, int] = defaultdict(int)
+        self.peaks: dict[str, int] = defaultdict(int)
+        self.starts: list[tuple[str, int]] = []
+        self.calls: list[list[str]] = []
+        self.throttles = 0
+
+    def run(
+        self, stack: SynthesizedStack, args: list[str], on_output: Callable[[str], None] | None = None
+    ) -> ExecutionResult:
+        subscription = get_subscription_id(stack.read())
+        with self.lock:
+            self.running[subscription] += 1
+            running = self.running[subscription]
+            self.peaks[subscription] = max(self.peaks[subscription], running)
+            self.starts.append((stack.name, running))
+            self.calls.append(args)
+            throttled = running > self.capacity
+            self.throttles += throttled
+        output = ["Error: StatusCode=429 TooManyRequests, retrying"] if throttled else ["Apply complete!"]
+        for line in output:
+            if on_output is not None:
+                on_output(line)
+        time.sleep(0.05)
+        with self.lock:
+            self.running[subscription] -= 1
+        return ExecutionResult(returncode=0, output=output)
+
+
+def _synthesized(subscription_id: str, resources: int) -> dict[str, Any]:
+    """
+    Create synthesized Terraform JSON with a number of storage containers.
+
+    Args:
+        subscription_id (str): The subscription ID of the azurerm provider.
+        resources (int): The number of resources.
+
+    Returns:
+        dict[str, Any]: The synthesized Terraform JSON.
+    """
+    return {
+        "provider": {"azurerm": [{"subscription_id": subscription_id, "features": [{}]}]},
+        "resource": {"azurerm_storage_container": {f"container{index}": {} for index in range(resources)}},
+    }
+
+
+def _stack(tmp_path: Path, name: str, subscription_id: str, resources: int = 10) -> SynthesizedStack:
+    """
+    Create a synthesized stack with its `cdk.tf.json` written to disk.
+
+    Args:
+        tmp_path (Path): Temporary directory.
+        name (str): The name of the stack.
+        subscription_id (str): The subscription ID of the azurerm provider.
+        resources (int): The number of resources.
+
+    Returns:
+        SynthesizedStack: The stack.
+    """
+    working_directory = tmp_path / "stacks" / name
+    working_directory.mkdir(parents=True)
+    synthesized_stack_path = working_directory / "cdk.tf.json"
+    synthesized_stack_path.write_text(json.dumps(_synthesized(subscription_id, resources)), encoding="utf-8")
+    return SynthesizedStack(
+        name=name, working_directory=working_directory, synthesized_stack_path=synthesized_stack_path
+    )
+
+
+class TestAimdLimit:
+    """
+    Test suite for the AimdLimit class.
+    """
+
+    def test__on_success(self) -> None:
+        """
+        Test the limit increases additively up to the maximum.
+        """
+        limit = AimdLimit(value=10, maximum=18, increase=5)
+
+        limit.on_success()
+        assert limit.value == 15
+        limit.on_success()
+        assert limit.value == 18
+
+    def test__on_throttle(self) -> None:
+        """
+        Test the limit decreases multiplicatively down to the minimum.
+        """
+        limit = AimdLimit(value=10, minimum=4, decrease_factor=0.5)
+
+        limit.on_throttle()
+        assert limit.value == 5
+        limit.on_throttle()
+        assert limit.value == 4
+
+
+class TestEstimateWrites:
+    """
+    Test suite for the estimate_writes function.
+    """
+
+    @pytest.mark.parametrize("resources, expected", [(0, 1), (3, 3), (50, TERRAFORM_PARALLELISM)])
+    def test__estimate_writes(self, resources: int, expected: int) -> None:
+        """
+        Test the writes are counted from resources and capped at Terraform parallelism.
+
+        Args:
+            resources (int): The number of resources in the stack.
+            expected (int): The expected estimate.
+        """
+        assert estimate_writes(_synthesized("sub", resources)) == expected
+
+
+class TestThrottleAwareOrchestrator:
+    """
+    Test suite for the ThrottleAwareOrchestrator class.
+    """
+
+    def test__run__groups_by_subscription(self, tmp_path: Path) -> None:
+        """
+        Test the write limit applies per subscription, so subscriptions run next to each other.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        stacks = [
+            _stack(tmp_path, f"{subscription}{index}", subscription) for subscription in "ab" for index in range(3)
+        ]
+        executor = SimulatedArmExecutor(capacity=10)
+
+        results = ThrottleAwareOrchestrator(
+            stacks, executor, commands=["apply"], parallelism=6, limit=AimdLimit(value=10, increase=0)
+        ).run()
+
+        assert all(result.status is StackStatus.SUCCEEDED for result in results.values())
+        assert executor.peaks == {"a": 1, "b": 1}
+        assert executor.throttles == 0
+
+    def test__run__backs_off_on_throttling(self, tmp_path: Path) -> None:
+        """
+        Test concurrency drops after the executor reports 429 responses and stacks still complete.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        stacks = [_stack(tmp_path, f"stack{index}", "a") for index in range(12)]
+        executor = SimulatedArmExecutor(capacity=2)
+
+        orchestrator = ThrottleAwareOrchestrator(
+            stacks, executor, commands=["apply"], parallelism=12, limit=AimdLimit(value=40, increase=0)
+        )
+        results = orchestrator.run()
+
+        assert all(result.status is StackStatus.SUCCEEDED for result in results.values())
+        assert orchestrator.limits["a"].value < 40
+        # The first wave of four stacks is throttled, after backing off no more than capacity run at once.
+        assert max(running for _, running in executor.starts[4:]) <= 2
+
+    def test__run__targets(self, tmp_path: Path) -> None:
+        """
+        Test the targets are passed to terraform plan, so a targeted run can be throttled too.
+
+        Args:
+            tmp_path (Path): Temporary directory.
+        """
+        stack = _stack(tmp_path, "stack", "a")
+        executor = SimulatedArmExecutor(capacity=2)
+
+        ThrottleAwareOrchestrator(
+            [stack], executor, commands=["plan"], targets={"stack": ["azurerm_storage_container.container0"]}
+        ).run()
+
+        assert executor.calls[0][-1] == "-target=azurerm_storage_container.container0"
@@ -0,0 +1,409 @@
+"""
+Module for testing the LazyLakeHouseStackConfig class.
+
+This module contains unit tests for the lazy lake house stack configuration, which keeps the raw configuration
+dictionary and decodes each section on first access.
+
+Tests:
+    - TestLazyLakeHouseStackConfig:
+        - test__lazy_config__decodes_on_access: Tests untouched sections are not decoded.
+        - test__lazy_config__caches_sections: Tests a section is decoded once.
+        - test__lazy_config__materialize: Tests materializing equals the eager configuration.
+        - test__lazy_config__missing_section: Tests a missing section raises on access.
+    - TestLakeHouseStack:
+        - test__lake_house_stack__lazy_config: Tests the stack synthesizes the same from a lazy and an eager config.
+        - test__lake_house_stack__azurerm_backend: Tests the stack stores its state under its own key in Azure Storage.
+        - test__lake_house_stack__private_endpoints: Tests every layer gets private endpoints in shared DNS zones.
+        - test__lake_house_stack__private_endpoints__per_layer: Tests layers with their own endpoints share the zones.
+        - test__lake_house_stack__endpoint_outputs: Tests the endpoint variants of every layer are stack outputs.
+        - test__lake_house_stack__read_replica_layers: Tests a read replica layer gets read-access replication.
+        - test__lake_house_stack__monitoring: Tests every layer sends its telemetry to the shared workspace.
+        - test__lake_house_stack__alerts: Tests every layer gets metric alerts with per layer thresholds.
+        - test__lake_house_stack__partitions: Tests a partitioned layer spreads its containers over storage accounts.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from cdktf import App, Testing
+
+from a1a_infra_base.stacks.lake_house import LakeHouseStack, LakeHouseStackConfig, LazyLakeHouseStackConfig
+
+
+@pytest.fixture(name="lake_house_stack_config__dict")
+def fixture__lake_house_stack_config__dict(storage_l1_config__factory: Callable[..., dict[str, Any]]) -> dict[str, Any]:
+    """
+    Fixture that provides a configuration dictionary for LakeHouseStackConfig.
+
+    Args:
+        storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "terraform_provider": {
+            "azurerm": {
+                "tenant_id": "test-tenant-id",
+                "subscription_id": "test-sub-id",
+                "client_id": "test-client-id",
+                "client_secret": "test-client-secret",
+            }
+        },
+        "terraform_backend": {"local": {"path": "tfstate/test.tfstate"}},
+        "constructs": {
+            "data_lake": {
+                "source_storage": storage_l1_config__factory("source"),
+                "bronze_storage": storage_l1_config__factory("bronze"),
+                "silver_storage": storage_l1_config__factory("silver"),
+                "gold_storage": storage_l1_config__factory("gold"),
+            }
+        },
+    }
+
+
+class TestLazyLakeHouseStackConfig:
+    """
+    Test suite for the LazyLakeHouseStackConfig class.
+    """
+
+    def test__lazy_config__decodes_on_access(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test untouched sections are not decoded, so their validation errors do not surface.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        lake_house_stack_config__dict["constructs"]["data_lake"]["gold_storage"]["location"] = "unknown"
+
+        config = LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+
+        assert config.provider_azurerm_config.subscription_id == "test-sub-id"
+        assert config.constructs_config.data_lake.source_storage_l1_config.name == "source"
+        with pytest.raises(ValueError):
+            _ = config.constructs_config.data_lake.gold_storage_l1_config
+
+    def test__lazy_config__caches_sections(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test a section is decoded once and returned from cache afterwards.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+
+        data_lake = config.constructs_config.data_lake
+        assert data_lake.gold_storage_l1_config is data_lake.gold_storage_l1_config
+        assert config.constructs_config is config.constructs_config
+
+    def test__lazy_config__materialize(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test materializing the lazy configuration equals decoding the eager configuration.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        lazy_config = LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+
+        assert lazy_config.materialize() == LakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+
+    def test__lazy_config__missing_section(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test a missing section raises a KeyError on access, like the eager configuration does on decode.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        del lake_house_stack_config__dict["terraform_backend"]
+
+        config = LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+
+        assert config.provider_azurerm_config.client_id == "test-client-id"
+        with pytest.raises(KeyError):
+            _ = config.backend_config
+        with pytest.raises(KeyError):
+            config.materialize()
+
+
+class TestLakeHouseStack:
+    """
+    Test suite for the LakeHouseStack stack.
+    """
+
+    def test__lake_house_stack__lazy_config(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test the stack synthesizes the same from a lazy and an eager configuration.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        eager_stack = LakeHouseStack(
+            App(), env="dev", config=LakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+        lazy_stack = LakeHouseStack(
+            App(), env="dev", config=LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+
+        assert Testing.synth(lazy_stack) == Testing.synth(eager_stack)
+
+    def test__lake_house_stack__azurerm_backend(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test the stack stores its state under its own key when configured with the Azure Storage backend.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        lake_house_stack_config__dict["terraform_backend"] = {
+            "azurerm": {"storage_account_name": "satfstate", "container_name": "tfstate"}
+        }
+
+        stack = LakeHouseStack(App(), env="dev", config=LakeHouseStackConfig.from_dict(lake_house_stack_config__dict))
+
+        backend = json.loads(Testing.synth(stack))["terraform"]["backend"]
+        assert backend == {
+            "azurerm": {
+                "storage_account_name": "satfstate",
+                "container_name": "tfstate",
+                "key": "dev/LakeHouseStack.tfstate",
+                "use_azuread_auth": True,
+            }
+        }
+
+    def test__lake_house_stack__private_endpoints(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test every layer gets private endpoints registered in DNS zones shared by the data lake, and a layer can
+        override the sub-resources.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        data_lake = lake_house_stack_config__dict["constructs"]["data_lake"]
+        data_lake["private_endpoints"] = {
+            "subnet_id": "test-subnet-id",
+            "virtual_network_ids": ["/subscriptions/test/virtualNetworks/vnet-databricks"],
+        }
+        data_lake["gold_storage"]["private_endpoints"] = {"subnet_id": "test-subnet-id", "subresources": ["dfs"]}
+
+        stack = LakeHouseStack(App(), env="dev", config=LakeHouseStackConfig.from_dict(lake_house_stack_config__dict))
+        lazy_stack = LakeHouseStack(
+            App(), env="dev", config=LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+
+        synthesized = Testing.synth(stack)
+        assert Testing.synth(lazy_stack) == synthesized
+        resources = json.loads(synthesized)["resource"]
+        zones = resources["azurerm_private_dns_zone"]
+        assert sorted(zone["name"] for zone in zones.values()) == [
+            "privatelink.blob.core.windows.net",
+            "privatelink.dfs.core.windows.net",
+        ]
+        assert sorted(link["name"] for link in resources["azurerm_private_dns_zone_virtual_network_link"].values()) == [
+            "privatelink.blob.core.windows.net-vnet-databricks",
+            "privatelink.dfs.core.windows.net-vnet-databricks",
+        ]
+        endpoints = resources["azurerm_private_endpoint"].values()
+        assert sorted(endpoint["name"] for endpoint in endpoints if "gold" in endpoint["name"]) == [
+            "sagolddevgwc01-dfs-pep"
+        ]
+        assert len(endpoints) == 7
+        zone_ids = {f"${{azurerm_private_dns_zone.{key}.id}}" for key in zones}
+        for endpoint in endpoints:
+            assert endpoint["subnet_id"] == "test-subnet-id"
+            assert set(endpoint["private_dns_zone_group"]["private_dns_zone_ids"]) <= zone_ids
+
+    def test__lake_house_stack__private_endpoints__per_layer(
+        self, lake_house_stack_config__dict: dict[str, Any]
+    ) -> None:
+        """
+        Test layers that each configure their own private endpoints, without any on the data lake, register in a
+        single set of private DNS zones, as zones with the same name collide in the resource group.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        data_lake = lake_house_stack_config__dict["constructs"]["data_lake"]
+        data_lake["bronze_storage"]["private_endpoints"] = {
+            "subnet_id": "test-subnet-id",
+            "virtual_network_ids": ["/subscriptions/test/virtualNetworks/vnet-ingest"],
+        }
+        data_lake["silver_storage"]["private_endpoints"] = {
+            "subnet_id": "test-subnet-id",
+            "virtual_network_ids": ["/subscriptions/test/virtualNetworks/vnet-databricks"],
+        }
+        data_lake["silver_storage"]["partitions"] = 2
+
+        stack = LakeHouseStack(App(), env="dev", config=LakeHouseStackConfig.from_dict(lake_house_stack_config__dict))
+
+        resources = json.loads(Testing.synth(stack))["resource"]
+        zones = resources["azurerm_private_dns_zone"]
+        assert sorted(zone["name"] for zone in zones.values()) == [
+            "privatelink.blob.core.windows.net",
+            "privatelink.dfs.core.windows.net",
+        ]
+        assert len(resources["azurerm_private_dns_zone_virtual_network_link"]) == 2 * 2
+        endpoints = resources["azurerm_private_endpoint"].values()
+        assert len(endpoints) == 3 * 2
+        zone_ids = {f"${{azurerm_private_dns_zone.{key}.id}}" for key in zones}
+        for endpoint in endpoints:
+            assert set(endpoint["private_dns_zone_group"]["private_dns_zone_ids"]) <= zone_ids
+
+    def test__lake_house_stack__endpoint_outputs(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test the published endpoint variants of every layer are stack outputs.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        gold_storage = lake_house_stack_config__dict["constructs"]["data_lake"]["gold_storage"]
+        gold_storage["routing_l0"] = {"publish_microsoft_endpoints": True, "publish_internet_endpoints": True}
+
+        stack = LakeHouseStack(App(), env="dev", config=LakeHouseStackConfig.from_dict(lake_house_stack_config__dict))
+
+        outputs = json.loads(Testing.synth(stack))["output"]
+        assert sorted(name for name in outputs if name.startswith("gold_")) == [
+            "gold_blob_endpoint",
+            "gold_blob_internet_endpoint",
+            "gold_blob_microsoft_endpoint",
+            "gold_dfs_endpoint",
+            "gold_dfs_internet_endpoint",
+            "gold_dfs_microsoft_endpoint",
+        ]
+        assert len(outputs) == 13
+        assert "primary_dfs_microsoft_endpoint" in outputs["gold_dfs_microsoft_endpoint"]["value"]
+
+    def test__lake_house_stack__read_replica_layers(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test a read replica layer has its geo-redundant replication upgraded to read-access and its secondary
+        endpoints published as stack outputs, while a locally redundant layer cannot have a read replica.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        data_lake = lake_house_stack_config__dict["constructs"]["data_lake"]
+        data_lake["gold_storage"]["account_replication_type"] = "GRS"
+        data_lake["read_replica_layers"] = ["gold"]
+
+        stack = LakeHouseStack(
+            App(), env="dev", config=LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+
+        synthesized = json.loads(Testing.synth(stack))
+        accounts = synthesized["resource"]["azurerm_storage_account"].values()
+        assert {account["name"]: account["account_replication_type"] for account in accounts}["sagolddevgwc01"] == (
+            "RAGRS"
+        )
+        assert {"gold_dfs_secondary_endpoint", "gold_blob_secondary_endpoint"} <= set(synthesized["output"])
+
+        data_lake["read_replica_layers"] = ["silver"]
+        with pytest.raises(ValueError, match="read replica"):
+            LakeHouseStack(App(), env="dev", config=LakeHouseStackConfig.from_dict(lake_house_stack_config__dict))
+
+    def test__lake_house_stack__monitoring(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test every layer sends its account metrics and blob service logs to the shared Log Analytics workspace, with
+        the categories of a layer overriding the ones of the data lake.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        data_lake = lake_house_stack_config__dict["constructs"]["data_lake"]
+        data_lake["monitoring"] = {
+            "log_analytics_workspace": {
+                "name": "lakehouse",
+                "location": "germany west central",
+                "sequence_number": "01",
+                "retention_in_days": 90,
+            }
+        }
+        data_lake["gold_storage"]["diagnostics"] = {"account": {}, "blob": {"log_categories": ["StorageRead"]}}
+
+        stack = LakeHouseStack(
+            App(), env="dev", config=LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+
+        synthesized = json.loads(Testing.synth(stack))
+        assert len(synthesized["resource"]["azurerm_log_analytics_workspace"]) == 1
+        settings = {
+            setting["name"]: setting
+            for setting in synthesized["resource"]["azurerm_monitor_diagnostic_setting"].values()
+        }
+        assert sorted(settings) == [
+            "sabronzedevgwc01-blob-diag",
+            "sabronzedevgwc01-diag",
+            "sagolddevgwc01-blob-diag",
+            "sasilverdevgwc01-blob-diag",
+            "sasilverdevgwc01-diag",
+            "sasourcedevgwc01-blob-diag",
+            "sasourcedevgwc01-diag",
+        ]
+        assert settings["sabronzedevgwc01-blob-diag"]["enabled_log"] == [
+            {"category": "StorageRead"},
+            {"category": "StorageWrite"},
+            {"category": "StorageDelete"},
+        ]
+        assert settings["sagolddevgwc01-blob-diag"]["enabled_log"] == [{"category": "StorageRead"}]
+        assert "enabled_metric" not in settings["sagolddevgwc01-blob-diag"]
+        assert settings["sabronzedevgwc01-blob-diag"]["target_resource_id"].endswith("/blobServices/default")
+
+        data_lake["monitoring"]["log_analytics_workspace_id"] = "/subscriptions/test/workspaces/central"
+        with pytest.raises(ValueError, match="exactly one"):
+            LakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+
+    def test__lake_house_stack__alerts(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test every layer gets the metric alerts of the data lake, with the thresholds of a layer overriding them.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        data_lake = lake_house_stack_config__dict["constructs"]["data_lake"]
+        data_lake["alerts"] = {"action_group_ids": ["/subscriptions/test/actionGroups/ag-oncall"]}
+        data_lake["gold_storage"]["alerts"] = {"success_e2e_latency_ms": 250, "throttled_transactions": None}
+
+        stack = LakeHouseStack(
+            App(), env="dev", config=LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+
+        synthesized = json.loads(Testing.synth(stack))
+        alerts = {alert["name"]: alert for alert in synthesized["resource"]["azurerm_monitor_metric_alert"].values()}
+        assert len(alerts) == 4 * 5 - 1
+        assert "sagolddevgwc01-throttling-alert" not in alerts
+        assert alerts["sagolddevgwc01-latency-alert"]["criteria"][0]["threshold"] == 250
+        assert alerts["sabronzedevgwc01-latency-alert"]["action"] == [
+            {"action_group_id": "/subscriptions/test/actionGroups/ag-oncall"}
+        ]
+        assert "action" not in alerts["sagolddevgwc01-latency-alert"]
+
+    def test__lake_house_stack__partitions(self, lake_house_stack_config__dict: dict[str, Any]) -> None:
+        """
+        Test a partitioned layer spreads its containers over consecutively numbered storage accounts, keeps its first
+        account at the construct path of the layer and publishes the container routing as a stack output.
+
+        Args:
+            lake_house_stack_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        gold_storage = lake_house_stack_config__dict["constructs"]["data_lake"]["gold_storage"]
+        gold_storage["partitions"] = 3
+        gold_storage["containers"] = [{"name": f"container{index}"} for index in range(12)]
+
+        stack = LakeHouseStack(
+            App(), env="dev", config=LazyLakeHouseStackConfig.from_dict(lake_house_stack_config__dict)
+        )
+
+        synthesized = json.loads(Testing.synth(stack))
+        account_names = {account["name"] for account in synthesized["resource"]["azurerm_storage_account"].values()}
+        assert {"sagolddevgwc01", "sagolddevgwc02", "sagolddevgwc03"} <= account_names
+        assert len(synthesized["resource"]["azurerm_storage_container"]) == 3 + 12
+        assert stack.data_lake is not None
+        assert stack.data_lake.gold_storage_l1 is stack.data_lake.storage_l1s["gold"]
+        assert stack.data_lake.storage_l1s["gold_2"].node.id == "StorageL1_Gold_2"
+        assert "gold_1_dfs_endpoint" in synthesized["output"]
+
+        routing = synthesized["output"]["container_routing"]["value"]
+        assert routing["source"] == {"test": "sasourcedevgwc01"}
+        assert sorted(routing["gold"]) == sorted(f"container{index}" for index in range(12))
+        gold_1_containers = stack.data_lake.storage_l1s["gold_1"].storage_containers
+        assert gold_1_containers
+        assert all(routing["gold"][container.full_name] == "sagolddevgwc02" for container in gold_1_containers)
@@ -0,0 +1,276 @@
+"""
+Module for testing the capacity planner of storage accounts.
+
+Tests:
+    - TestGetAccountLimits:
+        - test__get_account_limits: Tests the targets depend on the account kind, replication and region.
+        - test__get_account_limits__unpublished: Tests an account type without published targets raises.
+    - TestPlanCapacity:
+        - test__plan_capacity: Tests the utilization, headroom and required accounts of each account.
+        - test__plan_capacity__target_utilization: Tests the target utilization reserves headroom.
+        - test__plan_capacity__empty: Tests planning no accounts returns an empty plan.
+        - test__plan_capacity__unpublished: Tests an account without published targets is left out of the plan.
+    - TestCheckCapacity:
+        - test__check_capacity__matrix: Tests the layers of every environment are planned before synth.
+        - test__check_capacity__partitions: Tests the load of a partitioned layer is spread over its accounts.
+        - test__check_capacity__premium: Tests a premium layer does not abort the check.
+        - test__capacity_plan__invalid_layer: Tests an unknown layer in the capacity plan raises.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from cdktf import App
+
+from a1a_infra_base.capacity import (
+    AccountLimits,
+    PlannedAccount,
+    ProjectedLoadConfig,
+    get_account_limits,
+    plan_capacity,
+)
+from a1a_infra_base.constants import AzureLocation
+from a1a_infra_base.constructs.level0.storage_account import StorageAccountL0Config
+from a1a_infra_base.constructs.level2.data_lake import DataLakeL2Config
+from a1a_infra_base.synth import build_matrix, check_capacity
+
+
+class TestGetAccountLimits:
+    """
+    Test suite for the get_account_limits function.
+    """
+
+    def test__get_account_limits(self) -> None:
+        """
+        Test the targets of general-purpose v2 accounts depend on the region and the ones of legacy general-purpose v1
+        accounts on geo-redundant replication.
+        """
+        location = AzureLocation.GERMANY_WEST_CENTRAL
+
+        assert get_account_limits(
+            account_tier="Standard", account_kind=None, account_replication_type="GZRS", location=location
+        ) == AccountLimits(20_000, 60, 200, 5 * 1024)
+        assert get_account_limits(
+            account_tier="Standard",
+            account_kind="StorageV2",
+            account_replication_type="LRS",
+            location=AzureLocation.WEST_EUROPE,
+        ) == AccountLimits(20_000, 60, 200, 5 * 1024)
+        assert (
+            get_account_limits(
+                account_tier="Standard", account_kind="Storage", account_replication_type="GRS", location=location
+            ).ingress_gbps
+            == 5
+        )
+        assert (
+            get_account_limits(
+                account_tier="Standard", account_kind="Storage", account_replication_type="LRS", location=location
+            ).ingress_gbps
+            == 10
+        )
+
+    def test__get_account_limits__unpublished(self) -> None:
+        """
+        Test an account type without published targets raises a ValueError.
+        """
+        with pytest.raises(ValueError, match="No scalability targets"):
+            get_account_limits(
+                account_tier="Premium",
+                account_kind="BlockBlobStorage",
+                account_replication_type="LRS",
+                location=AzureLocation.GERMANY_WEST_CENTRAL,
+            )
+
+
+class TestPlanCapacity:
+    """
+    Test suite for the plan_capacity function.
+    """
+
+    def test__plan_capacity(self, storage_l1_config__factory: Callable[..., dict[str, Any]]) -> None:
+        """
+        Test the utilization and headroom per metric and the accounts required by the peak utilization.
+
+        Args:
+            storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+        """
+        config = StorageAccountL0Config.from_dict(storage_l1_config__factory("gold"))
+        accounts = [
+            PlannedAccount(name="fits", config=config, load=ProjectedLoadConfig(request_rate_per_second=10_000)),
+            PlannedAccount(
+                name="egress", config=config, load=ProjectedLoadConfig(request_rate_per_second=5_000, egress_gbps=500)
+            ),
+        ]
+
+        fits, egress = plan_capacity(accounts)
+
+        assert fits.fits
+        assert fits.utilization["request_rate_per_second"] == 0.5
+        assert fits.headroom["request_rate_per_second"] == 0.5
+        assert not egress.fits
+        assert egress.accounts_required == 3
+        assert egress.bottleneck == "egress_gbps"
+        assert egress.headroom["egress_gbps"] == -1.5
+
+    def test__plan_capacity__target_utilization(
+        self, storage_l1_config__factory: Callable[..., dict[str, Any]]
+    ) -> None:
+        """
+        Test a load within the targets needs more accounts when the target utilization reserves headroom.
+
+        Args:
+            storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+        """
+        config = StorageAccountL0Config.from_dict(storage_l1_config__factory("gold"))
+        load = ProjectedLoadConfig(request_rate_per_second=18_000)
+
+        (capacity,) = plan_capacity([PlannedAccount(name="gold", config=config, load=load, target_utilization=0.8)])
+
+        assert capacity.accounts_required == 2
+
+    def test__plan_capacity__empty(self) -> None:
+        """
+        Test planning no accounts returns an empty plan.
+        """
+        assert plan_capacity([]) == []
+
+    def test__plan_capacity__unpublished(self, storage_l1_config__factory: Callable[..., dict[str, Any]]) -> None:
+        """
+        Test an account type without published targets is left out of the plan instead of raising.
+
+        Args:
+            storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+        """
+        standard = StorageAccountL0Config.from_dict(storage_l1_config__factory("silver"))
+        premium = StorageAccountL0Config.from_dict(
+            storage_l1_config__factory("gold", account_tier="Premium", account_kind="BlockBlobStorage")
+        )
+        load = ProjectedLoadConfig(request_rate_per_second=10_000)
+
+        plan = plan_capacity(
+            [
+                PlannedAccount(name="gold", config=premium, load=load),
+                PlannedAccount(name="silver", config=standard, load=load),
+            ]
+        )
+
+        assert [capacity.name for capacity in plan] == ["silver"]
+
+
+class TestCheckCapacity:
+    """
+    Test suite for the check_capacity function.
+    """
+
+    @pytest.fixture(name="lake_house__dict")
+    def fixture__lake_house__dict(self, storage_l1_config__factory: Callable[..., dict[str, Any]]) -> dict[str, Any]:
+        """
+        Fixture that provides the `stack` section of a lake house configuration document with a capacity plan.
+
+        Args:
+            storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+
+        Returns:
+            dict[str, Any]: A configuration dictionary.
+        """
+        return {
+            "terraform_provider": {
+                "azurerm": {
+                    "tenant_id": "test-tenant-id",
+                    "subscription_id": "test-sub-id",
+                    "client_id": "test-client-id",
+                    "client_secret": "test-client-secret",
+                }
+            },
+            "terraform_backend": {"local": {"path": "tfstate/test.tfstate"}},
+            "constructs": {
+                "data_lake": {
+                    "source_storage": storage_l1_config__factory("source"),
+                    "bronze_storage": storage_l1_config__factory("bronze"),
+                    "silver_storage": storage_l1_config__factory("silver"),
+                    "gold_storage": storage_l1_config__factory("gold"),
+                    "capacity_plan": {
+                        "target_utilization": 0.8,
+                        "layers": {
+                            "bronze": {"ingress_gbps": 80},
+                            "gold": {"request_rate_per_second": 1_000, "capacity_tib": 100},
+                        },
+                    },
+                }
+            },
+        }
+
+    def test__check_capacity__matrix(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test the layers with a projected load of every environment are planned in one pass.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration dictionary.
+        """
+        app = App()
+        build_matrix(app, name="lake_house", dict_=lake_house__dict, envs=["dev", "prd"])
+
+        plan = check_capacity(app)
+
+        assert {capacity.name: capacity.accounts_required for capacity in plan} == {
+            "sabronzedevgwc01": 2,
+            "sagolddevgwc01": 1,
+            "sabronzeprdgwc01": 2,
+            "sagoldprdgwc01": 1,
+        }
+
+    def test__check_capacity__partitions(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test the load of a partitioned layer is spread evenly over its storage accounts, so each fits its targets.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration dictionary.
+        """
+        lake_house__dict["constructs"]["data_lake"]["bronze_storage"]["partitions"] = 2
+        app = App()
+        build_matrix(app, name="lake_house", dict_=lake_house__dict, envs=["dev"])
+
+        plan = check_capacity(app)
+
+        assert {capacity.name: capacity.accounts_required for capacity in plan} == {
+            "sabronzedevgwc01": 1,
+            "sabronzedevgwc02": 1,
+            "sagolddevgwc01": 1,
+        }
+
+    def test__check_capacity__premium(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a premium block blob layer with a projected load does not abort the check, as no targets are published
+        for it, while the other layers are still planned.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration dictionary.
+        """
+        lake_house__dict["constructs"]["data_lake"]["gold_storage"].update(
+            {
+                "performance_profile": "premium-hns",
+                "account_tier": "Premium",
+                "account_kind": "BlockBlobStorage",
+                "is_hns_enabled": True,
+            }
+        )
+        app = App()
+        build_matrix(app, name="lake_house", dict_=lake_house__dict, envs=["dev"])
+
+        plan = check_capacity(app)
+
+        assert [capacity.name for capacity in plan] == ["sabronzedevgwc01"]
+
+    def test__capacity_plan__invalid_layer(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an unknown layer in the capacity plan raises a ValueError.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration dictionary.
+        """
+        data_lake = lake_house__dict["constructs"]["data_lake"]
+        data_lake["capacity_plan"]["layers"]["platinum"] = {}
+
+        with pytest.raises(ValueError, match="platinum"):
+            DataLakeL2Config.from_dict(data_lake)
@@ -0,0 +1,39 @@
+"""
+Module for testing the command line of the a1a_infra_base application.
+
+Tests:
+    - TestParseEnvOverlay:
+        - test__parse_env_overlay: Tests an ENV=PATH argument is split into the environment and the path.
+        - test__parse_env_overlay__invalid: Tests an argument without an environment or path is rejected.
+"""
+
+import argparse
+from pathlib import Path
+
+import pytest
+
+from a1a_infra_base.__main__ import parse_env_overlay
+
+
+class TestParseEnvOverlay:
+    """
+    Test suite for the parse_env_overlay function.
+    """
+
+    def test__parse_env_overlay(self) -> None:
+        """
+        Test an ENV=PATH argument is split into the environment and the path, at the first equals sign only.
+        """
+        assert parse_env_overlay("prd=config/prd.yaml") == ("prd", Path("config/prd.yaml"))
+        assert parse_env_overlay("prd=config/a=b.yaml") == ("prd", Path("config/a=b.yaml"))
+
+    @pytest.mark.parametrize("value", ["prd.yaml", "=prd.yaml", "prd="])
+    def test__parse_env_overlay__invalid(self, value: str) -> None:
+        """
+        Test an argument without an environment or a path is rejected with an argparse error.
+
+        Args:
+            value (str): The argument value.
+        """
+        with pytest.raises(argparse.ArgumentTypeError, match="ENV=PATH"):
+            parse_env_overlay(value)
@@ -0,0 +1,59 @@
+"""
+Module for testing the placement of keys on partitions.
+
+Tests:
+    - TestPartitioning:
+        - test__get_partition__single: Tests every key is placed on the only partition.
+        - test__get_partition__invalid: Tests less than one partition raises.
+        - test__route__balanced: Tests keys are spread over every partition.
+        - test__route__stable: Tests growing the partitions only moves keys to the new partition.
+"""
+
+import pytest
+
+from a1a_infra_base.partitioning import get_partition, route
+
+KEYS = [f"container{index}" for index in range(1000)]
+
+
+class TestPartitioning:
+    """
+    Test suite for the partitioning functions.
+    """
+
+    def test__get_partition__single(self) -> None:
+        """
+        Test every key is placed on the only partition.
+        """
+        assert set(route(KEYS, 1).values()) == {0}
+
+    def test__get_partition__invalid(self) -> None:
+        """
+        Test less than one partition raises a ValueError.
+        """
+        with pytest.raises(ValueError, match="at least 1"):
+            get_partition("container", 0)
+
+    def test__route__balanced(self) -> None:
+        """
+        Test keys are spread over every partition, with each partition receiving a fair share.
+        """
+        routing = route(KEYS, 4)
+
+        counts = [list(routing.values()).count(partition) for partition in range(4)]
+        assert all(150 <= count <= 350 for count in counts)
+
+    @pytest.mark.parametrize("partitions", [1, 2, 3, 7])
+    def test__route__stable(self, partitions: int) -> None:
+        """
+        Test growing the partitions by one only moves keys to the new partition, about one in N + 1 of them.
+
+        Args:
+            partitions (int): The number of partitions before growing.
+        """
+        before = route(KEYS, partitions)
+        after = route(KEYS, partitions + 1)
+
+        moved = [key for key in KEYS if before[key] != after[key]]
+        assert all(after[key] == partitions for key in moved)
+        assert len(moved) < 2 * len(KEYS) / (partitions + 1)
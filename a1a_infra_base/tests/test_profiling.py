@@ -0,0 +1,98 @@
+"""
+Profiler factory tests.
+"""
+
+import pstats
+from pathlib import Path
+
+import pytest
+
+from a1a_infra_base.profiling import (
+    CombinedProfiler,
+    CpuProfiler,
+    MemoryProfiler,
+    ProfilerBase,
+    ProfilerFactory,
+)
+
+
+def _busy_work() -> list[str]:
+    """Allocate and burn some CPU so profilers have something to record."""
+    return [str(i) * 10 for i in range(50_000)]
+
+
+class TestCpuProfiler:
+    """Tests for CpuProfiler class."""
+
+    def test_stop__writes_pstats_and_collapsed(self, tmp_path: Path) -> None:
+        """Test stopping the CPU profiler writes a loadable `.pstats` file and a collapsed-stack file."""
+        # Arrange
+        profiler = CpuProfiler(output_dir=tmp_path, name="test")
+
+        # Act
+        profiler.start()
+        _busy_work()
+        paths = profiler.stop()
+
+        # Assert
+        assert paths == [tmp_path / "test.pstats", tmp_path / "test.collapsed"]
+        assert pstats.Stats(str(paths[0])).total_calls > 0
+        for line in paths[1].read_text(encoding="utf-8").splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert stack
+            assert int(count) > 0
+
+
+class TestMemoryProfiler:
+    """Tests for MemoryProfiler class."""
+
+    def test_stop__reports_each_checkpoint(self, tmp_path: Path) -> None:
+        """Test the memory report contains a section per checkpoint in order."""
+        # Arrange
+        profiler = MemoryProfiler(output_dir=tmp_path, name="test", top=5)
+
+        # Act
+        profiler.start()
+        profiler.checkpoint("config loaded")
+        data = _busy_work()
+        profiler.checkpoint("constructs built")
+        paths = profiler.stop()
+
+        # Assert
+        report = paths[0].read_text(encoding="utf-8")
+        assert paths == [tmp_path / "test.mem.txt"]
+        assert report.index("== config loaded") < report.index("== constructs built")
+        assert "-- growth since previous checkpoint" in report
+        assert data
+
+
+class TestProfilerFactory:
+    """Tests for ProfilerFactory class."""
+
+    @pytest.mark.parametrize(
+        "mode, expected_profiler",
+        [
+            ("cpu", CpuProfiler),
+            ("mem", MemoryProfiler),
+            ("both", CombinedProfiler),
+        ],
+    )
+    def test_create(self, mode: str, expected_profiler: type[ProfilerBase], tmp_path: Path) -> None:
+        """
+        Test `create` returns the correct profiler for given mode.
+
+        Args:
+            mode (str): The profile mode.
+            expected_profiler (type): The expected profiler type.
+            tmp_path (Path): Temporary output directory.
+        """
+        # Act
+        profiler = ProfilerFactory.create(mode=mode, output_dir=tmp_path, name="test")
+
+        # Assert
+        assert isinstance(profiler, expected_profiler)
+
+    def test_create__unsupported_mode__raises_not_implemented_error(self, tmp_path: Path) -> None:
+        """Test `create` raises `NotImplementedError` for unsupported mode."""
+        with pytest.raises(NotImplementedError):  # Assert
+            ProfilerFactory.create(mode="gpu", output_dir=tmp_path, name="test")  # Act
@@ -0,0 +1,47 @@
+"""
+Module for testing the ConstructSelection class.
+
+Tests:
+    - TestConstructSelection:
+        - test__includes: Tests which construct paths are part of a selection.
+"""
+
+import pytest
+
+from a1a_infra_base.selection import SELECT_ALL, ConstructSelection
+
+
+class TestConstructSelection:
+    """
+    Test suite for the ConstructSelection class.
+    """
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("LakeHouseStack", True),
+            ("LakeHouseStack/DataLakeL2", True),
+            ("LakeHouseStack/DataLakeL2/StorageL1_Gold", True),
+            ("LakeHouseStack/DataLakeL2/StorageL1_Gold/StorageContainerL0_test", True),
+            ("LakeHouseStack/DataLakeL2/StorageL1_Silver", False),
+            ("LakeHouseStack/ResourceGroupL0", False),
+            ("OtherStack", False),
+        ],
+    )
+    def test__includes(self, path: str, expected: bool) -> None:
+        """
+        Test which construct paths are part of a selection.
+
+        Args:
+            path (str): The candidate construct path.
+            expected (bool): Whether the candidate should be included.
+        """
+        selection = ConstructSelection(path="LakeHouseStack/DataLakeL2/StorageL1_Gold/")
+        assert selection.includes(path) is expected
+
+    def test__includes__select_all(self) -> None:
+        """
+        Test the default selection includes every construct path.
+        """
+        assert SELECT_ALL.includes("LakeHouseStack/ResourceGroupL0")
+        assert SELECT_ALL.parts == ()
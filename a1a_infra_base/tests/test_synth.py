@@ -0,0 +1,263 @@
+"""
+Module for testing the in-memory synth of configuration documents.
+
+Tests:
+    - TestBuildMatrix:
+        - test__build_matrix: Tests one stack per environment is built with a separated backend.
+        - test__build_matrix__overlay: Tests an environment overlay is merged over the shared configuration.
+    - TestSynthesize:
+        - test__synthesize__lake_house: Tests a lake house document is synthesized to Terraform JSON.
+        - test__synthesize__terraform_backend: Tests a terraform backend document is synthesized to Terraform JSON.
+        - test__synthesize__backend_env: Tests the state key of a single environment is separated for it.
+        - test__synthesize__does_not_write_to_disk: Tests synthesizing leaves no output directory behind.
+        - test__synthesize__unknown_name: Tests an unknown stack name raises a ValueError.
+        - test__synthesize__selection: Tests only the selected construct subtree is synthesized.
+        - test__synthesize__selection__unknown_path: Tests an unknown construct path raises a ValueError.
+"""
+
+import json
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from cdktf import App, Testing
+from cdktf_cdktf_provider_azurerm.management_lock import ManagementLock
+from cdktf_cdktf_provider_azurerm.resource_group import ResourceGroup
+from cdktf_cdktf_provider_azurerm.storage_account import StorageAccount
+from cdktf_cdktf_provider_azurerm.storage_container import StorageContainer
+
+from a1a_infra_base import synth
+from a1a_infra_base.selection import ConstructSelection
+from a1a_infra_base.synth import build_matrix, synthesize
+
+
+@pytest.fixture(name="stack_base__dict")
+def fixture__stack_base__dict() -> dict[str, Any]:
+    """
+    Fixture that provides the provider and backend sections shared by all stacks.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "terraform_provider": {
+            "azurerm": {
+                "tenant_id": "test-tenant-id",
+                "subscription_id": "test-sub-id",
+                "client_id": "test-client-id",
+                "client_secret": "test-client-secret",
+            }
+        },
+        "terraform_backend": {"local": {"path": "tfstate/test.tfstate"}},
+    }
+
+
+@pytest.fixture(name="lake_house__dict")
+def fixture__lake_house__dict(
+    stack_base__dict: dict[str, Any], storage_l1_config__factory: Callable[..., dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Fixture that provides a lake house configuration document.
+
+    Args:
+        stack_base__dict (dict[str, Any]): The provider and backend sections.
+        storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+
+    Returns:
+        dict[str, Any]: A configuration document.
+    """
+    return {
+        "name": "lake_house",
+        "stack": {
+            **stack_base__dict,
+            "constructs": {
+                "data_lake": {
+                    "source_storage": storage_l1_config__factory("source"),
+                    "bronze_storage": storage_l1_config__factory("bronze"),
+                    "silver_storage": storage_l1_config__factory("silver"),
+                    "gold_storage": storage_l1_config__factory("gold"),
+                }
+            },
+        },
+    }
+
+
+class TestBuildMatrix:
+    """
+    Test suite for the build_matrix function.
+    """
+
+    def test__build_matrix(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test one stack per environment is built with a unique ID and a separated backend.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        stacks = build_matrix(App(), name="lake_house", dict_=lake_house__dict["stack"], envs=["dev", "prd"])
+
+        assert [stack.node.id for stack in stacks] == ["LakeHouseStack_dev", "LakeHouseStack_prd"]
+        for env, stack in zip(["dev", "prd"], stacks):
+            synthesized = json.loads(Testing.synth(stack))
+            assert synthesized["terraform"]["backend"]["local"]["path"] == f"tfstate/{env}/test.tfstate"
+            accounts = synthesized["resource"][StorageAccount.TF_RESOURCE_TYPE].values()
+            assert f"sagold{env}gwc01" in [account["name"] for account in accounts]
+
+    def test__build_matrix__overlay(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an environment overlay is merged over the shared configuration of that environment only.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        overlays = {"prd": {"constructs": {"data_lake": {"gold_storage": {"account_replication_type": "ZRS"}}}}}
+
+        stacks = build_matrix(
+            App(), name="lake_house", dict_=lake_house__dict["stack"], envs=["dev", "prd"], overlays=overlays
+        )
+
+        replication_types = []
+        for stack in stacks:
+            accounts = json.loads(Testing.synth(stack))["resource"][StorageAccount.TF_RESOURCE_TYPE].values()
+            gold_account = next(account for account in accounts if account["name"].startswith("sagold"))
+            replication_types.append(gold_account["account_replication_type"])
+        assert replication_types == ["LRS", "ZRS"]
+        assert lake_house__dict["stack"]["constructs"]["data_lake"]["gold_storage"]["account_replication_type"] == "LRS"
+
+
+class TestSynthesize:
+    """
+    Test suite for the synthesize function.
+    """
+
+    def test__synthesize__lake_house(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test a lake house document is synthesized to Terraform JSON.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        synthesized = synthesize(lake_house__dict, env="dev")
+
+        assert list(synthesized) == ["LakeHouseStack"]
+        stack = synthesized["LakeHouseStack"]
+        assert stack["terraform"]["backend"]["local"]["path"] == "tfstate/dev/test.tfstate"
+        assert len(stack["resource"][StorageAccount.TF_RESOURCE_TYPE]) == 4
+        assert len(stack["resource"][StorageContainer.TF_RESOURCE_TYPE]) == 4
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            (None, "prd/LakeHouseStack.tfstate"),
+            ("lake/{env}/{stack}.tfstate", "lake/prd/LakeHouseStack.tfstate"),
+        ],
+    )
+    def test__synthesize__backend_env(self, lake_house__dict: dict[str, Any], key: str | None, expected: str) -> None:
+        """
+        Test synthesizing a single environment separates its state key, the same as a matrix build does, so the
+        environments never share a state blob.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+            key (str | None): The configured state key, None for the default.
+            expected (str): The expected state key for the prd environment.
+        """
+        backend = {"storage_account_name": "satfstate", "container_name": "tfstate"}
+        if key is not None:
+            backend["key"] = key
+        lake_house__dict["stack"]["terraform_backend"] = {"azurerm": backend}
+
+        synthesized = synthesize(lake_house__dict, env="prd")
+
+        assert synthesized["LakeHouseStack"]["terraform"]["backend"]["azurerm"]["key"] == expected
+
+    def test__synthesize__terraform_backend(
+        self, stack_base__dict: dict[str, Any], storage_l1_config__factory: Callable[..., dict[str, Any]]
+    ) -> None:
+        """
+        Test a terraform backend document is synthesized to Terraform JSON.
+
+        Args:
+            stack_base__dict (dict[str, Any]): The provider and backend sections.
+            storage_l1_config__factory (Callable[..., dict[str, Any]]): The storage configuration factory.
+        """
+        document = {
+            "name": "terraform_backend",
+            "stack": {**stack_base__dict, "constructs": {"storage": storage_l1_config__factory("tfstate")}},
+        }
+
+        synthesized = synthesize(document, env="dev")
+
+        accounts = synthesized["TerraformBackendStack"]["resource"][StorageAccount.TF_RESOURCE_TYPE]
+        assert [account["name"] for account in accounts.values()] == ["satfstatedevgwc01"]
+
+    def test__synthesize__does_not_write_to_disk(
+        self, lake_house__dict: dict[str, Any], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test synthesizing leaves no output directory behind. The app creates its output directory from the jsii node
+        process, whose working directory does not follow the Python one, so the test checks the output directory the
+        app is given instead.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+            tmp_path (Path): Temporary directory for the temporary output directories.
+            monkeypatch (pytest.MonkeyPatch): Used to record the output directory of the app.
+        """
+        outdirs: list[str] = []
+
+        def app(**kwargs: Any) -> App:
+            outdirs.append(kwargs["outdir"])
+            return App(**kwargs)
+
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(synth, "App", app)
+
+        synthesize(lake_house__dict, env="dev")
+
+        assert len(outdirs) == 1
+        assert Path(outdirs[0]).parent == tmp_path
+        assert not list(tmp_path.iterdir())
+
+    def test__synthesize__unknown_name(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an unknown stack name raises a ValueError.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        with pytest.raises(ValueError):
+            synthesize({**lake_house__dict, "name": "unknown"}, env="dev")
+
+    def test__synthesize__selection(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test only the selected construct subtree is synthesized, with the resource group name stubbed.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        selection = ConstructSelection(path="LakeHouseStack/DataLakeL2/StorageL1_Gold")
+
+        stack = synthesize(lake_house__dict, env="dev", selection=selection)["LakeHouseStack"]
+
+        assert "azurerm" in stack["provider"]
+        assert ResourceGroup.TF_RESOURCE_TYPE not in stack["resource"]
+        accounts = list(stack["resource"][StorageAccount.TF_RESOURCE_TYPE].values())
+        assert [account["name"] for account in accounts] == ["sagolddevgwc01"]
+        assert accounts[0]["resource_group_name"] == "rg-storage-dev-gwc-01"
+        assert len(stack["resource"][ManagementLock.TF_RESOURCE_TYPE]) == 1
+        assert len(stack["resource"][StorageContainer.TF_RESOURCE_TYPE]) == 1
+
+    def test__synthesize__selection__unknown_path(self, lake_house__dict: dict[str, Any]) -> None:
+        """
+        Test an unknown construct path raises a ValueError.
+
+        Args:
+            lake_house__dict (dict[str, Any]): The configuration document.
+        """
+        with pytest.raises(ValueError):
+            synthesize(
+                lake_house__dict, env="dev", selection=ConstructSelection(path="LakeHouseStack/DataLakeL2/Unknown")
+            )
@@ -0,0 +1,201 @@
+"""
+Module for testing the TerraformBackendLocalConfig and TerraformBackendAzurermConfig classes.
+
+Tests:
+    - TestTerraformBackendLocalConfig:
+        - test__from_dict: Tests the from_dict method of the TerraformBackendLocalConfig class.
+        - test__for_env: Tests the state path is separated per environment.
+    - TestTerraformBackendAzurermConfig:
+        - test__from_dict: Tests the from_dict method of the TerraformBackendAzurermConfig class.
+        - test__for_env: Tests the state key is separated per environment.
+        - test__create_backend: Tests every stack gets its own state key in its environment.
+        - test__state_lock__azurite: Tests stacks are locked independently by blob leases on a local Azurite.
+    - TestBackendConfigFromDict:
+        - test__backend_config_from_dict: Tests the backend type is selected by its key.
+        - test__backend_config_from_dict__invalid: Tests zero or several backend types raise an error.
+"""
+
+import json
+import os
+import uuid
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+
+from a1a_infra_base.terraform_backend import (
+    TerraformBackendAzurermConfig,
+    TerraformBackendLocalConfig,
+    backend_config_from_dict,
+)
+
+AZURITE_CONNECTION_STRING_ENV: str = "AZURITE_CONNECTION_STRING"
+
+
+def _backend(stack: TerraformStack) -> dict[str, Any]:
+    """
+    Synthesize a stack and return its backend block.
+
+    Args:
+        stack (TerraformStack): The stack.
+
+    Returns:
+        dict[str, Any]: The backend block, keyed by backend type.
+    """
+    return json.loads(Testing.synth(stack))["terraform"]["backend"]
+
+
+class TestTerraformBackendLocalConfig:
+    """
+    Test suite for the TerraformBackendLocalConfig class.
+    """
+
+    def test__from_dict(self) -> None:
+        """
+        Test the from_dict method of the TerraformBackendLocalConfig class.
+        """
+        config = TerraformBackendLocalConfig.from_dict({"path": "tfstate/test.tfstate"})
+        assert config.path == "tfstate/test.tfstate"
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("tfstate/test.tfstate", "tfstate/dev/test.tfstate"),
+            ("test.tfstate", "dev/test.tfstate"),
+            ("tfstate/test-{env}.tfstate", "tfstate/test-dev.tfstate"),
+        ],
+    )
+    def test__for_env(self, path: str, expected: str) -> None:
+        """
+        Test the state path is separated per environment.
+
+        Args:
+            path (str): The configured state path.
+            expected (str): The expected state path for the dev environment.
+        """
+        config = TerraformBackendLocalConfig(path=path)
+
+        assert config.for_env("dev").path == expected
+        assert config.path == path
+
+
+class TestTerraformBackendAzurermConfig:
+    """
+    Test suite for the TerraformBackendAzurermConfig class.
+    """
+
+    def test__from_dict(self) -> None:
+        """
+        Test the from_dict method of the TerraformBackendAzurermConfig class, including its defaults.
+        """
+        config = TerraformBackendAzurermConfig.from_dict({"storage_account_name": "satfstate", "container_name": "tf"})
+
+        assert config == TerraformBackendAzurermConfig(
+            storage_account_name="satfstate", container_name="tf", key="{stack}.tfstate", use_azuread_auth=True
+        )
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("{stack}.tfstate", "dev/{stack}.tfstate"),
+            ("lake/{env}/{stack}.tfstate", "lake/dev/{stack}.tfstate"),
+        ],
+    )
+    def test__for_env(self, key: str, expected: str) -> None:
+        """
+        Test the state key is separated per environment.
+
+        Args:
+            key (str): The configured state key.
+            expected (str): The expected state key for the dev environment.
+        """
+        config = TerraformBackendAzurermConfig(storage_account_name="satfstate", container_name="tf", key=key)
+
+        assert config.for_env("dev").key == expected
+        assert config.key == key
+
+    def test__create_backend(self) -> None:
+        """
+        Test every stack sharing a configuration gets its own state key, separated for its environment.
+        """
+        config = TerraformBackendAzurermConfig(
+            storage_account_name="satfstate", container_name="tf", resource_group_name="rg-tfstate"
+        )
+        app = App()
+        stacks = [TerraformStack(app, "LakeHouseStack_dev"), TerraformStack(app, "TerraformBackendStack_dev")]
+        for stack in stacks:
+            config.create_backend(stack, env="dev")
+
+        backends = [_backend(stack) for stack in stacks]
+
+        assert [backend["azurerm"]["key"] for backend in backends] == [
+            "dev/LakeHouseStack_dev.tfstate",
+            "dev/TerraformBackendStack_dev.tfstate",
+        ]
+        assert backends[0]["azurerm"]["resource_group_name"] == "rg-tfstate"
+
+    def test__state_lock__azurite(self) -> None:
+        """
+        Test stacks are locked independently: the state blob of each stack can be leased by a different agent, while a
+        second lease on the same state blob is refused. Terraform locks azurerm state with these blob leases.
+
+        Runs against the Azurite service of the devcontainer and is skipped when it is not available.
+        """
+        blob = pytest.importorskip("azure.storage.blob")
+        exceptions = pytest.importorskip("azure.core.exceptions")
+        connection_string = os.environ.get(AZURITE_CONNECTION_STRING_ENV)
+        if not connection_string:
+            pytest.skip(f"{AZURITE_CONNECTION_STRING_ENV} is not set.")
+
+        container_name = f"tfstate-{uuid.uuid4().hex[:8]}"
+        config = TerraformBackendAzurermConfig(storage_account_name="devstoreaccount1", container_name=container_name)
+        app = App()
+        stacks = [TerraformStack(app, "LakeHouseStack_dev"), TerraformStack(app, "LakeHouseStack_prd")]
+        for stack, env in zip(stacks, ["dev", "prd"]):
+            config.create_backend(stack, env=env)
+        keys = [_backend(stack)["azurerm"]["key"] for stack in stacks]
+
+        container = blob.BlobServiceClient.from_connection_string(connection_string).create_container(container_name)
+        try:
+            clients = [container.get_blob_client(key) for key in keys]
+            for client in clients:
+                client.upload_blob(b"{}")
+            leases = [client.acquire_lease(lease_duration=15) for client in clients]
+
+            with pytest.raises(exceptions.HttpResponseError):
+                clients[0].acquire_lease(lease_duration=15)
+
+            for lease in leases:
+                lease.release()
+        finally:
+            container.delete_container()
+
+
+class TestBackendConfigFromDict:
+    """
+    Test suite for the backend_config_from_dict function.
+    """
+
+    def test__backend_config_from_dict(self) -> None:
+        """
+        Test the backend type is selected by its key.
+        """
+        assert isinstance(backend_config_from_dict({"local": {"path": "x.tfstate"}}), TerraformBackendLocalConfig)
+        assert isinstance(
+            backend_config_from_dict({"azurerm": {"storage_account_name": "sa", "container_name": "tf"}}),
+            TerraformBackendAzurermConfig,
+        )
+
+    @pytest.mark.parametrize(
+        "dict_",
+        [{}, {"s3": {}}, {"local": {"path": "x.tfstate"}, "azurerm": {}}],
+    )
+    def test__backend_config_from_dict__invalid(self, dict_: dict[str, Any]) -> None:
+        """
+        Test zero, unknown or several backend types raise a ValueError.
+
+        Args:
+            dict_ (dict[str, Any]): The backend section.
+        """
+        with pytest.raises(ValueError):
+            backend_config_from_dict(dict_)
@@ -0,0 +1,117 @@
+"""
+Module for testing the TerraformProviderAzurermConfig class.
+
+Tests:
+    - TestTerraformProviderAzurermConfig:
+        - test__from_dict__defaults: Tests omitted performance settings default to fast plans.
+        - test__from_dict: Tests the performance settings are read from the configuration.
+        - test__from_dict__invalid_registrations: Tests an unknown registration mode raises an error.
+        - test__create_provider: Tests the settings are passed through to the provider block.
+"""
+
+import json
+from typing import Any
+
+import pytest
+from cdktf import App, TerraformStack, Testing
+
+from a1a_infra_base.terraform_provider import TerraformProviderAzurermConfig, TerraformProviderAzurermFeaturesConfig
+
+
+@pytest.fixture(name="provider_config__dict")
+def fixture__provider_config__dict() -> dict[str, Any]:
+    """
+    Fixture that provides a provider configuration dictionary with credentials only.
+
+    Returns:
+        dict[str, Any]: A configuration dictionary.
+    """
+    return {
+        "tenant_id": "test-tenant-id",
+        "subscription_id": "test-sub-id",
+        "client_id": "test-client-id",
+        "client_secret": "test-client-secret",
+    }
+
+
+class TestTerraformProviderAzurermConfig:
+    """
+    Test suite for the TerraformProviderAzurermConfig class.
+    """
+
+    def test__from_dict__defaults(self, provider_config__dict: dict[str, Any]) -> None:
+        """
+        Test omitted performance settings default to fast plans.
+
+        Args:
+            provider_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        config = TerraformProviderAzurermConfig.from_dict(provider_config__dict)
+
+        assert config.resource_provider_registrations == "none"
+        assert config.resource_providers_to_register == []
+        assert config.storage_use_azuread
+        assert config.disable_terraform_partner_id
+        assert config.features == TerraformProviderAzurermFeaturesConfig(
+            prevent_deletion_if_contains_resources=True, storage_data_plane_available=False
+        )
+
+    def test__from_dict(self, provider_config__dict: dict[str, Any]) -> None:
+        """
+        Test the performance settings are read from the configuration.
+
+        Args:
+            provider_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        provider_config__dict.update(
+            {
+                "resource_provider_registrations": "core",
+                "resource_providers_to_register": ["Microsoft.Insights"],
+                "storage_use_azuread": False,
+                "disable_terraform_partner_id": False,
+                "features": {"storage": {"data_plane_available": True}},
+            }
+        )
+
+        config = TerraformProviderAzurermConfig.from_dict(provider_config__dict)
+
+        assert config.resource_provider_registrations == "core"
+        assert config.resource_providers_to_register == ["Microsoft.Insights"]
+        assert not config.storage_use_azuread
+        assert not config.disable_terraform_partner_id
+        assert config.features.storage_data_plane_available
+        assert config.features.prevent_deletion_if_contains_resources
+
+    def test__from_dict__invalid_registrations(self, provider_config__dict: dict[str, Any]) -> None:
+        """
+        Test an unknown registration mode raises a ValueError.
+
+        Args:
+            provider_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        provider_config__dict["resource_provider_registrations"] = "some"
+
+        with pytest.raises(ValueError):
+            TerraformProviderAzurermConfig.from_dict(provider_config__dict)
+
+    def test__create_provider(self, provider_config__dict: dict[str, Any]) -> None:
+        """
+        Test the settings are passed through to the provider block.
+
+        Args:
+            provider_config__dict (dict[str, Any]): The configuration dictionary.
+        """
+        stack = TerraformStack(App(), "TestStack")
+        TerraformProviderAzurermConfig.from_dict(provider_config__dict).create_provider(stack)
+
+        (provider,) = json.loads(Testing.synth(stack))["provider"]["azurerm"]
+        assert provider["resource_provider_registrations"] == "none"
+        assert "resource_providers_to_register" not in provider
+        assert provider["storage_use_azuread"] is True
+        assert provider["disable_terraform_partner_id"] is True
+        assert provider["features"] == [
+            {
+                "resource_group": [{"prevent_deletion_if_contains_resources": True}],
+                "storage": [{"data_plane_available": False}],
+            }
+        ]